@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+수락 제어(부하 차단) 벤치마크
+처리 용량을 넘는 속도로 요청이 도착할 때(개방 루프) 대기열 무제한 방식과 AdmissionController 를 비교
+처리된 요청의 지연(p50/p99), 기한(REQUEST_TIMEOUT) 초과 비율, 거절 수와 거절까지 걸린 시간, Retry-After 를 측정
+
+  - 생성 대역: 요청 1건 = 고정 처리 시간 (모델 로드 없음, 동시 실행 한도만큼 병렬 처리)
+
+실행: python benchmarks/bench_admission.py [--service-ms 200] [--concurrency 2] [--overload 1.5,3] [--seconds 10]
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+# backend 디렉토리를 Python 경로에 추가
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from utils.admission import AdmissionController, AdmissionRejected
+
+
+def percentile(values: List[float], ratio: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * ratio))] if ordered else float("nan")
+
+
+async def run_load(
+    controller: AdmissionController,
+    service_time: float,
+    rate: float,
+    seconds: float,
+    deadline: float
+) -> Dict:
+    """포아송 도착(초당 rate건)으로 seconds 동안 요청 발생 후 모두 끝날 때까지 대기"""
+    served: List[float] = []
+    rejected: List[float] = []
+    retry_after: List[int] = []
+
+    async def request():
+        start = time.perf_counter()
+        try:
+            async with controller.slot():
+                await asyncio.sleep(service_time)
+        except AdmissionRejected as e:
+            rejected.append(time.perf_counter() - start)
+            retry_after.append(e.retry_after)
+            return
+        served.append(time.perf_counter() - start)
+
+    rng = random.Random(7)
+    tasks = []
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        tasks.append(asyncio.create_task(request()))
+        await asyncio.sleep(rng.expovariate(rate))
+    await asyncio.gather(*tasks)
+
+    return {
+        "requests": len(tasks),
+        "served": len(served),
+        "p50_ms": percentile(served, 0.5) * 1000,
+        "p99_ms": percentile(served, 0.99) * 1000,
+        "late": sum(1 for latency in served if latency > deadline),
+        "rejected": len(rejected),
+        "reject_ms": percentile(rejected, 0.99) * 1000 if rejected else 0.0,
+        "retry_after": statistics.median(retry_after) if retry_after else 0,
+        "peak_queue": controller.peak_queue_depth
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="수락 제어 벤치마크")
+    parser.add_argument("--service-ms", type=float, default=200.0, help="대역: 요청당 처리 시간")
+    parser.add_argument("--concurrency", type=int, default=2, help="동시 실행 한도")
+    parser.add_argument("--overload", default="0.8,1.5,3", help="처리 용량 대비 도착 속도 배수")
+    parser.add_argument("--seconds", type=float, default=10.0, help="요청 발생 시간")
+    parser.add_argument("--timeout", type=float, default=2.0, help="요청 기한 (REQUEST_TIMEOUT 대응, 초)")
+    parser.add_argument("--max-queue", type=int, default=8)
+    args = parser.parse_args()
+
+    service_time = args.service_ms / 1000
+    capacity = args.concurrency / service_time
+
+    print(f"수락 제어 벤치마크 - 처리 {args.service_ms:.0f}ms × 동시 {args.concurrency} "
+          f"(용량 {capacity:.1f} req/s), 기한 {args.timeout}초, 대기열 {args.max_queue}")
+    print("=" * 104)
+    print(f"{'부하':>5} {'방식':<10} | {'요청':>5} {'처리':>5} {'p50(ms)':>9} {'p99(ms)':>9} {'기한 초과':>8} | "
+          f"{'거절':>5} {'거절 p99(ms)':>12} {'Retry-After':>11} {'최대 대기열':>10}")
+    print("-" * 104)
+
+    for overload in [float(value) for value in args.overload.split(",")]:
+        rate = capacity * overload
+        variants = {
+            # 기존 동작: 동시 실행 한도만 있고 대기열/기한 제한 없음
+            "무제한 대기": AdmissionController(args.concurrency, max_queue=10 ** 9, timeout=float("inf")),
+            "수락 제어": AdmissionController(args.concurrency, max_queue=args.max_queue, timeout=args.timeout),
+        }
+        for label, controller in variants.items():
+            result = await run_load(controller, service_time, rate, args.seconds, args.timeout)
+            print(
+                f"{overload:>4.1f}x {label:<10} | {result['requests']:>5} {result['served']:>5} "
+                f"{result['p50_ms']:>9.0f} {result['p99_ms']:>9.0f} {result['late']:>8} | "
+                f"{result['rejected']:>5} {result['reject_ms']:>12.1f} {result['retry_after']:>11} "
+                f"{result['peak_queue']:>10}"
+            )
+        print("-" * 104)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+초안 모델 보조 생성 A/B 벤치마크
+같은 프리미엄 EFT 프롬프트를 초안 모델 없이(A) / 있이(B) 번갈아 생성해 디코딩 토큰/초와 속도 배율을 비교하고,
+수락률과 대상 forward 당 토큰 수, 탐욕 디코딩 결과 일치를 확인 (transformers/torch 및 로컬 모델 필요)
+
+실행: python benchmarks/bench_assisted_decoding.py [--model meta-llama/Llama-3.1-8B-Instruct]
+      [--draft meta-llama/Llama-3.2-1B-Instruct] [--runs 3] [--max-tokens 128] [--sample]
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# backend 디렉토리를 Python 경로에 추가
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from config.settings import get_settings
+from services.ai_engine import EFTAIEngine
+from services.emotion_analyzer import EmotionAnalyzer
+from services.prompt_manager import EFTPromptManager
+
+settings = get_settings()
+
+MESSAGES = [
+    "요즘 회사 일 때문에 너무 스트레스를 받고 잠도 잘 못 자요.",
+    "시험이 다가오니까 불안해서 아무것도 손에 안 잡혀요.",
+    "친구랑 싸워서 마음이 너무 속상하고 외로워요.",
+]
+
+ARMS = (("A: 대상 모델 단독", False), ("B: 초안 모델 보조", True))
+
+
+def run(engine: EFTAIEngine, token_ids, generation_params, assisted: bool) -> dict:
+    engine.assisted.enabled = assisted
+    start = time.perf_counter()
+    width, output_ids = engine._model_generate([token_ids], generation_params)
+    seconds = time.perf_counter() - start
+    new_tokens = output_ids[0, width:].tolist()
+    return {"tokens": new_tokens, "tokens_per_second": len(new_tokens) / seconds}
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="초안 모델 보조 생성 A/B 벤치마크")
+    parser.add_argument("--model", default=settings.PREMIUM_TIER_MODEL)
+    parser.add_argument("--draft", default=settings.PREMIUM_DRAFT_MODEL or "meta-llama/Llama-3.2-1B-Instruct")
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--max-tokens", type=int, default=128)
+    parser.add_argument("--sample", action="store_true", help="샘플링 생성 (기본: 탐욕 디코딩으로 출력 일치 확인)")
+    args = parser.parse_args()
+
+    engine = EFTAIEngine(model_name=args.model, device=settings.DEVICE, draft_model=args.draft)
+    await engine.initialize()
+    if engine.assisted is None:
+        print(f"초안 모델을 사용할 수 없습니다: {args.draft} (로그 확인)")
+        return
+
+    analyzer = EmotionAnalyzer()
+    manager = EFTPromptManager()
+    prompts = []
+    for message in MESSAGES:
+        emotion = await analyzer.analyze(message)
+        prompts.append(manager.build_eft_prompt(message, emotion, tier="premium", token_budget=engine.token_budget))
+
+    generation_params = engine._generation_params(args.max_tokens, 0.7, 0.9, 50)
+    generation_params["do_sample"] = args.sample
+
+    # 워밍업 (양쪽 모델 첫 실행 비용 제외)
+    for _, assisted in ARMS:
+        run(engine, prompts[0].token_ids, {**generation_params, "max_new_tokens": 4}, assisted)
+    stats_before = engine.assisted.get_stats()
+
+    results = {label: [] for label, _ in ARMS}
+    outputs = {}
+    for run_index in range(args.runs):
+        for index, prompt in enumerate(prompts):
+            # 순서 효과를 줄이기 위해 실행마다 A/B 순서 교대
+            arms = ARMS if run_index % 2 == 0 else tuple(reversed(ARMS))
+            for label, assisted in arms:
+                result = run(engine, prompt.token_ids, generation_params, assisted)
+                results[label].append(result["tokens_per_second"])
+                outputs.setdefault(index, {})[label] = result["tokens"]
+
+    stats = engine.assisted.get_stats()
+    draft_tokens = stats["draft_tokens"] - stats_before["draft_tokens"]
+    accepted_tokens = stats["accepted_tokens"] - stats_before["accepted_tokens"]
+    target_forwards = stats["target_forwards"] - stats_before["target_forwards"]
+    new_tokens = stats["new_tokens"] - stats_before["new_tokens"]
+
+    print(f"\n초안 모델 보조 생성 A/B 벤치마크 (대상: {args.model}, 초안: {args.draft}, "
+          f"최대 {args.max_tokens}토큰, {'샘플링' if args.sample else '탐욕 디코딩'}, {args.runs}회)")
+    print("=" * 72)
+    print(f"{'방식':<20} {'토큰/초 p50':>12} {'토큰/초 평균':>12} {'속도 배율':>10}")
+    print("-" * 72)
+    baseline = statistics.median(results[ARMS[0][0]])
+    for label, _ in ARMS:
+        median = statistics.median(results[label])
+        print(f"{label:<20} {median:>12.2f} {statistics.mean(results[label]):>12.2f} {median / baseline:>9.2f}x")
+    print("=" * 72)
+    print(f"초안 수락률: {accepted_tokens / draft_tokens if draft_tokens else 0.0:.1%} "
+          f"({accepted_tokens}/{draft_tokens}), 대상 forward 당 토큰: {new_tokens / target_forwards if target_forwards else 0.0:.2f}")
+    if not args.sample:
+        same = sum(1 for arm_outputs in outputs.values() if arm_outputs[ARMS[0][0]] == arm_outputs[ARMS[1][0]])
+        print(f"탐욕 디코딩 결과 일치: {same}/{len(outputs)}")
+
+    await engine.cleanup()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+콜드 스타트 벤치마크
+기존 로드 / 빠른 로드(safetensors mmap + low_cpu_mem_usage) / 빠른 로드 + 워밍업을 각각 새 프로세스에서 실행해
+모델 로드 시간, 최대 RSS, 워밍업 시간, 첫/두 번째 채팅 응답 지연을 비교 (transformers/torch 및 로컬 모델 필요)
+
+실행: python benchmarks/bench_cold_start.py [--model microsoft/DialoGPT-medium] [--max-tokens 32]
+"""
+
+import argparse
+import asyncio
+import json
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# backend 디렉토리를 Python 경로에 추가
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from config.settings import get_settings
+from services.ai_engine import EFTAIEngine
+from services.emotion_analyzer import EmotionAnalyzer
+from services.prompt_manager import EFTPromptManager
+
+settings = get_settings()
+
+MESSAGE = "요즘 회사 일 때문에 너무 스트레스를 받고 잠도 잘 못 자요."
+
+# (이름, FAST_MODEL_LOAD, WARMUP_MAX_TOKENS)
+VARIANTS = [
+    ("기존 로드", False, 0),
+    ("빠른 로드", True, 0),
+    ("빠른 로드 + 워밍업", True, 8),
+]
+
+
+async def run_variant(args) -> None:
+    """자식 프로세스: 로드 → (워밍업) → 채팅 2회 측정 후 결과를 JSON으로 저장"""
+    settings.FAST_MODEL_LOAD = args.fast
+    settings.WARMUP_MAX_TOKENS = args.warmup_tokens
+    started_at = time.perf_counter()
+
+    engine = EFTAIEngine(model_name=args.model, device=settings.DEVICE)
+    await engine.initialize()
+    load_seconds = time.perf_counter() - started_at
+
+    emotion = await EmotionAnalyzer().analyze(MESSAGE)
+    prompt = EFTPromptManager().build_eft_prompt(MESSAGE, emotion, tier="free", token_budget=engine.token_budget)
+
+    warmup_seconds = await engine.warm_up([prompt]) if args.warmup_tokens else 0.0
+    ready_seconds = time.perf_counter() - started_at
+
+    latencies = []
+    for _ in range(2):
+        start = time.perf_counter()
+        await engine.generate_response(prompt, max_tokens=args.max_tokens)
+        latencies.append(time.perf_counter() - start)
+
+    Path(args.output).write_text(json.dumps({
+        "load_seconds": load_seconds,
+        "warmup_seconds": warmup_seconds,
+        "ready_seconds": ready_seconds,
+        "first_latency": latencies[0],
+        "second_latency": latencies[1],
+        "peak_rss_bytes": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024,  # Linux: KB 단위
+    }))
+    await engine.cleanup()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="콜드 스타트 벤치마크")
+    parser.add_argument("--model", default=settings.FREE_TIER_MODEL)
+    parser.add_argument("--max-tokens", type=int, default=32)
+    parser.add_argument("--fast", type=int, default=1, help=argparse.SUPPRESS)  # 자식 프로세스용
+    parser.add_argument("--warmup-tokens", type=int, default=0, help=argparse.SUPPRESS)
+    parser.add_argument("--output", default=None, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.output:
+        args.fast = bool(args.fast)
+        asyncio.run(run_variant(args))
+        return
+
+    results = {}
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for index, (label, fast, warmup_tokens) in enumerate(VARIANTS):
+            output = Path(temp_dir) / f"variant{index}.json"
+            print(f"⏳ {label} 측정 중...")
+            subprocess.run([
+                sys.executable, __file__, "--model", args.model, "--max-tokens", str(args.max_tokens),
+                "--fast", str(int(fast)), "--warmup-tokens", str(warmup_tokens), "--output", str(output)
+            ], check=True)
+            results[label] = json.loads(output.read_text())
+
+    print(f"\n콜드 스타트 벤치마크 (모델: {args.model}, 응답 최대 {args.max_tokens}토큰)")
+    print("=" * 100)
+    print(f"{'방식':<20} {'로드(초)':>9} {'최대 RSS(MB)':>13} {'워밍업(초)':>11} {'준비(초)':>9} "
+          f"{'첫 응답(초)':>12} {'두 번째(초)':>12}")
+    print("-" * 100)
+    for label, result in results.items():
+        print(
+            f"{label:<20} {result['load_seconds']:>9.1f} {result['peak_rss_bytes'] / 1024 ** 2:>13.0f} "
+            f"{result['warmup_seconds']:>11.2f} {result['ready_seconds']:>9.1f} "
+            f"{result['first_latency']:>12.2f} {result['second_latency']:>12.2f}"
+        )
+    print("=" * 100)
+    print("준비 = 프로세스가 /ready 200을 반환할 수 있는 시점 (로드 + 워밍업)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+CPU 동적 int8 양자화 벤치마크
+fp32 / int8(첫 로드) / int8(양자화 캐시 재사용) 모델을 각각 별도 프로세스에서 로드해 로드 시간, 상주 메모리(RSS),
+탐욕 디코딩 토큰/초를 측정하고, fp32 대비 출력 변화(다음 토큰 분포 KL, top-1 일치율, 탐욕 출력 일치)를 비교
+(transformers/torch 및 로컬 모델 필요)
+
+실행: python benchmarks/bench_cpu_quantization.py [--model microsoft/DialoGPT-medium] [--runs 3] [--max-tokens 48]
+"""
+
+import argparse
+import asyncio
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# backend 디렉토리를 Python 경로에 추가
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+import psutil
+import torch
+
+from config.settings import get_settings
+from services.ai_engine import EFTAIEngine
+
+settings = get_settings()
+
+MESSAGES = [
+    "요즘 회사 일 때문에 너무 스트레스를 받고 잠도 잘 못 자요.",
+    "시험이 다가오니까 불안해서 아무것도 손에 안 잡혀요.",
+    "친구랑 싸워서 마음이 너무 속상하고 외로워요.",
+    "I feel anxious about my presentation tomorrow and can't focus.",
+    "Lately I've been feeling lonely even when I'm with friends.",
+]
+
+VARIANTS = [
+    ("fp32", None),
+    ("int8", "int8"),
+    ("int8 (캐시)", "int8"),  # 같은 설정으로 다시 로드 - 양자화 캐시 재사용
+]
+
+
+async def run_variant(args) -> None:
+    """자식 프로세스: 모델 1개 로드/측정 후 결과를 파일로 저장"""
+    settings.CPU_QUANTIZATION = None
+    rss_before = psutil.Process().memory_info().rss
+
+    start = time.perf_counter()
+    engine = EFTAIEngine(model_name=args.model, device="cpu", cpu_quantization=args.quantization)
+    await engine.initialize()
+    load_seconds = time.perf_counter() - start
+    rss_loaded = psutil.Process().memory_info().rss
+
+    model, tokenizer = engine.model, engine.tokenizer
+    inputs = [
+        torch.tensor([tokenizer.encode(engine._format_prompt(message))], dtype=torch.long)
+        for message in MESSAGES
+    ]
+
+    # 1. 출력 비교용 - 프롬프트 위치별 다음 토큰 로그 확률과 탐욕 디코딩 결과
+    log_probs, greedy = [], []
+    with torch.inference_mode():
+        for input_ids in inputs:
+            log_probs.append(torch.log_softmax(model(input_ids).logits[0].float(), dim=-1))
+            output = model.generate(
+                input_ids, attention_mask=torch.ones_like(input_ids),
+                max_new_tokens=args.max_tokens, do_sample=False, pad_token_id=tokenizer.eos_token_id
+            )
+            greedy.append(output[0, input_ids.shape[1]:].tolist())
+
+    # 2. 속도 - 고정 길이 탐욕 디코딩 토큰/초
+    rates = []
+    with torch.inference_mode():
+        for _ in range(args.runs):
+            for input_ids in inputs:
+                start = time.perf_counter()
+                model.generate(
+                    input_ids, attention_mask=torch.ones_like(input_ids),
+                    max_new_tokens=args.max_tokens, min_new_tokens=args.max_tokens,
+                    do_sample=False, pad_token_id=tokenizer.eos_token_id
+                )
+                rates.append(args.max_tokens / (time.perf_counter() - start))
+
+    torch.save({
+        "load_seconds": load_seconds,
+        "rss_model_bytes": rss_loaded - rss_before,
+        "footprint_bytes": engine.memory_footprint(),
+        "tokens_per_second": statistics.median(rates),
+        "log_probs": log_probs,
+        "greedy": greedy,
+    }, args.output)
+    await engine.cleanup()
+
+
+def compare(baseline: dict, result: dict) -> dict:
+    """fp32 대비 출력 변화"""
+    kl_values, top1_same, top1_total = [], 0, 0
+    for reference, candidate in zip(baseline["log_probs"], result["log_probs"]):
+        # KL(fp32 || 양자화) - 위치별
+        kl_values.extend((reference.exp() * (reference - candidate)).sum(dim=-1).tolist())
+        top1_same += int((reference.argmax(dim=-1) == candidate.argmax(dim=-1)).sum())
+        top1_total += reference.shape[0]
+
+    exact, divergence = 0, []
+    for reference, candidate in zip(baseline["greedy"], result["greedy"]):
+        if reference == candidate:
+            exact += 1
+            continue
+        divergence.append(next(
+            (index for index, (a, b) in enumerate(zip(reference, candidate)) if a != b),
+            min(len(reference), len(candidate))
+        ))
+    return {
+        "kl_mean": statistics.mean(kl_values),
+        "kl_max": max(kl_values),
+        "top1_agreement": top1_same / top1_total,
+        "greedy_exact": exact,
+        "first_divergence": statistics.mean(divergence) if divergence else None,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="CPU 동적 int8 양자화 벤치마크")
+    parser.add_argument("--model", default=settings.FREE_TIER_MODEL)
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--max-tokens", type=int, default=48)
+    parser.add_argument("--quantization", default=None, help=argparse.SUPPRESS)  # 자식 프로세스용
+    parser.add_argument("--output", default=None, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.output:
+        asyncio.run(run_variant(args))
+        return
+
+    results = {}
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for index, (label, quantization) in enumerate(VARIANTS):
+            output = Path(temp_dir) / f"variant{index}.pt"
+            command = [
+                sys.executable, __file__, "--model", args.model, "--runs", str(args.runs),
+                "--max-tokens", str(args.max_tokens), "--output", str(output)
+            ]
+            if quantization:
+                command += ["--quantization", quantization]
+            print(f"⏳ {label} 측정 중...")
+            subprocess.run(command, check=True)
+            results[label] = torch.load(output, weights_only=False)
+
+    baseline = results["fp32"]
+    print(f"\nCPU 동적 int8 양자화 벤치마크 (모델: {args.model}, {args.max_tokens}토큰 탐욕 디코딩, "
+          f"{torch.get_num_threads()} 스레드)")
+    print("=" * 88)
+    print(f"{'방식':<14} {'로드(초)':>9} {'RSS 증가(MB)':>13} {'가중치(MB)':>11} {'토큰/초':>9} {'속도 배율':>9}")
+    print("-" * 88)
+    for label, result in results.items():
+        print(
+            f"{label:<14} {result['load_seconds']:>9.1f} {result['rss_model_bytes'] / 1024 ** 2:>13.0f} "
+            f"{result['footprint_bytes'] / 1024 ** 2:>11.0f} {result['tokens_per_second']:>9.1f} "
+            f"{result['tokens_per_second'] / baseline['tokens_per_second']:>8.2f}x"
+        )
+    print("=" * 88)
+
+    drift = compare(baseline, results["int8"])
+    print("fp32 대비 int8 출력 변화")
+    print(f"  다음 토큰 분포 KL: 평균 {drift['kl_mean']:.4f}, 최대 {drift['kl_max']:.4f}")
+    print(f"  top-1 토큰 일치율: {drift['top1_agreement']:.1%}")
+    print(f"  탐욕 출력 완전 일치: {drift['greedy_exact']}/{len(MESSAGES)}"
+          + (f" (불일치 시 평균 {drift['first_divergence']:.1f}번째 토큰부터 달라짐)"
+             if drift["first_divergence"] is not None else ""))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+응답 길이 정책 조기 종료 벤치마크
+티어별 EFT 프롬프트를 조기 종료 없이(A) / 있이(B) 탐욕 디코딩해 생성 토큰 수, 지연, 절약 토큰을 비교하고
+후처리 후 남는 응답이 같은지 확인 (transformers/torch 및 로컬 모델 필요)
+
+실행: python benchmarks/bench_early_stopping.py [--model microsoft/DialoGPT-medium] [--tiers free premium]
+      [--max-tokens 800]
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# backend 디렉토리를 Python 경로에 추가
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from config.settings import get_settings
+from services.ai_engine import EFTAIEngine
+from services.emotion_analyzer import EmotionAnalyzer
+from services.prompt_manager import EFTPromptManager
+
+settings = get_settings()
+
+MESSAGES = [
+    "요즘 회사 일 때문에 너무 스트레스를 받고 잠도 잘 못 자요.",
+    "시험이 다가오니까 불안해서 아무것도 손에 안 잡혀요.",
+    "친구랑 싸워서 마음이 너무 속상하고 외로워요.",
+]
+
+ARMS = (("A: 조기 종료 없음", False), ("B: 길이 정책 조기 종료", True))
+
+
+def run(engine: EFTAIEngine, prompt, generation_params, length_policy) -> dict:
+    start = time.perf_counter()
+    width, output_ids = engine._model_generate([prompt.token_ids], generation_params, length_policy)
+    seconds = time.perf_counter() - start
+    text = engine._cut_at_end_marker(engine.tokenizer.decode(output_ids[0, width:], skip_special_tokens=True))
+    return {"tokens": output_ids.shape[1] - width, "seconds": seconds, "text": text}
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="응답 길이 정책 조기 종료 벤치마크")
+    parser.add_argument("--model", default=settings.FREE_TIER_MODEL)
+    parser.add_argument("--tiers", nargs="+", default=["free", "premium", "enterprise"])
+    parser.add_argument("--max-tokens", type=int, default=800)
+    args = parser.parse_args()
+
+    engine = EFTAIEngine(model_name=args.model, device=settings.DEVICE)
+    await engine.initialize()
+
+    analyzer = EmotionAnalyzer()
+    manager = EFTPromptManager()
+    generation_params = engine._generation_params(args.max_tokens, 0.7, 0.9, 50)
+    generation_params["do_sample"] = False  # 탐욕 디코딩 (A/B 후처리 결과 비교)
+
+    print(f"\n응답 길이 정책 조기 종료 벤치마크 (모델: {args.model}, 최대 {generation_params['max_new_tokens']}토큰)")
+    print("=" * 84)
+    print(f"{'티어':<12} {'방식':<22} {'생성 토큰 평균':>14} {'지연 p50(초)':>13} {'후처리 결과 일치':>16}")
+    print("-" * 84)
+    for tier in args.tiers:
+        policy = manager.get_response_length_policy(tier)
+        results = {label: [] for label, _ in ARMS}
+        for message in MESSAGES:
+            emotion = await analyzer.analyze(message)
+            prompt = manager.build_eft_prompt(message, emotion, tier=tier, token_budget=engine.token_budget)
+            for label, enabled in ARMS:
+                results[label].append(run(engine, prompt, generation_params, policy if enabled else None))
+
+        same = sum(
+            1 for a, b in zip(results[ARMS[0][0]], results[ARMS[1][0]])
+            if manager._clean_ai_response(engine._clean_response(a["text"], ""))
+            == manager._clean_ai_response(engine._clean_response(b["text"], ""))
+        )
+        for label, _ in ARMS:
+            runs = results[label]
+            print(
+                f"{tier:<12} {label:<22} {statistics.mean(run['tokens'] for run in runs):>14.1f} "
+                f"{statistics.median(run['seconds'] for run in runs):>13.2f} {f'{same}/{len(runs)}':>16}"
+            )
+        print("-" * 84)
+
+    stats = engine.early_stopping.get_stats()
+    print(f"조기 종료: {stats['early_stopped']}/{stats['requests']}건 {stats['stop_reasons']}, "
+          f"요청당 절약 토큰 평균 {stats['avg_tokens_saved_per_request']:.1f}")
+    print("후처리 결과 불일치는 문자 수 상한(티어 응답 길이 가이드)에서 멈춘 경우 - 정책상 의도된 단축")
+
+    await engine.cleanup()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
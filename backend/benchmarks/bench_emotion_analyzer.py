@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+감정 분석기 벤치마크
+기존 키워드별 정규식 스캔 방식과 단일 패스 오토마톤 방식의 속도/결과 비교
+
+실행: python benchmarks/bench_emotion_analyzer.py
+"""
+
+import asyncio
+import random
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+# backend 디렉토리를 Python 경로에 추가
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from services.emotion_analyzer import EmotionAnalyzer
+from models.chat_models import EmotionType
+
+FILLER_WORDS = [
+    "오늘", "그리고", "그래서", "하루", "생각", "사람", "시간", "마음", "이야기",
+    "집에", "가서", "하는데", "있었어요", "했어요", "같아요", "그런데", "너무", "정말",
+    "회사에서", "친구가", "엄마랑", "병원", "돈이", "프로젝트", "마감", "안", "못",
+]
+
+
+class LegacyEmotionAnalyzer(EmotionAnalyzer):
+    """기존 analyze() 경로 (키워드별 re.findall, 단계별 중복 스캔) - 비교 기준용"""
+
+    def legacy_analyze(self, text: str) -> Dict:
+        cleaned = self._preprocess_text(text)
+
+        scores = {emotion: 0.0 for emotion in EmotionType}
+        for emotion, keywords in self.emotion_keywords.items():
+            for keyword in keywords:
+                matches = len(re.findall(keyword, cleaned))
+                if matches > 0:
+                    scores[emotion] += matches * 1.0 * self._legacy_boost(cleaned, keyword)
+
+        for context_info in self.context_patterns.values():
+            if any(re.search(pattern, cleaned) for pattern in context_info["patterns"]):
+                for emotion in context_info["boost_emotions"]:
+                    scores[emotion] *= context_info["multiplier"]
+
+        negation_count = sum(cleaned.count(word) for word in self.negation_words)
+        if negation_count > 0:
+            for emotion in (EmotionType.JOY, EmotionType.SURPRISE):
+                scores[emotion] *= 0.7 ** negation_count
+
+        primary, secondary, intensity = self._determine_final_emotions(scores)
+        keywords = [k for k in self.emotion_keywords.get(primary, []) if k in cleaned]
+
+        confidence = 0.5
+        total_score = sum(scores.values())
+        if total_score > 5:
+            confidence += 0.2
+        elif total_score > 2:
+            confidence += 0.1
+        if 10 <= len(cleaned) <= 200:
+            confidence += 0.1
+        elif 200 < len(cleaned) <= 500:
+            confidence += 0.05
+        unique_emotions = len([k for k, v in scores.items() if v > 0])
+        if unique_emotions >= 2:
+            confidence += 0.1
+        elif unique_emotions == 1:
+            confidence += 0.05
+        if any(modifier in cleaned for modifier in self.intensity_modifiers):
+            confidence += 0.1
+
+        situations = []
+        for situation_name, situation_info in self.context_patterns.items():
+            for pattern in situation_info["patterns"]:
+                if re.search(pattern, cleaned):
+                    situations.append(situation_name)
+                    break
+        complexity = "complex" if len(situations) > 2 else "moderate" if len(situations) == 2 else "simple"
+
+        return {
+            "primary_emotion": primary,
+            "secondary_emotion": secondary,
+            "intensity": intensity,
+            "confidence": min(confidence, 1.0),
+            "emotional_keywords": sorted(set(keywords)),
+            "context_analysis": {
+                "detected_situations": situations,
+                "text_characteristics": {
+                    "length": len(cleaned),
+                    "sentence_count": len(cleaned.split('.')),
+                    "question_marks": cleaned.count('?'),
+                    "exclamation_marks": cleaned.count('!'),
+                    "repetitive_chars": len(re.findall(r'(.)\1{2,}', cleaned))
+                },
+                "emotional_complexity": complexity
+            },
+        }
+
+    def _legacy_boost(self, text: str, keyword: str) -> float:
+        boost = 1.0
+        for pos in [m.start() for m in re.finditer(keyword, text)]:
+            context = text[max(0, pos - 10):min(len(text), pos + len(keyword) + 10)]
+            for modifier, multiplier in self.intensity_modifiers.items():
+                if modifier in context:
+                    boost *= multiplier
+                    break
+        return boost
+
+
+def same_result(expected: Dict, analysis) -> bool:
+    """기존 결과와 현재 analyze() 결과 비교 (키워드는 10개 제한 전 집합 기준)"""
+    actual = analysis.model_dump()
+    if len(expected["emotional_keywords"]) > 10:
+        # 기존 구현도 list(set(...))[:10] 이므로 10개 초과 시 선택된 키워드는 임의
+        actual["emotional_keywords"] = expected["emotional_keywords"]
+    else:
+        actual["emotional_keywords"] = sorted(actual["emotional_keywords"])
+    return actual == expected
+
+
+def build_corpus(analyzer: EmotionAnalyzer, length: int, count: int, seed: int = 42) -> List[str]:
+    """사전 키워드와 일반 단어를 섞은 한국어 합성 텍스트 생성"""
+    rng = random.Random(seed)
+    vocabulary = (
+        [kw for kws in analyzer.emotion_keywords.values() for kw in kws]
+        + list(analyzer.intensity_modifiers.keys())
+        + analyzer.negation_words
+    )
+
+    corpus = []
+    for _ in range(count):
+        words = []
+        size = 0
+        while size < length:
+            word = rng.choice(vocabulary) if rng.random() < 0.3 else rng.choice(FILLER_WORDS)
+            if rng.random() < 0.1:
+                word += rng.choice([".", "!", "?", "ㅠㅠ"])
+            words.append(word)
+            size += len(word) + 1
+        corpus.append(" ".join(words)[:length])
+    return corpus
+
+
+def measure(func, texts: List[str], repeat: int) -> float:
+    """텍스트당 평균 소요 시간 (ms)"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for text in texts:
+            func(text)
+    return (time.perf_counter() - start) * 1000 / (repeat * len(texts))
+
+
+async def measure_async(func, texts: List[str], repeat: int) -> float:
+    """텍스트당 평균 소요 시간 (ms) - 코루틴 버전"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for text in texts:
+            await func(text)
+    return (time.perf_counter() - start) * 1000 / (repeat * len(texts))
+
+
+async def main():
+    analyzer = LegacyEmotionAnalyzer()
+    analyzer.analysis_cache = None  # 반복 측정이 캐시 적중으로 왜곡되지 않도록 비활성화
+
+    print("감정 분석기 벤치마크 (기존 단계별 스캔 vs 단일 패스 오토마톤 + 공유 특성)")
+    print("=" * 60)
+
+    for length, count, repeat in [(50, 200, 5), (2000, 30, 3), (5000, 20, 3)]:
+        texts = build_corpus(analyzer, length, count)
+
+        # 결과 동일성 검증
+        for text in texts:
+            if not same_result(analyzer.legacy_analyze(text), await analyzer.analyze(text)):
+                print(f"❌ 결과 불일치 (길이 {length}): {text[:40]}...")
+                sys.exit(1)
+
+        legacy_ms = measure(analyzer.legacy_analyze, texts, repeat)
+        current_ms = await measure_async(analyzer.analyze, texts, repeat)
+
+        print(
+            f"{length:>5}자 x {count:<4} | 기존 {legacy_ms:8.3f}ms | "
+            f"현재 {current_ms:8.3f}ms | {legacy_ms / current_ms:5.1f}x"
+        )
+
+    print("=" * 60)
+    print("✅ 모든 입력에서 기존 analyze() 결과와 동일")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+배치 감정 분석 벤치마크
+analyze() 반복 호출과 analyze_batch() 일괄 처리의 처리량 비교
+
+실행: python benchmarks/bench_emotion_batch.py
+"""
+
+import asyncio
+import math
+import sys
+import time
+from pathlib import Path
+
+# backend 디렉토리를 Python 경로에 추가
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from services.emotion_analyzer import EmotionAnalyzer
+from bench_emotion_analyzer import build_corpus
+
+
+def same_analysis(expected, actual) -> bool:
+    """배치 결과가 단건 결과와 같은지 비교 (부동소수점은 허용 오차 내)"""
+    return (
+        expected.primary_emotion == actual.primary_emotion
+        and expected.secondary_emotion == actual.secondary_emotion
+        and math.isclose(expected.intensity, actual.intensity, rel_tol=1e-9)
+        and math.isclose(expected.confidence, actual.confidence, rel_tol=1e-9)
+        and sorted(expected.emotional_keywords) == sorted(actual.emotional_keywords)
+        and expected.context_analysis == actual.context_analysis
+    )
+
+
+async def main():
+    analyzer = EmotionAnalyzer()
+    analyzer.analysis_cache = None  # 반복 측정이 캐시 적중으로 왜곡되지 않도록 비활성화
+
+    print("배치 감정 분석 벤치마크 (analyze() 반복 vs analyze_batch())")
+    print("=" * 60)
+
+    for length, count in [(80, 2000), (400, 1000), (2000, 200)]:
+        texts = build_corpus(analyzer, length, count, seed=length)
+
+        start = time.perf_counter()
+        single_results = [await analyzer.analyze(text) for text in texts]
+        single_elapsed = time.perf_counter() - start
+
+        start = time.perf_counter()
+        batch_results = await analyzer.analyze_batch(texts)
+        batch_elapsed = time.perf_counter() - start
+
+        mismatches = sum(
+            not same_analysis(expected, actual)
+            for expected, actual in zip(single_results, batch_results)
+        )
+        if mismatches:
+            print(f"❌ 결과 불일치 {mismatches}건 (길이 {length})")
+            sys.exit(1)
+
+        print(
+            f"{length:>5}자 x {count:<5} | 반복 {count / single_elapsed:9.1f} texts/s | "
+            f"배치 {count / batch_elapsed:9.1f} texts/s | {single_elapsed / batch_elapsed:4.2f}x"
+        )
+
+    print("=" * 60)
+    print("✅ 배치 결과가 단건 analyze() 결과와 일치")
+    print("참고: HTTP 단건 호출 대비 이득은 요청당 왕복/직렬화 비용만큼 추가로 커집니다")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
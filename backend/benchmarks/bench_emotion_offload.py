@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+감정 분석 오프로드 벤치마크
+긴 텍스트(5000자) 분석이 계속 들어오는 동안 짧은 요청의 응답 지연(p50/p99)을
+실행 모드(inline / thread / process)별로 비교
+
+실행: python benchmarks/bench_emotion_offload.py [측정 시간(초)]
+"""
+
+import asyncio
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+# backend 디렉토리를 Python 경로에 추가
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from services.emotion_analyzer import EmotionAnalyzer, _init_analysis_worker
+from utils.offload_executor import OffloadExecutor
+from bench_emotion_analyzer import build_corpus
+
+PROBE_INTERVAL = 0.005  # 짧은 요청 도착 간격 (초)
+HEAVY_CONCURRENCY = 2   # 동시에 처리 중인 긴 분석 요청 수
+POOL_WORKERS = 2
+
+
+def percentile(values: List[float], ratio: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * ratio))]
+
+
+async def run_scenario(
+    analyzer: EmotionAnalyzer,
+    short_texts: List[str],
+    long_texts: List[str],
+    duration: float,
+    with_load: bool
+) -> Dict[str, float]:
+    """짧은 요청을 고정 간격으로 도착시키고 (도착 예정 시각 → 완료) 지연을 측정"""
+    latencies: List[float] = []
+    heavy_done = 0
+    stop = asyncio.Event()
+
+    async def handle_short(text: str, arrival: float):
+        await analyzer.analyze(text)
+        latencies.append(time.perf_counter() - arrival)
+
+    async def heavy_worker(offset: int):
+        nonlocal heavy_done
+        index = offset
+        while not stop.is_set():
+            await analyzer.analyze(long_texts[index % len(long_texts)])
+            heavy_done += 1
+            index += HEAVY_CONCURRENCY
+            await asyncio.sleep(0)  # 다음 요청은 별도 도착으로 간주
+
+    heavy_tasks = [asyncio.create_task(heavy_worker(i)) for i in range(HEAVY_CONCURRENCY)] if with_load else []
+
+    # 개방형 부하: 이벤트 루프가 막혀 늦게 깨어나도 도착 시각은 예정대로 계산
+    start = time.perf_counter()
+    probes = []
+    count = int(duration / PROBE_INTERVAL)
+    for i in range(count):
+        arrival = start + i * PROBE_INTERVAL
+        delay = arrival - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        probes.append(asyncio.create_task(handle_short(short_texts[i % len(short_texts)], arrival)))
+    await asyncio.gather(*probes)
+    elapsed = time.perf_counter() - start
+
+    stop.set()
+    await asyncio.gather(*heavy_tasks)
+
+    return {
+        "p50": percentile(latencies, 0.50) * 1000,
+        "p99": percentile(latencies, 0.99) * 1000,
+        "max": max(latencies) * 1000,
+        "mean": statistics.mean(latencies) * 1000,
+        "heavy_per_sec": heavy_done / elapsed
+    }
+
+
+def configure(analyzer: EmotionAnalyzer, mode: str) -> Optional[OffloadExecutor]:
+    """분석기 실행 모드 전환 (설정값 대신 벤치마크에서 직접 지정)"""
+    analyzer.shutdown_executor()
+    analyzer.executor = None
+    if mode != "inline":
+        analyzer.executor = OffloadExecutor(
+            mode=mode,
+            max_workers=POOL_WORKERS,
+            initializer=_init_analysis_worker,
+            name=f"bench-{mode}"
+        )
+        analyzer.start_executor()
+    return analyzer.executor
+
+
+async def main():
+    duration = float(sys.argv[1]) if len(sys.argv) > 1 else 3.0
+    analyzer = EmotionAnalyzer()
+    analyzer.analysis_cache = None  # 반복 측정이 캐시 적중으로 왜곡되지 않도록 비활성화
+
+    short_texts = build_corpus(analyzer, 40, 200, seed=1)
+    long_texts = build_corpus(analyzer, 5000, 20, seed=2)
+
+    print("감정 분석 오프로드 벤치마크")
+    print(f"짧은 요청(40자) {1 / PROBE_INTERVAL:.0f} req/s + 긴 분석(5000자) 동시 {HEAVY_CONCURRENCY}건, {duration:.0f}초, CPU {os.cpu_count()}개")
+    print("=" * 72)
+
+    configure(analyzer, "inline")
+    baseline = await run_scenario(analyzer, short_texts, long_texts, duration, with_load=False)
+    print(
+        f"{'부하 없음':<12} | p50 {baseline['p50']:7.2f}ms | p99 {baseline['p99']:7.2f}ms | "
+        f"max {baseline['max']:7.2f}ms |"
+    )
+
+    for mode in ("inline", "thread", "process"):
+        executor = configure(analyzer, mode)
+        result = await run_scenario(analyzer, short_texts, long_texts, duration, with_load=True)
+        peak = executor.get_stats()["peak_in_flight"] if executor else 0
+        print(
+            f"{mode:<12} | p50 {result['p50']:7.2f}ms | p99 {result['p99']:7.2f}ms | "
+            f"max {result['max']:7.2f}ms | 긴 분석 {result['heavy_per_sec']:6.1f}/s | 최대 대기열 {peak}"
+        )
+
+    analyzer.shutdown_executor()
+    print("=" * 72)
+    print("참고: thread 모드는 GIL을 공유하므로 루프가 막히지는 않지만 switch interval 만큼 지연이 남고,")
+    print("      process 모드는 워커에 사전이 미리 적재되어 호출당 텍스트/결과 직렬화 비용만 추가됩니다")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
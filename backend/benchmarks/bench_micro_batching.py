@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+마이크로 배치 스케줄러 부하 벤치마크
+동시 접속 수를 늘려 가며 배치 크기별 처리량/지연 곡선을 측정 (각 클라이언트는 응답을 받으면 바로 다음 요청)
+
+  - 기본: 배치 비용 모델 대역(고정 비용 + 요청당 비용, 모델 1개를 순차 사용)으로 스케줄러 동작만 측정
+          CPU 생성은 가중치 읽기가 지배적이라 배치 크기가 늘어도 호출당 시간이 조금만 증가하는 특성을 흉내냄
+  - --model 지정 시: 실제 EFTAIEngine 로드 후 generate_response 로 측정 (transformers/torch 필요)
+
+실행: python benchmarks/bench_micro_batching.py [--batch-sizes 1,4,8] [--concurrency 1,2,4,8,16]
+      python benchmarks/bench_micro_batching.py --model microsoft/DialoGPT-medium --requests 4
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, List
+
+# backend 디렉토리를 Python 경로에 추가
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from config.settings import get_settings
+from utils.micro_batcher import MicroBatcher
+
+settings = get_settings()
+
+PROMPTS = [
+    "요즘 회사 일 때문에 너무 스트레스를 받아요",
+    "시험이 다가오니까 불안해서 잠이 안 와요",
+    "친구랑 싸워서 마음이 너무 속상해요",
+    "가족들이 제 마음을 몰라줘서 외로워요",
+]
+
+
+class BatchCostStandIn:
+    """배치 비용 모델 대역 (배치 1회 = 고정 비용 + 요청당 비용, 실행 중 GIL 해제)"""
+
+    def __init__(self, fixed_ms: float, per_item_ms: float):
+        self.fixed_ms = fixed_ms
+        self.per_item_ms = per_item_ms
+
+    def run_batch(self, key, prompts: List[str]) -> List[str]:
+        time.sleep((self.fixed_ms + self.per_item_ms * len(prompts)) / 1000)
+        return [f"응답: {prompt}" for prompt in prompts]
+
+
+async def run_load(generate: Callable[[str], Awaitable[str]], concurrency: int, requests_per_client: int) -> Dict:
+    """폐쇄 루프 부하: 클라이언트마다 응답을 받으면 바로 다음 요청"""
+    latencies: List[float] = []
+
+    async def client(index: int):
+        for turn in range(requests_per_client):
+            start = time.perf_counter()
+            await generate(PROMPTS[(index + turn) % len(PROMPTS)])
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(client(index) for index in range(concurrency)))
+    elapsed = time.perf_counter() - start
+
+    ordered = sorted(latencies)
+    return {
+        "throughput": len(latencies) / elapsed,
+        "p50_ms": statistics.median(ordered) * 1000,
+        "p99_ms": ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))] * 1000,
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="마이크로 배치 부하 벤치마크")
+    parser.add_argument("--batch-sizes", default="1,4,8")
+    parser.add_argument("--concurrency", default="1,2,4,8,16")
+    parser.add_argument("--window-ms", type=float, default=settings.BATCH_WINDOW_MS)
+    parser.add_argument("--requests", type=int, default=10, help="클라이언트당 요청 수")
+    parser.add_argument("--fixed-ms", type=float, default=80.0, help="대역: 배치 1회 고정 비용")
+    parser.add_argument("--per-item-ms", type=float, default=12.0, help="대역: 배치 내 요청당 추가 비용")
+    parser.add_argument("--model", default=None, help="실제 모델로 측정 (예: microsoft/DialoGPT-medium)")
+    parser.add_argument("--max-tokens", type=int, default=40)
+    args = parser.parse_args()
+
+    batch_sizes = [int(value) for value in args.batch_sizes.split(",")]
+    concurrency_levels = [int(value) for value in args.concurrency.split(",")]
+
+    engine = None
+    if args.model:
+        from services.ai_engine import EFTAIEngine
+        engine = EFTAIEngine(model_name=args.model, device=settings.DEVICE)
+        await engine.initialize()
+        target = f"모델 {args.model} (최대 {args.max_tokens}토큰)"
+    else:
+        stand_in = BatchCostStandIn(args.fixed_ms, args.per_item_ms)
+        target = f"배치 비용 대역 (고정 {args.fixed_ms}ms + 요청당 {args.per_item_ms}ms)"
+
+    print(f"마이크로 배치 부하 벤치마크 - {target}, 대기 창 {args.window_ms}ms")
+    print("=" * 78)
+    print(f"{'배치 크기':>8} {'동시 접속':>8} | {'처리량(req/s)':>14} {'p50(ms)':>10} {'p99(ms)':>10} | {'평균 배치':>8}")
+    print("-" * 78)
+
+    for batch_size in batch_sizes:
+        for concurrency in concurrency_levels:
+            if engine is not None:
+                # 배치 크기 1은 기존 경로 (요청마다 run_in_executor)
+                if engine.batcher is not None:
+                    await engine.batcher.shutdown()
+                engine.batcher = None if batch_size == 1 else MicroBatcher(
+                    engine._generate_batch_sync, batch_size, args.window_ms, name="bench"
+                )
+                batcher = engine.batcher
+                generate = lambda prompt: engine.generate_response(prompt, max_tokens=args.max_tokens)
+            else:
+                batcher = MicroBatcher(
+                    stand_in.run_batch, batch_size, args.window_ms if batch_size > 1 else 0.0, name="bench"
+                )
+                generate = lambda prompt, batcher=batcher: batcher.submit(("default",), prompt)
+
+            result = await run_load(generate, concurrency, args.requests)
+            avg_batch = batcher.get_stats()["avg_batch_size"] if batcher else 1.0
+            print(
+                f"{batch_size:>8} {concurrency:>8} | {result['throughput']:>14.1f} "
+                f"{result['p50_ms']:>10.1f} {result['p99_ms']:>10.1f} | {avg_batch:>8.2f}"
+            )
+            if engine is None:
+                await batcher.shutdown()
+        print("-" * 78)
+
+    if engine is not None:
+        await engine.cleanup()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+ONNX Runtime 백엔드 벤치마크
+무료 티어 모델을 PyTorch eager / ONNX Runtime(CPU) 백엔드로 각각 로드해 prefill 시간, 토큰당 디코딩 시간,
+토큰/초를 비교하고, 탐욕 디코딩 결과 일치와 generate_stream 인터페이스 동작을 확인
+(transformers/torch, optimum[onnxruntime] 및 로컬 모델 필요 - 첫 실행은 ONNX 내보내기/최적화 포함)
+
+실행: python benchmarks/bench_onnx_backend.py [--model microsoft/DialoGPT-medium] [--runs 3] [--max-tokens 48]
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# backend 디렉토리를 Python 경로에 추가
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+import torch
+
+from config.settings import get_settings
+from services.ai_engine import EFTAIEngine
+
+settings = get_settings()
+
+MESSAGES = [
+    "요즘 회사 일 때문에 너무 스트레스를 받고 잠도 잘 못 자요.",
+    "시험이 다가오니까 불안해서 아무것도 손에 안 잡혀요.",
+    "I feel anxious about my presentation tomorrow and can't focus.",
+    "Lately I've been feeling lonely even when I'm with friends.",
+]
+
+
+def timed_generate(engine: EFTAIEngine, input_ids, new_tokens: int) -> float:
+    """고정 길이 탐욕 디코딩 시간 (초)"""
+    start = time.perf_counter()
+    with torch.inference_mode():
+        engine.model.generate(
+            input_ids, attention_mask=torch.ones_like(input_ids),
+            max_new_tokens=new_tokens, min_new_tokens=new_tokens,
+            do_sample=False, pad_token_id=engine.tokenizer.eos_token_id
+        )
+    return time.perf_counter() - start
+
+
+async def measure(engine: EFTAIEngine, args) -> dict:
+    inputs = [
+        torch.tensor([engine.tokenizer.encode(engine._format_prompt(message))], dtype=torch.long)
+        for message in MESSAGES
+    ]
+    timed_generate(engine, inputs[0], 4)  # 워밍업 (세션/커널 첫 실행 비용 제외)
+
+    # 1. 1토큰 생성 = prefill, (N토큰 - 1토큰) / (N - 1) = 토큰당 디코딩
+    prefill, per_token = [], []
+    for _ in range(args.runs):
+        for input_ids in inputs:
+            first = timed_generate(engine, input_ids, 1)
+            full = timed_generate(engine, input_ids, args.max_tokens)
+            prefill.append(first)
+            per_token.append((full - first) / (args.max_tokens - 1))
+
+    # 2. 탐욕 디코딩 결과
+    greedy = []
+    with torch.inference_mode():
+        for input_ids in inputs:
+            output = engine.model.generate(
+                input_ids, attention_mask=torch.ones_like(input_ids),
+                max_new_tokens=args.max_tokens, do_sample=False, pad_token_id=engine.tokenizer.eos_token_id
+            )
+            greedy.append(output[0, input_ids.shape[1]:].tolist())
+
+    # 3. 서버와 같은 스트리밍 인터페이스
+    start, first_chunk, chunks = time.perf_counter(), None, 0
+    async for chunk in engine.generate_stream(MESSAGES[0], None, max_tokens=args.max_tokens):
+        if chunk["chunk_type"] == "text":
+            first_chunk = first_chunk or time.perf_counter() - start
+            chunks += 1
+
+    return {
+        "prefill_ms": statistics.median(prefill) * 1000,
+        "per_token_ms": statistics.median(per_token) * 1000,
+        "greedy": greedy,
+        "stream_first_chunk_ms": (first_chunk or 0.0) * 1000,
+        "stream_chunks": chunks,
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="ONNX Runtime 백엔드 벤치마크")
+    parser.add_argument("--model", default=settings.FREE_TIER_MODEL)
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--max-tokens", type=int, default=48)
+    args = parser.parse_args()
+
+    results = {}
+    for backend in ("torch", "onnx"):
+        start = time.perf_counter()
+        engine = EFTAIEngine(model_name=args.model, device="cpu", backend=backend)
+        await engine.initialize()
+        load_seconds = time.perf_counter() - start
+        results[backend] = {"load_seconds": load_seconds, **await measure(engine, args)}
+        await engine.cleanup()
+
+    baseline = results["torch"]
+    print(f"\nONNX Runtime 백엔드 벤치마크 (모델: {args.model}, {args.max_tokens}토큰 탐욕 디코딩, "
+          f"{torch.get_num_threads()} 스레드)")
+    print("=" * 92)
+    print(f"{'백엔드':<8} {'로드(초)':>9} {'prefill(ms)':>12} {'토큰당(ms)':>11} {'토큰/초':>9} {'속도 배율':>9} "
+          f"{'스트림 첫 청크(ms)':>18}")
+    print("-" * 92)
+    for backend, result in results.items():
+        print(
+            f"{backend:<8} {result['load_seconds']:>9.1f} {result['prefill_ms']:>12.1f} "
+            f"{result['per_token_ms']:>11.2f} {1000 / result['per_token_ms']:>9.1f} "
+            f"{baseline['per_token_ms'] / result['per_token_ms']:>8.2f}x {result['stream_first_chunk_ms']:>18.1f}"
+        )
+    print("=" * 92)
+
+    same = sum(1 for a, b in zip(baseline["greedy"], results["onnx"]["greedy"]) if a == b)
+    print(f"탐욕 디코딩 결과 일치: {same}/{len(MESSAGES)}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
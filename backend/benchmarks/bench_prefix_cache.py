@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""
+프리픽스 캐시 친화 프롬프트 레이아웃 벤치마크
+로컬 OpenAI 호환 대역 서버(vLLM 자동 프리픽스 캐시 모사)에 레이아웃별로 같은 대화를 보내
+프리픽스 적중률과 첫 토큰 지연(TTFT)을 비교 (모델 로드 없음)
+
+  - interleaved: 기존 로컬 엔드포인트 방식 (고정/가변 구간이 섞인 한 덩어리 프롬프트)
+  - messages:    고정 system 메시지 + 가변 user 메시지 (build_chat_messages)
+  - simple:      기존 /api/chat/completion 방식 (한 줄 system + 원문, EFT 맥락 없음 - 참고용)
+
+대역 서버는 1글자를 1토큰으로 보고 16토큰 블록 단위 해시 체인으로 프리픽스 캐시를 흉내 내며,
+캐시되지 않은 토큰 수에 비례해 prefill 지연을 준 뒤 SSE로 응답을 스트리밍합니다.
+
+실행: python benchmarks/bench_prefix_cache.py [--prefill-us 50] [--sessions 30] [--turns 4]
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import sys
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, List
+
+import httpx
+
+# backend 디렉토리를 Python 경로에 추가
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from services.emotion_analyzer import EmotionAnalyzer
+from services.prompt_manager import EFTPromptManager
+from services.session_emotion import SessionEmotionStore
+from models.chat_models import ConversationMessage
+from bench_emotion_analyzer import build_corpus
+
+SIMPLE_SYSTEM_PROMPT = "You are a helpful EFT counselor assistant specialized in Korean emotional support."
+
+
+class PrefixCachingStandIn:
+    """OpenAI 호환 /v1/chat/completions 대역 서버 (자동 프리픽스 캐시 모사)"""
+
+    def __init__(self, prefill_us: float, decode_ms: float, output_tokens: int,
+                 block_size: int = 16, max_blocks: int = 8192):
+        self.prefill_us = prefill_us
+        self.decode_ms = decode_ms
+        self.output_tokens = output_tokens
+        self.block_size = block_size
+        self.max_blocks = max_blocks
+        self.blocks: "OrderedDict[int, None]" = OrderedDict()
+        self.engine_lock = asyncio.Lock()  # 단일 GPU - prefill은 한 번에 하나씩
+        self.server = None
+
+    def reset(self):
+        self.blocks.clear()
+
+    def _apply_prefix_cache(self, prompt: str) -> int:
+        """캐시된 앞부분 토큰 수 계산 후 전체 블록 등록 (블록 해시는 앞 블록 해시와 연쇄)"""
+        cached_tokens, parent, hit = 0, 0, True
+        for start in range(0, len(prompt) - self.block_size + 1, self.block_size):
+            parent = hash((parent, prompt[start:start + self.block_size]))
+            if hit and parent in self.blocks:
+                cached_tokens += self.block_size
+                self.blocks.move_to_end(parent)
+                continue
+            hit = False
+            self.blocks[parent] = None
+            if len(self.blocks) > self.max_blocks:
+                self.blocks.popitem(last=False)
+        return cached_tokens
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                headers = {}
+                while (line := await reader.readline()) not in (b"\r\n", b""):
+                    name, _, value = line.decode().partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                body = json.loads(await reader.readexactly(int(headers.get("content-length", 0))))
+
+                # 채팅 템플릿 적용 (역할 태그 + 내용)
+                prompt = "".join(f"<|{m['role']}|>{m['content']}" for m in body["messages"]) + "<|assistant|>"
+
+                writer.write(
+                    b"HTTP/1.1 200 OK\r\ncontent-type: text/event-stream\r\n"
+                    b"transfer-encoding: chunked\r\n\r\n"
+                )
+
+                async with self.engine_lock:
+                    cached_tokens = self._apply_prefix_cache(prompt)
+                    await asyncio.sleep((len(prompt) - cached_tokens) * self.prefill_us / 1e6)
+
+                for index in range(self.output_tokens):
+                    if index:
+                        await asyncio.sleep(self.decode_ms / 1000)
+                    self._send_event(writer, {"choices": [{"index": 0, "delta": {"content": "네"}}]})
+                    await writer.drain()
+
+                self._send_event(writer, {
+                    "choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}],
+                    "usage": {
+                        "prompt_tokens": len(prompt),
+                        "completion_tokens": self.output_tokens,
+                        "prompt_tokens_details": {"cached_tokens": cached_tokens}
+                    }
+                })
+                self._send_chunk(writer, b"data: [DONE]\n\n")
+                self._send_chunk(writer, b"")
+                await writer.drain()
+        except (ConnectionResetError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    def _send_event(self, writer, payload: Dict):
+        self._send_chunk(writer, f"data: {json.dumps(payload, ensure_ascii=False)}\n\n".encode())
+
+    @staticmethod
+    def _send_chunk(writer, data: bytes):
+        writer.write(f"{len(data):x}\r\n".encode() + data + b"\r\n")
+
+    async def start(self) -> int:
+        self.server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        return self.server.sockets[0].getsockname()[1]
+
+    async def stop(self):
+        self.server.close()
+        await self.server.wait_closed()
+
+
+def build_workload(analyzer: EmotionAnalyzer, sessions: int, turns: int, seed: int = 11) -> List[Dict]:
+    """세션별 턴 입력을 섞어 도착 순서 구성 (티어 혼합, 대화 이력 누적)"""
+    rng = random.Random(seed)
+    store = SessionEmotionStore()
+    queues = []
+    for session in range(sessions):
+        tier = "premium" if session % 3 == 0 else "free"
+        messages = build_corpus(analyzer, rng.choice([80, 300, 800]), turns, seed=seed + session)
+        replies = build_corpus(analyzer, 150, turns, seed=seed + 1000 + session)
+        history: List[ConversationMessage] = []
+        turns_for_session = []
+        for turn, message in enumerate(messages):
+            emotion = analyzer._analyze_cleaned_text(analyzer._preprocess_text(message))
+            turns_for_session.append({
+                "user_message": message,
+                "emotion_state": emotion,
+                "conversation_history": list(history),
+                "tier": tier,
+                "session_state": store.update(f"bench-{session}", emotion)
+            })
+            history += [
+                ConversationMessage(role="user", content=message),
+                ConversationMessage(role="assistant", content=replies[turn])
+            ]
+        queues.append(turns_for_session)
+
+    # 세션 순서는 유지하면서 서로 다른 세션의 턴을 섞음
+    arrivals = []
+    while any(queues):
+        queue = rng.choice([queue for queue in queues if queue])
+        arrivals.append(queue.pop(0))
+    return arrivals
+
+
+def build_messages(manager: EFTPromptManager, layout: str, payload: Dict):
+    if layout == "messages":
+        chat_prompt = manager.build_chat_messages(**payload)
+        return chat_prompt.messages, chat_prompt.prefix_hash
+    if layout == "interleaved":
+        return [
+            {"role": "system", "content": SIMPLE_SYSTEM_PROMPT},
+            {"role": "user", "content": manager.build_eft_prompt(**payload)}
+        ], None
+    return [
+        {"role": "system", "content": SIMPLE_SYSTEM_PROMPT},
+        {"role": "user", "content": payload["user_message"]}
+    ], None
+
+
+async def run_layout(client: httpx.AsyncClient, base_url: str, manager, layout: str, workload: List[Dict]) -> Dict:
+    ttfts, prompt_tokens, cached_tokens, prefix_hashes = [], 0, 0, set()
+    for payload in workload:
+        messages, prefix_hash = build_messages(manager, layout, payload)
+        prefix_hashes.add(prefix_hash)
+
+        start = time.perf_counter()
+        first_token_at = None
+        async with client.stream(
+            "POST", f"{base_url}/v1/chat/completions",
+            json={"model": "stand-in", "messages": messages, "stream": True, "max_tokens": 8}
+        ) as response:
+            async for line in response.aiter_lines():
+                if not line.startswith("data: ") or line == "data: [DONE]":
+                    continue
+                event = json.loads(line[6:])
+                if first_token_at is None and event["choices"][0]["delta"].get("content"):
+                    first_token_at = time.perf_counter()
+                if "usage" in event:
+                    prompt_tokens += event["usage"]["prompt_tokens"]
+                    cached_tokens += event["usage"]["prompt_tokens_details"]["cached_tokens"]
+        ttfts.append(first_token_at - start)
+
+    ordered = sorted(ttfts)
+    return {
+        "requests": len(workload),
+        "avg_prompt_tokens": prompt_tokens / len(workload),
+        "hit_rate": cached_tokens / prompt_tokens if prompt_tokens else 0.0,
+        "ttft_p50_ms": statistics.median(ordered) * 1000,
+        "ttft_p99_ms": ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))] * 1000,
+        "prefixes": len(prefix_hashes - {None}),
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="프리픽스 캐시 친화 레이아웃 벤치마크")
+    parser.add_argument("--prefill-us", type=float, default=50.0, help="캐시되지 않은 토큰당 prefill 시간 (us)")
+    parser.add_argument("--decode-ms", type=float, default=2.0, help="토큰당 decode 시간 (ms)")
+    parser.add_argument("--sessions", type=int, default=30)
+    parser.add_argument("--turns", type=int, default=4)
+    args = parser.parse_args()
+
+    analyzer = EmotionAnalyzer()
+    analyzer.analysis_cache = None
+    manager = EFTPromptManager()
+    workload = build_workload(analyzer, args.sessions, args.turns)
+
+    stand_in = PrefixCachingStandIn(args.prefill_us, args.decode_ms, output_tokens=8)
+    port = await stand_in.start()
+    base_url = f"http://127.0.0.1:{port}"
+
+    print(f"프리픽스 캐시 레이아웃 벤치마크 ({args.sessions}세션 x {args.turns}턴, prefill {args.prefill_us}us/토큰)")
+    print("=" * 92)
+    print(f"{'레이아웃':<12} {'요청':>6} {'평균 프롬프트 토큰':>18} {'프리픽스 적중률':>16} "
+          f"{'TTFT p50(ms)':>13} {'TTFT p99(ms)':>13} {'프리픽스':>8}")
+    print("-" * 92)
+
+    async with httpx.AsyncClient(timeout=60.0) as client:
+        for layout in ("interleaved", "messages", "simple"):
+            stand_in.reset()  # 레이아웃마다 빈 캐시에서 시작
+            result = await run_layout(client, base_url, manager, layout, workload)
+            print(
+                f"{layout:<12} {result['requests']:>6} {result['avg_prompt_tokens']:>18.0f} "
+                f"{result['hit_rate']:>16.1%} {result['ttft_p50_ms']:>13.1f} {result['ttft_p99_ms']:>13.1f} "
+                f"{result['prefixes'] or '-':>8}"
+            )
+
+    await stand_in.stop()
+    print("=" * 92)
+    print("simple 레이아웃은 EFT 맥락 없이 원문만 보내는 기존 프록시 방식 (프롬프트 크기 비교용)")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+프롬프트 프리픽스 KV 캐시 벤치마크
+티어별 EFT 프롬프트(토큰 예산 조립)를 프리픽스 KV 캐시 없이/있이 생성해 첫 토큰 지연(TTFT, prefill 지배)과
+전체 생성 시간을 비교하고, 탐욕 디코딩 결과가 같은지 확인 (transformers/torch 및 로컬 모델 필요)
+
+실행: python benchmarks/bench_prefix_kv_cache.py [--model meta-llama/Llama-3.2-1B-Instruct] [--runs 5] [--max-tokens 32]
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# backend 디렉토리를 Python 경로에 추가
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from config.settings import get_settings
+from services.ai_engine import EFTAIEngine
+from services.emotion_analyzer import EmotionAnalyzer
+from services.prompt_manager import EFTPromptManager
+
+settings = get_settings()
+
+MESSAGES = [
+    "요즘 회사 일 때문에 너무 스트레스를 받고 잠도 잘 못 자요.",
+    "시험이 다가오니까 불안해서 아무것도 손에 안 잡혀요.",
+    "친구랑 싸워서 마음이 너무 속상하고 외로워요.",
+]
+
+
+async def measure(engine: EFTAIEngine, prompt, max_tokens: int) -> dict:
+    """스트리밍으로 TTFT/전체 시간 측정 (첫 텍스트 청크 = prefill + 첫 토큰)"""
+    start = time.perf_counter()
+    first_chunk, text = None, ""
+    async for chunk in engine.generate_stream("", None, prompt=prompt, max_tokens=max_tokens, temperature=1.0):
+        if chunk["chunk_type"] == "text":
+            first_chunk = first_chunk or time.perf_counter() - start
+            text += chunk["content"]
+    return {"ttft": first_chunk or 0.0, "total": time.perf_counter() - start, "text": text}
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="프롬프트 프리픽스 KV 캐시 벤치마크")
+    parser.add_argument("--model", default=settings.PREMIUM_TIER_MODEL)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--max-tokens", type=int, default=32)
+    args = parser.parse_args()
+
+    engine = EFTAIEngine(model_name=args.model, device=settings.DEVICE)
+    await engine.initialize()
+    # 출력 비교를 위해 탐욕 디코딩 사용
+    generation_params = engine._generation_params
+    engine._generation_params = lambda *params: {**generation_params(*params), "do_sample": False}
+
+    analyzer = EmotionAnalyzer()
+    manager = EFTPromptManager()
+    tiers = ("free", "premium", "enterprise")
+    prompts = {}
+    for tier in tiers:
+        prompts[tier] = []
+        for message in MESSAGES:
+            emotion = await analyzer.analyze(message)
+            prompts[tier].append(manager.build_eft_prompt(message, emotion, tier=tier, token_budget=engine.token_budget))
+
+    # 워밍업 (첫 호출 커널/캐시 준비 비용 제외)
+    await measure(engine, prompts["free"][0], 4)
+
+    results = {}
+    texts = {}
+    for label, cached in (("캐시 없음", False), ("프리픽스 캐시", True)):
+        if cached:
+            await engine.warm_prefix_cache(manager.get_static_prefix(tier) for tier in tiers)
+        elif engine.prefix_cache:
+            engine.prefix_cache.clear()
+        for tier in tiers:
+            runs = []
+            for _ in range(args.runs):
+                for index, prompt in enumerate(prompts[tier]):
+                    run = await measure(engine, prompt, args.max_tokens)
+                    runs.append(run)
+                    texts.setdefault((tier, index), {})[label] = run["text"]
+            results[(tier, label)] = runs
+
+    print(f"프롬프트 프리픽스 KV 캐시 벤치마크 (모델: {args.model}, 최대 {args.max_tokens}토큰, {args.runs}회)")
+    print("=" * 80)
+    print(f"{'티어':<12} {'방식':<14} {'입력 토큰':>9} {'TTFT p50(ms)':>14} {'전체 p50(ms)':>14}")
+    print("-" * 80)
+    for tier in tiers:
+        prompt_tokens = statistics.mean(prompt.prompt_tokens for prompt in prompts[tier])
+        for label in ("캐시 없음", "프리픽스 캐시"):
+            runs = results[(tier, label)]
+            print(
+                f"{tier:<12} {label:<14} {prompt_tokens:>9.0f} "
+                f"{statistics.median(run['ttft'] for run in runs) * 1000:>14.1f} "
+                f"{statistics.median(run['total'] for run in runs) * 1000:>14.1f}"
+            )
+    print("=" * 80)
+
+    same = sum(1 for outputs in texts.values() if len(set(outputs.values())) == 1)
+    print(f"탐욕 디코딩 결과 일치: {same}/{len(texts)}")
+    if engine.prefix_cache:
+        stats = engine.prefix_cache.get_stats()
+        print(f"프리픽스 {stats['prefixes']}개, {stats['cache']['bytes'] / 1024 ** 2:.1f}MB, "
+              f"재사용 prefill 토큰 {stats['reused_prefill_tokens']}")
+
+    await engine.cleanup()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+프롬프트 조각 사전 렌더링 벤치마크
+요청마다 모든 구간을 렌더링하던 기존 build_eft_prompt 와 미리 렌더링한 조각을 결합하는 방식 비교
+(대화 이력 20개 + 2000자 메시지의 무거운 입력 기준, 모델 로드 없음)
+
+실행: python benchmarks/bench_prompt_fragments.py
+"""
+
+import sys
+import time
+from pathlib import Path
+from typing import List
+
+# backend 디렉토리를 Python 경로에 추가
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from services.emotion_analyzer import EmotionAnalyzer
+from services.prompt_manager import EFTPromptManager, PromptStyle, PROMPT_TIERS
+from services.session_emotion import SessionEmotionStore
+from models.chat_models import EmotionAnalysis, EmotionType, UserProfile
+from bench_suite import build_suite_corpus
+
+
+class LegacyPromptManager(EFTPromptManager):
+    """기존 build_eft_prompt 경로 (요청마다 티어/감정/스타일 구간 렌더링) - 비교 기준용"""
+
+    def legacy_build_eft_prompt(
+        self,
+        user_message,
+        emotion_state,
+        conversation_history=None,
+        user_profile=None,
+        style=PromptStyle.EMPATHETIC,
+        tier="free",
+        session_state=None
+    ) -> str:
+        system_section = self._get_tier_system_prompt(tier)
+        profile_context = self._build_profile_context(user_profile)
+        emotion_context = self._build_emotion_context(emotion_state, session_state)
+        history_context = self._build_history_context(conversation_history)
+        safety_context = self._legacy_safety_context(user_message)
+        eft_context = self._legacy_eft_context(emotion_state)
+        culture_context = self._legacy_culture_context(user_message)
+        style_guide = self._legacy_style_guide(style, emotion_state)
+        tier_guide = self._build_tier_guide(tier)
+
+        full_prompt = f"""
+{system_section}
+
+{profile_context}
+
+{emotion_context}
+
+{history_context}
+
+{safety_context}
+
+{eft_context}
+
+{culture_context}
+
+{style_guide}
+
+{tier_guide}
+
+📝 **사용자 메시지**: "{user_message}"
+
+🎯 **응답 요구사항**:
+- 위 감정 분석을 바탕으로 공감적 응답 생성
+- 적절한 EFT 기법 추천 (구체적인 탭핑 포인트와 구문 포함)
+- 한국 문화 맥락 고려
+- {self._get_tier_response_length(tier)} 내외의 따뜻하고 실용적인 응답
+- 필요시 후속 질문이나 행동 제안
+
+지금부터 EFT 전문 상담사로서 응답해 주세요:
+"""
+        return full_prompt.strip()
+
+    def _legacy_safety_context(self, message: str) -> str:
+        emergency_detected = any(
+            keyword in message.lower() for keyword in self.safety_guidelines["emergency_keywords"]
+        )
+        professional_needed = any(
+            keyword in message.lower() for keyword in self.safety_guidelines["professional_referral_keywords"]
+        )
+        if emergency_detected:
+            return """
+🚨 **응급상황 감지**: 자해/자살 위험 신호가 감지되었습니다.
+- 즉시 전문기관 안내 필수
+- 따뜻한 지지와 함께 구체적인 도움처 제공
+- EFT 기법보다는 안전 확보 우선
+"""
+        elif professional_needed:
+            return """
+⚠️ **전문가 상담 권장**: 전문적 치료가 필요한 증상이 언급되었습니다.
+- 전문가 상담 권유
+- EFT는 보조적 도구로만 활용
+- 의학적 진단/처방 절대 금지
+"""
+        return "✅ **안전성 체크**: 일반적인 상담 진행 가능"
+
+    def _legacy_culture_context(self, message: str) -> str:
+        cultural_themes = []
+        if any(keyword in message for keyword in ["부모", "엄마", "아빠", "가족", "형제", "자매", "시댁", "처가"]):
+            cultural_themes.append("family_dynamics")
+        if any(keyword in message for keyword in ["회사", "직장", "상사", "동료", "업무", "야근", "승진", "면접"]):
+            cultural_themes.append("work_culture")
+        if any(keyword in message for keyword in ["결혼", "연애", "학벌", "스펙", "취업", "비교", "남들"]):
+            cultural_themes.append("social_pressure")
+        if not cultural_themes:
+            return ""
+        context = "🇰🇷 **한국 문화 고려사항**:\n"
+        for theme in cultural_themes:
+            context += f"- {self.korean_culture_context[theme]['description']}\n"
+        return context
+
+    def _legacy_eft_context(self, emotion: EmotionAnalysis) -> str:
+        techniques = self.eft_technique_database.get(emotion.primary_emotion, [])
+        if not techniques:
+            return "⚡ **EFT 추천**: 기본 감정 조절 기법 적용"
+        best_technique = max(techniques, key=lambda x: x["effectiveness"])
+        return f"""
+⚡ **추천 EFT 기법**: {best_technique["name"]}
+- 탭핑 포인트: {', '.join([point.value for point in best_technique["points"]])}
+- 셋업 구문: "{best_technique["setup_phrase"]}"
+- 리마인더: "{best_technique["reminder"]}"
+- 예상 소요시간: {best_technique["duration"]}분
+- 효과성: {best_technique["effectiveness"]:.0%}
+"""
+
+    def _legacy_style_guide(self, style: PromptStyle, emotion: EmotionAnalysis) -> str:
+        templates = self.emotion_response_templates.get(emotion.primary_emotion, {})
+        base_guide = f"""
+🎨 **응답 스타일 가이드**: {style.value}
+"""
+        if templates:
+            base_guide += f"""
+1. **감정 검증**: {templates.get("validation", "")}
+2. **탐색 질문**: {templates.get("exploration", "")}  
+3. **EFT 연결**: {templates.get("transition", "")}
+"""
+        return base_guide
+
+
+def measure(func, payloads: List[dict], repeat: int) -> float:
+    """입력 1건당 평균 소요 시간 (us)"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for payload in payloads:
+            func(**payload)
+    return (time.perf_counter() - start) * 1e6 / (repeat * len(payloads))
+
+
+def main():
+    analyzer = EmotionAnalyzer()
+    analyzer.analysis_cache = None
+    analyzer.executor = None
+    manager = LegacyPromptManager()
+    session_store = SessionEmotionStore()
+    profile = UserProfile(eft_experience_level="intermediate", previous_sessions=4)
+
+    corpus = build_suite_corpus(analyzer)
+    analyze = lambda text: analyzer._analyze_cleaned_text(analyzer._preprocess_text(text))
+
+    # 무거운 입력: 2000자 메시지 + 대화 이력 20개 + 세션 감정 흐름 + 프로필
+    heavy_payloads = []
+    for index, (message, history) in enumerate(corpus["history"]):
+        session_state = None
+        for turn in history[::2]:
+            session_state = session_store.update(f"bench-{index}", analyze(turn.content))
+        heavy_payloads.append({
+            "user_message": message,
+            "emotion_state": analyze(message),
+            "conversation_history": history,
+            "user_profile": profile,
+            "session_state": session_state
+        })
+
+    # 결과 동일성 검증: 모든 (티어 × 감정 × 스타일) 조합 + 알 수 없는 티어 + 안전성 분기
+    message, history = corpus["history"][0]
+    messages = [
+        message, message + " 요즘은 죽고싶다는 생각도 들어요", message + " 우울증 진단을 받았어요",
+        "회사 상사 때문에 힘들고 부모님은 결혼하라고 해요", "야근이 너무 많아요"
+    ]
+    for tier in PROMPT_TIERS + ("unknown",):
+        for emotion_type in EmotionType:
+            for style in PromptStyle:
+                for message in messages:
+                    payload = {
+                        "user_message": message,
+                        "emotion_state": EmotionAnalysis(
+                            primary_emotion=emotion_type, intensity=0.6, confidence=0.7,
+                            emotional_keywords=["힘들", "걱정"]
+                        ),
+                        "conversation_history": history,
+                        "style": style,
+                        "tier": tier
+                    }
+                    if manager.legacy_build_eft_prompt(**payload) != manager.build_eft_prompt(**payload):
+                        print(f"❌ 결과 불일치: {tier} / {emotion_type.value} / {style.value}")
+                        sys.exit(1)
+    for payload in heavy_payloads:
+        for tier in PROMPT_TIERS:
+            if manager.legacy_build_eft_prompt(**payload, tier=tier) != manager.build_eft_prompt(**payload, tier=tier):
+                print(f"❌ 결과 불일치 (무거운 입력, {tier})")
+                sys.exit(1)
+
+    print("프롬프트 생성 벤치마크 (요청마다 렌더링 vs 사전 렌더링 조각 결합)")
+    print(f"사전 렌더링 조각: {len(manager.prompt_fragments)}개 (티어 × 감정 × 스타일)")
+    print("=" * 72)
+
+    for tier in PROMPT_TIERS:
+        payloads = [{**payload, "tier": tier} for payload in heavy_payloads]
+        legacy_us = measure(manager.legacy_build_eft_prompt, payloads, 200)
+        current_us = measure(manager.build_eft_prompt, payloads, 200)
+        print(
+            f"{tier:<10} 무거운 입력 x {len(payloads):<3} | 기존 {legacy_us:8.1f}us | "
+            f"현재 {current_us:8.1f}us | {legacy_us / current_us:5.2f}x"
+        )
+
+    print("=" * 72)
+    print("✅ 모든 조합에서 기존 build_eft_prompt 결과와 동일")
+
+
+if __name__ == "__main__":
+    main()
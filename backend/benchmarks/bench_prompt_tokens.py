@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+프롬프트 토큰 예산 벤치마크
+기존 방식(전체 프롬프트 토큰화 → 뒤에서 자르기 → 디코딩 → 파이프라인 재토큰화)과
+구간별 토큰 ID 캐시 + 우선순위 조립(토큰 ID 그대로 전달)의 토크나이저 사용량/지연 비교
+
+실행: python benchmarks/bench_prompt_tokens.py [--tokenizer microsoft/DialoGPT-medium]
+  - transformers 와 로컬 캐시된 토크나이저가 있으면 실제 토크나이저 사용
+  - 없으면 UTF-8 바이트 단위 기준 토크나이저로 측정 (토큰 수는 근사치, 토큰화 횟수/글자 수 비교용)
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+# backend 디렉토리를 Python 경로에 추가
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from config.settings import get_settings
+from services.emotion_analyzer import EmotionAnalyzer
+from services.prompt_manager import EFTPromptManager
+from services.prompt_tokens import TokenBudget
+from services.session_emotion import SessionEmotionStore
+from models.chat_models import ConversationMessage
+from bench_emotion_analyzer import build_corpus
+
+settings = get_settings()
+
+
+class ByteLevelTokenizer:
+    """UTF-8 바이트 단위 기준 토크나이저 (병합 규칙 없는 byte-level BPE 근사)"""
+
+    eos_token = "\n"
+
+    def encode(self, text: str, add_special_tokens: bool = True) -> List[int]:
+        return list(text.encode("utf-8"))
+
+    def decode(self, token_ids, skip_special_tokens: bool = True) -> str:
+        return bytes(token_ids).decode("utf-8", errors="ignore")
+
+
+class CountingTokenizer:
+    """토크나이저 호출 횟수/처리 글자 수/소요 시간 집계"""
+
+    def __init__(self, tokenizer):
+        self.tokenizer = tokenizer
+        self.eos_token = tokenizer.eos_token
+        self.reset()
+
+    def reset(self):
+        self.calls = 0
+        self.chars = 0
+        self.seconds = 0.0
+
+    def encode(self, text: str, add_special_tokens: bool = True) -> List[int]:
+        start = time.perf_counter()
+        token_ids = list(self.tokenizer.encode(text, add_special_tokens=add_special_tokens))
+        self.seconds += time.perf_counter() - start
+        self.calls += 1
+        self.chars += len(text)
+        return token_ids
+
+    def decode(self, token_ids, skip_special_tokens: bool = True) -> str:
+        start = time.perf_counter()
+        text = self.tokenizer.decode(token_ids, skip_special_tokens=skip_special_tokens)
+        self.seconds += time.perf_counter() - start
+        self.calls += 1
+        self.chars += len(text)
+        return text
+
+
+def load_tokenizer(name: str):
+    """로컬 캐시된 실제 토크나이저, 없으면 바이트 단위 기준 토크나이저"""
+    try:
+        from transformers import AutoTokenizer
+        tokenizer = AutoTokenizer.from_pretrained(name, cache_dir=settings.MODEL_CACHE_DIR, local_files_only=True)
+        return tokenizer, name
+    except Exception as e:
+        print(f"⚠️ 실제 토크나이저 사용 불가 ({type(e).__name__}) - UTF-8 바이트 단위 기준 토크나이저로 측정")
+        return ByteLevelTokenizer(), "byte-level"
+
+
+def legacy_prepare(manager, tokenizer, prefix: str, suffix: str, max_tokens: int, payload: Dict) -> List[int]:
+    """기존 경로: 전체 토큰화 → 초과 시 뒤에서 자르기 → 디코딩 → 파이프라인에서 다시 토큰화"""
+    formatted = f"{prefix}{manager.build_eft_prompt(**payload)}{suffix}"
+    token_ids = tokenizer.encode(formatted)
+    if len(token_ids) > max_tokens:
+        formatted = tokenizer.decode(token_ids[-max_tokens:], skip_special_tokens=True)
+    return tokenizer.encode(formatted)
+
+
+def build_conversations(analyzer: EmotionAnalyzer, sessions: int, turns: int) -> List[List[Dict]]:
+    """세션별 턴 입력 (대화 이력이 턴마다 누적, 사용자 메시지 300~2000자)"""
+    store = SessionEmotionStore()
+    conversations = []
+    for session in range(sessions):
+        messages = build_corpus(analyzer, 2000, turns // 2, seed=100 + session) + \
+            build_corpus(analyzer, 300, turns - turns // 2, seed=200 + session)
+        replies = build_corpus(analyzer, 200, turns, seed=300 + session)
+        history: List[ConversationMessage] = []
+        payloads = []
+        for turn, message in enumerate(messages):
+            emotion = analyzer._analyze_cleaned_text(analyzer._preprocess_text(message))
+            payloads.append({
+                "user_message": message,
+                "emotion_state": emotion,
+                "conversation_history": list(history),
+                "session_state": store.update(f"bench-{session}", emotion)
+            })
+            history += [
+                ConversationMessage(role="user", content=message),
+                ConversationMessage(role="assistant", content=replies[turn])
+            ]
+        conversations.append(payloads)
+    return conversations
+
+
+def main():
+    parser = argparse.ArgumentParser(description="프롬프트 토큰 예산 벤치마크")
+    parser.add_argument("--tokenizer", default=settings.FREE_TIER_MODEL)
+    parser.add_argument("--sessions", type=int, default=5)
+    parser.add_argument("--turns", type=int, default=20)
+    args = parser.parse_args()
+
+    analyzer = EmotionAnalyzer()
+    analyzer.analysis_cache = None
+    manager = EFTPromptManager()
+    tokenizer, tokenizer_name = load_tokenizer(args.tokenizer)
+    counting = CountingTokenizer(tokenizer)
+    conversations = build_conversations(analyzer, args.sessions, args.turns)
+
+    print(f"프롬프트 토큰 예산 벤치마크 (토크나이저: {tokenizer_name}, {args.sessions}세션 x {args.turns}턴)")
+    print("=" * 100)
+    print(f"{'입력 한도':<10} {'방식':<8} {'p50(us)':>10} {'p99(us)':>10} {'토큰화 ms/턴':>12} "
+          f"{'토큰화 호출/턴':>14} {'토큰화 글자/턴':>14} {'입력 토큰':>10}")
+    print("-" * 100)
+
+    prefix, suffix = "User: ", f"{tokenizer.eos_token}EFT Counselor:"
+    for max_tokens in (200, 4000):
+        turns_total = sum(len(payloads) for payloads in conversations)
+
+        # 기존 경로
+        counting.reset()
+        latencies, prompt_tokens = [], []
+        for payloads in conversations:
+            for payload in payloads:
+                start = time.perf_counter()
+                token_ids = legacy_prepare(manager, counting, prefix, suffix, max_tokens, payload)
+                latencies.append(time.perf_counter() - start)
+                prompt_tokens.append(len(token_ids))
+        legacy = (latencies, counting.seconds, counting.calls, counting.chars, prompt_tokens)
+
+        # 토큰 예산 경로 (엔진 1개가 토큰 예산 1개를 계속 사용 - 캐시는 세션 간 공유)
+        counting.reset()
+        budget = TokenBudget(
+            encode=lambda text: counting.encode(text, add_special_tokens=False),
+            max_tokens=max_tokens, prefix=prefix, suffix=suffix
+        )
+        counting.reset()
+        latencies, prompt_tokens = [], []
+        for payloads in conversations:
+            for payload in payloads:
+                start = time.perf_counter()
+                prompt = manager.build_eft_prompt(**payload, token_budget=budget)
+                latencies.append(time.perf_counter() - start)
+                prompt_tokens.append(prompt.prompt_tokens)
+        budgeted = (latencies, counting.seconds, counting.calls, counting.chars, prompt_tokens)
+
+        for label, (latencies, seconds, calls, chars, tokens) in (("기존", legacy), ("토큰예산", budgeted)):
+            ordered = sorted(latencies)
+            print(
+                f"{max_tokens:<10} {label:<8} {statistics.median(ordered) * 1e6:>10.1f} "
+                f"{ordered[int(len(ordered) * 0.99)] * 1e6:>10.1f} {seconds * 1000 / turns_total:>12.3f} "
+                f"{calls / turns_total:>14.1f} {chars / turns_total:>14.0f} {max(tokens):>10}"
+            )
+
+        stats = budget.get_stats()
+        print(
+            f"{'':<10} 토큰 캐시 적중률 {stats['cache']['hit_rate']:.0%}, "
+            f"메시지 생략 {stats['truncated_messages']}/{stats['prompts']}, 제외 구간 {stats['dropped_sections']}"
+        )
+        print("-" * 100)
+
+
+if __name__ == "__main__":
+    main()
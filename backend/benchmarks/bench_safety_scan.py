@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+안전성/문화 키워드 스캔 벤치마크
+목록마다 `any(keyword in message ...)` 를 반복하던 기존 방식(안전성 2개 + 문화 3개 목록)과
+EFTPromptManager.scan_message 의 단일 정규식 스캔을 호출 1건 단위로 비교 (모델 로드 없음)
+
+실행: python benchmarks/bench_safety_scan.py
+"""
+
+import random
+import sys
+import time
+from pathlib import Path
+from typing import List, Tuple
+
+# backend 디렉토리를 Python 경로에 추가
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from services.emotion_analyzer import EmotionAnalyzer
+from services.prompt_manager import EFTPromptManager
+from bench_emotion_analyzer import build_corpus
+
+LEGACY_CULTURE_KEYWORDS = {
+    "family_dynamics": ["부모", "엄마", "아빠", "가족", "형제", "자매", "시댁", "처가"],
+    "work_culture": ["회사", "직장", "상사", "동료", "업무", "야근", "승진", "면접"],
+    "social_pressure": ["결혼", "연애", "학벌", "스펙", "취업", "비교", "남들"],
+}
+
+
+def legacy_scan(manager: EFTPromptManager, message: str) -> Tuple[bool, bool, Tuple[str, ...]]:
+    """기존 경로: 안전성 목록은 소문자 변환 후, 문화 목록은 원문에서 목록별로 검사"""
+    emergency = any(keyword in message.lower() for keyword in manager.safety_guidelines["emergency_keywords"])
+    referral = any(
+        keyword in message.lower() for keyword in manager.safety_guidelines["professional_referral_keywords"]
+    )
+    themes = tuple(
+        theme for theme, keywords in LEGACY_CULTURE_KEYWORDS.items()
+        if any(keyword in message for keyword in keywords)
+    )
+    return emergency, referral, themes
+
+
+def inject_keywords(texts: List[str], keywords: List[str], ratio: float, seed: int = 5) -> List[str]:
+    """텍스트 일부의 임의 위치에 안전성/문화 키워드 삽입 (실제 상담 메시지처럼 드물게 등장)"""
+    rng = random.Random(seed)
+    injected = []
+    for text in texts:
+        if rng.random() < ratio:
+            position = rng.randrange(len(text) + 1)
+            text = text[:position] + rng.choice(keywords) + text[position:]
+        injected.append(text)
+    return injected
+
+
+def measure(func, texts: List[str], repeat: int) -> float:
+    """호출 1건당 평균 소요 시간 (us)"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for text in texts:
+            func(text)
+    return (time.perf_counter() - start) * 1e6 / (repeat * len(texts))
+
+
+def main():
+    analyzer = EmotionAnalyzer()
+    manager = EFTPromptManager()
+    keywords = (
+        manager.safety_guidelines["emergency_keywords"]
+        + manager.safety_guidelines["professional_referral_keywords"]
+        + [keyword for keywords in LEGACY_CULTURE_KEYWORDS.values() for keyword in keywords]
+    )
+
+    workloads = [
+        ("짧은 채팅 (20자)", inject_keywords(build_corpus(analyzer, 20, 500, seed=1), keywords, 0.2), 200),
+        ("대화 메시지 (300자)", inject_keywords(build_corpus(analyzer, 300, 200, seed=2), keywords, 0.3), 50),
+        ("긴 메시지 (2000자)", inject_keywords(build_corpus(analyzer, 2000, 50, seed=3), keywords, 0.3), 20),
+        ("일기 (5000자)", inject_keywords(build_corpus(analyzer, 5000, 20, seed=4), keywords, 0.3), 20),
+    ]
+
+    # 결과 동일성 검증 (겹치는 키워드/대소문자/여러 분류 동시 등장 포함)
+    edge_cases = [
+        "", "괜찮아요", "죽고싶고 우울증도 있어요", "가족회사 상사가 결혼 얘기를 해요",
+        "트라우마외상", "부모님과 형제자매", "SNS 비교 스펙 취업", "자살자해복수" * 3,
+    ]
+    for _, texts, _ in workloads:
+        for text in texts + edge_cases:
+            signals = manager.scan_message(text)
+            current = (signals.emergency, signals.professional_referral, signals.cultural_themes)
+            if current != legacy_scan(manager, text):
+                print(f"❌ 결과 불일치: {text[:40]!r} → {current} / {legacy_scan(manager, text)}")
+                sys.exit(1)
+
+    print("안전성/문화 키워드 스캔 벤치마크 (목록별 any(in) vs 단일 정규식 스캔)")
+    print(f"키워드 {len(keywords)}개 (응급/전문가 의뢰/문화 테마 3종)")
+    print("=" * 76)
+    for label, texts, repeat in workloads:
+        legacy_us = measure(lambda text: legacy_scan(manager, text), texts, repeat)
+        current_us = measure(manager.scan_message, texts, repeat)
+        print(f"{label:<18} | 기존 {legacy_us:8.2f}us | 현재 {current_us:8.2f}us | {legacy_us / current_us:5.2f}x")
+    print("=" * 76)
+    print("✅ 모든 입력에서 기존 키워드 검사 결과와 동일")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+세션 대화 요약 벤치마크
+긴 상담 세션(클라이언트가 최근 20개 메시지를 매 턴 전송)에서 턴이 쌓일 때
+프롬프트 크기와 이전 대화 반영 범위를 세 가지 방식으로 비교 (모델 로드 없음)
+
+  - 최근 창만: 기존 방식 (최근 3개 메시지, 100자 절단)
+  - 전체 이력: 받은 이력 20개를 원문 그대로 포함 (프롬프트가 세션 길이에 비례해 증가)
+  - 요약 + 최근 창: 창 밖 메시지를 응답 후 추출 요약으로 접어 최근 창과 함께 포함
+
+실행: python benchmarks/bench_session_summary.py [--turns 40]
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import List
+
+# backend 디렉토리를 Python 경로에 추가
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from services.emotion_analyzer import EmotionAnalyzer
+from services.prompt_manager import EFTPromptManager
+from services.session_emotion import SessionEmotionStore
+from services.session_summary import SessionSummaryStore
+from models.chat_models import ConversationMessage
+from bench_emotion_analyzer import build_corpus
+
+CLIENT_HISTORY_LIMIT = 20  # ChatRequest.conversation_history 최대 길이
+
+
+def full_history_block(history: List[ConversationMessage]) -> str:
+    """받은 이력 전체를 원문 그대로 싣는 경우의 히스토리 구간"""
+    lines = ["📜 **대화 히스토리**:\n"]
+    for message in history:
+        role_emoji = "👤" if message.role == "user" else "🤖"
+        lines.append(f"- {role_emoji} {message.content}\n")
+    return "".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="세션 대화 요약 벤치마크")
+    parser.add_argument("--turns", type=int, default=40)
+    parser.add_argument("--message-chars", type=int, default=300)
+    args = parser.parse_args()
+
+    analyzer = EmotionAnalyzer()
+    analyzer.analysis_cache = None
+    manager = EFTPromptManager()
+    emotion_store = SessionEmotionStore()
+    summary_store = SessionSummaryStore(salience=analyzer.keyword_salience)
+
+    messages = build_corpus(analyzer, args.message_chars, args.turns, seed=21)
+    replies = build_corpus(analyzer, 150, args.turns, seed=22)
+
+    history: List[ConversationMessage] = []
+    rows, prompt_ms, fold_ms = [], [], []
+    for turn, message in enumerate(messages, start=1):
+        emotion = analyzer._analyze_cleaned_text(analyzer._preprocess_text(message))
+        session_state = emotion_store.update("bench", emotion)
+        client_history = history[-CLIENT_HISTORY_LIMIT:]
+        payload = {
+            "user_message": message,
+            "emotion_state": emotion,
+            "conversation_history": client_history,
+            "session_state": session_state,
+            "tier": "premium"
+        }
+
+        # 요청 경로: 저장된 요약 조회 + 프롬프트 생성
+        start = time.perf_counter()
+        summary = summary_store.get("bench")
+        summary_prompt = manager.build_eft_prompt(**payload, session_summary=summary)
+        prompt_ms.append((time.perf_counter() - start) * 1000)
+
+        window_prompt = manager.build_eft_prompt(**payload)
+        window_block = manager._build_history_context(client_history)
+        full_chars = len(window_prompt) - len(window_block) + len(full_history_block(client_history))
+
+        # 응답 전송 후 백그라운드 접기
+        start = time.perf_counter()
+        summary_store.fold("bench", client_history)
+        fold_ms.append((time.perf_counter() - start) * 1000)
+
+        earlier = max(0, len(history) - 3)
+        rows.append((
+            turn, len(window_prompt), full_chars, len(summary_prompt),
+            min(len(client_history), len(history)) - min(3, len(history)),
+            summary.folded_messages if summary else 0, earlier
+        ))
+
+        history += [
+            ConversationMessage(role="user", content=message),
+            ConversationMessage(role="assistant", content=replies[turn - 1])
+        ]
+
+    print(f"세션 대화 요약 벤치마크 ({args.turns}턴, 메시지 {args.message_chars}자, 클라이언트 이력 최대 {CLIENT_HISTORY_LIMIT}개)")
+    print("=" * 96)
+    print(f"{'턴':>4} | {'최근 창만(자)':>12} {'전체 이력(자)':>13} {'요약+창(자)':>12} | "
+          f"{'이전 메시지':>10} {'전체 이력 반영':>14} {'요약 반영':>10}")
+    print("-" * 96)
+    checkpoints = {1, 2, 5, 10, 20, 30, args.turns}
+    for turn, window_chars, full_chars, summary_chars, full_covered, summary_covered, earlier in rows:
+        if turn in checkpoints:
+            print(f"{turn:>4} | {window_chars:>12} {full_chars:>13} {summary_chars:>12} | "
+                  f"{earlier:>10} {full_covered:>14} {summary_covered:>10}")
+    print("=" * 96)
+
+    stats = summary_store.get_stats()
+    print(f"요청 경로 (요약 조회 + 프롬프트 생성): p50 {statistics.median(prompt_ms):.3f}ms")
+    print(f"백그라운드 접기: 평균 {statistics.mean(fold_ms):.3f}ms/턴, 접힌 메시지 {stats['folded_messages']}개")
+    print(f"최종 요약 ({len(summary_store.get('bench').text)}자):")
+    print(summary_store.get("bench").text)
+
+
+if __name__ == "__main__":
+    main()
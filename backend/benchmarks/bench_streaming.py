@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+스트리밍 생성 벤치마크
+기존 방식(전체 응답 생성 후 50단어 청크 + 0.1초 지연)과 generate_stream 의 실제 토큰 스트리밍을
+첫 청크 지연(TTFT)/전체 시간/초당 토큰 수로 비교 (transformers/torch 및 로컬 모델 필요)
+
+실행: python benchmarks/bench_streaming.py [--model microsoft/DialoGPT-small] [--runs 5] [--max-tokens 100]
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# backend 디렉토리를 Python 경로에 추가
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from config.settings import get_settings
+from services.ai_engine import EFTAIEngine
+from services.emotion_analyzer import EmotionAnalyzer
+from services.prompt_manager import EFTPromptManager
+
+settings = get_settings()
+
+MESSAGE = "요즘 회사 일 때문에 너무 스트레스를 받고 잠도 잘 못 자요. 어떻게 하면 좋을까요?"
+
+
+async def legacy_stream(engine: EFTAIEngine, prompt, max_tokens: int):
+    """기존 generate_stream: 전체 응답 생성 → 50단어 청크 분할 → 청크마다 0.1초 지연"""
+    response = await engine.generate_response(prompt, max_tokens=max_tokens)
+    words = response.split()
+    chunks = [" ".join(words[i:i + 50]) for i in range(0, len(words), 50)]
+    for chunk in chunks:
+        yield chunk
+        await asyncio.sleep(0.1)
+
+
+async def measure(stream) -> dict:
+    start = time.perf_counter()
+    first_chunk, metadata = None, None
+    async for chunk in stream:
+        if first_chunk is None:
+            first_chunk = time.perf_counter() - start
+        if isinstance(chunk, dict) and chunk.get("chunk_type") == "end":
+            metadata = chunk["metadata"]
+    return {"ttft": first_chunk or 0.0, "total": time.perf_counter() - start, "metadata": metadata}
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="스트리밍 생성 벤치마크")
+    parser.add_argument("--model", default=settings.FREE_TIER_MODEL)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--max-tokens", type=int, default=100)
+    args = parser.parse_args()
+
+    engine = EFTAIEngine(model_name=args.model, device=settings.DEVICE)
+    await engine.initialize()
+    analyzer = EmotionAnalyzer()
+    manager = EFTPromptManager()
+    emotion = await analyzer.analyze(MESSAGE)
+    prompt = manager.build_eft_prompt(MESSAGE, emotion, token_budget=engine.token_budget)
+
+    # 워밍업 (첫 호출 커널/캐시 준비 비용 제외)
+    await measure(engine.generate_stream(MESSAGE, emotion, prompt=prompt, max_tokens=8))
+
+    results = {"기존 (청크 시뮬레이션)": [], "토큰 스트리밍": []}
+    for _ in range(args.runs):
+        results["기존 (청크 시뮬레이션)"].append(await measure(legacy_stream(engine, prompt, args.max_tokens)))
+        results["토큰 스트리밍"].append(
+            await measure(engine.generate_stream(MESSAGE, emotion, prompt=prompt, max_tokens=args.max_tokens))
+        )
+
+    print(f"스트리밍 생성 벤치마크 (모델: {args.model}, 최대 {args.max_tokens}토큰, {args.runs}회)")
+    print("=" * 72)
+    print(f"{'방식':<22} {'TTFT p50(ms)':>14} {'전체 p50(ms)':>14} {'토큰/초':>10}")
+    print("-" * 72)
+    for label, runs in results.items():
+        rates = [run["metadata"]["tokens_per_sec"] for run in runs if run["metadata"]]
+        print(
+            f"{label:<22} {statistics.median(run['ttft'] for run in runs) * 1000:>14.1f} "
+            f"{statistics.median(run['total'] for run in runs) * 1000:>14.1f} "
+            f"{statistics.median(rates) if rates else float('nan'):>10.1f}"
+        )
+    print("=" * 72)
+
+    await engine.cleanup()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+"""
+감정 분석 / 프롬프트 생성 벤치마크 및 회귀 검사
+생성된 한국어 말뭉치(짧은 채팅, 2000자 대화 이력 포함 메시지, 5000자 일기)로
+EmotionAnalyzer.analyze / analyze_batch 와 EFTPromptManager.build_eft_prompt / scan_message 를 측정하고
+JSON 기준값과 비교해 임계치 이상 나빠지면 실패 (모델 로드 없음, CPU 전용)
+
+실행:
+    python benchmarks/bench_suite.py                    # 기준값과 비교 (회귀 시 종료 코드 1)
+    python benchmarks/bench_suite.py --save-baseline    # 현재 결과를 기준값으로 저장
+    python benchmarks/bench_suite.py --quick --only prompt
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+# backend 디렉토리를 Python 경로에 추가
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from services.emotion_analyzer import EmotionAnalyzer
+from services.prompt_manager import EFTPromptManager
+from services.session_emotion import SessionEmotionStore
+from models.chat_models import ConversationMessage
+from bench_emotion_analyzer import build_corpus
+
+DEFAULT_BASELINE = Path(__file__).resolve().parent / "baselines" / "bench_suite.json"
+
+# 회귀 판정 지표: (지표 이름, 클수록 좋은지 여부)
+CHECKED_METRICS = [("ops_per_sec", True), ("p99_us", False), ("peak_alloc_bytes", False)]
+
+
+def build_suite_corpus(analyzer: EmotionAnalyzer, seed: int = 7) -> Dict[str, Any]:
+    """벤치마크용 말뭉치 (시드 고정 - 실행마다 같은 입력)"""
+    rng = random.Random(seed)
+
+    short_lines = [
+        text for length in (20, 40, 60)
+        for text in build_corpus(analyzer, length, 100, seed=seed + length)
+    ]
+    rng.shuffle(short_lines)
+
+    # 대화 이력 20개(각 100자) + 2000자 메시지
+    history_messages = build_corpus(analyzer, 2000, 20, seed=seed + 2000)
+    histories = [
+        [
+            ConversationMessage(role="user" if turn % 2 == 0 else "assistant", content=content)
+            for turn, content in enumerate(build_corpus(analyzer, 100, 20, seed=seed + index))
+        ]
+        for index in range(len(history_messages))
+    ]
+
+    journals = build_corpus(analyzer, 5000, 10, seed=seed + 5000)
+
+    return {
+        "short": short_lines,
+        "history": list(zip(history_messages, histories)),
+        "journal": journals,
+    }
+
+
+def summarize(samples_ns: List[int]) -> Dict[str, float]:
+    """호출별 소요 시간(ns) → 처리량/분위수"""
+    ordered = sorted(samples_ns)
+    total_seconds = sum(ordered) / 1e9
+    return {
+        "calls": len(ordered),
+        "ops_per_sec": len(ordered) / total_seconds if total_seconds else 0.0,
+        "mean_us": statistics.mean(ordered) / 1000,
+        "p50_us": ordered[len(ordered) // 2] / 1000,
+        "p99_us": ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))] / 1000,
+    }
+
+
+def measure_allocations(call: Callable[[Any], Any], inputs: List[Any], calls: int) -> float:
+    """호출당 최대 추가 할당량 (tracemalloc 피크 - 호출 전 사용량, 바이트 평균)"""
+    peaks = []
+    tracemalloc.start()
+    try:
+        for index in range(calls):
+            arg = inputs[index % len(inputs)]
+            tracemalloc.reset_peak()
+            before, _ = tracemalloc.get_traced_memory()
+            call(arg)
+            _, peak = tracemalloc.get_traced_memory()
+            peaks.append(peak - before)
+    finally:
+        tracemalloc.stop()
+    return statistics.mean(peaks)
+
+
+def run_case(call: Callable[[Any], Any], inputs: List[Any], iterations: int) -> Dict[str, float]:
+    """워밍업 → 시간 측정 → 할당량 측정 (할당량은 tracemalloc 오버헤드 때문에 별도 패스)"""
+    for index in range(max(1, iterations // 20)):
+        call(inputs[index % len(inputs)])
+
+    samples = []
+    for index in range(iterations):
+        arg = inputs[index % len(inputs)]
+        start = time.perf_counter_ns()
+        call(arg)
+        samples.append(time.perf_counter_ns() - start)
+
+    result = summarize(samples)
+    result["peak_alloc_bytes"] = measure_allocations(call, inputs, min(iterations, 50))
+    return result
+
+
+def build_cases(quick: bool) -> Dict[str, Callable[[], Dict[str, float]]]:
+    """측정 항목 (이름 → 실행 함수)"""
+    scale = 0.2 if quick else 1.0
+    iterations = lambda count: max(20, int(count * scale))
+
+    analyzer = EmotionAnalyzer()
+    analyzer.analysis_cache = None  # 반복 측정이 캐시 적중으로 왜곡되지 않도록 비활성화
+    analyzer.executor = None        # 순수 분석 비용만 측정 (오프로드 디스패치 제외)
+    prompt_manager = EFTPromptManager()
+    session_store = SessionEmotionStore()
+    corpus = build_suite_corpus(analyzer)
+
+    loop = asyncio.new_event_loop()
+    analyze = lambda text: loop.run_until_complete(analyzer.analyze(text))
+    analyze_batch = lambda texts: loop.run_until_complete(analyzer.analyze_batch(texts))
+
+    # 프롬프트 입력 (감정 분석 결과/세션 상태는 미리 계산)
+    short_prompts = [(text, analyze(text), [], None) for text in corpus["short"][:100]]
+    history_prompts = []
+    for index, (message, history) in enumerate(corpus["history"]):
+        emotion = analyze(message)
+        session_state = None
+        for turn in history[::2]:
+            session_state = session_store.update(f"bench-{index}", analyze(turn.content))
+        history_prompts.append((message, emotion, history, session_state))
+    journal_prompts = [(text, analyze(text), [], None) for text in corpus["journal"]]
+
+    def build_prompt(payload, tier: str = "free"):
+        message, emotion, history, session_state = payload
+        return prompt_manager.build_eft_prompt(
+            user_message=message,
+            emotion_state=emotion,
+            conversation_history=history,
+            tier=tier,
+            session_state=session_state
+        )
+
+    batches = [corpus["short"][index:index + 100] for index in range(0, len(corpus["short"]), 100)]
+
+    return {
+        "analyze.short": lambda: run_case(analyze, corpus["short"], iterations(3000)),
+        "analyze.history_2000": lambda: run_case(analyze, [m for m, _ in corpus["history"]], iterations(300)),
+        "analyze.journal_5000": lambda: run_case(analyze, corpus["journal"], iterations(100)),
+        "analyze_batch.short_x100": lambda: run_case(analyze_batch, batches, iterations(60)),
+        "prompt.short": lambda: run_case(build_prompt, short_prompts, iterations(5000)),
+        "prompt.history_2000": lambda: run_case(build_prompt, history_prompts, iterations(3000)),
+        "prompt.history_2000_premium": lambda: run_case(
+            lambda payload: build_prompt(payload, tier="premium"), history_prompts, iterations(3000)
+        ),
+        "prompt.journal_5000": lambda: run_case(build_prompt, journal_prompts, iterations(2000)),
+        "safety_scan.short": lambda: run_case(prompt_manager.scan_message, corpus["short"], iterations(20000)),
+        "safety_scan.history_2000": lambda: run_case(
+            prompt_manager.scan_message, [m for m, _ in corpus["history"]], iterations(3000)
+        ),
+        "safety_scan.journal_5000": lambda: run_case(prompt_manager.scan_message, corpus["journal"], iterations(2000)),
+    }
+
+
+def compare(
+    results: Dict[str, Dict[str, float]],
+    baseline: Dict[str, Dict[str, float]],
+    threshold: float,
+    p99_threshold: float
+) -> List[str]:
+    """기준값 대비 회귀 항목 목록"""
+    regressions = []
+    for case, metrics in results.items():
+        reference = baseline.get(case)
+        if not reference:
+            continue
+        for metric, higher_is_better in CHECKED_METRICS:
+            if metric not in reference or not reference[metric]:
+                continue
+            allowed = p99_threshold if metric == "p99_us" else threshold
+            change = (metrics[metric] - reference[metric]) / reference[metric]
+            if (higher_is_better and change < -allowed) or (not higher_is_better and change > allowed):
+                regressions.append(
+                    f"{case}.{metric}: {reference[metric]:.1f} → {metrics[metric]:.1f} ({change:+.0%})"
+                )
+    return regressions
+
+
+def machine_info() -> Dict[str, Any]:
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="감정 분석/프롬프트 벤치마크 및 회귀 검사")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE, help="기준값 JSON 경로")
+    parser.add_argument("--save-baseline", action="store_true", help="현재 결과를 기준값으로 저장")
+    parser.add_argument("--threshold", type=float, default=0.25, help="처리량/할당량 허용 악화 비율")
+    parser.add_argument("--p99-threshold", type=float, default=0.5, help="p99 허용 악화 비율 (잡음이 커서 별도)")
+    parser.add_argument("--only", default=None, help="이름에 이 문자열이 포함된 항목만 실행")
+    parser.add_argument("--quick", action="store_true", help="반복 횟수 축소 (기준값 저장에는 사용하지 않음)")
+    parser.add_argument("--output", type=Path, default=None, help="결과 JSON 저장 경로")
+    args = parser.parse_args()
+
+    cases = build_cases(args.quick)
+    if args.only:
+        cases = {name: case for name, case in cases.items() if args.only in name}
+
+    print("감정 분석 / 프롬프트 생성 벤치마크")
+    print("=" * 96)
+    print(f"{'항목':<30} {'ops/sec':>12} {'p50(us)':>10} {'p99(us)':>10} {'할당(KB/call)':>14}")
+    print("-" * 96)
+
+    results: Dict[str, Dict[str, float]] = {}
+    for name, case in cases.items():
+        result = case()
+        results[name] = result
+        print(
+            f"{name:<30} {result['ops_per_sec']:>12.1f} {result['p50_us']:>10.1f} "
+            f"{result['p99_us']:>10.1f} {result['peak_alloc_bytes'] / 1024:>14.1f}"
+        )
+    print("=" * 96)
+
+    report = {"machine": machine_info(), "generated_at": time.time(), "results": results}
+    if args.output:
+        args.output.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+
+    if args.save_baseline:
+        baseline_report = {"machine": report["machine"], "results": {}}
+        if args.baseline.exists():
+            baseline_report = json.loads(args.baseline.read_text(encoding="utf-8"))
+            baseline_report["machine"] = report["machine"]
+        baseline_report["results"].update(results)
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(json.dumps(baseline_report, ensure_ascii=False, indent=2), encoding="utf-8")
+        print(f"기준값 저장: {args.baseline}")
+        return
+
+    if not args.baseline.exists():
+        print(f"기준값 없음 ({args.baseline}) - --save-baseline 으로 먼저 저장하세요")
+        return
+
+    baseline_report = json.loads(args.baseline.read_text(encoding="utf-8"))
+    if baseline_report.get("machine") != report["machine"]:
+        print(f"⚠️ 기준값 측정 환경이 다릅니다: {baseline_report.get('machine')}")
+
+    regressions = compare(results, baseline_report["results"], args.threshold, args.p99_threshold)
+    if regressions:
+        print(f"❌ 성능 회귀 {len(regressions)}건 (허용: 처리량/할당 {args.threshold:.0%}, p99 {args.p99_threshold:.0%})")
+        for line in regressions:
+            print(f"  - {line}")
+        sys.exit(1)
+
+    print(f"✅ 기준값 대비 회귀 없음 (허용: 처리량/할당 {args.threshold:.0%}, p99 {args.p99_threshold:.0%})")
+
+
+if __name__ == "__main__":
+    main()
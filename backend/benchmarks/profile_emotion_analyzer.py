@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+감정 분석기 단계별 프로파일
+기존 경로와 현재 경로(TextFeatures 공유)의 호출당 텍스트 스캔 횟수와 단계별 소요 시간 비교
+
+실행: python benchmarks/profile_emotion_analyzer.py [텍스트 길이]
+"""
+
+import asyncio
+import cProfile
+import pstats
+import sys
+from pathlib import Path
+
+# backend 디렉토리를 Python 경로에 추가
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from bench_emotion_analyzer import LegacyEmotionAnalyzer, build_corpus
+
+# 텍스트 전체를 훑는 호출들 (모듈 함수 + 컴파일된 패턴 메서드 + str.count)
+SCAN_FUNCTIONS = {
+    ("re", "search"), ("re", "findall"), ("re", "finditer"), ("re", "sub"),
+    ("re.Pattern", "search"), ("re.Pattern", "findall"), ("re.Pattern", "finditer"), ("re.Pattern", "sub"),
+    ("str", "count"),
+}
+
+
+def count_scans(stats: pstats.Stats, calls: int) -> float:
+    """호출당 텍스트 스캔 횟수"""
+    total = 0
+    for (filename, _, name), (_, ncalls, _, _, _) in stats.stats.items():
+        if filename.endswith("re/__init__.py") and ("re", name) in SCAN_FUNCTIONS:
+            total += ncalls
+        elif filename == "~":
+            for owner, method in SCAN_FUNCTIONS:
+                if name == f"<method '{method}' of '{owner}' objects>":
+                    total += ncalls
+    return total / calls
+
+
+def profile(func, texts) -> pstats.Stats:
+    profiler = cProfile.Profile()
+    profiler.enable()
+    for text in texts:
+        func(text)
+    profiler.disable()
+    return pstats.Stats(profiler)
+
+
+def main():
+    length = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    analyzer = LegacyEmotionAnalyzer()
+    analyzer.analysis_cache = None  # 반복 측정이 캐시 적중으로 왜곡되지 않도록 비활성화
+    texts = build_corpus(analyzer, length, 20)
+
+    loop = asyncio.new_event_loop()
+    current = lambda text: loop.run_until_complete(analyzer.analyze(text))
+
+    legacy_stats = profile(analyzer.legacy_analyze, texts)
+    current_stats = profile(current, texts)
+
+    print(f"감정 분석기 프로파일 ({length}자 x {len(texts)}개)")
+    print("=" * 60)
+    print(f"호출당 텍스트 스캔 횟수: 기존 {count_scans(legacy_stats, len(texts)):.0f}회 "
+          f"→ 현재 {count_scans(current_stats, len(texts)):.0f}회")
+    print(f"호출당 소요 시간: 기존 {legacy_stats.total_tt * 1000 / len(texts):.2f}ms "
+          f"→ 현재 {current_stats.total_tt * 1000 / len(texts):.2f}ms (프로파일러 오버헤드 포함)")
+
+    print("\n[현재 경로 단계별 누적 시간]")
+    current_stats.sort_stats("cumulative").print_stats(r"emotion_analyzer.py:\d+\((_|analyze)", 12)
+
+    loop.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -3,11 +3,15 @@ EFT AI 서버 설정 관리
 환경변수 및 모델 설정
 """
 
+from pydantic import field_validator
 from pydantic_settings import BaseSettings
 from typing import List, Optional, Dict
 import os
 from pathlib import Path
 
+# backend 디렉토리 (상대 경로 설정의 기준 - 서버를 어느 디렉토리에서 실행해도 같은 파일을 가리킴)
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
 class Settings(BaseSettings):
     """서버 설정 클래스"""
     
@@ -34,6 +38,8 @@ class Settings(BaseSettings):
     FREE_TIER_MODEL: str = "microsoft/DialoGPT-medium"      # 무료: 기본 대화 (토큰 제한 필요)
     PREMIUM_TIER_MODEL: str = "meta-llama/Llama-3.1-8B-Instruct"  # 프리미엄: 실제 Llama 3.1
     ENTERPRISE_TIER_MODEL: str = "meta-llama/Llama-3.1-70B-Instruct"  # 기업: 최고급
+    PREMIUM_DRAFT_MODEL: Optional[str] = None  # 프리미엄 보조 생성용 초안 모델 (같은 토크나이저, 예: "meta-llama/Llama-3.2-1B-Instruct")
+    FREE_TIER_BACKEND: str = "torch"  # "onnx": 무료 모델을 ONNX Runtime(CPU)으로 실행 (optimum[onnxruntime] 필요, 그래프는 MODEL_CACHE_DIR/onnx 에 캐시)
     
     # A/B 테스트용 무료 모델 엔진들
     FREE_ENGINES: dict = {
@@ -57,9 +63,15 @@ class Settings(BaseSettings):
     
     # GPU/CPU 설정
     DEVICE: str = "auto"  # "cuda", "cpu", "auto"
-    MAX_MEMORY: Optional[str] = None  # "12GiB" 형태로 설정 가능
+    MAX_MEMORY: Optional[str] = None  # "12GiB" 형태로 설정 가능 (로컬 모델 풀 전체 메모리 예산, 미설정 시 RAM의 80%)
+    MODEL_POOL_PRELOAD: List[str] = ["free"]  # 서버 시작 후 백그라운드로 미리 로드할 모델 (로드+워밍업 완료 시 /ready 200, 나머지는 첫 요청 시 로드)
+    FAST_MODEL_LOAD: bool = True  # safetensors(mmap) + low_cpu_mem_usage 로드 (최대 RAM ≈ 가중치 1배, accelerate 필요)
+    WARMUP_MAX_TOKENS: int = 8  # 모델 로드 후 워밍업 생성 토큰 수 (0이면 워밍업 생략)
+    RESPONSE_EARLY_STOPPING: bool = True  # 티어 응답 길이 정책(문자 수/문장 수)과 응답 끝 표시에 도달하면 생성 조기 종료
     LOAD_IN_8BIT: bool = False  # 메모리 절약용 (비활성화)
     LOAD_IN_4BIT: bool = False   # 양자화 비활성화 (bitsandbytes 패키지 없음)
+    CPU_QUANTIZATION: Optional[str] = None  # "int8": CPU 추론 시 Linear 레이어 동적 int8 양자화 (GPU에서는 무시)
+    CPU_QUANTIZATION_CACHE: bool = True  # 양자화된 모델을 MODEL_CACHE_DIR/quantized 에 저장해 재시작 시 재사용
     
     # 생성 파라미터 기본값
     DEFAULT_MAX_TOKENS: int = 400
@@ -84,14 +96,63 @@ class Settings(BaseSettings):
     OPENAI_API_KEY: Optional[str] = None  # 폴백용
     
     # 성능 최적화 설정
-    BATCH_SIZE: int = 1
+    BATCH_SIZE: int = 1  # 2 이상이면 로컬 생성 요청을 마이크로 배치로 묶어 처리
+    BATCH_WINDOW_MS: float = 20.0  # 마이크로 배치 대기 창 (첫 요청 도착 후 이 시간 동안 같은 파라미터 요청 수집)
     MAX_CONCURRENT_REQUESTS: int = 10
-    REQUEST_TIMEOUT: int = 120  # 초
+    MAX_QUEUE_LENGTH: int = 50  # 동시 실행 한도 초과 시 대기 가능한 요청 수 (초과분은 503 즉시 거절)
+    REQUEST_TIMEOUT: int = 120  # 초 (대기열에서 이 시간 안에 끝낼 수 없는 요청은 거절)
+    
+    # 배치 감정 분석 설정
+    EMOTION_BATCH_MAX_TEXTS: int = 5000  # 요청당 최대 텍스트 수
+    EMOTION_BATCH_MAX_BYTES: int = 8 * 1024 * 1024  # 배치 요청 바디 최대 크기 (8MB)
+    
+    # 감정 분석 결과 캐시 (전처리된 텍스트 기준 LRU)
+    EMOTION_CACHE_ENABLED: bool = True
+    EMOTION_CACHE_MAX_ENTRIES: int = 10000
+    EMOTION_CACHE_MAX_BYTES: int = 32 * 1024 * 1024  # 32MB
+    EMOTION_CACHE_TTL: Optional[float] = None  # 초 (None이면 만료 없음)
+
+    # 감정 분석 실행 위치 (긴 텍스트/배치는 이벤트 루프 밖에서 실행)
+    EMOTION_EXECUTION_MODE: str = "thread"  # "inline", "thread", "process"
+    EMOTION_OFFLOAD_MIN_CHARS: int = 1000  # 이 길이 미만은 항상 인라인 실행
+    EMOTION_POOL_WORKERS: int = 2
+
+    # 감정 사전 (내장 사전 + emotions.json 트리거 병합 후 컴파일, 상대 경로는 backend 디렉토리 기준으로 변환)
+    EMOTION_LEXICON_SOURCE: Optional[str] = "../assets/data/emotions.json"
+    EMOTION_LEXICON_PATH: str = "./data/emotion_lexicon.bin"
+
+    @field_validator("EMOTION_LEXICON_SOURCE", "EMOTION_LEXICON_PATH")
+    @classmethod
+    def _resolve_from_backend_dir(cls, value: Optional[str]) -> Optional[str]:
+        """상대 경로를 실행 디렉토리(CWD)가 아닌 backend 디렉토리 기준 절대 경로로 변환"""
+        if not value or Path(value).is_absolute():
+            return value
+        return str((BACKEND_DIR / value).resolve())
+
+    # 세션 감정 상태 (session_id별 누적 감정 벡터)
+    SESSION_EMOTION_DECAY: float = 0.7  # 턴마다 이전 누적값에 곱하는 감쇠율
+    SESSION_EMOTION_MAX_SESSIONS: int = 10000
+    SESSION_EMOTION_TTL: Optional[float] = 6 * 3600  # 초 (마지막 턴 기준)
+    SESSION_EMOTION_TRAJECTORY_LENGTH: int = 5  # 프롬프트에 표시할 최근 감정 흐름 길이
+
+    # 세션 대화 요약 (최근 메시지 창 밖으로 밀려난 턴을 응답 후 추출 요약으로 접음)
+    SESSION_SUMMARY_ENABLED: bool = True
+    SESSION_SUMMARY_MAX_POINTS: int = 6  # 요약에 유지할 핵심 문장 수
+    SESSION_SUMMARY_POINT_CHARS: int = 80  # 핵심 문장 최대 길이
+
+    # 프롬프트 토큰 예산 (구간별 토큰 ID 캐시)
+    PROMPT_TOKEN_CACHE_MAX_ENTRIES: int = 20000
+    PROMPT_TOKEN_CACHE_MAX_BYTES: int = 32 * 1024 * 1024  # 32MB
+    
+    # 프롬프트 프리픽스 KV 캐시 (티어별 고정 시스템 프롬프트 구간의 prefill 재사용, 로컬 엔진)
+    PREFIX_KV_CACHE_ENABLED: bool = True
+    PREFIX_KV_CACHE_MAX_BYTES: int = 512 * 1024 * 1024  # 512MB (엔진별)
     
     # vLLM 프록시 설정
     VLLM_CONNECT_TIMEOUT: float = 10.0  # 연결 타임아웃
     VLLM_READ_TIMEOUT: float = 120.0    # 읽기 타임아웃
     VLLM_HEALTH_CHECK_TIMEOUT: float = 5.0  # 헬스체크 타임아웃
+    VLLM_PROMPT_LAYOUT: str = "messages"  # "messages": EFT 프롬프트 (고정 system + 가변 user, 프리픽스 캐시 친화), "simple": 한 줄 system
     
     # Sticky 세션 설정 (사용자별 엔진 고정)
     STICKY_SESSION_TTL: int = 3600  # sticky 세션 유지 시간 (초)
@@ -181,6 +242,28 @@ MODEL_PRESETS = {
         "model_name": "meta-llama/Llama-3.1-70B-Instruct",
         "load_in_4bit": True,
         "max_memory": "40GiB"
+    },
+    
+    # 보조 생성 (초안 모델이 제안한 토큰을 8B 모델이 한 번에 검증 - 같은 출력 분포, 디코딩 가속)
+    "llama3-8b-assisted": {
+        "model_name": "meta-llama/Llama-3.1-8B-Instruct",
+        "load_in_4bit": False,
+        "max_memory": "14GiB",
+        "draft_model": "meta-llama/Llama-3.2-1B-Instruct"
+    },
+    
+    # CPU 서버용 (동적 int8 양자화 - 첫 로드에만 fp32 가중치 크기의 메모리 필요, 이후 양자화 캐시 사용)
+    "dialogpt-medium-cpu-int8": {
+        "model_name": "microsoft/DialoGPT-medium",
+        "load_in_4bit": False,
+        "max_memory": None,
+        "cpu_quantization": "int8"
+    },
+    "llama3-8b-cpu-int8": {
+        "model_name": "meta-llama/Llama-3.1-8B-Instruct",
+        "load_in_4bit": False,
+        "max_memory": "12GiB",
+        "cpu_quantization": "int8"
     }
 }
 
@@ -195,5 +278,6 @@ def apply_model_preset(preset_name: str) -> Settings:
     settings.MODEL_NAME = preset["model_name"]
     settings.LOAD_IN_4BIT = preset["load_in_4bit"]
     settings.MAX_MEMORY = preset["max_memory"]
+    settings.CPU_QUANTIZATION = preset.get("cpu_quantization")
     
     return settings
\ No newline at end of file
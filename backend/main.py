@@ -7,7 +7,7 @@ from fastapi import FastAPI, HTTPException, BackgroundTasks, Request, Header
 from fastapi.middleware.cors import CORSMiddleware
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.types import ASGIApp, Receive, Scope, Send
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ValidationError
 from typing import List, Optional, Dict, Any
 import asyncio
 import time
@@ -25,8 +25,12 @@ from collections import defaultdict, deque
 from services.ai_engine import EFTAIEngine
 from services.prompt_manager import EFTPromptManager
 from services.emotion_analyzer import EmotionAnalyzer
-from models.chat_models import ChatRequest, ChatResponse, StreamResponse
-from config.settings import get_settings
+from services.session_emotion import SessionEmotionStore
+from services.session_summary import SessionSummaryStore
+from services.model_pool import ModelPool, ModelSpec, build_model_specs, parse_memory_size
+from utils.admission import AdmissionRejected
+from models.chat_models import ChatRequest, ChatResponse, StreamResponse, ConversationMessage, EmotionAnalysis
+from config.settings import MODEL_PRESETS, get_settings
 from utils.logger import get_logger
 
 # 설정 및 로거
@@ -121,14 +125,16 @@ if extra:
 
 # 1. 요청 바디 크기 제한 (DoS 방지)
 class MaxBodySizeMiddleware(BaseHTTPMiddleware):
-    def __init__(self, app: ASGIApp, max_bytes: int = 128 * 1024):
+    def __init__(self, app: ASGIApp, max_bytes: int = 128 * 1024, path_limits: Optional[Dict[str, int]] = None):
         super().__init__(app)
         self.max_bytes = max_bytes
+        self.path_limits = path_limits or {}  # 경로별 예외 한도 (예: 배치 API)
 
     async def dispatch(self, request: Request, call_next):
+        max_bytes = self.path_limits.get(request.url.path, self.max_bytes)
         cl = request.headers.get("content-length")
-        if cl and cl.isdigit() and int(cl) > self.max_bytes:
-            logger.warning(f"요청 크기 초과: {cl} bytes (최대: {self.max_bytes})")
+        if cl and cl.isdigit() and int(cl) > max_bytes:
+            logger.warning(f"요청 크기 초과: {cl} bytes (최대: {max_bytes})")
             raise HTTPException(status_code=413, detail="Payload too large")
         return await call_next(request)
 
@@ -175,7 +181,11 @@ class SimpleRateLimitMiddleware(BaseHTTPMiddleware):
         return await call_next(request)
 
 # 미들웨어 등록 (순서 중요!)
-app.add_middleware(MaxBodySizeMiddleware, max_bytes=256 * 1024)  # 256KB로 여유 있게
+app.add_middleware(
+    MaxBodySizeMiddleware,
+    max_bytes=256 * 1024,  # 256KB로 여유 있게
+    path_limits={"/api/analyze/emotion/batch": settings.EMOTION_BATCH_MAX_BYTES}
+)
 app.add_middleware(CorrelationIdMiddleware)
 app.add_middleware(SimpleRateLimitMiddleware, requests_per_minute=120)  # 분당 120회
 app.add_middleware(ABRouteMiddleware)
@@ -189,16 +199,22 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# AI 엔진 전역 변수 (서버 시작시 로드)
-ai_engine: Optional[EFTAIEngine] = None  # 무료 모델
-premium_ai_engine: Optional[EFTAIEngine] = None  # 프리미엄 모델
+# AI 엔진 풀 (티어/프리셋별 모델을 첫 요청 시 로드, 메모리 예산 초과 시 LRU 축출)
+model_pool: Optional[ModelPool] = None
 prompt_manager: Optional[EFTPromptManager] = None
 emotion_analyzer: Optional[EmotionAnalyzer] = None
+session_emotion_store: Optional[SessionEmotionStore] = None
+session_summary_store: Optional[SessionSummaryStore] = None
+
+# 준비 상태 (/ready) - 미리 로드할 모델의 로드와 워밍업이 모두 끝나면 "ready"
+readiness: Dict[str, Any] = {"status": "starting", "models": {}, "startup_seconds": None}
+preload_task: Optional[asyncio.Task] = None
+_WARMUP_MESSAGE = "요즘 일이 많아서 스트레스 받고 잠도 잘 못 자요."
 
 @app.on_event("startup")
 async def startup_event():
     """서버 시작시 AI 모델 로드"""
-    global ai_engine, premium_ai_engine, prompt_manager, emotion_analyzer
+    global model_pool, prompt_manager, emotion_analyzer, session_emotion_store, session_summary_store, preload_task
     
     logger.info("🚀 EFT AI 서버 시작 중...")
     
@@ -210,42 +226,25 @@ async def startup_event():
         # 2. 감정 분석기 초기화
         logger.info("🧠 감정 분석 시스템 로드 중...")
         emotion_analyzer = EmotionAnalyzer()
+        emotion_analyzer.start_executor()
+        session_emotion_store = SessionEmotionStore()
+        if settings.SESSION_SUMMARY_ENABLED:
+            session_summary_store = SessionSummaryStore(salience=emotion_analyzer.keyword_salience)
         
         logger.info("✅ 기본 서비스 시작 완료!")
         logger.info("💡 AI 모델은 vLLM 서버 연동을 통해 제공됩니다")
         
-        # AI 엔진 로드는 선택사항으로 변경 (PyTorch 이슈 우회)
-        try:
-            # 3. 무료 AI 엔진 초기화 (DialoGPT) - 선택사항
-            logger.info("🆓 로컬 AI 모델 로드 시도 중...")
-            ai_engine = EFTAIEngine(
-                model_name=settings.FREE_TIER_MODEL,
-                device=settings.DEVICE,
-                max_memory=settings.MAX_MEMORY
-            )
-            await ai_engine.initialize()
-            logger.info("✅ 로컬 AI 모델 로드 성공!")
-        except Exception as ai_error:
-            logger.warning(f"⚠️ 로컬 AI 모델 로드 실패: {ai_error}")
-            logger.info("📢 vLLM 서버 연동으로 대체 가능합니다")
-            ai_engine = None
+        # 3. 로컬 AI 모델 풀 (무료/프리미엄/엔터프라이즈 티어 + MODEL_PRESETS, MAX_MEMORY 예산 안에서 유지)
+        model_pool = ModelPool(
+            build_model_specs(),
+            memory_budget=parse_memory_size(settings.MAX_MEMORY) if settings.MAX_MEMORY else None,
+            on_load=prepare_loaded_engine
+        )
         
-        # 4. 프리미엄 모델도 선택사항
-        if ai_engine:  # 기본 모델이 있을 때만 시도
-            try:
-                logger.info("💎 프리미엄 모델 로드 시도 중...")
-                premium_ai_engine = EFTAIEngine(
-                    model_name=settings.PREMIUM_TIER_MODEL,
-                    device=settings.DEVICE,
-                    max_memory=settings.MAX_MEMORY
-                )
-                await premium_ai_engine.initialize()
-                logger.info("✅ 프리미엄 모델 로드 완료!")
-            except Exception as premium_error:
-                logger.warning(f"⚠️ 프리미엄 모델 로드 실패: {premium_error}")
-                premium_ai_engine = None
-        
-        logger.info("🚀 EFT AI 서버 완전히 시작 완료!")
+        # 4. 미리 로드할 모델은 백그라운드에서 로드 (그동안 감정 분석/EFT 추천 등 모델 없는 엔드포인트는 바로 응답)
+        preload_task = asyncio.create_task(preload_models(time.perf_counter()))
+        
+        logger.info("🚀 EFT AI 서버 시작 완료! (모델은 백그라운드 로드 중, /ready 로 준비 상태 확인)")
         
     except Exception as e:
         logger.error(f"❌ 중요한 서비스 시작 실패: {e}")
@@ -257,14 +256,130 @@ async def shutdown_event():
     """서버 종료시 리소스 정리"""
     logger.info("🔄 서버 종료 중...")
     
-    if ai_engine:
-        await ai_engine.cleanup()
+    if preload_task and not preload_task.done():
+        preload_task.cancel()
+    
+    if model_pool:
+        await model_pool.shutdown()
     
-    if premium_ai_engine:
-        await premium_ai_engine.cleanup()
+    if emotion_analyzer:
+        emotion_analyzer.shutdown_executor()
         
     logger.info("✅ 서버 종료 완료")
 
+async def preload_models(started_at: float):
+    """MODEL_POOL_PRELOAD 모델을 순서대로 로드/워밍업 (선택사항 - 실패해도 기본 서비스로 계속 실행, PyTorch 이슈 우회)"""
+    readiness["status"] = "loading"
+    readiness["models"] = {name: "pending" for name in settings.MODEL_POOL_PRELOAD}
+    for name in settings.MODEL_POOL_PRELOAD:
+        readiness["models"][name] = "loading"
+        try:
+            logger.info(f"🆓 로컬 AI 모델 로드 시도 중... ({name})")
+            engine = await model_pool.get(name)  # 로드 후 prepare_loaded_engine 에서 워밍업
+            readiness["models"][name] = "ready" if engine.warmup_seconds is not None else "warmup_failed"
+            logger.info("✅ 로컬 AI 모델 로드 성공!")
+        except Exception as ai_error:
+            readiness["models"][name] = "failed"
+            logger.warning(f"⚠️ 로컬 AI 모델 로드 실패 ({name}): {ai_error}")
+            logger.info("📢 vLLM 서버 연동으로 대체 가능합니다")
+    
+    readiness["startup_seconds"] = time.perf_counter() - started_at
+    if all(state == "ready" for state in readiness["models"].values()):
+        readiness["status"] = "ready"
+        logger.info(f"🟢 서버 준비 완료 ({readiness['startup_seconds']:.1f}초)")
+    else:
+        readiness["status"] = "degraded"
+        logger.warning(f"⚠️ 일부 모델 준비 실패 - /ready 503 유지: {readiness['models']}")
+
+async def prepare_loaded_engine(spec: ModelSpec, engine: EFTAIEngine):
+    """모델 풀이 새로 로드한 엔진 준비 - 이 모델로 처리하는 티어의 고정 시스템 프롬프트 KV 상태 계산 후
+    티어별 실제 EFT 프롬프트로 워밍업 생성 (첫 요청이 첫 실행 비용을 떠안지 않도록)"""
+    tiers = sorted({
+        tier for other in model_pool.specs.values() if other.engine_key == spec.engine_key for tier in other.tiers
+    })
+    try:
+        await engine.warm_prefix_cache(prompt_manager.get_static_prefix(tier) for tier in tiers)
+    except Exception as e:
+        # 프리픽스 캐시 없이도 생성 가능 - 워밍업은 계속
+        logger.warning(f"⚠️ 프리픽스 KV 캐시 준비 실패 ({spec.name}): {e}")
+    
+    emotion_analysis = await emotion_analyzer.analyze(_WARMUP_MESSAGE)
+    await engine.warm_up(
+        prompt_manager.build_eft_prompt(
+            user_message=_WARMUP_MESSAGE,
+            emotion_state=emotion_analysis,
+            tier=tier,
+            token_budget=engine.token_budget
+        )
+        for tier in tiers
+    )
+
+async def acquire_engine(*names: str) -> EFTAIEngine:
+    """모델 풀에서 엔진 대여 (앞 순서부터 시도해 첫 사용 가능 모델, 모두 불가하면 503) - 사용 후 model_pool.release()"""
+    if not model_pool:
+        raise HTTPException(
+            status_code=503, 
+            detail="AI 모델이 아직 로드되지 않았습니다. 잠시 후 다시 시도해주세요."
+        )
+    
+    last_error = None
+    for name in names:
+        try:
+            return await model_pool.acquire(name)
+        except Exception as e:
+            logger.warning(f"⚠️ 모델 사용 불가 ({name}): {e}")
+            last_error = e
+    
+    if isinstance(last_error, AdmissionRejected):
+        raise overloaded_error(last_error)
+    raise HTTPException(
+        status_code=503, 
+        detail="AI 모델을 사용할 수 없습니다. 잠시 후 다시 시도해주세요."
+    )
+
+def engine_state(name: str) -> str:
+    """모델 풀 엔진 로드 상태 (헬스 체크용)"""
+    if not model_pool:
+        return "not_loaded"
+    if model_pool.is_loaded(name):
+        return "loaded"
+    return "loading" if model_pool.is_loading(name) else "not_loaded"
+
+def preview_session_emotion(session_id: Optional[str], emotion_analysis):
+    """새 메시지를 반영한 세션 감정 상태 후보 (프롬프트용, 저장은 응답 성공 후 - session_id 없으면 None)"""
+    if not session_id or not session_emotion_store:
+        return None
+    return session_emotion_store.preview(session_id, emotion_analysis)
+
+def commit_session_emotion(session_id: Optional[str], emotion_analysis):
+    """응답에 성공한 턴을 세션 감정 상태에 반영"""
+    if session_id and session_emotion_store:
+        session_emotion_store.update(session_id, emotion_analysis)
+
+def schedule_session_emotion(background_tasks: BackgroundTasks, session_id: Optional[str], emotion_analysis):
+    """응답 전송 후 세션 감정 상태 반영 (엔드포인트가 예외로 끝나면 백그라운드 작업은 실행되지 않음)"""
+    if session_id and session_emotion_store:
+        background_tasks.add_task(session_emotion_store.update, session_id, emotion_analysis)
+
+def get_session_summary(session_id: Optional[str]):
+    """세션 대화 요약 조회 (session_id 없거나 요약 비활성화 시 None)"""
+    if not session_id or not session_summary_store:
+        return None
+    return session_summary_store.get(session_id)
+
+def schedule_summary_fold(background_tasks: BackgroundTasks, session_id: Optional[str], history):
+    """최근 창 밖으로 밀려난 대화를 응답 전송 후 세션 요약에 반영 (요청 경로 지연 없음)"""
+    if session_id and session_summary_store and history:
+        background_tasks.add_task(session_summary_store.fold, session_id, list(history))
+
+def overloaded_error(error: AdmissionRejected) -> HTTPException:
+    """수락 거절 → 503 (관측된 처리 속도 기반 Retry-After)"""
+    return HTTPException(
+        status_code=503,
+        detail=f"요청이 많아 지금은 처리할 수 없습니다. {error.retry_after}초 후 다시 시도해주세요.",
+        headers={"Retry-After": str(error.retry_after)}
+    )
+
 # 기본 엔드포인트
 @app.get("/")
 async def root():
@@ -273,7 +388,7 @@ async def root():
         "service": "EFT AI 상담 서버",
         "status": "running",
         "version": "1.0.0",
-        "model_loaded": ai_engine is not None,
+        "model_loaded": engine_state("free") == "loaded",
         "timestamp": datetime.now().isoformat()
     }
 
@@ -285,12 +400,15 @@ async def health_check():
         "tier": settings.USER_TIER,
         "strategy": settings.AB_TEST_STRATEGY,
         "free_engines": {k: {"model": v["model"], "port": v["port"]} for k, v in settings.FREE_ENGINES.items()},
-        "free_ai_engine": "loaded" if ai_engine else "not_loaded",
-        "premium_ai_engine": "loaded" if premium_ai_engine else "not_loaded",
+        "free_ai_engine": engine_state("free"),
+        "premium_ai_engine": engine_state("premium"),
+        "enterprise_ai_engine": engine_state("enterprise"),
         "prompt_manager": "loaded" if prompt_manager else "not_loaded",
         "emotion_analyzer": "loaded" if emotion_analyzer else "not_loaded",
+        "ready": readiness["status"] == "ready",
         "uptime": time.time(),
-        "available_tiers": ["free", "premium"],  # 프리미엄은 항상 사용 가능 (폴백 지원)
+        "available_tiers": ["free", "premium", "enterprise"],  # 프리미엄/엔터프라이즈는 항상 사용 가능 (폴백 지원, 첫 요청 시 로드)
+        "model_presets": list(MODEL_PRESETS),
         "sticky_sessions_count": len(getattr(settings, 'STICKY_SESSIONS', {})),
         "supported_strategies": ["round_robin", "random", "weighted", "sticky"],
         "vllm_timeouts": {
@@ -301,34 +419,46 @@ async def health_check():
         "memory_usage": "TODO: 메모리 사용량"
     }
 
+@app.get("/ready")
+async def readiness_check():
+    """준비 상태 프로브 - 미리 로드할 모델의 로드와 워밍업이 끝나야 200, 그 전/실패 시 503
+    (/health 는 프로세스 생존 여부만 표시 - 롤링 배포는 /ready 로 트래픽 투입 시점 결정)"""
+    from fastapi.responses import JSONResponse
+    body = {
+        "status": readiness["status"],
+        "models": dict(readiness["models"]),
+        "startup_seconds": readiness["startup_seconds"],
+        "timestamp": datetime.now().isoformat()
+    }
+    return JSONResponse(status_code=200 if readiness["status"] == "ready" else 503, content=body)
+
 @app.get("/api/health")
 async def health_check_api():
     """헬스 체크 엔드포인트 (API 경로)"""
     # 동일한 응답 반환
     return {
         "status": "healthy",
-        "free_ai_engine": "loaded" if ai_engine else "not_loaded",
-        "premium_ai_engine": "loaded" if premium_ai_engine else "not_loaded",
+        "free_ai_engine": engine_state("free"),
+        "premium_ai_engine": engine_state("premium"),
+        "enterprise_ai_engine": engine_state("enterprise"),
         "prompt_manager": "loaded" if prompt_manager else "not_loaded",
         "emotion_analyzer": "loaded" if emotion_analyzer else "not_loaded",
+        "ready": readiness["status"] == "ready",
         "uptime": time.time(),
-        "available_tiers": ["free", "premium"],  # 프리미엄은 항상 사용 가능 (폴백 지원)
+        "available_tiers": ["free", "premium", "enterprise"],  # 프리미엄/엔터프라이즈는 항상 사용 가능 (폴백 지원, 첫 요청 시 로드)
+        "model_presets": list(MODEL_PRESETS),
         "memory_usage": "TODO: 메모리 사용량"
     }
 
 # 무료 모델 AI 채팅 엔드포인트 (DialoGPT)
 @app.post("/api/chat/free", response_model=ChatResponse)
-async def eft_chat_free(request: ChatRequest):
+async def eft_chat_free(request: ChatRequest, background_tasks: BackgroundTasks):
     """
     무료 티어 EFT AI 상담 채팅 (DialoGPT 기반)
     - 토큰 제한: 1024 토큰
     - 기본 감정 분석 및 EFT 추천
     """
-    if not ai_engine:
-        raise HTTPException(
-            status_code=503, 
-            detail="AI 모델이 아직 로드되지 않았습니다. 잠시 후 다시 시도해주세요."
-        )
+    engine = await acquire_engine("free")
     
     try:
         start_time = time.time()
@@ -336,20 +466,28 @@ async def eft_chat_free(request: ChatRequest):
         # 1. 감정 분석
         emotion_analysis = await emotion_analyzer.analyze(request.message)
         logger.info(f"[FREE] 감정 분석: {emotion_analysis}")
+        session_state = preview_session_emotion(request.session_id, emotion_analysis)
+        message_signals = prompt_manager.scan_message(request.message)  # 안전성/문화 키워드 (한 번만 스캔)
+        session_summary = get_session_summary(request.session_id)
         
         # 2. EFT 맞춤 프롬프트 생성
         eft_prompt = prompt_manager.build_eft_prompt(
             user_message=request.message,
             emotion_state=emotion_analysis,
             conversation_history=request.conversation_history,
-            user_profile=request.user_profile
+            user_profile=request.user_profile,
+            session_state=session_state,
+            token_budget=engine.token_budget,  # 모델 입력 한도 내 조립 (토큰 ID 그대로 전달)
+            message_signals=message_signals,
+            session_summary=session_summary
         )
         
         # 3. 무료 모델 응답 생성 (토큰 제한)
-        ai_response = await ai_engine.generate_response(
+        ai_response = await engine.generate_response(
             prompt=eft_prompt,
             max_tokens=min(request.max_tokens or 150, 150),  # 무료는 최대 150토큰
-            temperature=request.temperature or 0.7
+            temperature=request.temperature or 0.7,
+            length_policy=prompt_manager.get_response_length_policy("free")  # 응답이 완성되면 조기 종료
         )
         
         # 4. 후처리 및 EFT 추천
@@ -358,6 +496,8 @@ async def eft_chat_free(request: ChatRequest):
         )
         
         processing_time = time.time() - start_time
+        schedule_session_emotion(background_tasks, request.session_id, emotion_analysis)
+        schedule_summary_fold(background_tasks, request.session_id, request.conversation_history)
         
         # 5. 응답 반환
         return ChatResponse(
@@ -369,44 +509,52 @@ async def eft_chat_free(request: ChatRequest):
             processing_time=processing_time,
             timestamp=datetime.now().isoformat(),
             response_id=f"free_resp_{int(time.time() * 1000)}",
-            tier="free"
+            tier="free",
+            session_id=request.session_id,
+            emergency_detected=message_signals.emergency,
+            professional_referral=message_signals.professional_referral
         )
         
+    except AdmissionRejected as e:
+        raise overloaded_error(e)
     except Exception as e:
         logger.error(f"무료 채팅 처리 오류: {e}")
         raise HTTPException(
             status_code=500,
             detail=f"AI 응답 생성 중 오류가 발생했습니다: {str(e)}"
         )
+    
+    finally:
+        model_pool.release(engine)
 
-# 유료 모델 AI 채팅 엔드포인트 (Llama-3.1-8B)
-@app.post("/api/chat/premium", response_model=ChatResponse)
-async def eft_chat_premium(request: ChatRequest):
-    """
-    프리미엄 티어 EFT AI 상담 채팅 (Llama-3.1-8B 기반)
-    - 토큰 제한: 4000 토큰
-    - 고급 감정 분석 및 전문 EFT 상담
-    - 개인화된 맞춤 추천
-    """
-    # 프리미엄 모델 사용 가능 여부 체크
-    active_engine = premium_ai_engine if premium_ai_engine else ai_engine
+# 유료 티어 공통 처리 (프리미엄/엔터프라이즈)
+async def chat_with_tier(
+    request: ChatRequest,
+    background_tasks: BackgroundTasks,
+    tier: str,
+    max_tokens: int
+) -> ChatResponse:
+    """유료 티어 EFT 상담 - 요청 프리셋 → 티어 모델 → 하위 티어 모델 순으로 사용 가능한 모델 선택"""
+    if request.preset and request.preset not in MODEL_PRESETS:
+        raise HTTPException(status_code=400, detail=f"알 수 없는 모델 프리셋: {request.preset}")
     
-    if not active_engine:
-        raise HTTPException(
-            status_code=503, 
-            detail="AI 모델이 아직 로드되지 않았습니다. 잠시 후 다시 시도해주세요."
-        )
+    candidates = [request.preset] if request.preset else []
+    candidates += ["enterprise", "premium", "free"] if tier == "enterprise" else ["premium", "free"]
+    active_engine = await acquire_engine(*candidates)
     
-    # 프리미엄 모델이 없으면 폴백 안내
-    if not premium_ai_engine:
-        logger.warning("프리미엄 모델 사용 불가, 무료 모델로 폴백")
+    # 요청한 모델이 없으면 폴백 안내
+    if active_engine is not model_pool.peek(candidates[0]):
+        logger.warning(f"{candidates[0]} 모델 사용 불가, {active_engine.model_name} 모델로 폴백")
     
     try:
         start_time = time.time()
         
         # 1. 고급 감정 분석
         emotion_analysis = await emotion_analyzer.analyze(request.message)
-        logger.info(f"[PREMIUM] 감정 분석: {emotion_analysis}")
+        logger.info(f"[{tier.upper()}] 감정 분석: {emotion_analysis}")
+        session_state = preview_session_emotion(request.session_id, emotion_analysis)
+        message_signals = prompt_manager.scan_message(request.message)  # 안전성/문화 키워드 (한 번만 스캔)
+        session_summary = get_session_summary(request.session_id)
         
         # 2. 고급 EFT 맞춤 프롬프트 생성
         eft_prompt = prompt_manager.build_eft_prompt(
@@ -414,22 +562,29 @@ async def eft_chat_premium(request: ChatRequest):
             emotion_state=emotion_analysis,
             conversation_history=request.conversation_history,
             user_profile=request.user_profile,
-            tier="premium"  # 프리미엄 전용 프롬프트
+            tier=tier,  # 티어 전용 프롬프트
+            session_state=session_state,
+            token_budget=active_engine.token_budget,
+            message_signals=message_signals,
+            session_summary=session_summary
         )
         
-        # 3. 프리미엄 모델 응답 생성 (높은 토큰 한도)
+        # 3. 유료 모델 응답 생성 (높은 토큰 한도)
         ai_response = await active_engine.generate_response(
             prompt=eft_prompt,
-            max_tokens=min(request.max_tokens or 800, 800),  # 프리미엄은 최대 800토큰
-            temperature=request.temperature or 0.7
+            max_tokens=min(request.max_tokens or max_tokens, max_tokens),
+            temperature=request.temperature or 0.7,
+            length_policy=prompt_manager.get_response_length_policy(tier)
         )
         
         # 4. 고급 후처리 및 전문 EFT 추천
         processed_response = prompt_manager.post_process_response(
-            ai_response, emotion_analysis, tier="premium"
+            ai_response, emotion_analysis, tier=tier
         )
         
         processing_time = time.time() - start_time
+        schedule_session_emotion(background_tasks, request.session_id, emotion_analysis)
+        schedule_summary_fold(background_tasks, request.session_id, request.conversation_history)
         
         # 5. 응답 반환
         return ChatResponse(
@@ -440,48 +595,120 @@ async def eft_chat_premium(request: ChatRequest):
             confidence_score=processed_response["confidence"],
             processing_time=processing_time,
             timestamp=datetime.now().isoformat(),
-            response_id=f"premium_resp_{int(time.time() * 1000)}",
-            tier="premium"
+            response_id=f"{tier}_resp_{int(time.time() * 1000)}",
+            tier=tier,
+            session_id=request.session_id,
+            emergency_detected=message_signals.emergency,
+            professional_referral=message_signals.professional_referral
         )
         
+    except AdmissionRejected as e:
+        raise overloaded_error(e)
     except Exception as e:
-        logger.error(f"프리미엄 채팅 처리 오류: {e}")
+        logger.error(f"{tier} 채팅 처리 오류: {e}")
         raise HTTPException(
             status_code=500,
             detail=f"AI 응답 생성 중 오류가 발생했습니다: {str(e)}"
         )
+    
+    finally:
+        model_pool.release(active_engine)
+
+# 유료 모델 AI 채팅 엔드포인트 (Llama-3.1-8B)
+@app.post("/api/chat/premium", response_model=ChatResponse)
+async def eft_chat_premium(request: ChatRequest, background_tasks: BackgroundTasks):
+    """
+    프리미엄 티어 EFT AI 상담 채팅 (Llama-3.1-8B 기반)
+    - 토큰 제한: 4000 토큰
+    - 고급 감정 분석 및 전문 EFT 상담
+    - 개인화된 맞춤 추천
+    - preset 지정 시 해당 MODEL_PRESETS 모델 사용 (첫 요청 시 로드)
+    """
+    return await chat_with_tier(request, background_tasks, "premium", max_tokens=800)  # 프리미엄은 최대 800토큰
+
+# 엔터프라이즈 모델 AI 채팅 엔드포인트 (Llama-3.1-70B)
+@app.post("/api/chat/enterprise", response_model=ChatResponse)
+async def eft_chat_enterprise(request: ChatRequest, background_tasks: BackgroundTasks):
+    """
+    엔터프라이즈 티어 EFT AI 상담 채팅 (Llama-3.1-70B 기반)
+    - 최고 수준 분석 및 통합적 EFT 상담
+    - 모델을 사용할 수 없으면 프리미엄 → 무료 모델로 폴백
+    - preset 지정 시 해당 MODEL_PRESETS 모델 사용 (첫 요청 시 로드)
+    """
+    return await chat_with_tier(request, background_tasks, "enterprise", max_tokens=1000)  # 엔터프라이즈는 최대 1000토큰
 
 # 기존 채팅 엔드포인트 (무료 모델로 리다이렉트)
 @app.post("/api/chat", response_model=ChatResponse)
-async def eft_chat(request: ChatRequest):
+async def eft_chat(request: ChatRequest, background_tasks: BackgroundTasks):
     """
     기본 EFT AI 상담 채팅 (무료 모델로 리다이렉트)
     하위 호환성을 위해 유지
     """
-    return await eft_chat_free(request)
+    return await eft_chat_free(request, background_tasks)
 
 # 스트리밍 채팅 (긴 응답용)
 @app.post("/api/chat/stream")
-async def eft_chat_stream(request: ChatRequest):
-    """실시간 스트리밍 채팅 (긴 응답용)"""
-    if not ai_engine:
-        raise HTTPException(status_code=503, detail="AI 모델이 로드되지 않았습니다.")
+async def eft_chat_stream(request: ChatRequest, background_tasks: BackgroundTasks):
+    """실시간 스트리밍 채팅 (긴 응답용) - 모델이 디코딩하는 즉시 토큰 전달, 마지막 청크에 TTFT/초당 토큰 수"""
+    engine = await acquire_engine("free")
+    
+    # 첫 청크까지 먼저 받아 과부하 거절은 스트림 시작 전에 503으로 응답
+    stream = None
+    first_chunk = None
+    try:
+        # 감정 분석
+        emotion_analysis = await emotion_analyzer.analyze(request.message)
+        session_state = preview_session_emotion(request.session_id, emotion_analysis)
+        
+        # EFT 맞춤 프롬프트 (무료 엔드포인트와 동일한 토큰 예산 조립)
+        eft_prompt = prompt_manager.build_eft_prompt(
+            user_message=request.message,
+            emotion_state=emotion_analysis,
+            conversation_history=request.conversation_history,
+            user_profile=request.user_profile,
+            session_state=session_state,
+            token_budget=engine.token_budget,
+            session_summary=get_session_summary(request.session_id)
+        )
+        
+        # 스트리밍 응답 생성 (실행 슬롯 확보 후 첫 청크)
+        stream = engine.generate_stream(
+            message=request.message,
+            emotion_state=emotion_analysis,
+            prompt=eft_prompt,
+            max_tokens=request.max_tokens or 400,
+            temperature=request.temperature or 0.7,
+            length_policy=prompt_manager.get_response_length_policy("free")  # 무료 티어 프롬프트와 같은 길이 가이드
+        )
+        first_chunk = await stream.__anext__()
+    except AdmissionRejected as e:
+        raise overloaded_error(e)
+    except Exception as e:
+        first_chunk = e
+    finally:
+        # 생성 중에는 엔진의 실행 슬롯이 축출을 막으므로 대여는 첫 청크까지만 유지
+        model_pool.release(engine)
     
     async def generate_stream():
         try:
-            # 감정 분석
-            emotion_analysis = await emotion_analyzer.analyze(request.message)
-            
-            # 스트리밍 응답 생성
-            async for chunk in ai_engine.generate_stream(
-                message=request.message,
-                emotion_state=emotion_analysis
-            ):
+            if isinstance(first_chunk, Exception):
+                raise first_chunk
+            yield f"data: {json.dumps(first_chunk, ensure_ascii=False)}\n\n"
+            async for chunk in stream:
                 yield f"data: {json.dumps(chunk, ensure_ascii=False)}\n\n"
-                
+
+            # 끝까지 생성된 턴만 세션 감정 상태에 반영 (중간 오류는 오류 청크로 끝나므로 제외)
+            commit_session_emotion(request.session_id, emotion_analysis)
+
         except Exception as e:
             error_chunk = {"error": str(e), "type": "generation_error"}
             yield f"data: {json.dumps(error_chunk, ensure_ascii=False)}\n\n"
+        
+        finally:
+            if stream is not None:
+                await stream.aclose()
+    
+    schedule_summary_fold(background_tasks, request.session_id, request.conversation_history)
     
     from fastapi.responses import StreamingResponse
     return StreamingResponse(
@@ -511,6 +738,73 @@ async def analyze_emotion(request: dict):
         "timestamp": datetime.now().isoformat()
     }
 
+# 문장 단위 감정 타임라인 스트리밍 (일기/상담 노트 등 긴 텍스트용)
+@app.post("/api/analyze/emotion/stream")
+async def analyze_emotion_stream(request: dict):
+    """문장별 감정 분석 결과를 NDJSON으로 스트리밍 (한 줄에 한 문장, 마지막 줄은 요약)"""
+    if not emotion_analyzer:
+        raise HTTPException(status_code=503, detail="감정 분석 모델이 로드되지 않았습니다.")
+    
+    text = request.get("text", "")
+    if not isinstance(text, str) or not text.strip():
+        raise HTTPException(status_code=400, detail="분석할 텍스트가 필요합니다.")
+    
+    async def generate_timeline():
+        start_time = time.time()
+        sentence_count = 0
+        try:
+            async for sentence_emotion in emotion_analyzer.analyze_sentences(text):
+                sentence_count += 1
+                yield json.dumps(
+                    {"type": "sentence", **sentence_emotion.model_dump(mode="json")},
+                    ensure_ascii=False
+                ) + "\n"
+        except Exception as e:
+            logger.error(f"감정 타임라인 스트리밍 오류: {e}")
+            yield json.dumps({"type": "error", "error": str(e)}, ensure_ascii=False) + "\n"
+        
+        yield json.dumps({
+            "type": "end",
+            "sentence_count": sentence_count,
+            "processing_time": time.time() - start_time,
+            "timestamp": datetime.now().isoformat()
+        }, ensure_ascii=False) + "\n"
+    
+    from fastapi.responses import StreamingResponse
+    return StreamingResponse(
+        generate_timeline(),
+        media_type="application/x-ndjson",
+        headers={"Cache-Control": "no-cache"}
+    )
+
+# 배치 감정 분석 엔드포인트 (야간 재분석 등 대량 처리용)
+@app.post("/api/analyze/emotion/batch")
+async def analyze_emotion_batch(request: dict):
+    """여러 텍스트 일괄 감정 분석 (입력 순서대로 결과 반환)"""
+    if not emotion_analyzer:
+        raise HTTPException(status_code=503, detail="감정 분석 모델이 로드되지 않았습니다.")
+    
+    texts = request.get("texts")
+    if not isinstance(texts, list) or not texts:
+        raise HTTPException(status_code=400, detail="분석할 텍스트 목록(texts)이 필요합니다.")
+    if len(texts) > settings.EMOTION_BATCH_MAX_TEXTS:
+        raise HTTPException(
+            status_code=413,
+            detail=f"배치 크기 초과: 최대 {settings.EMOTION_BATCH_MAX_TEXTS}개까지 분석 가능합니다."
+        )
+    if not all(isinstance(text, str) for text in texts):
+        raise HTTPException(status_code=400, detail="texts 항목은 모두 문자열이어야 합니다.")
+    
+    start_time = time.time()
+    analyses = await emotion_analyzer.analyze_batch(texts)
+    
+    return {
+        "count": len(analyses),
+        "emotion_analyses": analyses,
+        "processing_time": time.time() - start_time,
+        "timestamp": datetime.now().isoformat()
+    }
+
 # EFT 기법 추천 엔드포인트
 @app.post("/api/recommend/eft")
 async def recommend_eft_technique(request: dict):
@@ -522,42 +816,104 @@ async def recommend_eft_technique(request: dict):
     if not emotion_state:
         raise HTTPException(status_code=400, detail="감정 상태 정보가 필요합니다.")
     
-    recommendations = prompt_manager.recommend_eft_techniques(emotion_state)
-    return {
-        "emotion_state": emotion_state,
-        "recommendations": recommendations,
-        "timestamp": datetime.now().isoformat()
-    }
+    try:
+        emotion_analysis = EmotionAnalysis.model_validate(emotion_state)
+    except ValidationError as e:
+        raise HTTPException(status_code=400, detail=f"감정 상태 형식이 올바르지 않습니다: {e.errors()[:3]}")
+    
+    # 감정별로 미리 직렬화된 추천 JSON을 응답 본문에 그대로 삽입 (요청마다 모델 생성/직렬화 없음)
+    recommendations_json = prompt_manager.recommend_eft_techniques_json(emotion_analysis)
+    body = (
+        f'{{"emotion_state":{json.dumps(emotion_state, ensure_ascii=False)},'
+        f'"recommendations":{recommendations_json},'
+        f'"timestamp":{json.dumps(datetime.now().isoformat())}}}'
+    )
+    
+    from fastapi.responses import Response
+    return Response(content=body, media_type="application/json")
 
 # 모델 성능 통계
 @app.get("/api/stats")
 async def get_model_stats():
     """모델 성능 및 사용 통계"""
-    if not ai_engine:
-        return {"error": "AI 모델이 로드되지 않았습니다."}
+    emotion_cache_stats = emotion_analyzer.get_cache_stats() if emotion_analyzer else None
+    emotion_executor_stats = emotion_analyzer.get_executor_stats() if emotion_analyzer else None
+    session_store_stats = session_emotion_store.get_stats() if session_emotion_store else None
+    summary_store_stats = session_summary_store.get_stats() if session_summary_store else None
+    lexicon_info = emotion_analyzer.get_lexicon_info() if emotion_analyzer else None
+    
+    pool_stats = model_pool.get_stats() if model_pool else None
+    
+    free_engine = model_pool.peek("free") if model_pool else None
+    if not free_engine:
+        return {
+            "error": "AI 모델이 로드되지 않았습니다.",
+            "model_pool": pool_stats,
+            "emotion_analysis_cache": emotion_cache_stats,
+            "emotion_analysis_executor": emotion_executor_stats,
+            "session_emotion_store": session_store_stats,
+            "session_summary_store": summary_store_stats,
+            "emotion_lexicon": lexicon_info
+        }
     
-    stats = await ai_engine.get_performance_stats()
+    stats = await free_engine.get_performance_stats()
     return {
         "model_stats": stats,
+        "model_pool": pool_stats,
+        "emotion_analysis_cache": emotion_cache_stats,
+        "emotion_analysis_executor": emotion_executor_stats,
+        "session_emotion_store": session_store_stats,
+        "session_summary_store": summary_store_stats,
+        "emotion_lexicon": lexicon_info,
         "server_uptime": time.time(),
         "total_requests": "TODO: 요청 수 추적",
         "average_response_time": "TODO: 평균 응답 시간"
     }
 
+def verify_admin_access(req: Request, x_admin_token: Optional[str]):
+    """관리자 전용 엔드포인트 접근 검사 (운영에서는 관리자 토큰 + 내부망만 허용)"""
+    if settings.DEBUG:
+        return
+    # 토큰 우선 체크
+    if settings.ADMIN_API_KEY and x_admin_token != settings.ADMIN_API_KEY:
+        raise HTTPException(status_code=403, detail="forbidden")
+    # 토큰이 없으면 내부 IP만
+    client = (req.client.host if req.client else "")
+    if client not in settings.INTERNAL_NETWORKS:
+        raise HTTPException(status_code=403, detail="forbidden")
+
+# 감정 사전 런타임 교체 (콘텐츠 편집 반영 - 서버/모델 재시작 없음)
+@app.post("/admin/lexicon/reload")
+async def reload_emotion_lexicon(req: Request, x_admin_token: Optional[str] = Header(None)):
+    """감정 사전 재컴파일 후 원자적 교체 (body: {"rebuild": false} 이면 기존 아티팩트만 다시 적재)"""
+    verify_admin_access(req, x_admin_token)
+    
+    if not emotion_analyzer:
+        raise HTTPException(status_code=503, detail="감정 분석 모델이 로드되지 않았습니다.")
+    
+    try:
+        body = await req.json() if await req.body() else {}
+    except ValueError:
+        raise HTTPException(status_code=400, detail="잘못된 JSON 본문입니다.")
+    rebuild = bool(body.get("rebuild", True)) if isinstance(body, dict) else True
+    
+    try:
+        # 컴파일/적재는 이벤트 루프 밖에서 수행 (교체 자체는 참조 하나만 바꿈)
+        loop = asyncio.get_running_loop()
+        lexicon_info = await loop.run_in_executor(None, emotion_analyzer.reload_lexicon, rebuild)
+    except Exception as e:
+        logger.error(f"감정 사전 교체 실패: {e}")
+        raise HTTPException(status_code=500, detail=f"감정 사전 교체 실패: {str(e)}")
+    
+    return {"status": "reloaded", "lexicon": lexicon_info, "timestamp": datetime.now().isoformat()}
+
 # Enhanced vLLM upstream health check endpoint  
 @app.get("/health/upstreams")
 async def health_upstreams(req: Request, x_admin_token: Optional[str] = Header(None)):
     """vLLM upstream 서버들의 상태를 체크합니다 (운영에서는 내부망/관리자 전용)"""
     
     # 운영 환경에서 보안 체크
-    if not settings.DEBUG:
-        # 토큰 우선 체크
-        if settings.ADMIN_API_KEY and x_admin_token != settings.ADMIN_API_KEY:
-            raise HTTPException(status_code=403, detail="forbidden")
-        # 토큰이 없으면 내부 IP만
-        client = (req.client.host if req.client else "")
-        if client not in settings.INTERNAL_NETWORKS:
-            raise HTTPException(status_code=403, detail="forbidden")
+    verify_admin_access(req, x_admin_token)
     import httpx
     upstreams = {}
     
@@ -616,6 +972,8 @@ class ChatProxyRequest(BaseModel):
     temperature: Optional[float] = Field(default=0.7, ge=0.0, le=2.0, description="창의성 수준")
     max_tokens: Optional[int] = Field(default=512, ge=1, le=2000, description="최대 토큰 수")
     model: Optional[str] = Field(default=None, description="요청 모델명 (선택사항)")
+    conversation_history: List[ConversationMessage] = Field(default_factory=list, max_length=20, description="대화 이력")
+    session_id: Optional[str] = Field(default=None, description="세션 ID")
     
 # 폴백 로직을 위한 도우미 함수
 def other_engine_key(cur_key: str) -> Optional[str]:
@@ -629,7 +987,7 @@ def other_engine_key(cur_key: str) -> Optional[str]:
     return None
 
 @app.post("/api/chat/completion")
-async def completion(request: ChatProxyRequest, req: Request):
+async def completion(request: ChatProxyRequest, req: Request, background_tasks: BackgroundTasks):
     """A/B 테스트용 채팅 완성 엔드포인트 (강화 + 폴백)"""
     import httpx
     
@@ -643,12 +1001,33 @@ async def completion(request: ChatProxyRequest, req: Request):
         base = f"http://127.0.0.1:{engine['port']}/v1"
         
         # vLLM(OpenAI 호환) chat.completions
-        payload = {
-            "model": request.model or engine["model"],
-            "messages": [
+        prefix_hash = None
+        if settings.VLLM_PROMPT_LAYOUT == "messages":
+            # 고정 system 메시지 + 가변 user 메시지 (vLLM 자동 프리픽스 캐시로 system 구간 prefill 재사용)
+            emotion_analysis = await emotion_analyzer.analyze(request.message)
+            session_state = preview_session_emotion(request.session_id, emotion_analysis)
+            chat_prompt = prompt_manager.build_chat_messages(
+                user_message=request.message,
+                emotion_state=emotion_analysis,
+                conversation_history=request.conversation_history,
+                session_state=session_state,
+                session_summary=get_session_summary(request.session_id)
+            )
+            # 두 엔진 모두 실패하면 HTTPException으로 끝나 아래 백그라운드 작업은 실행되지 않음
+            schedule_session_emotion(background_tasks, request.session_id, emotion_analysis)
+            schedule_summary_fold(background_tasks, request.session_id, request.conversation_history)
+            messages = chat_prompt.messages
+            prefix_hash = chat_prompt.prefix_hash
+            logger.info(f"[{correlation_id}] 프롬프트 프리픽스: {prefix_hash} ({chat_prompt.prefix_chars}자)")
+        else:
+            messages = [
                 {"role": "system", "content": "You are a helpful EFT counselor assistant specialized in Korean emotional support."},
                 {"role": "user", "content": request.message},
-            ],
+            ]
+        
+        payload = {
+            "model": request.model or engine["model"],
+            "messages": messages,
             "temperature": request.temperature,
             "max_tokens": request.max_tokens,
         }
@@ -679,7 +1058,8 @@ async def completion(request: ChatProxyRequest, req: Request):
                     "reply": content,
                     "processing_time": round(processing_time, 3),
                     "timestamp": datetime.now().isoformat(),
-                    "fallback_used": is_fallback
+                    "fallback_used": is_fallback,
+                    "prefix_hash": prefix_hash
                 }
             except Exception as e:
                 logger.error(f"[{correlation_id}] 엔진 {engine_key} 실패: {str(e)[:200]}")
@@ -718,7 +1098,7 @@ async def completion(request: ChatProxyRequest, req: Request):
             max_tokens=request.max_tokens
         )
         
-        response = await eft_chat_premium(chat_req)
+        response = await eft_chat_premium(chat_req, background_tasks)
         return {
             "tier": response.tier,
             "model": settings.PREMIUM_TIER_MODEL,
@@ -727,6 +1107,8 @@ async def completion(request: ChatProxyRequest, req: Request):
             "timestamp": response.timestamp
         }
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"프리미엄 모델 오류: {e}")
         raise HTTPException(status_code=500, detail=f"AI 응답 생성 오류: {str(e)}")
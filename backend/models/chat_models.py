@@ -3,7 +3,7 @@ EFT AI 채팅 관련 Pydantic 모델들
 요청/응답 스키마 정의
 """
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import List, Optional, Dict, Any, Literal
 from datetime import datetime
 from enum import Enum
@@ -61,6 +61,10 @@ class EmotionAnalysis(BaseModel):
     emotional_keywords: List[str] = Field(default=[], description="감정 키워드들")
     context_analysis: Optional[Dict[str, Any]] = Field(default=None, description="상황 분석")
 
+class FrozenEmotionAnalysis(EmotionAnalysis):
+    """불변 감정 분석 결과 (캐시 공유용, 필드 재할당 불가)"""
+    model_config = ConfigDict(frozen=True)
+
 class EFTRecommendation(BaseModel):
     """EFT 기법 추천"""
     technique_name: str = Field(..., description="기법 이름")
@@ -72,6 +76,10 @@ class EFTRecommendation(BaseModel):
     effectiveness_score: float = Field(..., ge=0.0, le=1.0, description="예상 효과성")
     additional_notes: Optional[str] = Field(default=None, description="추가 안내사항")
 
+class FrozenEFTRecommendation(EFTRecommendation):
+    """불변 EFT 기법 추천 (감정별로 미리 생성해 요청 간 공유, 필드 재할당 불가)"""
+    model_config = ConfigDict(frozen=True)
+
 class SuggestedAction(BaseModel):
     """제안 액션"""
     action_type: Literal["eft_session", "breathing", "reflection", "professional_help"] = Field(..., description="액션 타입")
@@ -85,13 +93,14 @@ class SuggestedAction(BaseModel):
 class ChatRequest(BaseModel):
     """채팅 요청"""
     message: str = Field(..., min_length=1, max_length=2000, description="사용자 메시지")
-    conversation_history: List[ConversationMessage] = Field(default=[], max_items=20, description="대화 이력")
+    conversation_history: List[ConversationMessage] = Field(default_factory=list, max_length=20, description="대화 이력")
     user_profile: Optional[UserProfile] = Field(default=None, description="사용자 프로필")
     
     # 생성 파라미터
     max_tokens: Optional[int] = Field(default=400, ge=50, le=1000, description="최대 토큰 수")
     temperature: Optional[float] = Field(default=0.7, ge=0.1, le=1.0, description="창의성 수준")
     top_p: Optional[float] = Field(default=0.9, ge=0.1, le=1.0, description="토큰 선택 확률")
+    preset: Optional[str] = Field(default=None, description="모델 프리셋 (MODEL_PRESETS 키, 프리미엄/엔터프라이즈 전용)")
     
     # EFT 관련 설정
     include_eft_recommendations: bool = Field(default=True, description="EFT 추천 포함 여부")
@@ -139,6 +148,14 @@ class ChatResponse(BaseModel):
     session_id: Optional[str] = Field(default=None, description="세션 ID")
     response_id: str = Field(..., description="응답 고유 ID")
 
+class SentenceEmotion(BaseModel):
+    """문장 단위 감정 분석 결과 (감정 타임라인 스트리밍용)"""
+    index: int = Field(..., description="문장 순번")
+    start: int = Field(..., description="원문 내 시작 위치")
+    end: int = Field(..., description="원문 내 끝 위치")
+    sentence: str = Field(..., description="문장 내용")
+    emotion_analysis: EmotionAnalysis = Field(..., description="문장 감정 분석 결과")
+
 class StreamResponse(BaseModel):
     """스트리밍 응답 청크"""
     chunk_type: Literal["text", "emotion", "eft", "action", "metadata", "error", "end"] = Field(..., description="청크 타입")
@@ -167,6 +184,15 @@ class ModelStats(BaseModel):
     memory_usage_gb: float = Field(default=0.0, description="메모리 사용량(GB)")
     gpu_utilization: Optional[float] = Field(default=None, description="GPU 사용률")
     uptime_hours: float = Field(default=0.0, description="가동 시간")
+    backend: str = Field(default="torch", description="추론 백엔드 (torch/onnx)")
+    quantization: Optional[str] = Field(default=None, description="적용된 CPU 양자화 (예: int8, 미적용 시 None)")
+    prompt_token_stats: Optional[Dict[str, Any]] = Field(default=None, description="프롬프트 토큰 예산 통계")
+    batching_stats: Optional[Dict[str, Any]] = Field(default=None, description="마이크로 배치 통계")
+    admission_stats: Optional[Dict[str, Any]] = Field(default=None, description="수락 제어 통계 (대기열 깊이/대기 시간/거절 수)")
+    prefix_cache_stats: Optional[Dict[str, Any]] = Field(default=None, description="프롬프트 프리픽스 KV 캐시 통계")
+    assisted_decoding_stats: Optional[Dict[str, Any]] = Field(default=None, description="초안 모델 보조 생성 통계 (수락률/속도 배율)")
+    warmup_seconds: Optional[float] = Field(default=None, description="로드 후 워밍업 생성 소요 시간 (미실행 시 None)")
+    early_stopping_stats: Optional[Dict[str, Any]] = Field(default=None, description="응답 길이 정책 조기 종료 통계 (요청별 절약 토큰)")
     last_updated: str = Field(..., description="마지막 업데이트 시간")
 
 class HealthCheckResponse(BaseModel):
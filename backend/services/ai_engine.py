@@ -5,14 +5,20 @@ transformers 라이브러리를 사용한 로컬/클라우드 LLM 추론
 
 import torch
 from transformers import (
+    AutoConfig,
     AutoModelForCausalLM, 
     AutoTokenizer, 
     BitsAndBytesConfig,
+    StoppingCriteria,
+    StoppingCriteriaList,
+    TextStreamer,
     pipeline
 )
-from typing import Optional, Dict, Any, List, AsyncGenerator
+from typing import Optional, Dict, Any, Iterable, List, AsyncGenerator, Sequence, Tuple, Union
 import asyncio
+import threading
 import time
+from contextlib import nullcontext
 from datetime import datetime
 import json
 import gc
@@ -22,10 +28,116 @@ import GPUtil
 from config.settings import get_settings
 from utils.logger import get_logger
 from models.chat_models import EmotionAnalysis, ModelStats
+from services.assisted_decoding import AssistedDecoding, tokenizers_match
+from services.cpu_quantization import (
+    CPU_QUANTIZATION_MODES,
+    load_quantized,
+    quantize_dynamic_int8,
+    quantized_cache_path,
+    save_quantized,
+    state_nbytes
+)
+from services.onnx_backend import INFERENCE_BACKENDS, cached_onnx_dir, load_onnx_causal_lm, onnx_model_nbytes
+from services.prefix_kv_cache import PrefixKVCache
+from services.prompt_tokens import BudgetedPrompt, TokenBudget
+from services.response_length import EarlyStoppingStats, ResponseLengthPolicy, ResponseProgress
+from utils.admission import AdmissionController
+from utils.micro_batcher import MicroBatcher
 
 logger = get_logger(__name__)
 settings = get_settings()
 
+# 모델별 입력 토큰 한도 (채팅 템플릿 포함)
+DIALOGPT_MAX_INPUT_TOKENS = 200  # DialoGPT는 매우 짧게 설정
+DEFAULT_MAX_INPUT_TOKENS = 4000  # Llama 모델은 더 여유롭게
+
+# 스트리밍 생성 종료 표시 (추론 스레드 → 이벤트 루프 큐)
+_STREAM_END = object()
+
+class _AsyncQueueStreamer(TextStreamer):
+    """추론 스레드에서 디코딩된 텍스트를 이벤트 루프의 asyncio.Queue로 전달
+
+    TextStreamer가 단어 경계까지 모아 확정한 텍스트만 전달하므로 청크를 이어 붙이면 전체 응답과 같습니다.
+    """
+
+    def __init__(self, tokenizer, loop: asyncio.AbstractEventLoop, queue: asyncio.Queue):
+        super().__init__(tokenizer, skip_prompt=True, skip_special_tokens=True)
+        self.loop = loop
+        self.queue = queue
+        self.generated_tokens = 0
+
+    def put(self, value):
+        if not self.next_tokens_are_prompt:
+            self.generated_tokens += value.numel()
+        super().put(value)
+
+    def on_finalized_text(self, text: str, stream_end: bool = False):
+        if text:
+            self.loop.call_soon_threadsafe(self.queue.put_nowait, text)
+
+class _CancelledCriteria(StoppingCriteria):
+    """스트림 소비가 중단되면(클라이언트 연결 종료 등) 다음 토큰에서 생성 중단"""
+
+    def __init__(self, cancelled: threading.Event):
+        self.cancelled = cancelled
+
+    def __call__(self, input_ids, scores, **kwargs) -> bool:
+        return self.cancelled.is_set()
+
+class _ResponseLengthCriteria(StoppingCriteria):
+    """응답 길이 정책/응답 끝 표시 기준 조기 종료 (모든 행의 응답이 완성되면 생성 중단)
+
+    행마다 이번 단계에 추가된 토큰만 증분 디코딩해 응답 끝 표시와 길이 정책을 확인
+    (이전 몇 토큰과 함께 디코딩한 뒤 차이만 취하므로 여러 토큰에 걸친 문자/공백도 올바르게 이어 붙임)
+    generate 의 종료 기준은 배치 전체 단위이므로 먼저 끝난 행은 나머지 행이 끝날 때까지 패딩되며,
+    행별 종료 시점(새 토큰 수)은 stopped_at 에 기록
+    """
+
+    def __init__(self, tokenizer, policy: ResponseLengthPolicy, end_markers: Sequence[str], input_width: int, rows: int):
+        self.tokenizer = tokenizer
+        self.policy = policy
+        self.end_markers = end_markers
+        self.input_width = input_width
+        self.eos_token_id = tokenizer.eos_token_id
+        self.reasons: List[Optional[str]] = [None] * rows
+        self.stopped_at: List[Optional[int]] = [None] * rows
+        self._progress = [ResponseProgress() for _ in range(rows)]
+        # 행별 증분 디코딩 위치 (prefix: 기준 텍스트 시작 토큰, read: 이미 반영한 토큰 끝)
+        self._offsets = [(input_width, input_width) for _ in range(rows)]
+
+    def _decode_delta(self, row: int, window: List[int], width: int) -> str:
+        """새로 확정된 텍스트 (window: 기준 위치부터 현재까지의 토큰, width: 현재 전체 토큰 수)"""
+        prefix_offset, read_offset = self._offsets[row]
+        prefix_text = self.tokenizer.decode(window[:read_offset - prefix_offset], skip_special_tokens=False)
+        new_text = self.tokenizer.decode(window, skip_special_tokens=False)
+        if len(new_text) <= len(prefix_text) or new_text.endswith("\ufffd"):
+            return ""  # 다음 토큰과 합쳐야 완성되는 문자 (바이트 단위 BPE)
+        self._offsets[row] = (read_offset, width)
+        return new_text[len(prefix_text):]
+
+    def _row_reason(self, row: int, input_ids) -> Optional[str]:
+        prefix_offset, read_offset = self._offsets[row]
+        width = input_ids.shape[1]
+        window = input_ids[row, prefix_offset:].tolist()  # 이번 단계에 필요한 토큰만 (프롬프트/이전 응답 제외)
+        if self.eos_token_id is not None and self.eos_token_id in window[read_offset - prefix_offset:]:
+            return "eos"  # 모델이 스스로 끝냄 (조기 종료로 집계하지 않음)
+        delta = self._decode_delta(row, window, width)
+        if not delta:
+            return None
+        progress = self._progress[row]
+        progress.extend(delta)
+        if progress.tail_contains(self.end_markers, len(delta)):
+            return "end_marker"
+        return self.policy.stop_reason(progress)
+
+    def __call__(self, input_ids, scores, **kwargs) -> bool:
+        for row, reason in enumerate(self.reasons):
+            if reason is None:
+                self.reasons[row] = self._row_reason(row, input_ids)
+                if self.reasons[row] is not None:
+                    self.stopped_at[row] = input_ids.shape[1] - self.input_width
+        return all(reason is not None for reason in self.reasons)
+
 class EFTAIEngine:
     """EFT 전문 AI 엔진"""
     
@@ -33,16 +145,44 @@ class EFTAIEngine:
         self, 
         model_name: str = None,
         device: str = "auto",
-        max_memory: str = None
+        max_memory: str = None,
+        cpu_quantization: Optional[str] = None,
+        backend: str = "torch",
+        draft_model: Optional[str] = None
     ):
+        if backend not in INFERENCE_BACKENDS:
+            raise ValueError(f"지원하지 않는 추론 백엔드: {backend} (사용 가능: {', '.join(INFERENCE_BACKENDS)})")
+        self.backend = backend
         self.model_name = model_name or settings.MODEL_NAME
-        self.device = device if device != "auto" else self._detect_best_device()
+        # ONNX 백엔드는 CPU 실행 공급자 전용
+        self.device = "cpu" if backend == "onnx" else device if device != "auto" else self._detect_best_device()
         self.max_memory = max_memory or settings.MAX_MEMORY
+        self.cpu_quantization = cpu_quantization or settings.CPU_QUANTIZATION
+        if self.cpu_quantization and self.cpu_quantization not in CPU_QUANTIZATION_MODES:
+            raise ValueError(
+                f"지원하지 않는 CPU 양자화: {self.cpu_quantization} (사용 가능: {', '.join(CPU_QUANTIZATION_MODES)})"
+            )
+        self.quantized = False  # 로드된 모델에 CPU 양자화가 적용되었는지
+        self._onnx_dir = None  # ONNX 백엔드가 로드한 그래프 디렉토리
+        self.draft_model_name = draft_model  # 보조 생성용 초안 모델 (대상 모델과 같은 토크나이저)
+        self.assisted: Optional[AssistedDecoding] = None  # 초안 모델 로드 후 생성
+        self.warmup_seconds: Optional[float] = None  # warm_up() 완료 시 소요 시간
         
         # 모델 및 토크나이저 (초기화 후 로드)
         self.model = None
         self.tokenizer = None
         self.generation_pipeline = None
+        self.token_budget: Optional[TokenBudget] = None  # 토크나이저 로드 후 생성
+        self.batcher: Optional[MicroBatcher] = None  # BATCH_SIZE > 1일 때 모델 로드 후 생성
+        self.prefix_cache: Optional[PrefixKVCache] = None  # 모델 로드 후 생성, warm_prefix_cache()로 채움
+        self.early_stopping = EarlyStoppingStats()  # 응답 길이 정책 조기 종료 통계
+        
+        # 수락 제어 (동시 생성 한도 + 대기열, 과부하 시 AdmissionRejected)
+        self.admission = AdmissionController(
+            max_concurrent=settings.MAX_CONCURRENT_REQUESTS,
+            max_queue=settings.MAX_QUEUE_LENGTH,
+            timeout=settings.REQUEST_TIMEOUT
+        )
         
         # 성능 통계
         self.stats = {
@@ -73,63 +213,160 @@ class EFTAIEngine:
         logger.info("양자화 비활성화 (bitsandbytes 패키지 불필요)")
         return None
     
-    async def initialize(self) -> None:
-        """모델 및 토크나이저 로드"""
+    def _use_cpu_quantization(self) -> bool:
+        """CPU 동적 양자화 적용 여부 (CPU 추론에서만 - GPU/MPS 는 fp16/fp32 그대로)"""
+        if not self.cpu_quantization:
+            return False
+        if self.backend != "torch":
+            logger.info(f"CPU 양자화({self.cpu_quantization}) 미적용: {self.backend} 백엔드")
+            return False
+        if self.device != "cpu":
+            logger.info(f"CPU 양자화({self.cpu_quantization}) 미적용: {self.device} 디바이스")
+            return False
+        return True
+    
+    def _load_pretrained_model(self, quantization_config: Optional[BitsAndBytesConfig], model_name: str = None):
+        """Hugging Face 가중치 로드 (model_name 미지정 시 대상 모델)"""
+        model_kwargs = {
+            "cache_dir": settings.MODEL_CACHE_DIR,
+            "torch_dtype": torch.float16 if self.device == "cuda" else torch.float32,
+            "device_map": "auto" if self.device == "cuda" else None,
+            "token": settings.HUGGINGFACE_TOKEN
+        }
+        
+        if settings.FAST_MODEL_LOAD:
+            # 빈(meta) 모델에 safetensors(mmap) 가중치를 바로 채움 - 무작위 초기화/중복 복사 없이 최대 RAM ≈ 가중치 1배
+            model_kwargs["low_cpu_mem_usage"] = True
+        
+        if quantization_config:
+            model_kwargs["quantization_config"] = quantization_config
+        
+        if self.max_memory:
+            model_kwargs["max_memory"] = {0: self.max_memory}
+        
+        model = AutoModelForCausalLM.from_pretrained(
+            model_name or self.model_name,
+            **model_kwargs
+        )
+        
+        # CPU 모드에서는 직접 디바이스 이동
+        if self.device == "cpu":
+            model = model.to(self.device)
+        return model
+    
+    def _load_cpu_quantized_model(self, quantization_config: Optional[BitsAndBytesConfig]):
+        """CPU 양자화 모델 로드 (캐시가 있으면 fp32 가중치 로드/양자화 생략)"""
+        cache_path = (
+            quantized_cache_path(self.model_name, self.cpu_quantization)
+            if settings.CPU_QUANTIZATION_CACHE else None
+        )
+        if cache_path and cache_path.exists():
+            try:
+                return load_quantized(cache_path)
+            except Exception as e:
+                logger.warning(f"⚠️ 양자화 모델 캐시 로드 실패, 다시 양자화: {e}")
+        
+        model = quantize_dynamic_int8(self._load_pretrained_model(quantization_config))
+        if cache_path:
+            try:
+                save_quantized(model, cache_path)
+            except Exception as e:
+                logger.warning(f"⚠️ 양자화 모델 캐시 저장 실패: {e}")
+        return model
+    
+    def _load_draft_model(self) -> None:
+        """보조 생성용 초안 모델 로드 (토크나이저가 다르거나 로드 실패 시 초안 없이 동작)"""
+        if self.backend != "torch":
+            logger.info(f"초안 모델 미사용: {self.backend} 백엔드")
+            return
         try:
-            logger.info(f"🤖 모델 로드 시작: {self.model_name}")
-            start_time = time.time()
-            
-            # 1. 토크나이저 로드
-            logger.info("📝 토크나이저 로드 중...")
-            self.tokenizer = AutoTokenizer.from_pretrained(
-                self.model_name,
+            draft_tokenizer = AutoTokenizer.from_pretrained(
+                self.draft_model_name,
                 cache_dir=settings.MODEL_CACHE_DIR,
                 token=settings.HUGGINGFACE_TOKEN
             )
+            if not tokenizers_match(self.tokenizer, draft_tokenizer):
+                logger.warning(f"⚠️ 초안 모델 토크나이저 불일치, 보조 생성 비활성화: {self.draft_model_name}")
+                return
+            draft_model = self._load_pretrained_model(None, model_name=self.draft_model_name)
+        except Exception as e:
+            logger.warning(f"⚠️ 초안 모델 로드 실패, 보조 생성 비활성화 ({self.draft_model_name}): {e}")
+            return
+        self.assisted = AssistedDecoding(self.model, draft_model, self.draft_model_name)
+        logger.info(f"🪄 보조 생성 활성화: 초안 모델 {self.draft_model_name}")
+    
+    def _load_sync(self) -> None:
+        """토크나이저/모델/파이프라인 로드 (블로킹 - initialize()가 스레드에서 호출)"""
+        # 1. 토크나이저 로드
+        logger.info("📝 토크나이저 로드 중...")
+        self.tokenizer = AutoTokenizer.from_pretrained(
+            self.model_name,
+            cache_dir=settings.MODEL_CACHE_DIR,
+            token=settings.HUGGINGFACE_TOKEN
+        )
+        
+        # 패딩 토큰 설정 (Llama는 기본적으로 없음)
+        if self.tokenizer.pad_token is None:
+            self.tokenizer.pad_token = self.tokenizer.eos_token
+        
+        # 프롬프트 조립용 토큰 예산 (구간별 토큰 ID 캐시)
+        self.token_budget = self._create_token_budget()
+        
+        # 2. 양자화 설정
+        quantization_config = self._setup_quantization_config()
+        
+        # 3. 모델 로드 (ONNX 백엔드는 내보낸 그래프, CPU 양자화 설정 시 Linear 레이어 동적 int8 양자화)
+        logger.info("🧠 언어모델 로드 중... (수 분 소요 가능)")
+        self.quantized = self._use_cpu_quantization()
+        if self.backend == "onnx":
+            self.model, self._onnx_dir = load_onnx_causal_lm(self.model_name)
+        elif self.quantized:
+            self.model = self._load_cpu_quantized_model(quantization_config)
+        else:
+            self.model = self._load_pretrained_model(quantization_config)
+        
+        # 3-1. 보조 생성용 초안 모델 (대상 모델 forward 1회로 초안 토큰 여러 개 검증)
+        if self.draft_model_name:
+            self._load_draft_model()
+        
+        # 4. 생성 파이프라인 초기화
+        logger.info("⚡ 생성 파이프라인 초기화 중...")
+        self.generation_pipeline = pipeline(
+            "text-generation",
+            model=self.model,
+            tokenizer=self.tokenizer,
+            device=0 if self.device == "cuda" else -1,
+            torch_dtype=torch.float16 if self.device == "cuda" else torch.float32,
+            do_sample=True,
+            return_full_text=False
+        )
+    
+    async def initialize(self) -> None:
+        """모델 및 토크나이저 로드 (무거운 로드 단계는 스레드에서 실행 - 로드 중에도 이벤트 루프는 다른 요청 처리)"""
+        try:
+            logger.info(f"🤖 모델 로드 시작: {self.model_name}")
+            start_time = time.time()
             
-            # 패딩 토큰 설정 (Llama는 기본적으로 없음)
-            if self.tokenizer.pad_token is None:
-                self.tokenizer.pad_token = self.tokenizer.eos_token
-            
-            # 2. 양자화 설정
-            quantization_config = self._setup_quantization_config()
-            
-            # 3. 모델 로드
-            logger.info("🧠 언어모델 로드 중... (수 분 소요 가능)")
-            
-            model_kwargs = {
-                "cache_dir": settings.MODEL_CACHE_DIR,
-                "torch_dtype": torch.float16 if self.device == "cuda" else torch.float32,
-                "device_map": "auto" if self.device == "cuda" else None,
-                "token": settings.HUGGINGFACE_TOKEN
-            }
-            
-            if quantization_config:
-                model_kwargs["quantization_config"] = quantization_config
-            
-            if self.max_memory:
-                model_kwargs["max_memory"] = {0: self.max_memory}
+            # 1~4. 토크나이저/모델/파이프라인 로드
+            await asyncio.get_running_loop().run_in_executor(None, self._load_sync)
             
-            self.model = AutoModelForCausalLM.from_pretrained(
-                self.model_name,
-                **model_kwargs
-            )
+            # 5. 동시 요청 마이크로 배치 (같은 생성 파라미터끼리 한 번의 generate 호출로 처리)
+            if settings.BATCH_SIZE > 1:
+                self.batcher = MicroBatcher(
+                    self._generate_batch_sync,
+                    max_batch_size=settings.BATCH_SIZE,
+                    window_ms=settings.BATCH_WINDOW_MS,
+                    name=f"generate-{self.model_name.split('/')[-1]}"
+                )
+                logger.info(f"📦 마이크로 배치 활성화 (최대 {settings.BATCH_SIZE}건, 대기 창 {settings.BATCH_WINDOW_MS}ms)")
             
-            # CPU 모드에서는 직접 디바이스 이동
-            if self.device == "cpu":
-                self.model = self.model.to(self.device)
-            
-            # 4. 생성 파이프라인 초기화
-            logger.info("⚡ 생성 파이프라인 초기화 중...")
-            self.generation_pipeline = pipeline(
-                "text-generation",
-                model=self.model,
-                tokenizer=self.tokenizer,
-                device=0 if self.device == "cuda" else -1,
-                torch_dtype=torch.float16 if self.device == "cuda" else torch.float32,
-                do_sample=True,
-                return_full_text=False
-            )
+            # 6. 프롬프트 프리픽스 KV 캐시 (모델이 바뀌면 새로 생성되므로 이전 KV 상태는 버려짐)
+            #    ONNX 그래프에는 외부 KV 상태를 주입하지 않음 (PyTorch 백엔드 전용)
+            if settings.PREFIX_KV_CACHE_ENABLED and self.backend == "torch":
+                self.prefix_cache = PrefixKVCache(
+                    max_bytes=settings.PREFIX_KV_CACHE_MAX_BYTES,
+                    name=self.model_name
+                )
             
             load_time = time.time() - start_time
             logger.info(f"✅ 모델 로드 완료! ({load_time:.1f}초 소요)")
@@ -158,15 +395,158 @@ class EFTAIEngine:
         except Exception as e:
             logger.warning(f"메모리 로깅 실패: {e}")
     
+    def memory_footprint(self) -> int:
+        """모델 가중치 + 프리픽스 KV 캐시 메모리 (바이트, 미로드 시 0)"""
+        if not self.model:
+            return 0
+        if self.backend == "onnx":
+            footprint = onnx_model_nbytes(self._onnx_dir)
+        elif self.quantized:
+            # 양자화된 Linear 가중치는 parameters()에 나타나지 않으므로 state_dict 기준
+            footprint = state_nbytes(self.model)
+        else:
+            try:
+                footprint = self.model.get_memory_footprint()
+            except Exception:
+                footprint = sum(param.numel() * param.element_size() for param in self.model.parameters())
+        if self.assisted:
+            draft_model = self.assisted.draft_model
+            footprint += sum(param.numel() * param.element_size() for param in draft_model.parameters())
+        if self.prefix_cache:
+            footprint += self.prefix_cache.nbytes
+        return footprint
+    
+    def _parameter_nbytes(self, model_name: str) -> int:
+        """설정(config.json)만으로 계산한 가중치 크기 (meta 디바이스에 모델 구조만 생성 - 가중치 다운로드/할당 없음)"""
+        config = AutoConfig.from_pretrained(
+            model_name,
+            cache_dir=settings.MODEL_CACHE_DIR,
+            token=settings.HUGGINGFACE_TOKEN
+        )
+        with torch.device("meta"):
+            model = AutoModelForCausalLM.from_config(config)
+        dtype_bytes = 2 if self.device == "cuda" else 4  # _load_pretrained_model 의 torch_dtype
+        return sum(param.numel() for param in model.parameters()) * dtype_bytes
+    
+    def estimate_memory_footprint(self) -> int:
+        """로드 전 메모리 추정 (바이트, 블로킹 - 모델 풀이 로드 전에 예산을 확보하는 데 사용)
+
+        캐시된 ONNX 그래프/양자화 모델은 파일 크기, 그 외에는 파라미터 수 × dtype 크기
+        (캐시가 없으면 내보내기/양자화 전에 원본 가중치를 먼저 로드하므로 원본 크기가 최대 사용량)
+        """
+        if self.backend == "onnx" and cached_onnx_dir(self.model_name) is not None:
+            return onnx_model_nbytes(cached_onnx_dir(self.model_name))
+        
+        cache_path = (
+            quantized_cache_path(self.model_name, self.cpu_quantization)
+            if self._use_cpu_quantization() and settings.CPU_QUANTIZATION_CACHE else None
+        )
+        footprint = cache_path.stat().st_size if cache_path and cache_path.exists() else self._parameter_nbytes(self.model_name)
+        if self.draft_model_name and self.backend == "torch":
+            footprint += self._parameter_nbytes(self.draft_model_name)
+        return footprint
+    
+    def _create_token_budget(self) -> TokenBudget:
+        """모델 채팅 템플릿과 입력 한도를 반영한 토큰 예산"""
+        prefix, suffix = self._prompt_template()
+        return TokenBudget(
+            encode=lambda text: self.tokenizer.encode(text, add_special_tokens=False),
+            max_tokens=self._max_input_tokens(),
+            prefix=prefix,
+            suffix=suffix,
+            name=self.model_name
+        )
+    
+    async def warm_prefix_cache(self, prefix_texts: Iterable[str]) -> int:
+        """고정 프롬프트 프리픽스(티어별 시스템 프롬프트)의 KV 상태를 미리 계산 (기존 항목은 무효화)
+
+        토큰 예산 조립과 같은 토큰 ID(채팅 템플릿 앞부분 + 구간 토큰)로 계산하므로
+        해당 구간이 포함된 BudgetedPrompt는 프리픽스를 건너뛰고 나머지 토큰만 prefill
+        프롬프트가 바뀌면 새 프리픽스로 다시 호출. 등록된 프리픽스 수 반환
+        """
+        if self.prefix_cache is None or not self.model or not self.token_budget:
+            return 0
+        
+        self.prefix_cache.clear()
+        loop = asyncio.get_running_loop()
+        registered = 0
+        for text in prefix_texts:
+            section_ids = self.token_budget.encode(text)
+            if len(section_ids) > self.token_budget.available:
+                # 입력 한도보다 긴 구간은 조립 시 항상 제외되므로 계산하지 않음 (예: DialoGPT)
+                logger.info(f"프리픽스 KV 캐시 생략 ({len(section_ids)}토큰 > 입력 한도 {self.token_budget.available})")
+                continue
+            
+            prefix_ids = list(self.token_budget.prefix_ids) + list(section_ids)
+            start_time = time.perf_counter()
+            past_key_values = await loop.run_in_executor(None, self._compute_prefix_kv, prefix_ids)
+            self.prefix_cache.put(prefix_ids, past_key_values)
+            registered += 1
+            logger.info(
+                f"🧊 프리픽스 KV 캐시 등록 ({len(prefix_ids)}토큰, {(time.perf_counter() - start_time) * 1000:.0f}ms)"
+            )
+        return registered
+    
+    async def warm_up(self, prompts: Iterable[Union[str, BudgetedPrompt]] = ()) -> float:
+        """워밍업 생성 - 첫 실행에만 드는 비용(커널 선택, 메모리 할당, 토큰 구간/프리픽스 캐시 조회 경로)을
+        실제 요청 전에 소모. 프롬프트마다 짧은 탐욕 생성 1회, 소요 시간(초) 반환 (WARMUP_MAX_TOKENS=0이면 생략)
+        """
+        if not self.model or not self.tokenizer:
+            return 0.0
+        if settings.WARMUP_MAX_TOKENS <= 0:
+            self.warmup_seconds = 0.0
+            return 0.0
+        
+        prompts = list(prompts) or ["안녕하세요. 요즘 마음이 좀 힘들어요."]
+        generation_params = {
+            key: value
+            for key, value in self._generation_params(settings.WARMUP_MAX_TOKENS, 1.0, 1.0, 0).items()
+            if key not in ("temperature", "top_p", "top_k")
+        }
+        generation_params["do_sample"] = False
+        
+        loop = asyncio.get_running_loop()
+        start_time = time.perf_counter()
+        for prompt in prompts:
+            token_ids = self._prompt_token_ids(prompt)
+            await loop.run_in_executor(None, self._model_generate, [token_ids], generation_params)
+        self.warmup_seconds = time.perf_counter() - start_time
+        logger.info(f"🔥 워밍업 생성 완료 ({len(prompts)}건, {self.warmup_seconds:.1f}초)")
+        return self.warmup_seconds
+    
+    def _compute_prefix_kv(self, prefix_ids: List[int]):
+        """프리픽스 토큰의 KV 상태 계산 (레이어별 (key, value) 튜플)"""
+        input_ids = torch.tensor([prefix_ids], dtype=torch.long, device=self.model.device)
+        with torch.inference_mode():
+            outputs = self.model(input_ids=input_ids, use_cache=True)
+        
+        past_key_values = outputs.past_key_values
+        if hasattr(past_key_values, "to_legacy_cache"):
+            past_key_values = past_key_values.to_legacy_cache()
+        return past_key_values
+    
+    def _is_dialogpt(self) -> bool:
+        return "DialoGPT" in self.model_name
+    
+    def _max_input_tokens(self) -> int:
+        """모델별 입력 토큰 한도"""
+        return DIALOGPT_MAX_INPUT_TOKENS if self._is_dialogpt() else DEFAULT_MAX_INPUT_TOKENS
+    
     async def generate_response(
         self,
-        prompt: str,
+        prompt: Union[str, BudgetedPrompt],
         max_tokens: int = 400,
         temperature: float = 0.7,
         top_p: float = 0.9,
-        top_k: int = 50
+        top_k: int = 50,
+        length_policy: Optional[ResponseLengthPolicy] = None
     ) -> str:
-        """AI 응답 생성 (단일 응답)"""
+        """AI 응답 생성 (단일 응답)
+
+        prompt가 BudgetedPrompt이면 조립된 토큰 ID를 그대로 모델에 전달 (재토큰화 없음)
+        length_policy 지정 시 응답이 정책 길이만큼 완성되면 max_tokens 전이라도 생성 중단
+        동시 생성 한도를 넘으면 대기열에서 기다리며, 기한 내 처리할 수 없으면 AdmissionRejected
+        """
         
         if not self.model or not self.tokenizer:
             raise RuntimeError("모델이 로드되지 않았습니다. initialize()를 먼저 호출하세요.")
@@ -175,13 +555,21 @@ class EFTAIEngine:
         start_time = time.time()
         
         try:
-            # 비동기 처리를 위해 스레드에서 실행
-            loop = asyncio.get_event_loop()
-            response = await loop.run_in_executor(
-                None, 
-                self._generate_sync, 
-                prompt, max_tokens, temperature, top_p, top_k
-            )
+            async with self.admission.slot():
+                if self.batcher is not None:
+                    # 동시 요청을 생성 파라미터별로 모아 배치 실행 (결과는 요청별로 분배)
+                    generation_params = self._generation_params(max_tokens, temperature, top_p, top_k)
+                    response = await self.batcher.submit(
+                        (tuple(sorted(generation_params.items())), length_policy), prompt
+                    )
+                else:
+                    # 비동기 처리를 위해 스레드에서 실행
+                    loop = asyncio.get_event_loop()
+                    response = await loop.run_in_executor(
+                        None, 
+                        self._generate_sync, 
+                        prompt, max_tokens, temperature, top_p, top_k, length_policy
+                    )
             
             processing_time = time.time() - start_time
             self.stats["total_processing_time"] += processing_time
@@ -201,25 +589,24 @@ class EFTAIEngine:
     
     def _generate_sync(
         self, 
-        prompt: str, 
+        prompt: Union[str, BudgetedPrompt], 
         max_tokens: int, 
         temperature: float, 
         top_p: float, 
-        top_k: int
+        top_k: int,
+        length_policy: Optional[ResponseLengthPolicy] = None
     ) -> str:
-        """동기적 텍스트 생성 (내부 메서드)"""
+        """동기적 텍스트 생성 (내부 메서드, 길이 정책 조기 종료는 토큰 ID 경로에만 적용)"""
         
         try:
+            generation_params = self._generation_params(max_tokens, temperature, top_p, top_k)
+            
+            if isinstance(prompt, BudgetedPrompt):
+                return self._generate_from_ids(prompt, generation_params, length_policy)
+            
             # 모델별 프롬프트 포맷팅 (DialoGPT vs Llama 구분)
-            if "DialoGPT" in self.model_name:
-                formatted_prompt = self._format_dialogpt_prompt(prompt)
-                # DialoGPT 토큰 길이 제한 (더 보수적으로 설정)
-                max_input_length = 200  # 매우 짧게 설정
-                safe_max_tokens = min(max_tokens, 100)  # 안전한 출력 길이
-            else:
-                formatted_prompt = self._format_llama_prompt(prompt)
-                max_input_length = 4000  # Llama 모델은 더 여유롭게
-                safe_max_tokens = max_tokens
+            formatted_prompt = self._format_prompt(prompt)
+            max_input_length = self._max_input_tokens()
             
             # 입력 토큰 길이 체크 및 제한
             input_tokens = self.tokenizer.encode(formatted_prompt, return_tensors="pt")
@@ -231,20 +618,10 @@ class EFTAIEngine:
                 formatted_prompt = self.tokenizer.decode(truncated_tokens[0], skip_special_tokens=True)
                 logger.info(f"토큰 길이 조정: {input_tokens.shape[1]} → {max_input_length}")
             
-            # 생성 파라미터
-            generation_params = {
-                "max_new_tokens": safe_max_tokens,
-                "temperature": temperature,
-                "top_p": top_p,
-                "top_k": top_k,
-                "do_sample": True,
-                "pad_token_id": self.tokenizer.eos_token_id,
-                "eos_token_id": self.tokenizer.eos_token_id,
-                "truncation": True
-            }
+            generation_params["truncation"] = True
             
             # DialoGPT 전용 파라미터 추가
-            if "DialoGPT" in self.model_name:
+            if self._is_dialogpt():
                 generation_params["max_length"] = 1024  # 전체 길이 제한
             
             # 텍스트 생성
@@ -265,27 +642,186 @@ class EFTAIEngine:
             logger.error(f"동기 생성 실패: {e}")
             raise e
     
-    def _format_llama_prompt(self, user_prompt: str) -> str:
-        """Llama 모델용 프롬프트 포맷팅"""
+    def _generation_params(self, max_tokens: int, temperature: float, top_p: float, top_k: int) -> Dict[str, Any]:
+        """model.generate 생성 파라미터"""
+        # DialoGPT 출력 길이 제한 (더 보수적으로 설정)
+        safe_max_tokens = min(max_tokens, 100) if self._is_dialogpt() else max_tokens
         
-        # Llama-2/3 Chat 템플릿 적용
-        if "llama-2" in self.model_name.lower():
-            formatted = f"<s>[INST] {user_prompt} [/INST]"
-        elif "llama-3" in self.model_name.lower():
-            formatted = f"<|begin_of_text|><|start_header_id|>user<|end_header_id|>\n\n{user_prompt}<|eot_id|><|start_header_id|>assistant<|end_header_id|>\n\n"
-        else:
-            # 기본 포맷
-            formatted = f"Human: {user_prompt}\n\nAssistant: "
+        return {
+            "max_new_tokens": safe_max_tokens,
+            "temperature": temperature,
+            "top_p": top_p,
+            "top_k": top_k,
+            "do_sample": True,
+            "pad_token_id": self.tokenizer.eos_token_id,
+            "eos_token_id": self.tokenizer.eos_token_id
+        }
+    
+    def _prompt_token_ids(self, prompt: Union[str, BudgetedPrompt]) -> List[int]:
+        """모델 입력 토큰 ID (텍스트 프롬프트는 채팅 템플릿 적용 후 입력 한도만큼 뒤에서부터 유지)"""
+        if isinstance(prompt, BudgetedPrompt):
+            return prompt.token_ids
+        
+        token_ids = self.tokenizer.encode(self._format_prompt(prompt))
+        max_input_length = self._max_input_tokens()
+        if len(token_ids) > max_input_length:
+            logger.warning(f"입력 토큰 길이 초과 ({len(token_ids)} > {max_input_length}), 자르기 적용")
+            token_ids = token_ids[-max_input_length:]
+        return token_ids
+    
+    def _model_generate(
+        self,
+        rows: Sequence[Sequence[int]],
+        generation_params: Dict[str, Any],
+        length_policy: Optional[ResponseLengthPolicy] = None,
+        **generate_kwargs
+    ):
+        """토큰 ID 행들로 model.generate 실행 (입력 폭, 출력 토큰 ID 반환)
+
+        길이가 다른 행은 왼쪽을 패딩하고 attention mask로 가리므로, 모든 행의 새 토큰이 같은 위치부터 시작
+        단일 행이 캐시된 프리픽스로 시작하면 그 KV 상태를 넘겨 나머지 토큰만 prefill
+        (배치는 행마다 패딩 위치가 달라 프리픽스 캐시를 쓰지 않음)
+        초안 모델이 있으면 단일 행은 보조 생성 (transformers 보조 생성은 배치 1 전용, 초안 KV와 맞출 수 없어 프리픽스 캐시 미사용)
+        length_policy 지정 시 모든 행의 응답이 정책 길이만큼 완성되거나 응답 끝 표시가 나오면 생성 중단
+        """
+        assisted = len(rows) == 1 and self.assisted is not None and self.assisted.enabled
+        if assisted:
+            generate_kwargs["assistant_model"] = self.assisted.draft_model
+        elif len(rows) == 1 and self.prefix_cache is not None:
+            cached = self.prefix_cache.lookup(rows[0])
+            if cached is not None:
+                generate_kwargs["past_key_values"] = cached[1]
+        
+        width = max(len(row) for row in rows)
+        pad_token_id = self.tokenizer.pad_token_id
+        if pad_token_id is None:
+            pad_token_id = self.tokenizer.eos_token_id
+        
+        input_ids = torch.tensor(
+            [[pad_token_id] * (width - len(row)) + list(row) for row in rows],
+            dtype=torch.long, device=self.model.device
+        )
+        attention_mask = torch.tensor(
+            [[0] * (width - len(row)) + [1] * len(row) for row in rows],
+            dtype=torch.long, device=self.model.device
+        )
+        
+        length_criteria = None
+        if length_policy is not None and settings.RESPONSE_EARLY_STOPPING:
+            length_criteria = _ResponseLengthCriteria(
+                self.tokenizer, length_policy, self._end_markers(), width, len(rows)
+            )
+            stopping_criteria = generate_kwargs.pop("stopping_criteria", None) or StoppingCriteriaList()
+            stopping_criteria.append(length_criteria)
+            generate_kwargs["stopping_criteria"] = stopping_criteria
+        
+        # 초안 모델이 있는 엔진은 단일 행 생성마다 보조/일반 생성 통계 기록
+        tracking = self.assisted.track(assisted) if self.assisted is not None and len(rows) == 1 else nullcontext({})
+        with torch.inference_mode(), tracking as counts:
+            output_ids = self.model.generate(
+                input_ids=input_ids,
+                attention_mask=attention_mask,
+                **generation_params,
+                **generate_kwargs
+            )
+            counts["new_tokens"] = output_ids.shape[1] - width
+        
+        if length_criteria is not None:
+            # 행마다 자기 응답이 끝난 시점 기준 (배치의 다른 행 때문에 더 생성된 토큰은 제외)
+            new_tokens = output_ids.shape[1] - width
+            saved = [
+                self.early_stopping.record(
+                    reason, stopped_at if stopped_at is not None else new_tokens, generation_params["max_new_tokens"]
+                )
+                for reason, stopped_at in zip(length_criteria.reasons, length_criteria.stopped_at)
+            ]
+            if any(saved):
+                logger.info(f"✂️ 응답 길이 정책 조기 종료 ({new_tokens}토큰 생성, 요청별 절약 토큰 {saved})")
+        return width, output_ids
+    
+    def _generate_from_ids(
+        self,
+        prompt: BudgetedPrompt,
+        generation_params: Dict[str, Any],
+        length_policy: Optional[ResponseLengthPolicy] = None
+    ) -> str:
+        """토큰 예산 안에서 조립된 토큰 ID로 직접 생성 (새로 생성된 토큰만 디코딩)"""
+        input_length, output_ids = self._model_generate([prompt.token_ids], generation_params, length_policy)
+        
+        generated_text = self._cut_at_end_marker(self.tokenizer.decode(
+            output_ids[0, input_length:],
+            skip_special_tokens=True
+        ))
+        logger.info(f"🤖 원본 출력 ({prompt.prompt_tokens} 입력 토큰): {repr(generated_text)}")
+        
+        return self._clean_response(generated_text, prompt.text)
+    
+    def _generate_batch_sync(
+        self,
+        generation_key: Tuple[Tuple[Tuple[str, Any], ...], Optional[ResponseLengthPolicy]],
+        prompts: List[Union[str, BudgetedPrompt]]
+    ) -> List[str]:
+        """마이크로 배치 실행 (같은 생성 파라미터/응답 길이 정책의 요청들을 한 번의 generate 호출로 처리)"""
+        generation_items, length_policy = generation_key
+        rows = [self._prompt_token_ids(prompt) for prompt in prompts]
+        input_width, output_ids = self._model_generate(rows, dict(generation_items), length_policy)
         
-        return formatted
+        generated_texts = [
+            self._cut_at_end_marker(text)
+            for text in self.tokenizer.batch_decode(output_ids[:, input_width:], skip_special_tokens=True)
+        ]
+        logger.info(f"📦 배치 생성 완료 ({len(prompts)}건, 입력 폭 {input_width}토큰)")
+        
+        return [
+            self._clean_response(text, prompt.text if isinstance(prompt, BudgetedPrompt) else prompt)
+            for text, prompt in zip(generated_texts, prompts)
+        ]
     
-    def _format_dialogpt_prompt(self, user_prompt: str) -> str:
-        """DialoGPT 모델용 프롬프트 포맷팅 (간단한 대화형)"""
+    def _prompt_template(self) -> Tuple[str, str]:
+        """모델별 채팅 템플릿 (프롬프트 앞/뒤 고정 구간)"""
+        if self._is_dialogpt():
+            # DialoGPT를 위한 간단하지만 명확한 EFT 상담사 설정
+            return "User: ", f"{self.tokenizer.eos_token}EFT Counselor:"
         
-        # DialoGPT를 위한 간단하지만 명확한 EFT 상담사 설정
-        formatted = f"User: {user_prompt}{self.tokenizer.eos_token}EFT Counselor:"
+        # Llama-2/3 Chat 템플릿 적용
+        model_name = self.model_name.lower()
+        if "llama-2" in model_name:
+            return "<s>[INST] ", " [/INST]"
+        elif "llama-3" in model_name:
+            return (
+                "<|begin_of_text|><|start_header_id|>user<|end_header_id|>\n\n",
+                "<|eot_id|><|start_header_id|>assistant<|end_header_id|>\n\n"
+            )
         
-        return formatted
+        # 기본 포맷
+        return "Human: ", "\n\nAssistant: "
+    
+    def _end_markers(self) -> Tuple[str, ...]:
+        """모델별 응답 끝 표시 (턴 종료 토큰, 다음 턴 시작 구간 - 생성 텍스트에 나오면 응답 완료)"""
+        if self._is_dialogpt():
+            markers = ("User:",)
+        else:
+            model_name = self.model_name.lower()
+            if "llama-2" in model_name:
+                markers = ("</s>", "[INST]")
+            elif "llama-3" in model_name:
+                markers = ("<|eot_id|>", "<|end_of_text|>", "<|start_header_id|>")
+            else:
+                markers = ("Human:",)
+        return markers + ((self.tokenizer.eos_token,) if self.tokenizer.eos_token else ())
+    
+    def _cut_at_end_marker(self, text: str) -> str:
+        """응답 끝 표시(다음 턴 시작 등 일반 텍스트 구간) 이후 제거"""
+        for marker in self._end_markers():
+            position = text.find(marker)
+            if position >= 0:
+                text = text[:position]
+        return text
+    
+    def _format_prompt(self, user_prompt: str) -> str:
+        """모델별 프롬프트 포맷팅"""
+        prefix, suffix = self._prompt_template()
+        return f"{prefix}{user_prompt}{suffix}"
     
     def _clean_response(self, generated_text: str, prompt: str) -> str:
         """응답 후처리 및 정리"""
@@ -324,37 +860,108 @@ class EFTAIEngine:
     async def generate_stream(
         self, 
         message: str, 
-        emotion_state: EmotionAnalysis
+        emotion_state: EmotionAnalysis,
+        prompt: Optional[Union[str, BudgetedPrompt]] = None,
+        max_tokens: int = 400,
+        temperature: float = 0.7,
+        top_p: float = 0.9,
+        top_k: int = 50,
+        length_policy: Optional[ResponseLengthPolicy] = None
     ) -> AsyncGenerator[Dict[str, Any], None]:
-        """스트리밍 응답 생성 (긴 응답용)"""
+        """스트리밍 응답 생성 (긴 응답용)
+
+        추론 스레드에서 model.generate 가 토큰을 디코딩하는 즉시 텍스트 청크로 전달하고,
+        마지막 "end" 청크 metadata에 첫 토큰 지연(TTFT)과 초당 생성 토큰 수를 포함
+        prompt 미지정 시 message를 그대로 프롬프트로 사용
+        length_policy 지정 시 응답이 정책 길이만큼 완성되면 max_tokens 전이라도 스트림 종료
+        실행 슬롯은 첫 청크 전에 확보하며(과부하 시 AdmissionRejected) 생성이 끝나거나 소비가 중단될 때 반납
+        """
+        if not self.model or not self.tokenizer:
+            raise RuntimeError("모델이 로드되지 않았습니다. initialize()를 먼저 호출하세요.")
+        
+        self.stats["total_requests"] += 1
         
-        # TODO: 실제 스트리밍 구현
-        # 현재는 청크로 나누어 시뮬레이션
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue()
+        cancelled = threading.Event()
+        streamer = _AsyncQueueStreamer(self.tokenizer, loop, queue)
+        token_ids = self._prompt_token_ids(prompt if prompt is not None else message)
+        generation_params = self._generation_params(max_tokens, temperature, top_p, top_k)
         
-        response = await self.generate_response(message)
-        chunks = self._split_into_chunks(response, chunk_size=50)
+        def run_generation():
+            try:
+                self._model_generate(
+                    [token_ids], generation_params, length_policy,
+                    streamer=streamer,
+                    stopping_criteria=StoppingCriteriaList([_CancelledCriteria(cancelled)])
+                )
+                loop.call_soon_threadsafe(queue.put_nowait, _STREAM_END)
+            except Exception as e:
+                loop.call_soon_threadsafe(queue.put_nowait, e)
         
-        for i, chunk in enumerate(chunks):
+        # 1. 실행 슬롯 확보 후 추론 스레드에서 생성 시작 (이벤트 루프는 큐만 대기)
+        await self.admission.acquire()
+        start_time = time.perf_counter()
+        first_token_time = None
+        sequence_number = 0
+        try:
+            loop.run_in_executor(None, run_generation)
+            
+            # 2. 디코딩된 텍스트를 도착 즉시 전달
+            while True:
+                item = await queue.get()
+                if item is _STREAM_END:
+                    break
+                if isinstance(item, Exception):
+                    raise item
+                
+                if first_token_time is None:
+                    first_token_time = time.perf_counter()
+                yield {
+                    "chunk_type": "text",
+                    "content": item,
+                    "sequence_number": sequence_number,
+                    "is_final": False
+                }
+                sequence_number += 1
+            
+            # 3. 생성 지표 (TTFT, 초당 생성 토큰 수)
+            total_time = time.perf_counter() - start_time
+            self.stats["total_processing_time"] += total_time
+            self.stats["successful_requests"] += 1
+            
+            metrics = {
+                "prompt_tokens": len(token_ids),
+                "generated_tokens": streamer.generated_tokens,
+                "ttft_ms": (first_token_time - start_time) * 1000 if first_token_time else None,
+                "tokens_per_sec": streamer.generated_tokens / total_time if total_time > 0 else 0.0,
+                "total_time_ms": total_time * 1000
+            }
+            logger.info(
+                f"✅ 스트리밍 생성 완료 ({streamer.generated_tokens}토큰, {total_time:.2f}초, "
+                f"TTFT {metrics['ttft_ms'] or 0:.0f}ms)"
+            )
             yield {
-                "chunk_type": "text",
-                "content": chunk,
-                "sequence_number": i,
-                "is_final": i == len(chunks) - 1
+                "chunk_type": "end",
+                "content": "",
+                "sequence_number": sequence_number,
+                "is_final": True,
+                "metadata": metrics
             }
             
-            # 스트리밍 시뮬레이션을 위한 지연
-            await asyncio.sleep(0.1)
-    
-    def _split_into_chunks(self, text: str, chunk_size: int = 50) -> List[str]:
-        """텍스트를 청크로 분할"""
-        words = text.split()
-        chunks = []
-        
-        for i in range(0, len(words), chunk_size):
-            chunk = ' '.join(words[i:i + chunk_size])
-            chunks.append(chunk)
+        except Exception as e:
+            error_msg = f"스트리밍 생성 실패: {str(e)}"
+            logger.error(error_msg)
+            self.stats["errors"].append({
+                "timestamp": datetime.now().isoformat(),
+                "error": error_msg
+            })
+            raise e
         
-        return chunks
+        finally:
+            # 소비가 중단되면(클라이언트 연결 종료 등) 추론 스레드도 다음 토큰에서 멈춤
+            cancelled.set()
+            self.admission.release(time.perf_counter() - start_time)
     
     async def get_performance_stats(self) -> ModelStats:
         """모델 성능 통계 반환"""
@@ -395,6 +1002,15 @@ class EFTAIEngine:
             memory_usage_gb=memory_usage,
             gpu_utilization=gpu_utilization,
             uptime_hours=uptime / 3600,
+            backend=self.backend,
+            quantization=self.cpu_quantization if self.quantized else None,
+            prompt_token_stats=self.token_budget.get_stats() if self.token_budget else None,
+            batching_stats=self.batcher.get_stats() if self.batcher else None,
+            admission_stats=self.admission.get_stats(),
+            prefix_cache_stats=self.prefix_cache.get_stats() if self.prefix_cache else None,
+            assisted_decoding_stats=self.assisted.get_stats() if self.assisted else None,
+            warmup_seconds=self.warmup_seconds,
+            early_stopping_stats=self.early_stopping.get_stats(),
             last_updated=datetime.now().isoformat()
         )
     
@@ -403,13 +1019,27 @@ class EFTAIEngine:
         logger.info("🔄 AI 엔진 리소스 정리 중...")
         
         try:
+            if self.batcher:
+                await self.batcher.shutdown()
+                self.batcher = None
+            
+            if self.prefix_cache:
+                self.prefix_cache.clear()
+                self.prefix_cache = None
+            
+            if self.assisted:
+                self.assisted.close()
+                self.assisted = None
+            
             if self.model:
                 del self.model
                 self.model = None
+                self._onnx_dir = None
             
             if self.tokenizer:
                 del self.tokenizer
                 self.tokenizer = None
+                self.token_budget = None
                 
             if self.generation_pipeline:
                 del self.generation_pipeline
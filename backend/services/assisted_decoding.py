@@ -0,0 +1,119 @@
+"""
+초안 모델 보조 생성 (assisted / speculative decoding)
+작은 초안 모델이 토큰 여러 개를 제안하고 대상 모델이 한 번의 forward 로 검증 (transformers generate(assistant_model=...))
+출력 분포는 대상 모델 단독 생성과 같고, 제안이 많이 수락될수록 토큰당 대상 모델 forward 횟수가 줄어듦
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator
+
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class AssistedDecoding:
+    """초안 모델 + 수락률/속도 통계
+
+    - 대상/초안 모델의 forward 호출을 스레드별로 세어 생성 1회의 제안/수락 토큰 수를 계산합니다.
+      (초안 forward 1회 = 제안 토큰 1개, 대상 forward 1회 = 검증 1회로 수락 토큰 + 대상 토큰 1개 확정)
+    - 같은 엔진에서 초안 없이 생성한 단일 요청도 기록해 실제 디코딩 속도 배율을 비교합니다.
+    """
+
+    def __init__(self, target_model: Any, draft_model: Any, draft_model_name: str):
+        self.draft_model = draft_model
+        self.draft_model_name = draft_model_name
+        self.enabled = True  # False면 초안 없이 생성 (A/B 비교용)
+
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._hooks = [
+            target_model.register_forward_hook(self._counter("target")),
+            draft_model.register_forward_hook(self._counter("draft")),
+        ]
+
+        # 통계
+        self.generations = 0
+        self.new_tokens = 0
+        self.target_forwards = 0
+        self.draft_tokens = 0
+        self.accepted_tokens = 0
+        self.seconds = 0.0
+        self.plain_generations = 0
+        self.plain_new_tokens = 0
+        self.plain_seconds = 0.0
+
+    def _counter(self, kind: str):
+        def hook(module, inputs, output):
+            counts = getattr(self._local, "counts", None)
+            if counts is not None:
+                counts[kind] += 1
+        return hook
+
+    @contextmanager
+    def track(self, assisted: bool) -> Iterator[Dict[str, int]]:
+        """generate 호출 1회 측정 - 종료 후 counts["new_tokens"]를 채우면 통계에 반영"""
+        counts = {"target": 0, "draft": 0, "new_tokens": 0}
+        self._local.counts = counts
+        start_time = time.perf_counter()
+        try:
+            yield counts
+        finally:
+            self._local.counts = None
+        self._record(assisted, counts, time.perf_counter() - start_time)
+
+    def _record(self, assisted: bool, counts: Dict[str, int], seconds: float) -> None:
+        new_tokens = counts["new_tokens"]
+        with self._lock:
+            if not assisted:
+                self.plain_generations += 1
+                self.plain_new_tokens += new_tokens
+                self.plain_seconds += seconds
+                return
+            self.generations += 1
+            self.new_tokens += new_tokens
+            self.target_forwards += counts["target"]
+            self.draft_tokens += counts["draft"]
+            # 검증마다 대상 모델이 1토큰을 직접 확정하므로 나머지가 수락된 초안 토큰
+            self.accepted_tokens += min(max(new_tokens - counts["target"], 0), counts["draft"])
+            self.seconds += seconds
+
+    def close(self) -> None:
+        for hook in self._hooks:
+            hook.remove()
+        self._hooks = []
+        self.draft_model = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """수락률, 대상 forward 당 토큰 수, 초안 사용/미사용 디코딩 속도 배율"""
+        with self._lock:
+            assisted_rate = self.new_tokens / self.seconds if self.seconds else 0.0
+            plain_rate = self.plain_new_tokens / self.plain_seconds if self.plain_seconds else 0.0
+            return {
+                "draft_model": self.draft_model_name,
+                "enabled": self.enabled,
+                "generations": self.generations,
+                "new_tokens": self.new_tokens,
+                "target_forwards": self.target_forwards,
+                "draft_tokens": self.draft_tokens,
+                "accepted_tokens": self.accepted_tokens,
+                "acceptance_rate": self.accepted_tokens / self.draft_tokens if self.draft_tokens else 0.0,
+                "tokens_per_target_forward": self.new_tokens / self.target_forwards if self.target_forwards else 0.0,
+                "assisted_tokens_per_second": assisted_rate,
+                "plain_generations": self.plain_generations,
+                "plain_tokens_per_second": plain_rate,
+                "speedup": assisted_rate / plain_rate if assisted_rate and plain_rate else None,
+            }
+
+
+def tokenizers_match(target_tokenizer: Any, draft_tokenizer: Any) -> bool:
+    """초안 모델이 대상 모델과 같은 토큰 ID 체계를 쓰는지 (보조 생성은 토큰 ID를 그대로 주고받음)"""
+    if target_tokenizer.get_vocab() != draft_tokenizer.get_vocab():
+        return False
+    return all(
+        getattr(target_tokenizer, attribute, None) == getattr(draft_tokenizer, attribute, None)
+        for attribute in ("bos_token_id", "eos_token_id")
+    )
+
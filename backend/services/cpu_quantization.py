@@ -0,0 +1,102 @@
+"""
+CPU 동적 int8 양자화
+Linear 레이어 가중치를 int8 로 양자화(활성값은 실행 시 양자화)하고, 양자화된 모델을 디스크에 캐시해 재시작 시 재사용
+"""
+
+import re
+import time
+from pathlib import Path
+from typing import Any
+
+import torch
+import transformers
+from transformers.pytorch_utils import Conv1D
+
+from config.settings import get_settings
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+# 지원하는 CPU 양자화 모드
+CPU_QUANTIZATION_MODES = ("int8",)
+
+
+def _conv1d_to_linear(model: torch.nn.Module) -> int:
+    """GPT-2 계열 Conv1D(x @ W + b)를 같은 연산의 nn.Linear 로 교체 (동적 양자화 대상에 포함) - 교체 수 반환"""
+    replaced = 0
+    for parent in list(model.modules()):
+        for child_name, child in list(parent.named_children()):
+            if not isinstance(child, Conv1D):
+                continue
+            in_features, out_features = child.weight.shape
+            linear = torch.nn.Linear(in_features, out_features, bias=child.bias is not None)
+            linear.weight.data = child.weight.data.t().contiguous()
+            if child.bias is not None:
+                linear.bias.data = child.bias.data
+            setattr(parent, child_name, linear)
+            replaced += 1
+    return replaced
+
+
+def quantize_dynamic_int8(model: torch.nn.Module) -> torch.nn.Module:
+    """Linear 레이어 동적 int8 양자화 (제자리 변환, 최대 메모리는 fp32 모델 + 레이어 1개 수준)"""
+    start_time = time.perf_counter()
+    converted = _conv1d_to_linear(model)
+    model.eval()
+    quantized = torch.ao.quantization.quantize_dynamic(
+        model, {torch.nn.Linear}, dtype=torch.qint8, inplace=True
+    )
+    logger.info(
+        f"🗜️ 동적 int8 양자화 완료 ({time.perf_counter() - start_time:.1f}초"
+        f"{f', Conv1D {converted}개 Linear 변환' if converted else ''})"
+    )
+    return quantized
+
+
+def _tensor_nbytes(value: Any) -> int:
+    if torch.is_tensor(value):
+        return value.numel() * value.element_size()
+    if isinstance(value, (tuple, list)):
+        return sum(_tensor_nbytes(item) for item in value)
+    return 0
+
+
+def state_nbytes(model: torch.nn.Module) -> int:
+    """state_dict 기준 모델 메모리 (양자화 모듈의 packed 가중치 포함, 공유 텐서는 한 번만)"""
+    seen = set()
+    total = 0
+    for value in model.state_dict(keep_vars=True).values():
+        tensors = value if isinstance(value, (tuple, list)) else (value,)
+        for tensor in tensors:
+            if torch.is_tensor(tensor) and tensor.data_ptr() not in seen:
+                seen.add(tensor.data_ptr())
+                total += _tensor_nbytes(tensor)
+    return total
+
+
+def quantized_cache_path(model_name: str, mode: str) -> Path:
+    """양자화 모델 캐시 경로 (모듈 클래스를 그대로 저장하므로 torch/transformers 버전별로 분리)"""
+    safe_name = re.sub(r"[^A-Za-z0-9._-]+", "--", model_name)
+    return (
+        Path(settings.MODEL_CACHE_DIR) / "quantized"
+        / f"{safe_name}-{mode}-torch{torch.__version__}-transformers{transformers.__version__}.pt"
+    )
+
+
+def load_quantized(path: Path) -> torch.nn.Module:
+    """캐시된 양자화 모델 로드 (서버가 직접 저장한 파일만 사용 - 임의 파일 로드 금지)"""
+    start_time = time.perf_counter()
+    model = torch.load(path, map_location="cpu", weights_only=False)
+    model.eval()
+    logger.info(f"🗜️ 양자화 모델 캐시 로드 ({path.name}, {time.perf_counter() - start_time:.1f}초)")
+    return model
+
+
+def save_quantized(model: torch.nn.Module, path: Path) -> None:
+    """양자화 모델 캐시 저장 (임시 파일에 쓴 뒤 교체 - 중단 시 손상된 캐시 방지)"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_suffix(".tmp")
+    torch.save(model, temp_path)
+    temp_path.replace(path)
+    logger.info(f"💾 양자화 모델 캐시 저장: {path} ({path.stat().st_size / 1024 ** 2:.0f}MB)")
@@ -4,152 +4,158 @@
 """
 
 import re
+import sys
 import asyncio
-from typing import Dict, List, Tuple, Optional, Any
+import hashlib
+import threading
+import time
+from concurrent.futures import BrokenExecutor
+from dataclasses import dataclass
+from typing import AsyncIterator, Dict, List, Tuple, Optional, Any
 import numpy as np
 from collections import Counter
 
-from models.chat_models import EmotionAnalysis, EmotionType
+from config.settings import get_settings
+from models.chat_models import EmotionAnalysis, EmotionType, FrozenEmotionAnalysis, SentenceEmotion
+from services.emotion_lexicon import CompiledLexicon, load_emotion_lexicon
+from utils.keyword_automaton import KeywordAutomaton
+from utils.lru_cache import LRUCache
+from utils.offload_executor import EXECUTION_MODES, OffloadExecutor
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
+settings = get_settings()
+
+# 전처리/특성 추출용 정규식 (모듈 로드 시 1회 컴파일)
+_REPEATED_CHAR_PATTERN = re.compile(r'(.)\1{2,}')
+_NOISE_CHAR_PATTERN = re.compile(r'[^\w\s!?.,~ㅠㅜㅋㅎ]')
+
+# 문장 분리: 종결 부호(. ! ? …) 뒤 공백/끝 또는 줄바꿈 기준 (소수점 등 부호 뒤 공백이 없으면 분리하지 않음)
+_SENTENCE_PATTERN = re.compile(r'\S[^\n]*?(?:[.!?…]+(?=\s|$)|$)', re.MULTILINE)
+
+# 감정 동점 처리 순서 (EmotionType 선언 순서 - 단일/배치 분석 공통)
+_EMOTION_ORDER = {emotion: index for index, emotion in enumerate(EmotionType)}
+
+# 캐시 항목 크기 추정용 (pydantic 인스턴스 + 맥락 dict 기본 크기)
+_ANALYSIS_BASE_BYTES = 1536
+
+def _estimate_cache_entry_bytes(key: bytes, analysis: EmotionAnalysis) -> int:
+    """캐시 항목 메모리 추정치"""
+    return (
+        sys.getsizeof(key)
+        + _ANALYSIS_BASE_BYTES
+        + sum(sys.getsizeof(keyword) for keyword in analysis.emotional_keywords)
+    )
+
+@dataclass
+class TextFeatures:
+    """analyze() 1회당 한 번만 계산되어 이후 모든 단계가 공유하는 텍스트 특성"""
+    text: str                                      # 전처리된 텍스트
+    keyword_hits: Dict[str, List[int]]             # 사전 항목별 등장 위치 (겹침 포함)
+    detected_situations: List[str]                 # 매칭된 상황 (context_patterns 순서)
+    modifier_spans: List[Tuple[int, int, int]]     # 강도 수식어 (start, end, rank) - rank 내림차순
+    negation_positions: List[int]                  # 부정어 시작 위치 (단어별 겹치지 않는 매칭)
+    repeated_char_runs: List[Tuple[int, int]]      # 같은 문자 3회 이상 반복 구간
+    text_characteristics: Dict[str, int]           # 길이/문장 수/물음표/느낌표/반복 문자 수
+    lexicon: CompiledLexicon                       # 특성 추출에 사용한 사전 (이후 단계도 같은 사전 사용)
+    
+    @property
+    def has_modifiers(self) -> bool:
+        return bool(self.modifier_spans)
+    
+    @property
+    def negation_count(self) -> int:
+        return len(self.negation_positions)
 
 class EmotionAnalyzer:
     """한국어 텍스트 감정 분석기"""
     
     def __init__(self):
         """감정 분석기 초기화"""
-        self.emotion_keywords = self._load_emotion_keywords()
-        self.intensity_modifiers = self._load_intensity_modifiers()
-        self.context_patterns = self._load_context_patterns()
-        self.negation_words = self._load_negation_words()
+        # 컴파일된 감정 사전 (런타임 교체 시 이 참조만 바뀜)
+        self.lexicon: CompiledLexicon = load_emotion_lexicon()
+        self._reload_lock = threading.Lock()
+        
+        # 분석 결과 캐시 (전처리된 텍스트 기준)
+        self.analysis_cache: Optional[LRUCache] = None
+        if settings.EMOTION_CACHE_ENABLED:
+            self.analysis_cache = LRUCache(
+                max_entries=settings.EMOTION_CACHE_MAX_ENTRIES,
+                max_bytes=settings.EMOTION_CACHE_MAX_BYTES,
+                ttl_seconds=settings.EMOTION_CACHE_TTL,
+                sizeof=_estimate_cache_entry_bytes
+            )
+        
+        # 긴 텍스트/배치 분석 실행기 (짧은 텍스트는 디스패치 비용이 더 커서 인라인 실행)
+        if settings.EMOTION_EXECUTION_MODE not in EXECUTION_MODES:
+            raise ValueError(f"지원하지 않는 감정 분석 실행 모드: {settings.EMOTION_EXECUTION_MODE}")
+        self.offload_min_chars = settings.EMOTION_OFFLOAD_MIN_CHARS
+        self.inline_runs = 0
+        self.executor: Optional[OffloadExecutor] = None
+        if settings.EMOTION_EXECUTION_MODE != "inline":
+            self.executor = OffloadExecutor(
+                mode=settings.EMOTION_EXECUTION_MODE,
+                max_workers=settings.EMOTION_POOL_WORKERS,
+                initializer=_init_analysis_worker,
+                name="emotion-analysis"
+            )
         
         logger.info("✅ 감정 분석기 초기화 완료")
     
-    def _load_emotion_keywords(self) -> Dict[EmotionType, List[str]]:
-        """감정별 키워드 사전"""
-        return {
-            EmotionType.JOY: [
-                "기쁘", "행복", "즐거", "신나", "좋", "만족", "환상", "최고", "완벽",
-                "웃", "미소", "설레", "흥분", "활기", "상쾌", "기분좋", "희희",
-                "야호", "와우", "대박", "짱", "꿀", "사랑스러", "달콤", "따뜻"
-            ],
-            EmotionType.SADNESS: [
-                "슬프", "아프", "우울", "눈물", "울", "마음아파", "속상", "답답", 
-                "허무", "절망", "좌절", "힘들", "괴로", "고통", "비참", "처량",
-                "쓸쓸", "외로", "공허", "암울", "침울", "깊은한숨", "한숨", "체념"
-            ],
-            EmotionType.ANGER: [
-                "화", "짜증", "열받", "분노", "억울", "빡쳐", "미치겠", "뭐야",
-                "어이없", "말도안돼", "개빡", "개열받", "진짜", "어떻게", "왜",
-                "죽이고싶", "때리고싶", "복수", "원망", "증오", "혈압", "참을수없"
-            ],
-            EmotionType.FEAR: [
-                "무섭", "두려", "걱정", "근심", "불안", "공포", "무서워", "떨려",
-                "오싹", "소름", "긴장", "초조", "조마조마", "심장", "식은땀", 
-                "떨림", "겁", "공포감", "불안감", "위험", "위기감"
-            ],
-            EmotionType.SURPRISE: [
-                "놀라", "깜짝", "어?", "헉", "와", "어머", "세상에", "진짜?",
-                "설마", "어떻게", "믿을수없", "상상못했", "예상못했", "갑자기",
-                "느닷없이", "충격", "당황", "어리둥절"
-            ],
-            EmotionType.DISGUST: [
-                "역겨", "싫", "꼴보기싫", "구역질", "더러", "지겨", "짜증", "엣",
-                "우웩", "토나와", "못봐주겠", "한심", "어이없", "기가막혀"
-            ],
-            EmotionType.STRESS: [
-                "스트레스", "압박", "부담", "피곤", "지쳐", "힘들", "벅차", "몰려",
-                "쌓여", "터질것같", "한계", "과로", "번아웃", "소진", "지침",
-                "무리", "버거", "감당안돼", "머리아파", "목어깨", "근육", "긴장"
-            ],
-            EmotionType.ANXIETY: [
-                "불안", "걱정", "근심", "초조", "조급", "불안정", "동요", "염려",
-                "우려", "걱정스러", "마음편하지않", "안절부절", "조마조마", 
-                "가슴답답", "심장두근", "손떨림", "식은땀", "불면", "잠못자"
-            ],
-            EmotionType.LONELINESS: [
-                "외로", "혼자", "쓸쓸", "고립", "단절", "소외", "공허", "텅빈",
-                "아무도없", "홀로", "곁에없", "버림받", "소통안돼", "이해안돼",
-                "혼밥", "혼술", "혼영", "혼자만", "외톨이"
-            ],
-            EmotionType.FRUSTRATION: [
-                "답답", "막막", "좌절", "포기", "안돼", "어떻게", "방법없", "길막",
-                "진전없", "제자리", "발전없", "소용없", "헛수고", "벽", "한계",
-                "막다른", "절망적", "희망없", "어쩔수없"
-            ]
-        }
+    @property
+    def emotion_keywords(self) -> Dict[EmotionType, List[str]]:
+        return self.lexicon.emotion_keywords
+    
+    @property
+    def intensity_modifiers(self) -> Dict[str, float]:
+        return self.lexicon.intensity_modifiers
     
-    def _load_intensity_modifiers(self) -> Dict[str, float]:
-        """강도 수식어 사전 (배율)"""
-        return {
-            # 강화 수식어
-            "정말": 1.5, "너무": 1.4, "진짜": 1.3, "완전": 1.3, "엄청": 1.3,
-            "무척": 1.2, "매우": 1.2, "꽤": 1.1, "상당히": 1.2, "극도로": 1.6,
-            "최고로": 1.5, "최대로": 1.5, "심각하게": 1.4, "치명적으로": 1.6,
-            "죽도록": 1.5, "미치도록": 1.4, "파멸적으로": 1.6,
+    @property
+    def context_patterns(self) -> Dict[str, Dict[str, Any]]:
+        return self.lexicon.context_patterns
+    
+    @property
+    def negation_words(self) -> List[str]:
+        return self.lexicon.negation_words
+    
+    @property
+    def keyword_automaton(self) -> KeywordAutomaton:
+        return self.lexicon.automaton
+    
+    def reload_lexicon(self, rebuild: bool = True) -> Dict[str, Any]:
+        """감정 사전 런타임 교체 (재시작 없음)
+        
+        새 사전을 완전히 준비한 뒤 참조 하나만 바꾸므로, 진행 중인 분석은 시작 시점의
+        사전으로 끝까지 처리되고 이후 분석부터 새 사전을 사용합니다.
+        """
+        with self._reload_lock:
+            previous_version = self.lexicon.version
             
-            # 완화 수식어  
-            "좀": 0.8, "약간": 0.7, "살짝": 0.6, "조금": 0.7, "그냥": 0.8,
-            "별로": 0.6, "그렇게": 0.8, "그런대로": 0.7, "어느정도": 0.8,
-            "적당히": 0.7, "다소": 0.8, "어느정도": 0.8,
+            # 1. 새 사전 준비 (원본 재컴파일 + 아티팩트 갱신, 또는 아티팩트 적재)
+            lexicon = load_emotion_lexicon(rebuild=rebuild)
             
-            # 반복/지속 강화
-            "계속": 1.3, "지속적으로": 1.2, "끊임없이": 1.4, "쭉": 1.2,
-            "항상": 1.3, "늘": 1.2, "자꾸": 1.3, "또": 1.1, "다시": 1.1
-        }
+            # 2. 프로세스 워커는 새 아티팩트를 적재한 풀로 미리 교체 (첫 요청 지연 방지)
+            if self.executor is not None and self.executor.mode == "process":
+                self.executor.recycle()
+            
+            # 3. 원자적 교체
+            self.lexicon = lexicon
+            
+            # 4. 이전 사전 결과 캐시 정리 (캐시 키에 사전 버전이 포함되어 혼용은 없음)
+            if self.analysis_cache is not None and lexicon.version != previous_version:
+                self.analysis_cache.clear()
+            
+            logger.info(f"✅ 감정 사전 교체: {previous_version} → {lexicon.version}")
+            return {"previous_version": previous_version, "swapped_at": time.time(), **lexicon.describe()}
     
-    def _load_context_patterns(self) -> Dict[str, Dict[str, Any]]:
-        """상황별 패턴 인식"""
-        return {
-            "work_stress": {
-                "patterns": [
-                    r"(회사|직장|업무|일|상사|동료|야근|출근|퇴근|월급|승진)",
-                    r"(프로젝트|마감|회의|보고서|발표|평가|성과)"
-                ],
-                "boost_emotions": [EmotionType.STRESS, EmotionType.FRUSTRATION],
-                "multiplier": 1.2
-            },
-            "relationship_issues": {
-                "patterns": [
-                    r"(남친|여친|애인|연인|짝사랑|이별|헤어|차임|바람)",
-                    r"(친구|동기|선후배|인간관계|사람들|소통|갈등)"
-                ],
-                "boost_emotions": [EmotionType.SADNESS, EmotionType.LONELINESS, EmotionType.ANGER],
-                "multiplier": 1.3
-            },
-            "family_problems": {
-                "patterns": [
-                    r"(부모|엄마|아빠|가족|형제|자매|시댁|처가|시어머니|장모)",
-                    r"(가정|집|결혼|육아|아이|자식)"
-                ],
-                "boost_emotions": [EmotionType.STRESS, EmotionType.FRUSTRATION, EmotionType.SADNESS],
-                "multiplier": 1.4
-            },
-            "health_concerns": {
-                "patterns": [
-                    r"(아프|병|몸살|감기|병원|의사|약|치료|건강|몸)",
-                    r"(두통|복통|소화|불면|잠못|피곤|지쳐)"
-                ],
-                "boost_emotions": [EmotionType.ANXIETY, EmotionType.SADNESS],
-                "multiplier": 1.3
-            },
-            "financial_stress": {
-                "patterns": [
-                    r"(돈|비용|비싸|비용|월세|대출|빚|카드|적금|투자)",
-                    r"(경제|재정|수입|지출|생활비|용돈)"
-                ],
-                "boost_emotions": [EmotionType.STRESS, EmotionType.ANXIETY],
-                "multiplier": 1.3
-            }
-        }
+    def get_lexicon_info(self) -> Dict[str, Any]:
+        """현재 감정 사전 정보"""
+        return self.lexicon.describe()
     
-    def _load_negation_words(self) -> List[str]:
-        """부정어 리스트"""
-        return [
-            "안", "못", "아니", "없", "말고", "말아", "아냐", "아니야", 
-            "절대", "전혀", "조금도", "별로", "그리", "딱히"
-        ]
+    def keyword_salience(self, text: str) -> float:
+        """감정 키워드 등장 횟수 (세션 요약 핵심 문장 선택용 - 전체 분석 없이 사전 스캔만 수행)"""
+        keyword_hits = self.keyword_automaton.find_all(self._preprocess_text(text))
+        return float(sum(len(positions) for positions in keyword_hits.values()))
     
     async def analyze(self, text: str) -> EmotionAnalysis:
         """텍스트 감정 분석 메인 함수"""
@@ -158,42 +164,244 @@ class EmotionAnalyzer:
             return self._create_neutral_emotion()
         
         try:
-            # 1. 텍스트 전처리
+            # 1. 텍스트 전처리 (결과 캐시 키)
             cleaned_text = self._preprocess_text(text)
             
-            # 2. 감정별 점수 계산
-            emotion_scores = self._calculate_emotion_scores(cleaned_text)
+            if self.analysis_cache is None:
+                return await self._run_analysis(cleaned_text)
             
-            # 3. 상황별 컨텍스트 부스트 적용
-            emotion_scores = self._apply_context_boost(cleaned_text, emotion_scores)
+            # 2. 캐시 조회 - 캐시된 불변 결과의 사본을 반환해 공유 객체 변경을 차단
+            cache_key = self._cache_key(cleaned_text)
+            cached = self.analysis_cache.get(cache_key)
+            if cached is not None:
+                return cached.model_copy(deep=True)
             
-            # 4. 부정어 처리
-            emotion_scores = self._handle_negation(cleaned_text, emotion_scores)
+            analysis = FrozenEmotionAnalysis.model_construct(**dict(await self._run_analysis(cleaned_text)))
+            self.analysis_cache.put(cache_key, analysis)
+            return analysis.model_copy(deep=True)
             
-            # 5. 최종 감정 및 강도 결정
-            primary_emotion, secondary_emotion, intensity = self._determine_final_emotions(emotion_scores)
+        except Exception as e:
+            logger.error(f"감정 분석 오류: {e}")
+            return self._create_neutral_emotion()
+    
+    async def analyze_sentences(self, text: str) -> AsyncIterator[SentenceEmotion]:
+        """문장 단위 감정 타임라인 (문장을 찾는 즉시 분석해 순서대로 반환)
+        
+        문장은 원문을 앞에서부터 순차 탐색하며 분리하므로, 첫 결과는 전체 길이와 무관하게
+        첫 문장 분석 직후 반환되고 결과를 모아두지 않아 메모리가 문서 크기에 비례해 늘지 않습니다.
+        """
+        if not text:
+            return
+        
+        index = 0
+        for match in _SENTENCE_PATTERN.finditer(text):
+            sentence = match.group().rstrip()
+            analysis = await self.analyze(sentence)
             
-            # 6. 감정 키워드 추출
-            emotional_keywords = self._extract_emotional_keywords(cleaned_text, primary_emotion)
+            yield SentenceEmotion(
+                index=index,
+                start=match.start(),
+                end=match.start() + len(sentence),
+                sentence=sentence,
+                emotion_analysis=analysis
+            )
+            index += 1
             
-            # 7. 신뢰도 계산
-            confidence = self._calculate_confidence(emotion_scores, cleaned_text)
+            # 짧은 문장은 인라인 분석되므로 문장마다 이벤트 루프에 양보
+            await asyncio.sleep(0)
+    
+    async def _run_analysis(self, cleaned_text: str) -> EmotionAnalysis:
+        """길이에 따라 인라인 또는 오프로드 풀에서 분석 실행"""
+        if self.executor is None or len(cleaned_text) < self.offload_min_chars:
+            self.inline_runs += 1
+            return self._analyze_cleaned_text(cleaned_text)
+        return await self._offload(self._analyze_cleaned_text, _analyze_in_worker, cleaned_text)
+    
+    async def _offload(self, thread_func, process_func, *args):
+        """오프로드 풀에서 실행 (프로세스 모드는 워커에 적재된 분석기 사용, 풀 손상 시 인라인 대체)"""
+        func = process_func if self.executor.mode == "process" else thread_func
+        try:
+            return await self.executor.run(func, *args)
+        except BrokenExecutor as e:
+            logger.warning(f"⚠️ 감정 분석 풀 오류, 인라인 실행으로 대체: {e}")
+            self.inline_runs += 1
+            return thread_func(*args)
+    
+    def start_executor(self) -> None:
+        """오프로드 풀 예열 (서버 시작 시 호출)"""
+        if self.executor is not None:
+            self.executor.start()
+    
+    def shutdown_executor(self) -> None:
+        """오프로드 풀 종료 (서버 종료 시 호출)"""
+        if self.executor is not None:
+            self.executor.shutdown()
+    
+    def get_executor_stats(self) -> Dict[str, Any]:
+        """실행 위치별 처리 건수 및 오프로드 대기열 지표"""
+        stats: Dict[str, Any] = {
+            "mode": settings.EMOTION_EXECUTION_MODE,
+            "offload_min_chars": self.offload_min_chars,
+            "inline_runs": self.inline_runs
+        }
+        if self.executor is not None:
+            stats.update(self.executor.get_stats())
+        return stats
+    
+    def _analyze_cleaned_text(self, cleaned_text: str) -> EmotionAnalysis:
+        """전처리된 텍스트 감정 분석 (캐시 미적용 경로)"""
+        
+        # 1. 텍스트 특성 추출 (키워드/상황/수식어/부정어 - 이후 모든 단계에서 공유)
+        features = self._extract_text_features(cleaned_text)
+        
+        # 2. 감정별 점수 계산
+        emotion_scores = self._calculate_emotion_scores(features)
+        
+        # 3. 상황별 컨텍스트 부스트 적용
+        emotion_scores = self._apply_context_boost(features, emotion_scores)
+        
+        # 4. 부정어 처리
+        emotion_scores = self._handle_negation(features, emotion_scores)
+        
+        # 5. 최종 감정 및 강도 결정
+        primary_emotion, secondary_emotion, intensity = self._determine_final_emotions(emotion_scores)
+        
+        # 6. 감정 키워드 추출
+        emotional_keywords = self._extract_emotional_keywords(features, primary_emotion)
+        
+        # 7. 신뢰도 계산
+        confidence = self._calculate_confidence(emotion_scores, features)
+        
+        # 8. 상황 분석 (맥락 정보)
+        context_analysis = self._analyze_context(features)
+        
+        return EmotionAnalysis(
+            primary_emotion=primary_emotion,
+            secondary_emotion=secondary_emotion,
+            intensity=intensity,
+            confidence=confidence,
+            emotional_keywords=emotional_keywords,
+            context_analysis=context_analysis
+        )
+    
+    def _cache_key(self, cleaned_text: str) -> bytes:
+        """전처리된 텍스트의 고정 길이 다이제스트 (긴 일기도 키 메모리 일정)"""
+        return hashlib.blake2b(
+            cleaned_text.encode("utf-8"), digest_size=16, person=self.lexicon.version.encode("ascii")
+        ).digest()
+    
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """분석 결과 캐시 통계"""
+        if self.analysis_cache is None:
+            return {"enabled": False}
+        return {"enabled": True, **self.analysis_cache.get_stats()}
+    
+    async def analyze_batch(self, texts: List[str]) -> List[EmotionAnalysis]:
+        """여러 텍스트 일괄 감정 분석
+        
+        텍스트별 키워드 스캔 결과로 (텍스트 x 키워드) 가중 매칭 행렬을 만든 뒤,
+        감정 점수 합산, 상황 배율, 부정어 감쇠, 상위 2개 감정 선택을 배치 전체에 대해
+        배열 연산으로 처리합니다. 합산/곱셈 순서를 analyze()와 맞춰 점수가 비트 단위로 같고
+        동점은 EmotionType 선언 순서로 정하므로, 결과는 텍스트별 analyze() 결과와 같습니다.
+        전체 텍스트 길이가 오프로드 기준 이상이면 배치 전체를 풀에서 실행합니다.
+        """
+        total_chars = sum(len(text) for text in texts if text)
+        if self.executor is None or total_chars < self.offload_min_chars:
+            self.inline_runs += 1
+            return self._analyze_batch_sync(texts)
+        return await self._offload(self._analyze_batch_sync, _analyze_batch_in_worker, texts)
+    
+    def _analyze_batch_sync(self, texts: List[str]) -> List[EmotionAnalysis]:
+        """배치 감정 분석 본체 (동기 - 오프로드 풀에서도 실행)"""
+        results: List[Optional[EmotionAnalysis]] = [None] * len(texts)
+        rows: List[Tuple[int, TextFeatures]] = []
+        lexicon = self.lexicon  # 배치 전체가 같은 사전을 사용
+        
+        # 1. 텍스트별 전처리 및 특성 추출
+        for index, text in enumerate(texts):
+            if not text or len(text.strip()) == 0:
+                results[index] = self._create_neutral_emotion()
+                continue
+            
+            try:
+                cleaned_text = self._preprocess_text(text)
+                rows.append((index, self._extract_text_features(cleaned_text, lexicon)))
+            except Exception as e:
+                logger.error(f"배치 감정 분석 오류 (#{index}): {e}")
+                results[index] = self._create_neutral_emotion()
+        
+        if not rows:
+            return results
+        
+        try:
+            # 2. (텍스트 x 키워드) 가중 매칭 행렬 및 상황/부정어/수식어 특성 구성
+            #    마지막 열은 항상 0 (감정별 키워드 수가 달라 score_gather 빈 칸이 가리키는 열)
+            hit_matrix = np.zeros((len(rows), len(lexicon.score_entries) + 1))
+            situation_matrix = np.zeros((len(rows), len(lexicon.context_patterns)), dtype=bool)
+            negation_factors = np.ones(len(rows))
+            text_lengths = np.zeros(len(rows))
+            has_modifiers = np.zeros(len(rows), dtype=bool)
+            
+            situation_index = {name: index for index, name in enumerate(lexicon.context_patterns)}
+            for row, (_, features) in enumerate(rows):
+                for keyword, weight in self._calculate_keyword_weights(features).items():
+                    hit_matrix[row, lexicon.score_entry_index[keyword]] = weight
+                
+                for situation_name in features.detected_situations:
+                    situation_matrix[row, situation_index[situation_name]] = True
+                
+                if features.negation_count > 0:
+                    negation_factors[row] = 0.7 ** features.negation_count
+                text_lengths[row] = len(features.text)
+                has_modifiers[row] = features.has_modifiers
+            
+            # 3. 감정별 점수 = 매칭 행렬 x 키워드→감정 소속 행렬
+            #    행렬곱은 가산 순서가 정해지지 않아 동점/임계값 비교가 analyze()와 어긋날 수 있으므로,
+            #    감정 키워드 목록 위치 순서대로 열을 모아 더함 (0을 더하는 것은 값을 바꾸지 않음)
+            scores = np.zeros((len(rows), len(lexicon.emotion_columns)))
+            for entry_columns in lexicon.score_gather:
+                scores += hit_matrix[:, entry_columns]
+            
+            # 4. 상황별 컨텍스트 배율 (상황 순서 → 강화 감정 순서대로 곱함, 해당 없는 행은 1.0)
+            for situation_row, (multiplier, columns) in enumerate(lexicon.context_boost_columns):
+                factors = np.where(situation_matrix[:, situation_row], multiplier, 1.0)
+                for column in columns:
+                    scores[:, column] *= factors
+            
+            # 5. 부정어 처리 (긍정 감정만 감소, 배율은 단일 분석과 같은 0.7 ** 부정어 수)
+            scores[:, lexicon.positive_columns] *= negation_factors[:, None]
+            
+            # 6. 최종 감정/강도/신뢰도 (총점은 sum()과 같은 순서로 행별 합산)
+            total_scores = np.array([sum(row_scores) for row_scores in scores.tolist()])
+            primary_columns, secondary_columns, intensities = self._determine_final_emotions_batch(scores)
+            confidences = self._calculate_confidence_batch(scores, total_scores, text_lengths, has_modifiers)
             
-            # 8. 상황 분석 (맥락 정보)
-            context_analysis = self._analyze_context(cleaned_text)
+        except Exception as e:
+            logger.error(f"배치 감정 분석 오류: {e}")
+            for index, _ in rows:
+                results[index] = self._create_neutral_emotion()
+            return results
+        
+        # 7. 텍스트별 결과 조립
+        for row, (index, features) in enumerate(rows):
+            if primary_columns[row] < 0:
+                primary_emotion = EmotionType.NEUTRAL
+            else:
+                primary_emotion = lexicon.emotion_columns[primary_columns[row]]
+            secondary_emotion = (
+                lexicon.emotion_columns[secondary_columns[row]] if secondary_columns[row] >= 0 else None
+            )
             
-            return EmotionAnalysis(
+            results[index] = EmotionAnalysis(
                 primary_emotion=primary_emotion,
                 secondary_emotion=secondary_emotion,
-                intensity=intensity,
-                confidence=confidence,
-                emotional_keywords=emotional_keywords,
-                context_analysis=context_analysis
+                intensity=float(intensities[row]),
+                confidence=float(confidences[row]),
+                emotional_keywords=self._extract_emotional_keywords(features, primary_emotion),
+                context_analysis=self._analyze_context(features)
             )
-            
-        except Exception as e:
-            logger.error(f"감정 분석 오류: {e}")
-            return self._create_neutral_emotion()
+        
+        return results
     
     def _preprocess_text(self, text: str) -> str:
         """텍스트 전처리"""
@@ -201,78 +409,191 @@ class EmotionAnalyzer:
         cleaned = text.lower().strip()
         
         # 반복 문자 정리 (예: "아아아악" -> "아악")
-        cleaned = re.sub(r'(.)\1{2,}', r'\1\1', cleaned)
+        cleaned = _REPEATED_CHAR_PATTERN.sub(r'\1\1', cleaned)
         
         # 의미없는 특수문자 제거 (감정 표현은 유지)
-        cleaned = re.sub(r'[^\w\s!?.,~ㅠㅜㅋㅎ]', '', cleaned)
+        cleaned = _NOISE_CHAR_PATTERN.sub('', cleaned)
         
         return cleaned
     
-    def _calculate_emotion_scores(self, text: str) -> Dict[EmotionType, float]:
-        """감정별 점수 계산"""
+    def _extract_text_features(self, text: str, lexicon: Optional[CompiledLexicon] = None) -> TextFeatures:
+        """전처리된 텍스트의 특성을 한 번에 추출
+        
+        사전(감정 키워드/수식어/부정어)은 오토마톤 단일 패스로, 상황 패턴은 상황별
+        결합 정규식으로 검사하며, 이후 단계는 이 결과만 읽습니다.
+        """
+        lexicon = lexicon or self.lexicon
+        keyword_hits = lexicon.automaton.find_all(text)
+        
+        detected_situations = [
+            situation_name for situation_name, pattern in lexicon.situation_patterns
+            if pattern.search(text)
+        ]
+        
+        negation_positions: List[int] = []
+        for neg_word in lexicon.negation_words:
+            hits = keyword_hits.get(neg_word)
+            if hits:
+                negation_positions.extend(KeywordAutomaton.non_overlapping(hits, len(neg_word)))
+        negation_positions.sort()
+        
+        repeated_char_runs = [(m.start(), m.end()) for m in _REPEATED_CHAR_PATTERN.finditer(text)]
+        
+        return TextFeatures(
+            text=text,
+            keyword_hits=keyword_hits,
+            detected_situations=detected_situations,
+            modifier_spans=self._collect_modifier_spans(lexicon, keyword_hits),
+            negation_positions=negation_positions,
+            repeated_char_runs=repeated_char_runs,
+            text_characteristics={
+                "length": len(text),
+                "sentence_count": text.count('.') + 1,
+                "question_marks": text.count('?'),
+                "exclamation_marks": text.count('!'),
+                "repetitive_chars": len(repeated_char_runs)
+            },
+            lexicon=lexicon
+        )
+    
+    def _calculate_emotion_scores(self, features: TextFeatures) -> Dict[EmotionType, float]:
+        """감정별 점수 계산
+        
+        매칭된 키워드만 (감정 열, 감정 키워드 목록 내 위치) 순서로 더하므로,
+        감정마다 사전 순서대로 전체 키워드를 훑으며 더하는 것과 가산 순서(= 결과)가 같음
+        """
+        lexicon = features.lexicon
         emotion_scores = {emotion: 0.0 for emotion in EmotionType}
+        keyword_weights = self._calculate_keyword_weights(features)
         
-        for emotion, keywords in self.emotion_keywords.items():
-            for keyword in keywords:
-                # 키워드 매칭 횟수
-                matches = len(re.findall(keyword, text))
-                base_score = matches * 1.0
-                
-                if base_score > 0:
-                    # 강도 수식어 적용
-                    intensity_boost = self._calculate_intensity_boost(text, keyword)
-                    final_score = base_score * intensity_boost
-                    
-                    emotion_scores[emotion] += final_score
+        slots = sorted(
+            (column, position, weight)
+            for keyword, weight in keyword_weights.items()
+            for column, position in lexicon.keyword_score_slots.get(keyword, ())
+        )
+        for column, _, weight in slots:
+            emotion_scores[lexicon.emotion_columns[column]] += weight
         
         return emotion_scores
     
-    def _calculate_intensity_boost(self, text: str, keyword: str) -> float:
+    def _calculate_keyword_weights(self, features: TextFeatures) -> Dict[str, float]:
+        """키워드별 점수 (매칭 횟수 x 강도 수식어 배율), 매칭된 키워드만 포함"""
+        text, keyword_hits, modifier_spans = features.text, features.keyword_hits, features.modifier_spans
+        lexicon = features.lexicon
+        keyword_weights: Dict[str, float] = {}
+        window_ranks_by_length: Dict[int, List[Optional[int]]] = {}
+        
+        # 오토마톤에 매칭된 감정 키워드 + 정규식 키워드만 계산
+        candidates = [kw for kw in keyword_hits if kw in lexicon.score_entry_index and kw not in lexicon.regex_keywords]
+        candidates.extend(lexicon.regex_keywords)
+        
+        for keyword in candidates:
+            # 키워드 매칭 위치 (겹치지 않는 매칭만)
+            positions = self._keyword_positions(lexicon, text, keyword, keyword_hits)
+            base_score = len(positions) * 1.0
+            
+            if base_score > 0:
+                # 강도 수식어 적용
+                intensity_boost = 1.0
+                if modifier_spans:
+                    window_ranks = window_ranks_by_length.get(len(keyword))
+                    if window_ranks is None:
+                        window_ranks = self._modifier_window_ranks(len(text), len(keyword), modifier_spans)
+                        window_ranks_by_length[len(keyword)] = window_ranks
+                    intensity_boost = self._calculate_intensity_boost(lexicon, positions, window_ranks)
+                
+                keyword_weights[keyword] = base_score * intensity_boost
+        
+        return keyword_weights
+    
+    def _keyword_positions(
+        self,
+        lexicon: CompiledLexicon,
+        text: str,
+        keyword: str,
+        keyword_hits: Dict[str, List[int]]
+    ) -> List[int]:
+        """키워드 매칭 시작 위치 (re.finditer와 동일한 결과)"""
+        pattern = lexicon.regex_keywords.get(keyword)
+        if pattern is not None:
+            return [m.start() for m in pattern.finditer(text)]
+        
+        return KeywordAutomaton.non_overlapping(keyword_hits.get(keyword, []), len(keyword))
+    
+    def _collect_modifier_spans(
+        self,
+        lexicon: CompiledLexicon,
+        keyword_hits: Dict[str, List[int]]
+    ) -> List[Tuple[int, int, int]]:
+        """텍스트 내 강도 수식어 등장 구간 (start, end, rank) - 우선순위 낮은 것부터 정렬"""
+        spans = []
+        for modifier, rank in lexicon.modifier_ranks.items():
+            for start in keyword_hits.get(modifier, ()):
+                spans.append((start, start + len(modifier), rank))
+        
+        spans.sort(key=lambda span: span[2], reverse=True)
+        return spans
+    
+    def _modifier_window_ranks(
+        self,
+        text_length: int,
+        keyword_length: int,
+        modifier_spans: List[Tuple[int, int, int]]
+    ) -> List[Optional[int]]:
+        """키워드 시작 위치별로 앞뒤 10글자 범위에 온전히 포함된 수식어 중 최우선 순위
+        
+        위치 p의 범위는 [p-10, p+keyword_length+10) 이므로, 구간 [start, end)의 수식어는
+        end-keyword_length-10 <= p <= start+10 인 위치에서 보입니다.
+        우선순위가 낮은 수식어부터 덮어써서 사전 순서상 가장 앞선 수식어가 남도록 합니다.
+        """
+        window_ranks: List[Optional[int]] = [None] * (text_length + 1)
+        
+        for start, end, rank in modifier_spans:
+            low = max(0, end - keyword_length - 10)
+            high = min(text_length, start + 10)
+            if low <= high:
+                window_ranks[low:high + 1] = [rank] * (high - low + 1)
+        
+        return window_ranks
+    
+    def _calculate_intensity_boost(
+        self,
+        lexicon: CompiledLexicon,
+        keyword_positions: List[int],
+        window_ranks: List[Optional[int]]
+    ) -> float:
         """강도 수식어에 따른 배율 계산"""
         boost = 1.0
         
-        # 키워드 앞뒤 5글자 범위에서 수식어 찾기
-        keyword_positions = [m.start() for m in re.finditer(keyword, text)]
-        
+        # 키워드 앞뒤 10글자 범위에서 첫 번째 수식어만 적용
         for pos in keyword_positions:
-            start = max(0, pos - 10)
-            end = min(len(text), pos + len(keyword) + 10)
-            context = text[start:end]
-            
-            for modifier, multiplier in self.intensity_modifiers.items():
-                if modifier in context:
-                    boost *= multiplier
-                    break  # 첫 번째 수식어만 적용
+            rank = window_ranks[pos]
+            if rank is not None:
+                boost *= lexicon.modifier_multipliers[rank]
         
         return boost
     
-    def _apply_context_boost(self, text: str, emotion_scores: Dict[EmotionType, float]) -> Dict[EmotionType, float]:
+    def _apply_context_boost(self, features: TextFeatures, emotion_scores: Dict[EmotionType, float]) -> Dict[EmotionType, float]:
         """상황별 컨텍스트 부스트 적용"""
         
-        for context_name, context_info in self.context_patterns.items():
-            context_matched = False
+        # 특성 추출 단계에서 감지된 상황 (context_patterns 순서 유지)
+        for context_name in features.detected_situations:
+            context_info = features.lexicon.context_patterns[context_name]
             
-            # 패턴 매칭 체크
-            for pattern in context_info["patterns"]:
-                if re.search(pattern, text):
-                    context_matched = True
-                    break
+            # 해당 상황에서 강화할 감정들에 배율 적용
+            for emotion in context_info["boost_emotions"]:
+                if emotion in emotion_scores:
+                    emotion_scores[emotion] *= context_info["multiplier"]
             
-            if context_matched:
-                # 해당 상황에서 강화할 감정들에 배율 적용
-                for emotion in context_info["boost_emotions"]:
-                    if emotion in emotion_scores:
-                        emotion_scores[emotion] *= context_info["multiplier"]
-                
-                logger.debug(f"컨텍스트 부스트 적용: {context_name}")
+            logger.debug(f"컨텍스트 부스트 적용: {context_name}")
         
         return emotion_scores
     
-    def _handle_negation(self, text: str, emotion_scores: Dict[EmotionType, float]) -> Dict[EmotionType, float]:
+    def _handle_negation(self, features: TextFeatures, emotion_scores: Dict[EmotionType, float]) -> Dict[EmotionType, float]:
         """부정어 처리"""
         
         # 간단한 부정어 처리 (예: "안 좋아" -> 기쁨 감소)
-        negation_count = sum(text.count(neg_word) for neg_word in self.negation_words)
+        negation_count = features.negation_count
         
         if negation_count > 0:
             # 긍정 감정은 감소, 부정 감정은 유지
@@ -298,8 +619,8 @@ class EmotionAnalyzer:
         if not non_zero_emotions:
             return EmotionType.NEUTRAL, None, 0.5
         
-        # 점수 순으로 정렬
-        sorted_emotions = sorted(non_zero_emotions.items(), key=lambda x: x[1], reverse=True)
+        # 점수 순으로 정렬 (동점은 EmotionType 선언 순서 - 배치 분석과 동일)
+        sorted_emotions = sorted(non_zero_emotions.items(), key=lambda x: (-x[1], _EMOTION_ORDER[x[0]]))
         
         primary_emotion = sorted_emotions[0][0]
         primary_score = sorted_emotions[0][1]
@@ -320,14 +641,37 @@ class EmotionAnalyzer:
         
         return primary_emotion, secondary_emotion, intensity
     
-    def _extract_emotional_keywords(self, text: str, primary_emotion: EmotionType) -> List[str]:
+    def _determine_final_emotions_batch(self, scores: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """배치 최종 감정 결정 (_determine_final_emotions의 행렬 버전)
+        
+        Returns:
+            (주요 감정 열 인덱스, 보조 감정 열 인덱스, 강도) - 감정이 없으면 인덱스 -1
+        """
+        # 점수 내림차순 정렬 (열 = EmotionType 선언 순서, 안정 정렬이므로 동점은 선언 순서 - 단일 분석과 동일)
+        order = np.argsort(-scores, axis=1, kind="stable")[:, :2]
+        top_scores = np.take_along_axis(scores, order, axis=1)
+        primary_scores, secondary_scores = top_scores[:, 0], top_scores[:, 1]
+        
+        has_primary = primary_scores > 0
+        has_secondary = (secondary_scores > 0) & (secondary_scores >= primary_scores * 0.5)
+        
+        primary_columns = np.where(has_primary, order[:, 0], -1)
+        secondary_columns = np.where(has_primary & has_secondary, order[:, 1], -1)
+        
+        # 강도 계산 (가정된 최대 점수 10.0, 최소 0.3 보정, 감정 없음은 0.5)
+        intensities = np.maximum(np.minimum(primary_scores / 10.0, 1.0), 0.3)
+        intensities = np.where(has_primary, intensities, 0.5)
+        
+        return primary_columns, secondary_columns, intensities
+    
+    def _extract_emotional_keywords(self, features: TextFeatures, primary_emotion: EmotionType) -> List[str]:
         """감정 키워드 추출"""
         keywords = []
         
-        if primary_emotion in self.emotion_keywords:
-            emotion_keywords = self.emotion_keywords[primary_emotion]
+        if primary_emotion in features.lexicon.emotion_keywords:
+            emotion_keywords = features.lexicon.emotion_keywords[primary_emotion]
             for keyword in emotion_keywords:
-                if keyword in text:
+                if keyword in features.keyword_hits:
                     keywords.append(keyword)
         
         # 중복 제거 및 길이 제한
@@ -335,7 +679,7 @@ class EmotionAnalyzer:
         
         return unique_keywords
     
-    def _calculate_confidence(self, emotion_scores: Dict[EmotionType, float], text: str) -> float:
+    def _calculate_confidence(self, emotion_scores: Dict[EmotionType, float], features: TextFeatures) -> float:
         """분석 신뢰도 계산"""
         
         confidence = 0.5  # 기본 신뢰도
@@ -348,7 +692,7 @@ class EmotionAnalyzer:
             confidence += 0.1
         
         # 2. 텍스트 길이가 적절할 때 신뢰도 증가
-        text_length = len(text)
+        text_length = features.text_characteristics["length"]
         if 10 <= text_length <= 200:
             confidence += 0.1
         elif 200 < text_length <= 500:
@@ -362,14 +706,37 @@ class EmotionAnalyzer:
             confidence += 0.05
         
         # 4. 강도 수식어가 있을 때 신뢰도 증가
-        has_modifiers = any(modifier in text for modifier in self.intensity_modifiers.keys())
-        if has_modifiers:
+        if features.has_modifiers:
             confidence += 0.1
         
         # 최대 1.0으로 제한
         return min(confidence, 1.0)
     
-    def _analyze_context(self, text: str) -> Dict[str, Any]:
+    def _calculate_confidence_batch(
+        self,
+        scores: np.ndarray,
+        total_scores: np.ndarray,
+        text_lengths: np.ndarray,
+        has_modifiers: np.ndarray
+    ) -> np.ndarray:
+        """배치 신뢰도 계산 (_calculate_confidence의 행렬 버전, 동일한 가산 순서)
+        
+        total_scores는 행별 sum(emotion_scores.values()) - numpy 합계는 가산 순서가 달라 임계값 비교가 어긋날 수 있음
+        """
+        unique_emotions = (scores > 0).sum(axis=1)
+        
+        confidences = np.full(len(scores), 0.5)
+        confidences = confidences + np.where(total_scores > 5, 0.2, np.where(total_scores > 2, 0.1, 0.0))
+        confidences = confidences + np.where(
+            (text_lengths >= 10) & (text_lengths <= 200), 0.1,
+            np.where((text_lengths > 200) & (text_lengths <= 500), 0.05, 0.0)
+        )
+        confidences = confidences + np.where(unique_emotions >= 2, 0.1, np.where(unique_emotions == 1, 0.05, 0.0))
+        confidences = confidences + np.where(has_modifiers, 0.1, 0.0)
+        
+        return np.minimum(confidences, 1.0)
+    
+    def _analyze_context(self, features: TextFeatures) -> Dict[str, Any]:
         """상황 분석 (맥락 정보)"""
         
         context = {
@@ -378,21 +745,11 @@ class EmotionAnalyzer:
             "emotional_complexity": "simple"
         }
         
-        # 1. 상황 감지
-        for situation_name, situation_info in self.context_patterns.items():
-            for pattern in situation_info["patterns"]:
-                if re.search(pattern, text):
-                    context["detected_situations"].append(situation_name)
-                    break
+        # 1. 상황 감지 (특성 추출 단계 결과)
+        context["detected_situations"] = list(features.detected_situations)
         
         # 2. 텍스트 특성 분석
-        context["text_characteristics"] = {
-            "length": len(text),
-            "sentence_count": len(text.split('.')),
-            "question_marks": text.count('?'),
-            "exclamation_marks": text.count('!'),
-            "repetitive_chars": len(re.findall(r'(.)\1{2,}', text))
-        }
+        context["text_characteristics"] = dict(features.text_characteristics)
         
         # 3. 감정 복잡도 결정
         if len(context["detected_situations"]) > 2:
@@ -413,6 +770,22 @@ class EmotionAnalyzer:
             context_analysis={"error": "분석 실패 또는 중립적 텍스트"}
         )
 
+# 오프로드 프로세스 워커별 분석기 (initializer에서 사전을 한 번만 적재)
+_worker_analyzer: Optional[EmotionAnalyzer] = None
+
+def _init_analysis_worker() -> None:
+    """프로세스 워커 초기화 - 사전 컴파일 후 상주 (캐시는 부모 프로세스에서만 유지)"""
+    global _worker_analyzer
+    _worker_analyzer = EmotionAnalyzer()
+    _worker_analyzer.analysis_cache = None
+    _worker_analyzer.executor = None
+
+def _analyze_in_worker(cleaned_text: str) -> EmotionAnalysis:
+    return _worker_analyzer._analyze_cleaned_text(cleaned_text)
+
+def _analyze_batch_in_worker(texts: List[str]) -> List[EmotionAnalysis]:
+    return _worker_analyzer._analyze_batch_sync(texts)
+
 # 전역 감정 분석기 인스턴스 (싱글톤)
 _emotion_analyzer_instance: Optional[EmotionAnalyzer] = None
 
@@ -0,0 +1,542 @@
+"""
+감정 사전 빌드/적재
+내장 사전(키워드/수식어/상황/부정어)과 assets/data/emotions.json 트리거를 병합해
+사전 컴파일된 아티팩트(오토마톤 테이블 + 문자열 테이블)로 저장하고 mmap으로 적재
+
+빌드: python -m services.emotion_lexicon [--source 경로] [--output 경로]
+"""
+
+import argparse
+import hashlib
+import json
+import mmap
+import os
+import re
+import struct
+import sys
+import time
+from array import array
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from config.settings import get_settings
+from models.chat_models import EmotionType
+from utils.keyword_automaton import KeywordAutomaton
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+# 아티팩트 형식: MAGIC | 메타 길이(uint32) | 메타 JSON | 4바이트 정렬 | uint32 배열 섹션들 | 문자열 바이트
+LEXICON_MAGIC = b"EFTLEX01"
+_HEADER = struct.Struct("<8sI")
+_AUTOMATON_TABLES = ("state_offsets", "trans_chars", "trans_next", "fail", "output_offsets", "output_ids")
+
+# 정규식 메타문자가 포함된 키워드는 오토마톤 대신 re.finditer로 매칭 (예: "어?")
+_REGEX_METACHARACTERS = frozenset(".^$*+?{}[]\\|()")
+
+# emotions.json 감정 ID → EmotionType (매핑되지 않는 감정은 병합 대상에서 제외)
+_EMOTION_ID_MAP = {
+    "stress": EmotionType.STRESS,
+    "anxiety": EmotionType.ANXIETY,
+    "anger": EmotionType.ANGER,
+    "sadness": EmotionType.SADNESS,
+    "fear": EmotionType.FEAR,
+    "loneliness": EmotionType.LONELINESS,
+    "frustration": EmotionType.FRUSTRATION,
+    "joy": EmotionType.JOY,
+    "surprise": EmotionType.SURPRISE,
+    "disgust": EmotionType.DISGUST,
+    "love": EmotionType.LOVE,
+}
+
+# JSON 내 // 주석 제거용 (문자열 리터럴은 그대로 유지)
+_JSON_COMMENT_PATTERN = re.compile(r'("(?:\\.|[^"\\])*")|//[^\n]*')
+
+def builtin_emotion_keywords() -> Dict[EmotionType, List[str]]:
+    """감정별 키워드 사전"""
+    return {
+        EmotionType.JOY: [
+            "기쁘", "행복", "즐거", "신나", "좋", "만족", "환상", "최고", "완벽",
+            "웃", "미소", "설레", "흥분", "활기", "상쾌", "기분좋", "희희",
+            "야호", "와우", "대박", "짱", "꿀", "사랑스러", "달콤", "따뜻"
+        ],
+        EmotionType.SADNESS: [
+            "슬프", "아프", "우울", "눈물", "울", "마음아파", "속상", "답답", 
+            "허무", "절망", "좌절", "힘들", "괴로", "고통", "비참", "처량",
+            "쓸쓸", "외로", "공허", "암울", "침울", "깊은한숨", "한숨", "체념"
+        ],
+        EmotionType.ANGER: [
+            "화", "짜증", "열받", "분노", "억울", "빡쳐", "미치겠", "뭐야",
+            "어이없", "말도안돼", "개빡", "개열받", "진짜", "어떻게", "왜",
+            "죽이고싶", "때리고싶", "복수", "원망", "증오", "혈압", "참을수없"
+        ],
+        EmotionType.FEAR: [
+            "무섭", "두려", "걱정", "근심", "불안", "공포", "무서워", "떨려",
+            "오싹", "소름", "긴장", "초조", "조마조마", "심장", "식은땀", 
+            "떨림", "겁", "공포감", "불안감", "위험", "위기감"
+        ],
+        EmotionType.SURPRISE: [
+            "놀라", "깜짝", "어?", "헉", "와", "어머", "세상에", "진짜?",
+            "설마", "어떻게", "믿을수없", "상상못했", "예상못했", "갑자기",
+            "느닷없이", "충격", "당황", "어리둥절"
+        ],
+        EmotionType.DISGUST: [
+            "역겨", "싫", "꼴보기싫", "구역질", "더러", "지겨", "짜증", "엣",
+            "우웩", "토나와", "못봐주겠", "한심", "어이없", "기가막혀"
+        ],
+        EmotionType.STRESS: [
+            "스트레스", "압박", "부담", "피곤", "지쳐", "힘들", "벅차", "몰려",
+            "쌓여", "터질것같", "한계", "과로", "번아웃", "소진", "지침",
+            "무리", "버거", "감당안돼", "머리아파", "목어깨", "근육", "긴장"
+        ],
+        EmotionType.ANXIETY: [
+            "불안", "걱정", "근심", "초조", "조급", "불안정", "동요", "염려",
+            "우려", "걱정스러", "마음편하지않", "안절부절", "조마조마", 
+            "가슴답답", "심장두근", "손떨림", "식은땀", "불면", "잠못자"
+        ],
+        EmotionType.LONELINESS: [
+            "외로", "혼자", "쓸쓸", "고립", "단절", "소외", "공허", "텅빈",
+            "아무도없", "홀로", "곁에없", "버림받", "소통안돼", "이해안돼",
+            "혼밥", "혼술", "혼영", "혼자만", "외톨이"
+        ],
+        EmotionType.FRUSTRATION: [
+            "답답", "막막", "좌절", "포기", "안돼", "어떻게", "방법없", "길막",
+            "진전없", "제자리", "발전없", "소용없", "헛수고", "벽", "한계",
+            "막다른", "절망적", "희망없", "어쩔수없"
+        ]
+    }
+
+def builtin_intensity_modifiers() -> Dict[str, float]:
+    """강도 수식어 사전 (배율)"""
+    return {
+        # 강화 수식어
+        "정말": 1.5, "너무": 1.4, "진짜": 1.3, "완전": 1.3, "엄청": 1.3,
+        "무척": 1.2, "매우": 1.2, "꽤": 1.1, "상당히": 1.2, "극도로": 1.6,
+        "최고로": 1.5, "최대로": 1.5, "심각하게": 1.4, "치명적으로": 1.6,
+        "죽도록": 1.5, "미치도록": 1.4, "파멸적으로": 1.6,
+        
+        # 완화 수식어  
+        "좀": 0.8, "약간": 0.7, "살짝": 0.6, "조금": 0.7, "그냥": 0.8,
+        "별로": 0.6, "그렇게": 0.8, "그런대로": 0.7, "어느정도": 0.8,
+        "적당히": 0.7, "다소": 0.8, "어느정도": 0.8,
+        
+        # 반복/지속 강화
+        "계속": 1.3, "지속적으로": 1.2, "끊임없이": 1.4, "쭉": 1.2,
+        "항상": 1.3, "늘": 1.2, "자꾸": 1.3, "또": 1.1, "다시": 1.1
+    }
+
+def builtin_context_patterns() -> Dict[str, Dict[str, Any]]:
+    """상황별 패턴 인식"""
+    return {
+        "work_stress": {
+            "patterns": [
+                r"(회사|직장|업무|일|상사|동료|야근|출근|퇴근|월급|승진)",
+                r"(프로젝트|마감|회의|보고서|발표|평가|성과)"
+            ],
+            "boost_emotions": [EmotionType.STRESS, EmotionType.FRUSTRATION],
+            "multiplier": 1.2
+        },
+        "relationship_issues": {
+            "patterns": [
+                r"(남친|여친|애인|연인|짝사랑|이별|헤어|차임|바람)",
+                r"(친구|동기|선후배|인간관계|사람들|소통|갈등)"
+            ],
+            "boost_emotions": [EmotionType.SADNESS, EmotionType.LONELINESS, EmotionType.ANGER],
+            "multiplier": 1.3
+        },
+        "family_problems": {
+            "patterns": [
+                r"(부모|엄마|아빠|가족|형제|자매|시댁|처가|시어머니|장모)",
+                r"(가정|집|결혼|육아|아이|자식)"
+            ],
+            "boost_emotions": [EmotionType.STRESS, EmotionType.FRUSTRATION, EmotionType.SADNESS],
+            "multiplier": 1.4
+        },
+        "health_concerns": {
+            "patterns": [
+                r"(아프|병|몸살|감기|병원|의사|약|치료|건강|몸)",
+                r"(두통|복통|소화|불면|잠못|피곤|지쳐)"
+            ],
+            "boost_emotions": [EmotionType.ANXIETY, EmotionType.SADNESS],
+            "multiplier": 1.3
+        },
+        "financial_stress": {
+            "patterns": [
+                r"(돈|비용|비싸|비용|월세|대출|빚|카드|적금|투자)",
+                r"(경제|재정|수입|지출|생활비|용돈)"
+            ],
+            "boost_emotions": [EmotionType.STRESS, EmotionType.ANXIETY],
+            "multiplier": 1.3
+        }
+    }
+
+def builtin_negation_words() -> List[str]:
+    """부정어 리스트"""
+    return [
+        "안", "못", "아니", "없", "말고", "말아", "아냐", "아니야", 
+        "절대", "전혀", "조금도", "별로", "그리", "딱히"
+    ]
+
+def load_emotion_triggers(path: str) -> Dict[EmotionType, List[str]]:
+    """emotions.json의 감정별 트리거를 키워드로 변환
+
+    트리거는 구문 그대로와 공백을 뺀 형태(예: "업무 압박", "업무압박")를 모두 등록합니다.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.loads(_JSON_COMMENT_PATTERN.sub(lambda m: m.group(1) or "", f.read()))
+
+    triggers: Dict[EmotionType, List[str]] = {}
+    for emotion_info in data.get("predefinedEmotions", []):
+        emotion = _EMOTION_ID_MAP.get(emotion_info.get("id"))
+        if emotion is None:
+            logger.debug(f"감정 사전 병합 제외 (매핑 없음): {emotion_info.get('id')}")
+            continue
+
+        keywords = triggers.setdefault(emotion, [])
+        for trigger in emotion_info.get("triggers", []):
+            phrase = " ".join(trigger.lower().split())
+            if phrase:
+                keywords.extend([phrase, phrase.replace(" ", "")])
+
+    return triggers
+
+class CompiledLexicon:
+    """컴파일된 감정 사전 (분석 1회 동안 하나의 인스턴스만 참조 - 교체 시 참조만 바꿈)"""
+
+    def __init__(
+        self,
+        emotion_keywords: Dict[EmotionType, List[str]],
+        intensity_modifiers: Dict[str, float],
+        context_patterns: Dict[str, Dict[str, Any]],
+        negation_words: List[str],
+        sources: Optional[List[str]] = None,
+        automaton: Optional[KeywordAutomaton] = None,
+        version: Optional[str] = None,
+        source_hash: Optional[str] = None
+    ):
+        self.emotion_keywords = emotion_keywords
+        self.intensity_modifiers = intensity_modifiers
+        self.context_patterns = context_patterns
+        self.negation_words = negation_words
+        self.sources = sources or ["builtin"]
+        self.version = version or self._compute_version()
+        self.source_hash = source_hash  # 컴파일에 쓴 emotions.json 내용 해시 (원본 없으면 None)
+        self.loaded_from = "sources"
+        self.load_seconds = 0.0
+
+        emotion_terms = [kw for keywords in emotion_keywords.values() for kw in keywords]
+
+        # 키워드/수식어/부정어 사전을 단일 오토마톤으로 컴파일 (아티팩트 적재 시 복원된 테이블 사용)
+        self.automaton = automaton or KeywordAutomaton(
+            emotion_terms + list(intensity_modifiers.keys()) + negation_words
+        )
+
+        self.regex_keywords = {
+            kw: re.compile(kw) for kw in emotion_terms if _REGEX_METACHARACTERS.intersection(kw)
+        }
+
+        # 상황별 패턴은 상황당 하나의 정규식 alternation으로 결합
+        self.situation_patterns = [
+            (situation_name, re.compile("|".join(situation_info["patterns"])))
+            for situation_name, situation_info in context_patterns.items()
+        ]
+
+        # 수식어 우선순위 (사전 순서상 먼저 나온 수식어가 우선 적용됨)
+        self.modifier_ranks = {modifier: rank for rank, modifier in enumerate(intensity_modifiers)}
+        self.modifier_multipliers = list(intensity_modifiers.values())
+
+        # 감정 점수 계산용 색인 (점수 대상 키워드, 감정 열 = EmotionType 선언 순서)
+        self.score_entries = list(dict.fromkeys(emotion_terms))
+        self.score_entry_index = {kw: index for index, kw in enumerate(self.score_entries)}
+        self.emotion_columns = list(EmotionType)
+
+        # 키워드 → (감정 열, 해당 감정 키워드 목록 내 위치) - 매칭된 키워드만 사전 순서대로 더하기 위함
+        self.keyword_score_slots: Dict[str, List[Tuple[int, int]]] = {}
+        for emotion, keywords in emotion_keywords.items():
+            column = self.emotion_columns.index(emotion)
+            for position, keyword in enumerate(keywords):
+                self.keyword_score_slots.setdefault(keyword, []).append((column, position))
+
+        # 배치 분석용 행렬 (analyze()와 같은 연산 순서로 계산할 수 있는 형태)
+        # - 감정 점수: score_gather[p, c] = 감정 c의 p번째 키워드 열 (없으면 항상 0인 마지막 열),
+        #   매칭 행렬에서 p 순서대로 모아 더하면 감정 키워드 목록 순서대로 더하는 단일 분석과 가산 순서가 같음
+        # - 상황 배율: 상황 순서대로 (배율, 강화 감정 열 목록) - 같은 감정이 여러 번 나오면 그만큼 곱함
+        longest = max((len(keywords) for keywords in emotion_keywords.values()), default=0)
+        self.score_gather = np.full((longest, len(self.emotion_columns)), len(self.score_entries), dtype=np.intp)
+        for emotion, keywords in emotion_keywords.items():
+            column = self.emotion_columns.index(emotion)
+            for position, keyword in enumerate(keywords):
+                self.score_gather[position, column] = self.score_entry_index[keyword]
+
+        self.context_boost_columns = [
+            (
+                context_info["multiplier"],
+                [self.emotion_columns.index(emotion) for emotion in context_info["boost_emotions"]]
+            )
+            for context_info in context_patterns.values()
+        ]
+        self.positive_columns = [
+            self.emotion_columns.index(emotion) for emotion in (EmotionType.JOY, EmotionType.SURPRISE)
+        ]
+
+    def _tables_to_json(self) -> Dict[str, Any]:
+        """사전 테이블의 JSON 표현 (감정은 값 문자열, 순서 유지)"""
+        return {
+            "emotion_keywords": {emotion.value: keywords for emotion, keywords in self.emotion_keywords.items()},
+            "intensity_modifiers": list(self.intensity_modifiers.items()),
+            "context_patterns": {
+                name: {
+                    "patterns": info["patterns"],
+                    "boost_emotions": [emotion.value for emotion in info["boost_emotions"]],
+                    "multiplier": info["multiplier"]
+                }
+                for name, info in self.context_patterns.items()
+            },
+            "negation_words": self.negation_words
+        }
+
+    def _compute_version(self) -> str:
+        """사전 내용 기반 버전 (내용이 같으면 같은 버전)"""
+        payload = json.dumps(self._tables_to_json(), ensure_ascii=False).encode("utf-8")
+        return hashlib.blake2b(payload, digest_size=8).hexdigest()
+
+    def describe(self) -> Dict[str, Any]:
+        """사전 정보 (통계/관리 API용)"""
+        return {
+            "version": self.version,
+            "sources": self.sources,
+            "source_hash": self.source_hash,
+            "loaded_from": self.loaded_from,
+            "load_ms": self.load_seconds * 1000,
+            "emotion_keywords": sum(len(keywords) for keywords in self.emotion_keywords.values()),
+            "intensity_modifiers": len(self.intensity_modifiers),
+            "context_patterns": len(self.context_patterns),
+            "negation_words": len(self.negation_words),
+            "automaton_states": len(self.automaton._fail)
+        }
+
+def source_fingerprint(source_path: Optional[str] = None) -> Optional[str]:
+    """emotions.json 내용 해시 (아티팩트가 현재 원본으로 빌드되었는지 확인용, 원본 없으면 None)"""
+    source_path = settings.EMOTION_LEXICON_SOURCE if source_path is None else source_path
+    if not source_path or not Path(source_path).exists():
+        return None
+    return hashlib.blake2b(Path(source_path).read_bytes(), digest_size=8).hexdigest()
+
+def compile_lexicon(source_path: Optional[str] = None) -> CompiledLexicon:
+    """내장 사전과 emotions.json 트리거를 병합해 컴파일"""
+    start_time = time.perf_counter()
+    source_path = settings.EMOTION_LEXICON_SOURCE if source_path is None else source_path
+
+    emotion_keywords = builtin_emotion_keywords()
+    sources = ["builtin"]
+
+    if source_path and Path(source_path).exists():
+        for emotion, triggers in load_emotion_triggers(source_path).items():
+            merged = emotion_keywords.setdefault(emotion, [])
+            merged.extend(trigger for trigger in dict.fromkeys(triggers) if trigger not in merged)
+        sources.append(str(source_path))
+    elif source_path:
+        logger.warning(f"⚠️ 감정 사전 원본 없음, 내장 사전만 사용: {source_path}")
+
+    lexicon = CompiledLexicon(
+        emotion_keywords=emotion_keywords,
+        intensity_modifiers=builtin_intensity_modifiers(),
+        context_patterns=builtin_context_patterns(),
+        negation_words=builtin_negation_words(),
+        sources=sources,
+        source_hash=source_fingerprint(source_path)
+    )
+    lexicon.load_seconds = time.perf_counter() - start_time
+    return lexicon
+
+def write_lexicon_artifact(lexicon: CompiledLexicon, path: Optional[str] = None) -> int:
+    """컴파일된 사전을 아티팩트로 저장 (임시 파일 후 교체 - 읽는 쪽은 항상 완전한 파일만 봄)
+
+    Returns:
+        저장된 바이트 수
+    """
+    path = path or settings.EMOTION_LEXICON_PATH
+
+    # 1. 문자열 테이블 (중복 제거 - 키워드/패턴/감정 값은 모두 문자열 ID로 참조)
+    string_ids: Dict[str, int] = {}
+
+    def intern_id(value: str) -> int:
+        if value not in string_ids:
+            string_ids[value] = len(string_ids)
+        return string_ids[value]
+
+    keyword_ids = [intern_id(keyword) for keyword in lexicon.automaton.keywords]
+    tables = lexicon._tables_to_json()
+    meta = {
+        "version": lexicon.version,
+        "sources": lexicon.sources,
+        "source_hash": lexicon.source_hash,
+        "byteorder": sys.byteorder,
+        "built_at": time.time(),
+        "emotion_keywords": {
+            emotion: [intern_id(keyword) for keyword in keywords]
+            for emotion, keywords in tables["emotion_keywords"].items()
+        },
+        "intensity_modifiers": [[intern_id(modifier), multiplier] for modifier, multiplier in tables["intensity_modifiers"]],
+        "context_patterns": {
+            name: {**info, "patterns": [intern_id(pattern) for pattern in info["patterns"]]}
+            for name, info in tables["context_patterns"].items()
+        },
+        "negation_words": [intern_id(word) for word in tables["negation_words"]]
+    }
+
+    encoded = [value.encode("utf-8") for value in string_ids]
+    string_offsets = [0]
+    for value in encoded:
+        string_offsets.append(string_offsets[-1] + len(value))
+
+    # 2. uint32 배열 섹션 (오토마톤 테이블 + 문자열 오프셋)
+    arrays: List[Tuple[str, List[int]]] = [("keyword_ids", keyword_ids), ("string_offsets", string_offsets)]
+    arrays.extend(lexicon.automaton.to_tables().items())
+
+    sections: Dict[str, List[int]] = {}
+    chunks: List[bytes] = []
+    offset = 0
+    for name, values in arrays:
+        chunk = array("I", values).tobytes()
+        sections[name] = [offset, len(values)]
+        chunks.append(chunk)
+        offset += len(chunk)
+    strings_blob = b"".join(encoded)
+    sections["strings"] = [offset, len(strings_blob)]
+    chunks.append(strings_blob)
+    meta["sections"] = sections
+
+    # 3. 헤더 + 메타 + 정렬 패딩 + 데이터
+    meta_bytes = json.dumps(meta, ensure_ascii=False).encode("utf-8")
+    header = _HEADER.pack(LEXICON_MAGIC, len(meta_bytes)) + meta_bytes
+    padding = b"\0" * (-len(header) % 4)
+
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    temp_path = f"{path}.{os.getpid()}.tmp"  # 여러 프로세스가 동시에 갱신해도 서로의 임시 파일을 덮지 않음
+    with open(temp_path, "wb") as f:
+        f.write(header + padding)
+        for chunk in chunks:
+            f.write(chunk)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_path, path)
+
+    size = len(header) + len(padding) + offset + len(strings_blob)
+    logger.info(f"✅ 감정 사전 아티팩트 저장: {path} ({size} bytes, 버전 {lexicon.version})")
+    return size
+
+def load_lexicon_artifact(path: Optional[str] = None) -> CompiledLexicon:
+    """아티팩트를 mmap으로 적재 (오토마톤 BFS/사전 병합 없이 테이블에서 바로 복원)"""
+    start_time = time.perf_counter()
+    path = path or settings.EMOTION_LEXICON_PATH
+
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        magic, meta_length = _HEADER.unpack_from(mapped, 0)
+        if magic != LEXICON_MAGIC:
+            raise ValueError(f"감정 사전 아티팩트 형식 아님: {path}")
+
+        meta = json.loads(mapped[_HEADER.size:_HEADER.size + meta_length].decode("utf-8"))
+        if meta["byteorder"] != sys.byteorder:
+            raise ValueError(f"감정 사전 아티팩트 바이트 순서 불일치: {meta['byteorder']}")
+
+        data_start = _HEADER.size + meta_length
+        data_start += -data_start % 4
+        views: List[memoryview] = []
+        base = memoryview(mapped)
+
+        def section(name: str) -> memoryview:
+            offset, count = meta["sections"][name]
+            view = base[data_start + offset:data_start + offset + count * 4].cast("I")
+            views.append(view)
+            return view
+
+        try:
+            # 1. 문자열 테이블 복원 (sys.intern으로 동일 문자열은 한 객체만 유지)
+            string_offsets = section("string_offsets")
+            strings_offset, _ = meta["sections"]["strings"]
+            strings_start = data_start + strings_offset
+            strings = [
+                sys.intern(bytes(base[strings_start + string_offsets[i]:strings_start + string_offsets[i + 1]]).decode("utf-8"))
+                for i in range(len(string_offsets) - 1)
+            ]
+
+            # 2. 오토마톤 테이블 복원
+            automaton = KeywordAutomaton.from_tables(
+                [strings[keyword_id] for keyword_id in section("keyword_ids")],
+                {name: section(name) for name in _AUTOMATON_TABLES}
+            )
+        finally:
+            for view in views:
+                view.release()
+            base.release()
+
+    lexicon = CompiledLexicon(
+        emotion_keywords={
+            EmotionType(emotion): [strings[keyword_id] for keyword_id in keyword_ids]
+            for emotion, keyword_ids in meta["emotion_keywords"].items()
+        },
+        intensity_modifiers={strings[modifier_id]: multiplier for modifier_id, multiplier in meta["intensity_modifiers"]},
+        context_patterns={
+            name: {
+                "patterns": [strings[pattern_id] for pattern_id in info["patterns"]],
+                "boost_emotions": [EmotionType(emotion) for emotion in info["boost_emotions"]],
+                "multiplier": info["multiplier"]
+            }
+            for name, info in meta["context_patterns"].items()
+        },
+        negation_words=[strings[word_id] for word_id in meta["negation_words"]],
+        sources=meta["sources"],
+        automaton=automaton,
+        version=meta["version"],
+        source_hash=meta.get("source_hash")
+    )
+    lexicon.loaded_from = "artifact"
+    lexicon.load_seconds = time.perf_counter() - start_time
+    return lexicon
+
+def load_emotion_lexicon(rebuild: bool = False) -> CompiledLexicon:
+    """감정 사전 적재
+
+    - rebuild=False: 아티팩트가 있으면 mmap 적재, 없거나 손상되면 원본에서 컴파일
+      (아티팩트가 현재 emotions.json 으로 빌드되지 않았으면 다시 컴파일 후 아티팩트 갱신)
+    - rebuild=True: 원본에서 다시 컴파일 후 아티팩트 갱신 (프로세스 워커는 갱신된 아티팩트를 적재)
+    """
+    path = settings.EMOTION_LEXICON_PATH
+
+    if not rebuild and Path(path).exists():
+        try:
+            lexicon = load_lexicon_artifact(path)
+            current_hash = source_fingerprint()
+            if lexicon.source_hash == current_hash:
+                return lexicon
+            logger.info(
+                f"🔄 감정 사전 원본 변경 감지, 아티팩트 재빌드 "
+                f"(아티팩트 {lexicon.source_hash} → 원본 {current_hash})"
+            )
+            rebuild = True
+        except Exception as e:
+            logger.warning(f"⚠️ 감정 사전 아티팩트 적재 실패, 원본에서 컴파일: {e}")
+
+    lexicon = compile_lexicon()
+    if rebuild:
+        write_lexicon_artifact(lexicon, path)
+    return lexicon
+
+def main():
+    parser = argparse.ArgumentParser(description="감정 사전 아티팩트 빌드")
+    parser.add_argument("--source", default=settings.EMOTION_LEXICON_SOURCE, help="emotions.json 경로")
+    parser.add_argument("--output", default=settings.EMOTION_LEXICON_PATH, help="아티팩트 저장 경로")
+    args = parser.parse_args()
+
+    lexicon = compile_lexicon(args.source)
+    size = write_lexicon_artifact(lexicon, args.output)
+
+    loaded = load_lexicon_artifact(args.output)
+    print(json.dumps({**loaded.describe(), "bytes": size}, ensure_ascii=False, indent=2))
+
+if __name__ == "__main__":
+    main()
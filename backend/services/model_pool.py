@@ -0,0 +1,352 @@
+"""
+로컬 모델 풀
+티어/프리셋별 EFTAIEngine 을 첫 요청 시 로드하고, 메모리 예산(MAX_MEMORY)을 넘으면 가장 오래 쓰지 않은 모델부터 내림
+"""
+
+import asyncio
+import math
+import re
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+import psutil
+
+from config.settings import MODEL_PRESETS, get_settings
+from services.ai_engine import EFTAIEngine
+from utils.admission import AdmissionRejected
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+# MAX_MEMORY 미설정 시 물리 메모리 중 모델에 쓸 비율
+_DEFAULT_BUDGET_FRACTION = 0.8
+
+# 로드 실패한 모델을 다시 시도하기까지의 대기 시간 (초) - 요청마다 느린 실패 반복 방지
+_LOAD_RETRY_SECONDS = 300.0
+
+_MEMORY_UNITS = {
+    "": 1, "B": 1,
+    "KB": 1000, "MB": 1000 ** 2, "GB": 1000 ** 3, "TB": 1000 ** 4,
+    "KIB": 1024, "MIB": 1024 ** 2, "GIB": 1024 ** 3, "TIB": 1024 ** 4,
+}
+
+
+def parse_memory_size(value: str) -> int:
+    """"12GiB", "800MB" 형태의 메모리 크기 → 바이트"""
+    match = re.fullmatch(r"\s*([\d.]+)\s*([A-Za-z]*)\s*", value)
+    if not match or match.group(2).upper() not in _MEMORY_UNITS:
+        raise ValueError(f"알 수 없는 메모리 크기: {value}")
+    return int(float(match.group(1)) * _MEMORY_UNITS[match.group(2).upper()])
+
+
+@dataclass(frozen=True)
+class ModelSpec:
+    """풀에서 제공하는 모델 (같은 model_name/백엔드/CPU 양자화를 가리키는 항목은 엔진 1개를 공유)"""
+    name: str                      # 풀 키 (티어 이름 또는 MODEL_PRESETS 키)
+    model_name: str                # Hugging Face 모델 ID
+    max_memory: Optional[str] = None
+    tiers: Tuple[str, ...] = ()    # 이 모델로 처리하는 프롬프트 티어 (프리픽스 KV 캐시 준비용)
+    cpu_quantization: Optional[str] = None  # 미설정 시 settings.CPU_QUANTIZATION
+    backend: str = "torch"         # 추론 백엔드 (torch/onnx)
+    draft_model: Optional[str] = None  # 보조 생성용 초안 모델
+
+    @property
+    def engine_key(self) -> str:
+        return engine_key(
+            self.model_name, self.cpu_quantization or settings.CPU_QUANTIZATION, self.backend, self.draft_model
+        )
+
+
+def engine_key(
+    model_name: str,
+    cpu_quantization: Optional[str],
+    backend: str = "torch",
+    draft_model: Optional[str] = None
+) -> str:
+    """엔진 식별 키 (같은 모델이라도 백엔드/양자화/초안 모델이 다르면 별도 엔진)"""
+    if backend != "torch":
+        return f"{model_name}@{backend}"  # CPU 양자화/보조 생성은 PyTorch 백엔드에만 적용
+    key = f"{model_name}@{cpu_quantization}" if cpu_quantization else model_name
+    return f"{key}+{draft_model}" if draft_model else key
+
+
+def _engine_key_of(engine: EFTAIEngine) -> str:
+    return engine_key(engine.model_name, engine.cpu_quantization, engine.backend, engine.draft_model_name)
+
+
+def build_model_specs() -> Dict[str, ModelSpec]:
+    """티어별 모델 설정 + MODEL_PRESETS 항목"""
+    specs = {
+        "free": ModelSpec("free", settings.FREE_TIER_MODEL, tiers=("free",), backend=settings.FREE_TIER_BACKEND),
+        "premium": ModelSpec(
+            "premium", settings.PREMIUM_TIER_MODEL, tiers=("premium",), draft_model=settings.PREMIUM_DRAFT_MODEL
+        ),
+        "enterprise": ModelSpec("enterprise", settings.ENTERPRISE_TIER_MODEL, tiers=("enterprise",)),
+    }
+    for preset_name, preset in MODEL_PRESETS.items():
+        # 프리셋은 프리미엄/엔터프라이즈 엔드포인트에서 선택
+        specs[preset_name] = ModelSpec(
+            preset_name, preset["model_name"],
+            max_memory=preset.get("max_memory"),
+            tiers=("premium", "enterprise"),
+            cpu_quantization=preset.get("cpu_quantization"),
+            draft_model=preset.get("draft_model")
+        )
+    return specs
+
+
+class ModelPool:
+    """메모리 예산 안에서 EFTAIEngine 을 지연 로드/LRU 축출하는 풀
+
+    - get(name): 로드된 엔진 반환, 없으면 로드 (같은 모델을 동시에 요청하면 로드 1회를 함께 대기)
+    - 서로 다른 모델의 로드는 한 번에 하나씩 (최대 메모리 사용량 제한)
+    - 로드 전에 예상 크기(지난번 측정값, 처음이면 설정 기반 추정치)만큼, 로드 후에는 실제 크기 기준으로
+      예산을 넘는 만큼 사용 중이 아닌(대여/실행/대기 요청 없는) 엔진을 가장 오래 쓰지 않은 순서로 내림
+    - 예산이 사용 중인 엔진으로 차 있으면 AdmissionRejected("memory_budget")로 거절
+    - 추정 오차로 로드 후에도 예산을 넘으면, 사용 중이던 엔진이 반납될 때 다시 축출
+    """
+
+    def __init__(
+        self,
+        specs: Dict[str, ModelSpec],
+        memory_budget: Optional[int] = None,
+        engine_factory: Optional[Callable[[ModelSpec], EFTAIEngine]] = None,
+        on_load: Optional[Callable[[ModelSpec, EFTAIEngine], Awaitable[None]]] = None
+    ):
+        self.specs = specs
+        self.memory_budget = memory_budget or int(psutil.virtual_memory().total * _DEFAULT_BUDGET_FRACTION)
+        self._engine_factory = engine_factory or (
+            lambda spec: EFTAIEngine(
+                model_name=spec.model_name,
+                device=settings.DEVICE,
+                max_memory=spec.max_memory or settings.MAX_MEMORY,
+                cpu_quantization=spec.cpu_quantization,
+                backend=spec.backend,
+                draft_model=spec.draft_model
+            )
+        )
+        self._on_load = on_load
+
+        # 엔진 키(model_name[@양자화]) -> 엔진 (LRU 순서: 앞쪽이 가장 오래 쓰지 않은 것)
+        self._engines: "OrderedDict[str, EFTAIEngine]" = OrderedDict()
+        self._loading: Dict[str, asyncio.Future] = {}
+        self._load_lock: Optional[asyncio.Lock] = None
+        self._leases: Dict[str, int] = {}
+        self._footprints: Dict[str, int] = {}  # 마지막으로 측정한 모델별 메모리 (다음 로드 전 예산 확보용)
+        self._failures: Dict[str, Tuple[float, str]] = {}
+        self._over_budget = False  # 로드 후 축출 가능한 엔진이 없어 예산 초과 상태로 남았는지
+        self._trim_task: Optional[asyncio.Task] = None
+
+        # 통계
+        self.hits = 0
+        self.loads = 0
+        self.failed_loads = 0
+        self.evictions = 0
+        self.total_load_time = 0.0
+
+    def _spec(self, name: str) -> ModelSpec:
+        spec = self.specs.get(name)
+        if spec is None:
+            raise ValueError(f"알 수 없는 모델: {name} (사용 가능: {', '.join(self.specs)})")
+        return spec
+
+    def peek(self, name: str) -> Optional[EFTAIEngine]:
+        """로드된 엔진만 조회 (로드/LRU 갱신 없음)"""
+        spec = self.specs.get(name)
+        return self._engines.get(spec.engine_key) if spec else None
+
+    def is_loaded(self, name: str) -> bool:
+        return self.peek(name) is not None
+
+    def is_loading(self, name: str) -> bool:
+        spec = self.specs.get(name)
+        return spec is not None and spec.engine_key in self._loading
+
+    async def get(self, name: str) -> EFTAIEngine:
+        """엔진 조회 (미로드 시 로드, 동시 요청은 같은 로드를 대기)"""
+        spec = self._spec(name)
+        key = spec.engine_key
+
+        engine = self._engines.get(key)
+        if engine is not None:
+            self._engines.move_to_end(key)
+            self.hits += 1
+            return engine
+
+        failure = self._failures.get(key)
+        if failure and time.monotonic() - failure[0] < _LOAD_RETRY_SECONDS:
+            raise RuntimeError(f"모델 로드 실패 후 재시도 대기 중 ({key}): {failure[1]}")
+
+        load = self._loading.get(key)
+        if load is None:
+            load = self._loading[key] = asyncio.ensure_future(self._load(spec))
+            load.add_done_callback(lambda _: self._loading.pop(key, None))
+        # 대기 중인 요청 하나가 취소되어도 로드는 계속 (다른 대기자 보호)
+        return await asyncio.shield(load)
+
+    async def acquire(self, name: str) -> EFTAIEngine:
+        """엔진 대여 (반납 전까지 축출 대상에서 제외) - release()로 반납"""
+        engine = await self.get(name)
+        key = _engine_key_of(engine)
+        self._leases[key] = self._leases.get(key, 0) + 1
+        return engine
+
+    def release(self, engine: EFTAIEngine) -> None:
+        """대여 반납"""
+        key = _engine_key_of(engine)
+        count = self._leases.get(key, 0) - 1
+        if count > 0:
+            self._leases[key] = count
+        else:
+            self._leases.pop(key, None)
+            if self._over_budget and (self._trim_task is None or self._trim_task.done()):
+                self._trim_task = asyncio.ensure_future(self._trim())
+    
+    async def _trim(self) -> None:
+        """예산 초과 상태에서 대여가 끝나면 유휴 엔진 축출 (가장 최근 사용한 엔진은 유지)"""
+        if self._load_lock is None:
+            self._load_lock = asyncio.Lock()
+        async with self._load_lock:
+            if self._over_budget and self._engines:
+                await self._make_room(0, exclude=next(reversed(self._engines)))
+
+    async def _load(self, spec: ModelSpec) -> EFTAIEngine:
+        key = spec.engine_key
+        if self._load_lock is None:
+            self._load_lock = asyncio.Lock()
+
+        async with self._load_lock:
+            engine = self._engine_factory(spec)
+            try:
+                # 1. 예상 크기만큼 예산 확보 (로드 전에 축출 - 로드 중 예산 초과 방지)
+                needed = self._footprints.get(key) or await self._estimate_footprint(engine)
+                if needed > self.memory_budget:
+                    raise RuntimeError(
+                        f"모델 예상 크기({needed / 1024 ** 3:.2f}GB)가 메모리 예산"
+                        f"({self.memory_budget / 1024 ** 3:.2f}GB)보다 큼: {key}"
+                    )
+                await self._make_room(needed, exclude=key)
+
+                # 2. 모델 로드
+                logger.info(f"📦 모델 풀 로드: {spec.name} → {key} (예상 {needed / 1024 ** 3:.2f}GB)")
+                start_time = time.perf_counter()
+                await engine.initialize()
+            except AdmissionRejected:
+                raise  # 일시적 거절 (사용 중인 모델이 반납되면 재시도 가능)
+            except Exception as e:
+                self.failed_loads += 1
+                self._failures[key] = (time.monotonic(), str(e))
+                try:
+                    await engine.cleanup()
+                except Exception:
+                    pass
+                raise
+
+            load_time = time.perf_counter() - start_time
+            self.loads += 1
+            self.total_load_time += load_time
+            self._failures.pop(key, None)
+            self._engines[key] = engine
+
+            # 3. 로드 후 준비 작업 (프리픽스 KV 캐시 등) - 실패해도 엔진은 사용
+            if self._on_load is not None:
+                try:
+                    await self._on_load(spec, engine)
+                except Exception as e:
+                    logger.warning(f"⚠️ 모델 로드 후 준비 실패 ({key}): {e}")
+
+            # 4. 실제 크기 기준으로 예산 초과분 축출
+            self._footprints[key] = engine.memory_footprint()
+            await self._make_room(0, exclude=key)
+            logger.info(
+                f"✅ 모델 풀 로드 완료: {key} ({load_time:.1f}초, {self._footprints[key] / 1024 ** 3:.2f}GB, "
+                f"풀 사용량 {self.used_bytes() / 1024 ** 3:.2f}/{self.memory_budget / 1024 ** 3:.2f}GB)"
+            )
+            return engine
+
+    async def _estimate_footprint(self, engine: EFTAIEngine) -> int:
+        """처음 로드하는 모델의 예상 크기 (설정 조회는 스레드에서, 실패 시 0 - 로드 후 실제 크기로 정리)"""
+        try:
+            return await asyncio.get_running_loop().run_in_executor(None, engine.estimate_memory_footprint)
+        except Exception as e:
+            logger.warning(f"⚠️ 모델 크기 추정 실패, 로드 후 예산 정리 ({engine.model_name}): {e}")
+            return 0
+
+    def used_bytes(self) -> int:
+        """로드된 엔진 메모리 합계 (프리픽스 KV 캐시 포함, 현재 값)"""
+        return sum(engine.memory_footprint() for engine in self._engines.values())
+
+    def _is_busy(self, key: str, engine: EFTAIEngine) -> bool:
+        admission = engine.admission
+        return self._leases.get(key, 0) > 0 or admission.in_flight > 0 or admission.queue_depth > 0
+
+    async def _make_room(self, needed: int, exclude: str) -> None:
+        """needed 바이트를 더해도 예산 안에 들도록 유휴 엔진을 LRU 순서로 축출"""
+        self._over_budget = False
+        while self.used_bytes() + needed > self.memory_budget:
+            victim = next(
+                (key for key, engine in self._engines.items() if key != exclude and not self._is_busy(key, engine)),
+                None
+            )
+            if victim is not None:
+                await self.evict(victim)
+                continue
+
+            busy = [engine for key, engine in self._engines.items() if key != exclude]
+            if needed and busy:
+                # 사용 중인 모델이 예산을 차지 - 가장 먼저 끝날 것으로 보이는 모델 기준으로 재시도 안내
+                retry_after = max(1, math.ceil(min(engine.admission.estimated_wait() for engine in busy)))
+                raise AdmissionRejected("memory_budget", retry_after, sum(e.admission.queue_depth for e in busy))
+            # 로드 후 실제 크기가 추정치보다 큼 - 사용 중인 엔진이 반납되면 release()에서 다시 축출
+            self._over_budget = bool(busy)
+            logger.warning(
+                f"⚠️ 모델 풀 메모리 예산 초과 ({self.used_bytes() / 1024 ** 3:.2f}GB > "
+                f"{self.memory_budget / 1024 ** 3:.2f}GB) - 축출 가능한 모델 없음"
+            )
+            return
+
+    async def evict(self, key: str) -> None:
+        """엔진 내리기 (다음 요청 시 다시 로드)"""
+        engine = self._engines.pop(key, None)
+        if engine is None:
+            return
+        self.evictions += 1
+        logger.info(f"♻️ 모델 풀 축출: {key} ({self._footprints.get(key, 0) / 1024 ** 3:.2f}GB)")
+        await engine.cleanup()
+
+    async def shutdown(self) -> None:
+        """전체 엔진 정리"""
+        for key in list(self._engines):
+            engine = self._engines.pop(key)
+            await engine.cleanup()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """풀 상태 (로드된 모델, 메모리 사용량, 로드/축출 수)"""
+        return {
+            "memory_budget_bytes": self.memory_budget,
+            "used_bytes": self.used_bytes(),
+            "loaded": [
+                {
+                    "model_name": engine.model_name,
+                    "backend": engine.backend,
+                    "draft_model": engine.draft_model_name if engine.assisted else None,
+                    "quantization": engine.cpu_quantization if engine.quantized else None,
+                    "specs": [spec.name for spec in self.specs.values() if spec.engine_key == key],
+                    "bytes": engine.memory_footprint(),
+                    "leases": self._leases.get(key, 0),
+                    "in_flight": engine.admission.in_flight
+                }
+                for key, engine in reversed(self._engines.items())  # 최근 사용 순
+            ],
+            "loading": list(self._loading),
+            "over_budget": self._over_budget,
+            "failed": {key: message for key, (_, message) in self._failures.items()},
+            "hits": self.hits,
+            "loads": self.loads,
+            "failed_loads": self.failed_loads,
+            "evictions": self.evictions,
+            "avg_load_seconds": self.total_load_time / self.loads if self.loads else 0.0
+        }
@@ -0,0 +1,139 @@
+"""
+ONNX Runtime 추론 백엔드
+causal LM 을 past-key-values 포함 ONNX 그래프로 내보내 CPU 실행 공급자로 실행 (PyTorch eager 의 토큰당 프레임워크 오버헤드 제거)
+내보낸 그래프와 최적화된 그래프는 MODEL_CACHE_DIR/onnx 에 캐시해 재시작 시 재사용
+"""
+
+import re
+import time
+from pathlib import Path
+from typing import Any, Optional, Tuple
+
+from config.settings import get_settings
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+# 지원하는 추론 백엔드
+INFERENCE_BACKENDS = ("torch", "onnx")
+
+_PROVIDER = "CPUExecutionProvider"
+
+
+def onnx_cache_dir(model_name: str) -> Path:
+    """모델별 ONNX 캐시 디렉토리 (exported: 내보낸 그래프, optimized: 그래프 최적화 결과)"""
+    safe_name = re.sub(r"[^A-Za-z0-9._-]+", "--", model_name)
+    return Path(settings.MODEL_CACHE_DIR) / "onnx" / safe_name
+
+
+def _onnx_file(directory: Path) -> Optional[Path]:
+    """디렉토리의 ONNX 그래프 파일 (없으면 None)"""
+    files = sorted(directory.glob("*.onnx")) if directory.is_dir() else []
+    return files[0] if files else None
+
+
+def onnx_model_nbytes(directory: Optional[Path]) -> int:
+    """ONNX 그래프 + 외부 가중치 파일 크기 (세션이 메모리에 올리는 가중치 크기 추정)"""
+    if directory is None or not directory.is_dir():
+        return 0
+    return sum(
+        path.stat().st_size for path in directory.iterdir()
+        if path.suffix == ".onnx" or path.name.endswith(".onnx_data")
+    )
+
+
+def cached_onnx_dir(model_name: str) -> Optional[Path]:
+    """캐시된 ONNX 그래프 디렉토리 (최적화 → 내보낸 그래프 순, 없으면 None)"""
+    cache_dir = onnx_cache_dir(model_name)
+    for directory in (cache_dir / "optimized", cache_dir / "exported"):
+        if _onnx_file(directory) is not None:
+            return directory
+    return None
+
+
+def _session_options():
+    import onnxruntime
+
+    options = onnxruntime.SessionOptions()
+    options.graph_optimization_level = onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL
+    return options
+
+
+def _load(ort_model_class, directory: Path) -> Any:
+    return ort_model_class.from_pretrained(
+        directory,
+        file_name=_onnx_file(directory).name,
+        use_cache=True,
+        provider=_PROVIDER,
+        session_options=_session_options()
+    )
+
+
+def _export(ort_model_class, model_name: str, export_dir: Path) -> None:
+    """Hugging Face 모델 → ONNX (past-key-values 입력/출력 포함 그래프 1개)"""
+    start_time = time.perf_counter()
+    logger.info(f"📤 ONNX 내보내기: {model_name} (최초 1회)")
+    model = ort_model_class.from_pretrained(
+        model_name,
+        export=True,
+        use_cache=True,
+        use_merged=False,  # 병합(merged) 그래프는 ORTOptimizer 미지원
+        provider=_PROVIDER,
+        cache_dir=settings.MODEL_CACHE_DIR,
+        token=settings.HUGGINGFACE_TOKEN
+    )
+    model.save_pretrained(export_dir)
+    logger.info(f"💾 ONNX 그래프 저장: {export_dir} ({time.perf_counter() - start_time:.1f}초)")
+
+
+def _optimize(ort_model_class, export_dir: Path, optimized_dir: Path) -> bool:
+    """트랜스포머 그래프 최적화 (어텐션/GELU/LayerNorm 융합) 결과 저장 - 실패 시 내보낸 그래프 사용"""
+    try:
+        from optimum.onnxruntime import ORTOptimizer
+        from optimum.onnxruntime.configuration import OptimizationConfig
+
+        start_time = time.perf_counter()
+        optimizer = ORTOptimizer.from_pretrained(_load(ort_model_class, export_dir))
+        optimizer.optimize(
+            save_dir=optimized_dir,
+            optimization_config=OptimizationConfig(optimization_level=2, optimize_for_gpu=False)
+        )
+        logger.info(f"⚙️ ONNX 그래프 최적화 저장: {optimized_dir} ({time.perf_counter() - start_time:.1f}초)")
+        return True
+    except Exception as e:
+        logger.warning(f"⚠️ ONNX 그래프 최적화 실패, 내보낸 그래프 사용: {e}")
+        return False
+
+
+def load_onnx_causal_lm(model_name: str) -> Tuple[Any, Path]:
+    """ONNX Runtime causal LM 로드 (캐시 없으면 내보내기 → 최적화 후 저장) - (모델, 그래프 디렉토리)
+
+    반환 모델은 transformers GenerationMixin 을 구현하므로 generate()/파이프라인/스트리머를 그대로 사용
+    """
+    try:
+        from optimum.onnxruntime import ORTModelForCausalLM
+    except ImportError as e:
+        raise RuntimeError("ONNX 백엔드에는 optimum[onnxruntime] 패키지가 필요합니다") from e
+
+    cache_dir = onnx_cache_dir(model_name)
+    export_dir, optimized_dir = cache_dir / "exported", cache_dir / "optimized"
+
+    # 1. 최적화된 그래프 → 2. 내보낸 그래프 순으로 캐시 사용
+    if _onnx_file(optimized_dir) is None:
+        if _onnx_file(export_dir) is None:
+            _export(ORTModelForCausalLM, model_name, export_dir)
+        _optimize(ORTModelForCausalLM, export_dir, optimized_dir)
+
+    for directory in (optimized_dir, export_dir):
+        if _onnx_file(directory) is None:
+            continue
+        try:
+            model = _load(ORTModelForCausalLM, directory)
+            logger.info(f"⚡ ONNX Runtime 모델 로드: {directory} ({_PROVIDER})")
+            return model, directory
+        except Exception as e:
+            if directory == export_dir:
+                raise
+            logger.warning(f"⚠️ 최적화된 ONNX 그래프 로드 실패, 내보낸 그래프 사용: {e}")
+    raise RuntimeError(f"ONNX 그래프 없음: {cache_dir}")
@@ -0,0 +1,98 @@
+"""
+프롬프트 프리픽스 KV 캐시
+티어별 고정 시스템 프롬프트 구간의 key/value 상태를 한 번만 계산해 두고 요청마다 prefill 재사용
+"""
+
+import threading
+from typing import Any, Dict, Optional, Sequence, Set, Tuple
+
+from utils.lru_cache import LRUCache
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def kv_nbytes(past_key_values: Any) -> int:
+    """KV 상태 메모리 크기 (레이어별 (key, value) 텐서 중첩 구조)"""
+    if hasattr(past_key_values, "element_size"):
+        return past_key_values.numel() * past_key_values.element_size()
+    if isinstance(past_key_values, (tuple, list)):
+        return sum(kv_nbytes(item) for item in past_key_values)
+    return 0
+
+
+class PrefixKVCache:
+    """토큰 ID 프리픽스 → KV 상태 캐시 (메모리 한도 LRU)
+
+    - 키는 프리픽스 토큰 ID 튜플이므로 모델 입력이 캐시된 프리픽스로 시작할 때만 적중합니다.
+      프롬프트 문구가 바뀌면 토큰 ID가 달라져 이전 항목은 적중하지 않습니다.
+    - 값은 레이어별 (key, value) 튜플(legacy 형식)로 보관합니다. generate 는 이를 이어 붙여
+      새 텐서를 만들므로 캐시된 상태는 요청 사이에 변경되지 않습니다.
+    """
+
+    def __init__(self, max_bytes: int, name: str = "prefix"):
+        self.name = name
+        self._cache = LRUCache(
+            max_entries=64,
+            max_bytes=max_bytes,
+            sizeof=lambda key, value: kv_nbytes(value)
+        )
+        self._prefixes: Set[Tuple[int, ...]] = set()  # 등록된 프리픽스 (길이 내림차순 탐색)
+        self._lock = threading.Lock()
+
+        # 통계
+        self.lookups = 0
+        self.hits = 0
+        self.reused_tokens = 0
+
+    def put(self, prefix_ids: Sequence[int], past_key_values: Any) -> None:
+        key = tuple(prefix_ids)
+        self._cache.put(key, past_key_values)
+        with self._lock:
+            self._prefixes.add(key)
+
+    def lookup(self, token_ids: Sequence[int]) -> Optional[Tuple[int, Any]]:
+        """입력이 시작하는 가장 긴 캐시 프리픽스 (프리픽스 길이, KV 상태) - 새로 계산할 토큰이 1개 이상 남아야 적중"""
+        with self._lock:
+            candidates = sorted(self._prefixes, key=len, reverse=True)
+            self.lookups += 1
+
+        for prefix in candidates:
+            if len(prefix) >= len(token_ids) or tuple(token_ids[:len(prefix)]) != prefix:
+                continue
+            past_key_values = self._cache.get(prefix)
+            if past_key_values is None:
+                # 메모리 한도로 축출된 항목
+                with self._lock:
+                    self._prefixes.discard(prefix)
+                continue
+            with self._lock:
+                self.hits += 1
+                self.reused_tokens += len(prefix)
+            return len(prefix), past_key_values
+        return None
+
+    @property
+    def nbytes(self) -> int:
+        """캐시된 KV 상태 메모리 합계"""
+        return self._cache.get_stats()["bytes"]
+
+    def clear(self) -> None:
+        """전체 무효화 (모델/프롬프트 교체 시)"""
+        self._cache.clear()
+        with self._lock:
+            self._prefixes.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """프리픽스 재사용 통계"""
+        with self._lock:
+            stats = {
+                "name": self.name,
+                "prefixes": len(self._prefixes),
+                "lookups": self.lookups,
+                "hits": self.hits,
+                "hit_rate": self.hits / self.lookups if self.lookups else 0.0,
+                "reused_prefill_tokens": self.reused_tokens,
+            }
+        stats["cache"] = self._cache.get_stats()
+        return stats
@@ -3,15 +3,30 @@ EFT 전문 프롬프트 관리 시스템
 심리상담 및 EFT 기법에 특화된 프롬프트 생성 및 관리
 """
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple, Union
+import hashlib
 import json
+from dataclasses import dataclass
+from itertools import chain
 from datetime import datetime
 from enum import Enum
 
+from pydantic import TypeAdapter
+
 from models.chat_models import (
-    EmotionAnalysis, EmotionType, EFTRecommendation, 
+    EmotionAnalysis, EmotionType, EFTRecommendation, FrozenEFTRecommendation,
     EFTPoint, SuggestedAction, ConversationMessage, UserProfile
 )
+from services.session_emotion import SessionEmotionState
+from services.session_summary import HISTORY_WINDOW, SessionSummary
+from services.prompt_tokens import BudgetedPrompt, TokenBudget
+from services.response_length import (
+    MAX_KEPT_SENTENCES,
+    SENTENCE_SEPARATOR,
+    TRUNCATE_OVER_CHARS,
+    ResponseLengthPolicy
+)
+from utils.keyword_scanner import KeywordScanner
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -24,6 +39,69 @@ class PromptStyle(str, Enum):
     PROFESSIONAL = "professional"  # 전문적
     CASUAL = "casual"          # 친근한
 
+# 프롬프트 조각을 미리 생성하는 티어 목록 (그 외 티어는 무료 티어와 동일하게 처리)
+PROMPT_TIERS = ("free", "premium", "enterprise")
+
+# 토큰 예산 초과 시 구간 포함 우선순위 (높을수록 먼저 포함, 사용자 메시지는 항상 포함)
+SECTION_PRIORITIES = {
+    "safety": 90,
+    "system": 80,
+    "requirements": 70,
+    "emotion": 60,
+    "eft": 50,
+    "style": 40,
+    "profile": 30,
+    "summary": 25,
+    "history": 20,
+    "tier_guide": 10,
+    "culture": 0,
+}
+_SECTIONS_BY_PRIORITY = sorted(SECTION_PRIORITIES, key=SECTION_PRIORITIES.get, reverse=True)
+
+# 감정별 추천 기법 수
+MAX_EFT_RECOMMENDATIONS = 3
+
+_EFT_RECOMMENDATION_LIST = TypeAdapter(List[EFTRecommendation])
+
+# 요청마다 내용이 달라 토큰 ID를 캐시하지 않는 구간
+_UNCACHED_SECTIONS = {"emotion"}
+
+@dataclass(frozen=True)
+class PromptFragments:
+    """(티어, 주요 감정, 스타일) 조합별로 미리 렌더링한 프롬프트 고정 구간
+
+    사용자 입력에 따라 달라지는 구간(프로필/감정 분석/히스토리/안전성/문화/메시지) 사이에
+    끼워 넣기만 하면 되도록, 구간 사이의 줄바꿈까지 포함해 저장합니다.
+    """
+    header: str          # 시스템 프롬프트 (티어)
+    eft_block: str       # EFT 기법 컨텍스트 (주요 감정)
+    style_block: str     # 응답 스타일 가이드 (스타일 × 주요 감정)
+    tier_block: str      # 티어별 응답 가이드
+    message_open: str    # 사용자 메시지 머리말
+    message_close: str   # 사용자 메시지 닫는 따옴표
+    requirements: str    # 응답 요구사항 (티어별 응답 길이)
+    chat_system: str     # 메시지 레이아웃용 시스템 메시지 (바이트 단위로 고정)
+    prefix_hash: str     # chat_system 해시 (프리픽스 캐시 키 추적용)
+
+@dataclass(frozen=True)
+class MessageSignals:
+    """사용자 메시지 키워드 스캔 결과 (안전성/문화 구간과 ChatResponse 플래그에 공유)"""
+    emergency: bool                  # 자해/자살 등 응급 키워드
+    professional_referral: bool      # 전문 치료가 필요한 증상 키워드
+    cultural_themes: Tuple[str, ...] # 한국 문화 맥락 테마 (korean_culture_context 순서)
+
+@dataclass
+class ChatPrompt:
+    """OpenAI 호환 messages 레이아웃 프롬프트
+
+    고정 구간(티어 시스템 프롬프트, 안전 규칙, 감정별 EFT/스타일 가이드)은 system 메시지에,
+    요청마다 달라지는 구간(프로필, 감정 분석, 히스토리, 사용자 메시지)은 마지막 user 메시지에 배치해
+    vLLM 자동 프리픽스 캐시가 system 메시지 전체를 재사용할 수 있게 합니다.
+    """
+    messages: List[Dict[str, str]]
+    prefix_hash: str     # 같은 해시 = 같은 system 메시지 (바이트 단위 동일)
+    prefix_chars: int
+
 class EFTPromptManager:
     """EFT 전문 프롬프트 관리자"""
     
@@ -35,6 +113,19 @@ class EFTPromptManager:
         self.korean_culture_context = self._load_korean_context()
         self.safety_guidelines = self._load_safety_guidelines()
         
+        # 안전성/문화 키워드 전체를 하나의 스캐너로 컴파일 (메시지당 한 번만 순회)
+        self.keyword_scanner = self._build_keyword_scanner()
+        
+        # 티어/감정/스타일에만 의존하는 구간은 초기화 시 한 번만 렌더링
+        self.prompt_fragments = self._build_prompt_fragments()
+        
+        # 감정별 EFT 추천 (불변 객체 + 직렬화된 JSON, 요청마다 모델 생성/검증/정렬 없음)
+        self.eft_recommendations = self._build_eft_recommendations()
+        self.eft_recommendations_json = {
+            emotion_type: _EFT_RECOMMENDATION_LIST.dump_json(list(recommendations)).decode("utf-8")
+            for emotion_type, recommendations in self.eft_recommendations.items()
+        }
+        
         logger.info("✅ EFT 프롬프트 매니저 초기화 완료")
     
     def _load_base_system_prompt(self) -> str:
@@ -156,11 +247,13 @@ class EFTPromptManager:
         return {
             "family_dynamics": {
                 "description": "한국은 가족 중심 사회로 가족 관계가 개인 정체성에 큰 영향",
-                "considerations": ["효도 의무감", "가족 기대 부담", "세대 갈등", "형제 서열"]
+                "considerations": ["효도 의무감", "가족 기대 부담", "세대 갈등", "형제 서열"],
+                "keywords": ["부모", "엄마", "아빠", "가족", "형제", "자매", "시댁", "처가"]
             },
             "work_culture": {
                 "description": "집단주의적 직장 문화와 위계 관계",
-                "considerations": ["상하 관계", "야근 문화", "동료 관계", "성과 압박"]
+                "considerations": ["상하 관계", "야근 문화", "동료 관계", "성과 압박"],
+                "keywords": ["회사", "직장", "상사", "동료", "업무", "야근", "승진", "면접"]
             },
             "emotional_expression": {
                 "description": "감정 표현에 대한 문화적 제약",
@@ -168,7 +261,8 @@ class EFTPromptManager:
             },
             "social_pressure": {
                 "description": "사회적 기대와 비교 문화",
-                "considerations": ["학력 중시", "결혼 압박", "경제적 성취", "외모 관심"]
+                "considerations": ["학력 중시", "결혼 압박", "경제적 성취", "외모 관심"],
+                "keywords": ["결혼", "연애", "학벌", "스펙", "취업", "비교", "남들"]
             }
         }
     
@@ -191,6 +285,25 @@ class EFTPromptManager:
             ]
         }
     
+    def _build_keyword_scanner(self) -> KeywordScanner:
+        """응급/전문가 의뢰/문화 테마 키워드 스캐너 (분류 이름 = 플래그 또는 문화 테마 키)"""
+        categories = {
+            "emergency": self.safety_guidelines["emergency_keywords"],
+            "professional_referral": self.safety_guidelines["professional_referral_keywords"],
+        }
+        for theme, theme_info in self.korean_culture_context.items():
+            categories[theme] = theme_info.get("keywords", [])
+        return KeywordScanner(categories, normalize=str.lower)
+    
+    def scan_message(self, message: str) -> MessageSignals:
+        """사용자 메시지 안전성/문화 키워드 스캔 (한 번의 순회로 모든 플래그 계산)"""
+        found = self.keyword_scanner.scan(message)
+        return MessageSignals(
+            emergency="emergency" in found,
+            professional_referral="professional_referral" in found,
+            cultural_themes=tuple(theme for theme in self.korean_culture_context if theme in found)
+        )
+    
     def build_eft_prompt(
         self,
         user_message: str,
@@ -198,70 +311,256 @@ class EFTPromptManager:
         conversation_history: List[ConversationMessage] = None,
         user_profile: UserProfile = None,
         style: PromptStyle = PromptStyle.EMPATHETIC,
-        tier: str = "free"
-    ) -> str:
-        """EFT 전문 프롬프트 생성"""
+        tier: str = "free",
+        session_state: Optional[SessionEmotionState] = None,
+        token_budget: Optional[TokenBudget] = None,
+        message_signals: Optional[MessageSignals] = None,
+        session_summary: Optional[SessionSummary] = None
+    ) -> Union[str, BudgetedPrompt]:
+        """EFT 전문 프롬프트 생성
+
+        고정 구간은 미리 렌더링된 조각을 사용하고, 요청마다 달라지는 구간만 생성해 한 번에 결합
+        token_budget 지정 시 우선순위가 낮은 구간부터 제외해 예산에 맞춘 BudgetedPrompt(토큰 ID 포함) 반환
+        message_signals 지정 시 호출자가 이미 계산한 키워드 스캔 결과를 재사용
+        session_summary 지정 시 최근 대화 맥락 앞에 이전 대화 요약을 포함
+        """
+        sections = self._build_prompt_sections(
+            user_message, emotion_state, conversation_history,
+            user_profile, style, tier, session_state, message_signals, session_summary
+        )
         
-        # 1. 시스템 프롬프트 (티어별 차별화)
-        system_section = self._get_tier_system_prompt(tier)
+        if token_budget is not None:
+            return self._assemble_within_budget(sections, token_budget)
         
-        # 2. 사용자 프로필 맥락 추가
+        return "".join(part for _, parts in sections for part in parts)
+    
+    def _build_prompt_sections(
+        self,
+        user_message: str,
+        emotion_state: EmotionAnalysis,
+        conversation_history: Optional[List[ConversationMessage]],
+        user_profile: Optional[UserProfile],
+        style: PromptStyle,
+        tier: str,
+        session_state: Optional[SessionEmotionState],
+        message_signals: Optional[MessageSignals] = None,
+        session_summary: Optional[SessionSummary] = None
+    ) -> List[Tuple[str, List[str]]]:
+        """프롬프트 구간 목록 (이름, 텍스트 조각) - 순서대로 이어 붙이면 완성된 프롬프트"""
+        fragments = self.get_prompt_fragments(tier, emotion_state.primary_emotion, style)
+        
+        # 1. 사용자 프로필 맥락
         profile_context = self._build_profile_context(user_profile)
         
-        # 3. 감정 분석 맥락 추가
-        emotion_context = self._build_emotion_context(emotion_state)
-        
-        # 4. 대화 히스토리 맥락
-        history_context = self._build_history_context(conversation_history)
-        
-        # 5. 안전성 체크
-        safety_context = self._build_safety_context(user_message)
-        
-        # 6. EFT 기법 컨텍스트
-        eft_context = self._build_eft_context(emotion_state)
-        
-        # 7. 한국 문화 컨텍스트
-        culture_context = self._build_culture_context(user_message)
-        
-        # 8. 응답 스타일 가이드
-        style_guide = self._build_style_guide(style, emotion_state)
+        # 2. 감정 분석 맥락 (세션 누적 감정 흐름 포함)
+        emotion_context = self._build_emotion_context(emotion_state, session_state)
+        
+        # 3. 대화 히스토리 맥락 (줄 단위 - 다음 턴에서도 같은 줄은 토큰 캐시 재사용)
+        #    최근 창 밖의 메시지는 세션 요약으로 대체 (요약은 접힐 때만 바뀌므로 토큰 캐시 재사용)
+        summary_parts = [session_summary.text, "\n\n"] if session_summary and session_summary.text else []
+        history_lines = self._build_history_lines(conversation_history)
+        
+        # 4. 안전성 체크 / 한국 문화 컨텍스트 (키워드 스캔 한 번)
+        signals = message_signals or self.scan_message(user_message)
+        safety_context = self._build_safety_context(signals)
+        culture_context = self._build_culture_context(signals)
+        
+        # 시스템 → 프로필 → 감정 → 요약 → 히스토리 → 안전성 → EFT → 문화 → 스타일 → 티어 → 메시지 → 요구사항
+        return [
+            ("system", [fragments.header]),
+            ("profile", [profile_context + "\n\n"]),
+            ("emotion", [emotion_context + "\n\n"]),
+            ("summary", summary_parts),
+            ("history", history_lines + ["\n\n"]),
+            ("safety", [safety_context]),
+            ("eft", [fragments.eft_block]),
+            ("culture", [culture_context]),
+            ("style", [fragments.style_block]),
+            ("tier_guide", [fragments.tier_block]),
+            ("message", [fragments.message_open, user_message, fragments.message_close]),
+            ("requirements", [fragments.requirements]),
+        ]
+    
+    def _assemble_within_budget(
+        self,
+        sections: List[Tuple[str, List[str]]],
+        token_budget: TokenBudget
+    ) -> BudgetedPrompt:
+        """토큰 예산 안에서 구간 조립
+
+        사용자 메시지를 먼저 확보한 뒤 우선순위가 높은 구간부터 남은 예산에 들어가는 것만 포함하고,
+        사용자 메시지 자체가 예산을 넘을 때만 메시지 앞부분을 잘라냄 (최근 내용 유지)
+        """
+        section_parts = dict(sections)
+        
+        # 1. 사용자 메시지 확보 (예산 초과 시 메시지 본문 앞부분 제거)
+        message_open, user_message, message_close = section_parts["message"]
+        open_ids = token_budget.encode(message_open)
+        close_ids = token_budget.encode(message_close)
+        body_ids = token_budget.encode(user_message, cache=False)
+        
+        remaining = token_budget.available - len(open_ids) - len(body_ids) - len(close_ids)
+        message_truncated = remaining < 0
+        if message_truncated:
+            keep = max(0, token_budget.available - len(open_ids) - len(close_ids))
+            body_ids = body_ids[-keep:] if keep else ()
+            remaining = 0
+        section_ids: Dict[str, Tuple[int, ...]] = {"message": open_ids + body_ids + close_ids}
+        
+        # 2. 우선순위 순으로 남은 예산에 들어가는 구간만 포함 (감정 분석 구간은 캐시하지 않음)
+        dropped = []
+        for name in _SECTIONS_BY_PRIORITY:
+            parts = section_parts[name]
+            has_content = any(part.strip() for part in parts)  # 구분용 줄바꿈만 있는 빈 구간은 제외 목록에서 생략
+            if remaining <= 0:
+                if has_content:
+                    dropped.append(name)  # 예산 소진 - 토큰화 생략
+                continue
+            
+            cache = name not in _UNCACHED_SECTIONS
+            ids = tuple(chain.from_iterable(token_budget.encode(part, cache=cache) for part in parts))
+            if len(ids) <= remaining:
+                section_ids[name] = ids
+                remaining -= len(ids)
+            elif has_content:
+                dropped.append(name)
+        
+        # 3. 원래 순서대로 조립
+        token_ids = list(token_budget.prefix_ids)
+        text_parts = []
+        for name, parts in sections:
+            ids = section_ids.get(name)
+            if ids is not None:
+                token_ids.extend(ids)
+                text_parts.extend(parts)
+        token_ids.extend(token_budget.suffix_ids)
+        
+        prompt = BudgetedPrompt(
+            text="".join(text_parts),
+            token_ids=token_ids,
+            max_tokens=token_budget.max_tokens,
+            dropped_sections=dropped,
+            message_truncated=message_truncated
+        )
+        token_budget.record(prompt)
         
-        # 9. 티어별 응답 가이드
-        tier_guide = self._build_tier_guide(tier)
+        if dropped or message_truncated:
+            logger.debug(
+                f"토큰 예산 적용: {prompt.prompt_tokens}/{token_budget.max_tokens} 토큰, "
+                f"제외 구간 {dropped}{', 메시지 일부 생략' if message_truncated else ''}"
+            )
+        return prompt
+    
+    def _build_prompt_fragments(self) -> Dict[Tuple[str, EmotionType, PromptStyle], PromptFragments]:
+        """모든 (티어 × 감정 × 스타일) 조합의 고정 구간 렌더링"""
+        eft_blocks = {
+            emotion_type: f"\n\n{self._build_eft_context(emotion_type)}\n\n"
+            for emotion_type in EmotionType
+        }
         
-        # 최종 프롬프트 조합
-        full_prompt = f"""
-{system_section}
-
-{profile_context}
-
-{emotion_context}
-
-{history_context}
-
-{safety_context}
-
-{eft_context}
-
-{culture_context}
-
-{style_guide}
-
-{tier_guide}
-
-📝 **사용자 메시지**: "{user_message}"
-
-🎯 **응답 요구사항**:
-- 위 감정 분석을 바탕으로 공감적 응답 생성
+        fragments = {}
+        for tier in PROMPT_TIERS:
+            # 프롬프트 전체에 strip()을 적용하던 것과 같도록 시작 공백 제거
+            header = f"\n{self._get_tier_system_prompt(tier)}\n\n".lstrip()
+            tier_guide = self._build_tier_guide(tier)
+            tier_block = f"\n\n{tier_guide}"
+            requirements = f"\n\n{self._build_response_requirements(tier, '위 감정 분석')}"
+            
+            # 메시지 레이아웃: 티어 공통 구간을 앞에 두어 감정/스타일이 달라도 앞부분은 공유
+            chat_tier_prefix = "\n\n".join((
+                self._get_tier_system_prompt(tier).strip(),
+                tier_guide.strip(),
+                self._build_response_requirements(tier, '사용자 메시지와 함께 전달되는 감정 분석')
+            ))
+            
+            for emotion_type in EmotionType:
+                for style in PromptStyle:
+                    style_guide = self._build_style_guide(style, emotion_type)
+                    chat_system = "\n\n".join((
+                        chat_tier_prefix,
+                        eft_blocks[emotion_type].strip(),
+                        style_guide.strip()
+                    ))
+                    fragments[(tier, emotion_type, style)] = PromptFragments(
+                        header=header,
+                        eft_block=eft_blocks[emotion_type],
+                        style_block=f"\n\n{style_guide}",
+                        tier_block=tier_block,
+                        message_open="\n\n📝 **사용자 메시지**: \"",
+                        message_close="\"",
+                        requirements=requirements,
+                        chat_system=chat_system,
+                        prefix_hash=hashlib.blake2b(chat_system.encode("utf-8"), digest_size=8).hexdigest()
+                    )
+        
+        return fragments
+    
+    def _build_response_requirements(self, tier: str, analysis_ref: str) -> str:
+        """응답 요구사항 (analysis_ref: 감정 분석 위치를 가리키는 표현 - 레이아웃별로 다름)"""
+        return f"""🎯 **응답 요구사항**:
+- {analysis_ref}을 바탕으로 공감적 응답 생성
 - 적절한 EFT 기법 추천 (구체적인 탭핑 포인트와 구문 포함)
 - 한국 문화 맥락 고려
 - {self._get_tier_response_length(tier)} 내외의 따뜻하고 실용적인 응답
 - 필요시 후속 질문이나 행동 제안
 
-지금부터 EFT 전문 상담사로서 응답해 주세요:
-"""
+지금부터 EFT 전문 상담사로서 응답해 주세요:"""
+    
+    def build_chat_messages(
+        self,
+        user_message: str,
+        emotion_state: EmotionAnalysis,
+        conversation_history: List[ConversationMessage] = None,
+        user_profile: UserProfile = None,
+        style: PromptStyle = PromptStyle.EMPATHETIC,
+        tier: str = "free",
+        session_state: Optional[SessionEmotionState] = None,
+        message_signals: Optional[MessageSignals] = None,
+        session_summary: Optional[SessionSummary] = None
+    ) -> ChatPrompt:
+        """OpenAI 호환 messages 레이아웃 프롬프트 생성 (vLLM 프록시용)
+
+        system 메시지는 (티어, 주요 감정, 스타일)별로 미리 렌더링된 고정 문자열을 그대로 사용하고,
+        사용자별 구간은 모두 마지막 user 메시지에 모음
+        """
+        fragments = self.get_prompt_fragments(tier, emotion_state.primary_emotion, style)
+        signals = message_signals or self.scan_message(user_message)
+        
+        # 요청마다 달라지는 구간 (빈 구간 제외)
+        volatile_sections = (
+            self._build_profile_context(user_profile),
+            self._build_emotion_context(emotion_state, session_state),
+            session_summary.text if session_summary else "",
+            self._build_history_context(conversation_history),
+            self._build_safety_context(signals),
+            self._build_culture_context(signals),
+            f"📝 **사용자 메시지**: \"{user_message}\""
+        )
+        user_content = "\n\n".join(section.strip() for section in volatile_sections if section.strip())
         
-        return full_prompt.strip()
+        return ChatPrompt(
+            messages=[
+                {"role": "system", "content": fragments.chat_system},
+                {"role": "user", "content": user_content}
+            ],
+            prefix_hash=fragments.prefix_hash,
+            prefix_chars=len(fragments.chat_system)
+        )
+    
+    def get_prompt_fragments(
+        self,
+        tier: str,
+        emotion_type: EmotionType,
+        style: PromptStyle = PromptStyle.EMPATHETIC
+    ) -> PromptFragments:
+        """미리 렌더링된 고정 구간 조회 (알 수 없는 티어는 무료 티어 기준)"""
+        if tier not in PROMPT_TIERS:
+            tier = "free"
+        return self.prompt_fragments[(tier, emotion_type, style)]
+    
+    def get_static_prefix(self, tier: str) -> str:
+        """티어별 고정 시스템 프롬프트 구간 (감정/스타일과 무관하게 모든 프롬프트의 맨 앞 - KV 캐시 프리픽스용)"""
+        return self.get_prompt_fragments(tier, EmotionType.NEUTRAL).header
     
     def _build_profile_context(self, profile: UserProfile) -> str:
         """사용자 프로필 컨텍스트 생성"""
@@ -277,51 +576,54 @@ class EFTPromptManager:
 """
         return context
     
-    def _build_emotion_context(self, emotion: EmotionAnalysis) -> str:
-        """감정 분석 컨텍스트 생성"""
+    def _build_emotion_context(
+        self,
+        emotion: EmotionAnalysis,
+        session_state: Optional[SessionEmotionState] = None
+    ) -> str:
+        """감정 분석 컨텍스트 생성 (세션 상태는 고정 크기라 대화 길이와 무관)"""
         context = f"""
 🧠 **감정 분석 결과**:
 - 주요 감정: {emotion.primary_emotion.value} (강도: {emotion.intensity:.2f})
 - 보조 감정: {emotion.secondary_emotion.value if emotion.secondary_emotion else "없음"}
 - 분석 신뢰도: {emotion.confidence:.2f}
 - 감정 키워드: {', '.join(emotion.emotional_keywords)}
+"""
+        if session_state and session_state.turns > 1:
+            trajectory = " → ".join(emotion_type.value for emotion_type, _ in session_state.recent)
+            context += f"""- 대화 흐름: {session_state.turns}번째 대화, 누적 주요 감정 {session_state.dominant_emotion.value} ({session_state.dominant_share:.0%})
+- 최근 감정 변화: {trajectory} (강도 {session_state.intensity_trend})
 """
         return context
     
     def _build_history_context(self, history: List[ConversationMessage]) -> str:
         """대화 히스토리 컨텍스트 생성"""
+        return "".join(self._build_history_lines(history))
+    
+    def _build_history_lines(self, history: Optional[List[ConversationMessage]]) -> List[str]:
+        """대화 히스토리 컨텍스트 (제목 + 메시지별 줄)"""
         if not history or len(history) == 0:
-            return "📜 **대화 히스토리**: 첫 대화입니다."
+            return ["📜 **대화 히스토리**: 첫 대화입니다."]
         
-        recent_messages = history[-3:]  # 최근 3개 메시지만
-        history_text = "📜 **최근 대화 맥락**:\n"
+        recent_messages = history[-HISTORY_WINDOW:]  # 최근 메시지만 (이전 메시지는 세션 요약으로 전달)
+        history_lines = ["📜 **최근 대화 맥락**:\n"]
         
         for msg in recent_messages:
             role_emoji = "👤" if msg.role == "user" else "🤖"
-            history_text += f"- {role_emoji} {msg.content[:100]}{'...' if len(msg.content) > 100 else ''}\n"
+            history_lines.append(f"- {role_emoji} {msg.content[:100]}{'...' if len(msg.content) > 100 else ''}\n")
         
-        return history_text
+        return history_lines
     
-    def _build_safety_context(self, message: str) -> str:
+    def _build_safety_context(self, signals: MessageSignals) -> str:
         """안전성 체크 컨텍스트"""
-        emergency_detected = any(
-            keyword in message.lower() 
-            for keyword in self.safety_guidelines["emergency_keywords"]
-        )
-        
-        professional_needed = any(
-            keyword in message.lower()
-            for keyword in self.safety_guidelines["professional_referral_keywords"] 
-        )
-        
-        if emergency_detected:
+        if signals.emergency:
             return """
 🚨 **응급상황 감지**: 자해/자살 위험 신호가 감지되었습니다.
 - 즉시 전문기관 안내 필수
 - 따뜻한 지지와 함께 구체적인 도움처 제공
 - EFT 기법보다는 안전 확보 우선
 """
-        elif professional_needed:
+        elif signals.professional_referral:
             return """
 ⚠️ **전문가 상담 권장**: 전문적 치료가 필요한 증상이 언급되었습니다.
 - 전문가 상담 권유
@@ -331,9 +633,9 @@ class EFTPromptManager:
         else:
             return "✅ **안전성 체크**: 일반적인 상담 진행 가능"
     
-    def _build_eft_context(self, emotion: EmotionAnalysis) -> str:
-        """EFT 기법 컨텍스트 생성"""
-        techniques = self.eft_technique_database.get(emotion.primary_emotion, [])
+    def _build_eft_context(self, emotion_type: EmotionType) -> str:
+        """EFT 기법 컨텍스트 생성 (초기화 시 감정별로 한 번만 호출)"""
+        techniques = self.eft_technique_database.get(emotion_type, [])
         
         if not techniques:
             return "⚡ **EFT 추천**: 기본 감정 조절 기법 적용"
@@ -350,39 +652,22 @@ class EFTPromptManager:
 """
         return context
     
-    def _build_culture_context(self, message: str) -> str:
-        """한국 문화 컨텍스트 생성"""
-        cultural_themes = []
-        
-        # 가족 관련
-        family_keywords = ["부모", "엄마", "아빠", "가족", "형제", "자매", "시댁", "처가"]
-        if any(keyword in message for keyword in family_keywords):
-            cultural_themes.append("family_dynamics")
-        
-        # 직장 관련
-        work_keywords = ["회사", "직장", "상사", "동료", "업무", "야근", "승진", "면접"]
-        if any(keyword in message for keyword in work_keywords):
-            cultural_themes.append("work_culture")
-        
-        # 사회적 압박
-        social_keywords = ["결혼", "연애", "학벌", "스펙", "취업", "비교", "남들"]
-        if any(keyword in message for keyword in social_keywords):
-            cultural_themes.append("social_pressure")
-        
-        if not cultural_themes:
+    def _build_culture_context(self, signals: MessageSignals) -> str:
+        """한국 문화 컨텍스트 생성 (가족/직장/사회적 압박 등 스캔된 테마별 설명)"""
+        if not signals.cultural_themes:
             return ""
         
         context = "🇰🇷 **한국 문화 고려사항**:\n"
-        for theme in cultural_themes:
+        for theme in signals.cultural_themes:
             theme_info = self.korean_culture_context[theme]
             context += f"- {theme_info['description']}\n"
         
         return context
     
-    def _build_style_guide(self, style: PromptStyle, emotion: EmotionAnalysis) -> str:
-        """응답 스타일 가이드 생성"""
+    def _build_style_guide(self, style: PromptStyle, emotion_type: EmotionType) -> str:
+        """응답 스타일 가이드 생성 (초기화 시 스타일/감정별로 한 번만 호출)"""
         
-        templates = self.emotion_response_templates.get(emotion.primary_emotion, {})
+        templates = self.emotion_response_templates.get(emotion_type, {})
         
         base_guide = f"""
 🎨 **응답 스타일 가이드**: {style.value}
@@ -401,29 +686,37 @@ class EFTPromptManager:
         
         return base_guide
     
-    def recommend_eft_techniques(self, emotion_state: EmotionAnalysis) -> List[EFTRecommendation]:
-        """감정 상태 기반 EFT 기법 추천"""
-        
-        techniques = self.eft_technique_database.get(emotion_state.primary_emotion, [])
-        recommendations = []
-        
-        for tech in techniques:
-            recommendation = EFTRecommendation(
-                technique_name=tech["name"],
-                tapping_points=tech["points"],
-                setup_phrase=tech["setup_phrase"],
-                reminder_phrase=tech["reminder"],
-                duration_minutes=tech["duration"],
-                difficulty_level="beginner",  # 기본값
-                effectiveness_score=tech["effectiveness"],
-                additional_notes=f"{emotion_state.primary_emotion.value} 감정에 특화된 기법입니다."
-            )
-            recommendations.append(recommendation)
-        
-        # 효과성 순으로 정렬
-        recommendations.sort(key=lambda x: x.effectiveness_score, reverse=True)
+    def _build_eft_recommendations(self) -> Dict[EmotionType, Tuple[FrozenEFTRecommendation, ...]]:
+        """감정별 상위 EFT 기법 추천 생성 (초기화 시 한 번)"""
+        table = {}
+        for emotion_type in EmotionType:
+            recommendations = [
+                FrozenEFTRecommendation(
+                    technique_name=tech["name"],
+                    tapping_points=tech["points"],
+                    setup_phrase=tech["setup_phrase"],
+                    reminder_phrase=tech["reminder"],
+                    duration_minutes=tech["duration"],
+                    difficulty_level="beginner",  # 기본값
+                    effectiveness_score=tech["effectiveness"],
+                    additional_notes=f"{emotion_type.value} 감정에 특화된 기법입니다."
+                )
+                for tech in self.eft_technique_database.get(emotion_type, [])
+            ]
+            
+            # 효과성 순으로 정렬 후 상위 기법만 유지
+            recommendations.sort(key=lambda x: x.effectiveness_score, reverse=True)
+            table[emotion_type] = tuple(recommendations[:MAX_EFT_RECOMMENDATIONS])
         
-        return recommendations[:3]  # 상위 3개만 반환
+        return table
+    
+    def recommend_eft_techniques(self, emotion_state: EmotionAnalysis) -> List[EFTRecommendation]:
+        """감정 상태 기반 EFT 기법 추천 (미리 생성된 불변 객체 공유)"""
+        return list(self.eft_recommendations[emotion_state.primary_emotion])
+    
+    def recommend_eft_techniques_json(self, emotion_state: EmotionAnalysis) -> str:
+        """감정 상태 기반 EFT 기법 추천 (직렬화된 JSON 배열 - 응답 본문에 그대로 삽입)"""
+        return self.eft_recommendations_json[emotion_state.primary_emotion]
     
     def _get_tier_system_prompt(self, tier: str) -> str:
         """티어별 시스템 프롬프트 생성"""
@@ -487,6 +780,10 @@ class EFTPromptManager:
         else:
             return "200-400자"  # 무료 티어
     
+    def get_response_length_policy(self, tier: str) -> ResponseLengthPolicy:
+        """티어별 응답 길이 정책 (생성 조기 종료 기준 - 응답 길이 가이드 상한 + 후처리 문장 수 제한)"""
+        return ResponseLengthPolicy.from_length_guide(self._get_tier_response_length(tier))
+    
     def post_process_response(
         self, 
         ai_response: str, 
@@ -530,9 +827,11 @@ class EFTPromptManager:
             cleaned = cleaned.replace(prefix, "").strip()
         
         # 길이 제한 (너무 긴 응답 방지)
-        if len(cleaned) > 800:
-            sentences = cleaned.split('. ')
-            cleaned = '. '.join(sentences[:4]) + '.'
+        if len(cleaned) > TRUNCATE_OVER_CHARS:
+            sentences = cleaned.split(SENTENCE_SEPARATOR)
+            cleaned = SENTENCE_SEPARATOR.join(sentences[:MAX_KEPT_SENTENCES])
+            if not cleaned.endswith('.'):  # 조기 종료로 마지막 문장이 마침표로 끝난 경우
+                cleaned += '.'
         
         return cleaned
     
@@ -0,0 +1,138 @@
+"""
+프롬프트 토큰 예산 관리
+토크나이저 기반 구간별 토큰 ID 캐시 및 예산 내 프롬프트 조립 결과
+"""
+
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from config.settings import get_settings
+from utils.lru_cache import LRUCache
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+# 캐시 항목 메모리 추정치 (튜플 기본 크기 + 토큰 ID당 포인터/정수)
+_TOKEN_ID_BYTES = 8 + 28
+_TOKEN_TUPLE_BASE_BYTES = 56
+
+@dataclass
+class BudgetedPrompt:
+    """토큰 예산 안에서 조립된 프롬프트 (모델에 토큰 ID를 그대로 전달)"""
+    text: str                          # 포함된 구간 텍스트 (채팅 템플릿 제외, 사용자 메시지는 원문)
+    token_ids: List[int]               # 채팅 템플릿 포함 모델 입력 토큰 ID
+    max_tokens: int                    # 적용된 입력 토큰 한도
+    dropped_sections: List[str] = field(default_factory=list)  # 예산 초과로 제외된 구간
+    message_truncated: bool = False    # 사용자 메시지 앞부분을 잘랐는지 여부
+
+    @property
+    def prompt_tokens(self) -> int:
+        return len(self.token_ids)
+
+class TokenBudget:
+    """토크나이저 기반 입력 토큰 예산
+
+    - 구간 텍스트별 토큰 ID를 LRU 캐시에 보관하므로 고정 구간(시스템 프롬프트, 가이드 등)과
+      반복되는 대화 이력 줄은 처음 한 번만 토큰화됩니다.
+    - 구간은 줄바꿈/따옴표 경계에서 나뉘므로 구간별 토큰 ID를 이어 붙여 그대로 모델 입력으로 사용합니다.
+    """
+
+    def __init__(
+        self,
+        encode: Callable[[str], Sequence[int]],
+        max_tokens: int,
+        prefix: str = "",
+        suffix: str = "",
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        name: str = "prompt"
+    ):
+        self._encode = encode
+        self.max_tokens = max_tokens
+        self.name = name
+        self._cache = LRUCache(
+            max_entries=max_entries or settings.PROMPT_TOKEN_CACHE_MAX_ENTRIES,
+            max_bytes=max_bytes or settings.PROMPT_TOKEN_CACHE_MAX_BYTES,
+            sizeof=lambda key, value: sys.getsizeof(key) + _TOKEN_TUPLE_BASE_BYTES + _TOKEN_ID_BYTES * len(value)
+        )
+        self._stats_lock = threading.Lock()
+
+        # 토크나이저 호출 통계
+        self.encode_calls = 0
+        self.encoded_chars = 0
+        self.encode_seconds = 0.0
+
+        # 조립 결과 통계
+        self.prompts = 0
+        self.truncated_messages = 0
+        self.total_prompt_tokens = 0
+        self.dropped_counts: Dict[str, int] = {}
+
+        # 채팅 템플릿 (모델별 고정 앞/뒤 구간)
+        self.prefix_ids = self.encode(prefix)
+        self.suffix_ids = self.encode(suffix)
+
+    @property
+    def available(self) -> int:
+        """채팅 템플릿을 제외한 프롬프트 본문 토큰 한도"""
+        return max(0, self.max_tokens - len(self.prefix_ids) - len(self.suffix_ids))
+
+    def encode(self, text: str, cache: bool = True) -> Tuple[int, ...]:
+        """텍스트 → 토큰 ID (cache=False는 한 번만 쓰이는 사용자 입력용)"""
+        if not text:
+            return ()
+
+        if cache:
+            cached = self._cache.get(text)
+            if cached is not None:
+                return cached
+
+        start_time = time.perf_counter()
+        token_ids = tuple(self._encode(text))
+        elapsed = time.perf_counter() - start_time
+
+        with self._stats_lock:
+            self.encode_calls += 1
+            self.encoded_chars += len(text)
+            self.encode_seconds += elapsed
+
+        if cache:
+            self._cache.put(text, token_ids)
+        return token_ids
+
+    def count(self, text: str) -> int:
+        """텍스트 토큰 수 (캐시 사용)"""
+        return len(self.encode(text))
+
+    def record(self, prompt: BudgetedPrompt) -> None:
+        """조립 결과 통계 반영"""
+        with self._stats_lock:
+            self.prompts += 1
+            self.total_prompt_tokens += prompt.prompt_tokens
+            if prompt.message_truncated:
+                self.truncated_messages += 1
+            for section in prompt.dropped_sections:
+                self.dropped_counts[section] = self.dropped_counts.get(section, 0) + 1
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """토크나이저 사용량 및 구간 제외 통계"""
+        with self._stats_lock:
+            return {
+                "name": self.name,
+                "max_tokens": self.max_tokens,
+                "prompts": self.prompts,
+                "avg_prompt_tokens": self.total_prompt_tokens / self.prompts if self.prompts else 0.0,
+                "truncated_messages": self.truncated_messages,
+                "dropped_sections": dict(self.dropped_counts),
+                "encode_calls": self.encode_calls,
+                "encoded_chars": self.encoded_chars,
+                "encode_ms": self.encode_seconds * 1000,
+                "cache": self._cache.get_stats()
+            }
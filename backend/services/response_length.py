@@ -0,0 +1,123 @@
+"""
+응답 길이 정책 기반 생성 조기 종료
+티어별 응답 길이 가이드(문자 수 상한)와 후처리 문장 수 제한을 생성 중에 적용해, 후처리에서 버려질 토큰은 디코딩하지 않음
+"""
+
+import re
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Sequence
+
+# 후처리 길이 제한 (EFTPromptManager._clean_ai_response): 이 길이를 넘는 응답은 앞 문장 N개만 유지
+TRUNCATE_OVER_CHARS = 800
+MAX_KEPT_SENTENCES = 4
+SENTENCE_SEPARATOR = ". "
+
+# 조기 종료 사유 (모델 EOS 로 끝난 경우는 절약으로 집계하지 않음)
+STOP_REASONS = ("sentences", "char_budget", "end_marker")
+
+_LENGTH_GUIDE_PATTERN = re.compile(r"(\d+)\s*-\s*(\d+)\s*자")
+_SENTENCE_END_PATTERN = re.compile(r"[.!?…][\"'”’)\]]*\s*$")
+_SENTENCE_END_WINDOW = 16  # 문장 끝 확인 시 보는 끝부분 문자 수 (마침표 + 닫는 따옴표/괄호 + 공백)
+
+
+class ResponseProgress:
+    """생성 중인 응답 텍스트의 길이/문장 수 (새로 디코딩된 텍스트만 반영 - 토큰당 비용이 응답 길이와 무관)"""
+
+    def __init__(self):
+        self.text = ""
+        self.separators = 0  # SENTENCE_SEPARATOR 등장 횟수 (후처리 문장 분할 기준)
+        self._start: Optional[int] = None  # 첫 공백 아닌 문자 위치
+        self._end = 0  # 마지막 공백 아닌 문자 다음 위치
+
+    @property
+    def length(self) -> int:
+        """앞뒤 공백을 제외한 길이 (후처리의 strip() 기준)"""
+        return self._end - self._start if self._start is not None else 0
+
+    def extend(self, delta: str) -> None:
+        # 구분자가 이전 텍스트 끝과 새 텍스트 사이에 걸칠 수 있으므로 이전 마지막 문자부터 셈
+        overlap = len(SENTENCE_SEPARATOR) - 1
+        self.separators += (self.text[-overlap:] + delta).count(SENTENCE_SEPARATOR)
+        content = delta.strip()
+        if content:
+            if self._start is None:
+                self._start = len(self.text) + len(delta) - len(delta.lstrip())
+            self._end = len(self.text) + len(delta.rstrip())
+        self.text += delta
+
+    def ends_sentence(self) -> bool:
+        return _SENTENCE_END_PATTERN.search(self.text[-_SENTENCE_END_WINDOW:]) is not None
+
+    def tail_contains(self, markers: Sequence[str], delta_length: int) -> bool:
+        """방금 추가된 텍스트(이전 텍스트와 걸친 부분 포함)에 표시 문자열이 있는지"""
+        window = delta_length + max((len(marker) for marker in markers), default=0)
+        tail = self.text[-window:]
+        return any(marker in tail for marker in markers)
+
+
+@dataclass(frozen=True)
+class ResponseLengthPolicy:
+    """응답 길이 정책 (생성 텍스트가 기준을 만족하면 남길 텍스트가 완성된 것으로 보고 생성 종료)
+
+    - 문장 수: 후처리 제한 길이를 넘고 문장 구분자가 max_sentences개 나오면, 후처리가 남길 앞 문장들이 모두 생성됨
+    - 문자 수: 티어 응답 길이 가이드 상한(max_chars)에 도달한 뒤 문장이 끝나면 종료
+    """
+    max_chars: int
+    max_sentences: int = MAX_KEPT_SENTENCES
+    truncate_over: int = TRUNCATE_OVER_CHARS
+
+    @classmethod
+    def from_length_guide(cls, guide: str) -> "ResponseLengthPolicy":
+        """응답 길이 가이드("400-800자" 형식) → 상한 문자 수 정책"""
+        match = _LENGTH_GUIDE_PATTERN.search(guide)
+        if match is None:
+            raise ValueError(f"응답 길이 가이드 형식 오류: {guide}")
+        return cls(max_chars=int(match.group(2)))
+
+    def stop_reason(self, progress: ResponseProgress) -> Optional[str]:
+        """생성된 텍스트가 정책을 만족하면 종료 사유, 아니면 None"""
+        if progress.length > self.truncate_over and progress.separators >= self.max_sentences:
+            return "sentences"
+        if progress.length >= self.max_chars and progress.ends_sentence():
+            return "char_budget"
+        return None
+
+
+class EarlyStoppingStats:
+    """조기 종료 통계 (요청별 생성 토큰 수와 max_new_tokens 대비 절약한 토큰 수)
+
+    절약 토큰 = max_new_tokens - 실제 생성 토큰 (정책으로 종료된 요청만 집계하며,
+    정책이 없었다면 모델이 그 전에 EOS 를 냈을 수도 있으므로 상한 추정치)
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.generated_tokens = 0
+        self.tokens_saved = 0
+        self.stop_reasons = {reason: 0 for reason in STOP_REASONS}
+
+    def record(self, reason: Optional[str], generated_tokens: int, max_new_tokens: int) -> int:
+        """요청 1건 기록 - 절약한 토큰 수 반환"""
+        saved = max(max_new_tokens - generated_tokens, 0) if reason in self.stop_reasons else 0
+        with self._lock:
+            self.requests += 1
+            self.generated_tokens += generated_tokens
+            self.tokens_saved += saved
+            if reason in self.stop_reasons:
+                self.stop_reasons[reason] += 1
+        return saved
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            early_stopped = sum(self.stop_reasons.values())
+            return {
+                "requests": self.requests,
+                "early_stopped": early_stopped,
+                "stop_reasons": dict(self.stop_reasons),
+                "generated_tokens": self.generated_tokens,
+                "tokens_saved": self.tokens_saved,
+                "avg_tokens_saved_per_request": self.tokens_saved / self.requests if self.requests else 0.0,
+                "early_stop_rate": early_stopped / self.requests if self.requests else 0.0,
+            }
@@ -0,0 +1,143 @@
+"""
+세션 감정 상태 관리
+session_id별 누적 감정 벡터를 턴마다 감쇠시키며 유지 (새 메시지만 분석해 반영)
+"""
+
+import sys
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, Optional, Tuple
+
+from config.settings import get_settings
+from models.chat_models import EmotionAnalysis, EmotionType
+from utils.lru_cache import LRUCache
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+# 세션 상태 1건의 메모리 추정치 (감정 벡터 + 최근 흐름 + 객체 기본 크기)
+_SESSION_STATE_BYTES = 2048
+
+# 보조 감정 반영 비율
+_SECONDARY_WEIGHT = 0.5
+
+@dataclass
+class SessionEmotionState:
+    """세션 누적 감정 상태 (턴 수와 무관하게 고정 크기)"""
+    vector: Dict[EmotionType, float] = field(default_factory=lambda: {emotion: 0.0 for emotion in EmotionType})
+    turns: int = 0
+    recent: Deque[Tuple[EmotionType, float]] = field(default_factory=deque)  # 최근 (주요 감정, 강도)
+
+    @property
+    def dominant_emotion(self) -> EmotionType:
+        """누적 벡터 기준 지배적 감정"""
+        emotion, score = max(self.vector.items(), key=lambda item: item[1])
+        return emotion if score > 0 else EmotionType.NEUTRAL
+
+    @property
+    def dominant_share(self) -> float:
+        """지배적 감정이 누적 벡터에서 차지하는 비중"""
+        total = sum(self.vector.values())
+        return self.vector[self.dominant_emotion] / total if total > 0 else 0.0
+
+    @property
+    def intensity_trend(self) -> str:
+        """직전 턴 대비 강도 추세"""
+        if len(self.recent) < 2:
+            return "유지"
+        delta = self.recent[-1][1] - self.recent[-2][1]
+        if delta > 0.1:
+            return "상승"
+        if delta < -0.1:
+            return "완화"
+        return "유지"
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "turns": self.turns,
+            "dominant_emotion": self.dominant_emotion.value,
+            "dominant_share": round(self.dominant_share, 3),
+            "intensity_trend": self.intensity_trend,
+            "recent_emotions": [emotion.value for emotion, _ in self.recent]
+        }
+
+class SessionEmotionStore:
+    """session_id별 감정 상태 저장소 (LRU/TTL 한도 내 유지)
+
+    턴마다 누적 벡터에 감쇠율을 곱한 뒤 새 메시지의 분석 결과를 더하므로,
+    대화 이력 전체를 다시 분석하지 않고 턴당 O(1)로 대화 흐름을 갱신합니다.
+    프롬프트에는 preview()로 만든 후보 상태를 쓰고, 응답이 성공한 턴만 update()로 저장합니다
+    (실패/과부하 거절 후 재시도한 턴이 두 번 누적되지 않도록).
+    """
+
+    def __init__(
+        self,
+        decay: Optional[float] = None,
+        max_sessions: Optional[int] = None,
+        ttl_seconds: Optional[float] = None,
+        trajectory_length: Optional[int] = None
+    ):
+        self.decay = settings.SESSION_EMOTION_DECAY if decay is None else decay
+        self.trajectory_length = trajectory_length or settings.SESSION_EMOTION_TRAJECTORY_LENGTH
+        max_sessions = max_sessions or settings.SESSION_EMOTION_MAX_SESSIONS
+
+        self._states = LRUCache(
+            max_entries=max_sessions,
+            max_bytes=max_sessions * _SESSION_STATE_BYTES,
+            ttl_seconds=settings.SESSION_EMOTION_TTL if ttl_seconds is None else ttl_seconds,
+            sizeof=lambda key, value: sys.getsizeof(key) + _SESSION_STATE_BYTES
+        )
+
+        logger.info("✅ 세션 감정 상태 저장소 초기화 완료")
+
+    def get(self, session_id: str) -> Optional[SessionEmotionState]:
+        """세션 상태 조회 (없거나 만료되면 None)"""
+        return self._states.get(session_id)
+
+    def preview(self, session_id: str, analysis: EmotionAnalysis) -> SessionEmotionState:
+        """새 메시지를 반영한 세션 상태 후보 (저장된 상태는 바꾸지 않음)"""
+        stored = self._states.get(session_id)
+        if stored is None:
+            state = SessionEmotionState(recent=deque(maxlen=self.trajectory_length))
+        else:
+            state = SessionEmotionState(
+                vector=dict(stored.vector),
+                turns=stored.turns,
+                recent=deque(stored.recent, maxlen=self.trajectory_length)
+            )
+        self._fold(state, analysis)
+        return state
+
+    def update(self, session_id: str, analysis: EmotionAnalysis) -> SessionEmotionState:
+        """새 메시지의 분석 결과를 세션 상태에 반영"""
+        state = self._states.get(session_id) or SessionEmotionState(
+            recent=deque(maxlen=self.trajectory_length)
+        )
+        self._fold(state, analysis)
+
+        # 저장 시각 갱신 (TTL은 마지막 턴 기준)
+        self._states.put(session_id, state)
+        return state
+
+    def _fold(self, state: SessionEmotionState, analysis: EmotionAnalysis) -> None:
+        """상태에 한 턴 반영 (감쇠 후 새 메시지 감정 누적)"""
+        # 1. 이전 턴 누적값 감쇠
+        for emotion in state.vector:
+            state.vector[emotion] *= self.decay
+
+        # 2. 새 메시지 감정 반영 (중립은 누적하지 않음)
+        if analysis.primary_emotion != EmotionType.NEUTRAL:
+            state.vector[analysis.primary_emotion] += analysis.intensity
+        if analysis.secondary_emotion and analysis.secondary_emotion != EmotionType.NEUTRAL:
+            state.vector[analysis.secondary_emotion] += analysis.intensity * _SECONDARY_WEIGHT
+
+        state.turns += 1
+        state.recent.append((analysis.primary_emotion, analysis.intensity))
+
+    def clear(self) -> None:
+        self._states.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """저장소 통계"""
+        return {"decay": self.decay, **self._states.get_stats()}
@@ -0,0 +1,186 @@
+"""
+세션 대화 요약 관리
+프롬프트 창(최근 메시지)에서 밀려난 턴을 session_id별 추출 요약으로 접어 고정 크기로 유지
+"""
+
+import re
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from config.settings import get_settings
+from models.chat_models import ConversationMessage
+from utils.lru_cache import LRUCache
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+# 프롬프트에 원문으로 싣는 최근 메시지 수 (이보다 앞선 메시지는 요약으로 접힘)
+HISTORY_WINDOW = 3
+
+# 문장 경계 (마침표/물음표/느낌표 뒤 공백, 줄바꿈)
+_SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?])\s+|\n+")
+
+# 세션 요약 1건의 메모리 추정치 (요약 문장 + 객체 기본 크기)
+_SUMMARY_BASE_BYTES = 512
+
+@dataclass(frozen=True)
+class SummaryPoint:
+    """요약 항목 (접힌 사용자 메시지에서 뽑은 핵심 문장)"""
+    turn: int          # 세션 내 메시지 순번 (접힌 순서)
+    salience: float    # 문장 중요도 (높을수록 오래 유지)
+    text: str
+
+@dataclass(frozen=True)
+class SessionSummary:
+    """세션 누적 대화 요약 (접을 때마다 새 객체로 교체 - 프롬프트 생성 중에도 안전하게 공유)"""
+    points: Tuple[SummaryPoint, ...] = ()
+    folded_messages: int = 0                   # 지금까지 요약으로 접힌 메시지 수
+    last_folded: Optional[Tuple[int, ...]] = None  # 마지막으로 접힌 메시지 지문 (다음 요청에서 이어 접을 위치)
+    text: str = ""                             # 프롬프트용 렌더링 결과
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "folded_messages": self.folded_messages,
+            "points": [point.text for point in self.points],
+            "chars": len(self.text)
+        }
+
+def _fingerprint(messages: List[ConversationMessage]) -> Tuple[int, ...]:
+    """연속 메시지 지문 (마지막 2개를 묶어 짧은 메시지가 반복돼도 위치를 구분)"""
+    return tuple(hash((message.role, message.content)) for message in messages)
+
+class SessionSummaryStore:
+    """session_id별 롤링 대화 요약 저장소 (LRU/TTL 한도 내 유지)
+
+    클라이언트가 보내는 대화 이력 중 프롬프트 창(HISTORY_WINDOW) 밖으로 밀려난 메시지만
+    응답 전송 후 추출 요약으로 접으므로, 세션이 길어져도 프롬프트 크기와 prefill 비용이 일정합니다.
+    """
+
+    def __init__(
+        self,
+        salience: Optional[Callable[[str], float]] = None,
+        max_points: Optional[int] = None,
+        point_chars: Optional[int] = None,
+        max_sessions: Optional[int] = None,
+        ttl_seconds: Optional[float] = None
+    ):
+        self._salience = salience or (lambda sentence: 0.0)
+        self.max_points = max_points or settings.SESSION_SUMMARY_MAX_POINTS
+        self.point_chars = point_chars or settings.SESSION_SUMMARY_POINT_CHARS
+        max_sessions = max_sessions or settings.SESSION_EMOTION_MAX_SESSIONS
+
+        self._summaries = LRUCache(
+            max_entries=max_sessions,
+            max_bytes=max_sessions * (_SUMMARY_BASE_BYTES + self.max_points * self.point_chars * 4),
+            ttl_seconds=settings.SESSION_EMOTION_TTL if ttl_seconds is None else ttl_seconds,
+            sizeof=lambda key, value: sys.getsizeof(key) + _SUMMARY_BASE_BYTES + sys.getsizeof(value.text)
+        )
+        self._lock = threading.Lock()  # 같은 세션의 접기 작업 직렬화
+
+        # 접기 통계
+        self.folds = 0
+        self.folded_messages = 0
+        self.fold_seconds = 0.0
+
+        logger.info("✅ 세션 대화 요약 저장소 초기화 완료")
+
+    def get(self, session_id: Optional[str]) -> Optional[SessionSummary]:
+        """세션 요약 조회 (없거나 만료되면 None)"""
+        if not session_id:
+            return None
+        return self._summaries.get(session_id)
+
+    def fold(self, session_id: Optional[str], history: Optional[List[ConversationMessage]]) -> Optional[SessionSummary]:
+        """프롬프트 창 밖으로 밀려난 메시지를 요약에 반영 (응답 전송 후 백그라운드에서 호출)"""
+        if not session_id or not history or len(history) <= HISTORY_WINDOW:
+            return self.get(session_id)
+
+        start_time = time.perf_counter()
+        out_of_window = history[:-HISTORY_WINDOW]
+
+        with self._lock:
+            summary = self._summaries.get(session_id) or SessionSummary()
+
+            # 1. 이미 접힌 위치 찾기 (클라이언트 이력은 앞에서부터 잘려 나가므로 뒤에서부터 검색)
+            start = 0
+            if summary.last_folded is not None:
+                width = len(summary.last_folded)
+                for end in range(len(out_of_window), width - 1, -1):
+                    if _fingerprint(out_of_window[end - width:end]) == summary.last_folded:
+                        start = end
+                        break
+
+            new_messages = out_of_window[start:]
+            if not new_messages:
+                return summary
+
+            # 2. 새로 밀려난 사용자 메시지마다 핵심 문장 추출
+            points = list(summary.points)
+            for offset, message in enumerate(new_messages):
+                if message.role != "user":
+                    continue
+                point = self._extract_point(message.content, summary.folded_messages + offset)
+                if point is not None:
+                    points.append(point)
+
+            # 3. 항목 수 한도 초과 시 중요도 낮은 것부터 제외 (동점이면 최근 항목 유지), 시간순 정렬
+            if len(points) > self.max_points:
+                points = sorted(points, key=lambda point: (point.salience, point.turn), reverse=True)[:self.max_points]
+                points.sort(key=lambda point: point.turn)
+
+            folded_messages = summary.folded_messages + len(new_messages)
+            summary = SessionSummary(
+                points=tuple(points),
+                folded_messages=folded_messages,
+                last_folded=_fingerprint(out_of_window[-2:]),
+                text=self._render(points, folded_messages)
+            )
+            self._summaries.put(session_id, summary)
+
+            self.folds += 1
+            self.folded_messages += len(new_messages)
+            self.fold_seconds += time.perf_counter() - start_time
+
+        return summary
+
+    def _extract_point(self, content: str, turn: int) -> Optional[SummaryPoint]:
+        """메시지에서 중요도가 가장 높은 문장 하나 선택 (동점이면 앞 문장)"""
+        best_sentence, best_score = None, None
+        for sentence in _SENTENCE_BOUNDARY.split(content):
+            sentence = sentence.strip()
+            if not sentence:
+                continue
+            score = self._salience(sentence)
+            if best_score is None or score > best_score:
+                best_sentence, best_score = sentence, score
+
+        if best_sentence is None:
+            return None
+        if len(best_sentence) > self.point_chars:
+            best_sentence = best_sentence[:self.point_chars] + "..."
+        return SummaryPoint(turn=turn, salience=best_score, text=best_sentence)
+
+    @staticmethod
+    def _render(points: List[SummaryPoint], folded_messages: int) -> str:
+        if not points:
+            return ""
+        lines = [f"🗂️ **이전 대화 요약** (앞선 메시지 {folded_messages}개):\n"]
+        lines.extend(f"- 👤 {point.text}\n" for point in points)
+        return "".join(lines)
+
+    def clear(self) -> None:
+        self._summaries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """저장소 통계"""
+        return {
+            "max_points": self.max_points,
+            "folds": self.folds,
+            "folded_messages": self.folded_messages,
+            "avg_fold_ms": self.fold_seconds * 1000 / self.folds if self.folds else 0.0,
+            **self._summaries.get_stats()
+        }
@@ -0,0 +1,195 @@
+"""
+추론 요청 수락 제어
+동시 실행 한도 + 대기열 길이 한도 + 시작 기한으로 과부하 시 빠르게 거절 (대기열 지표 포함)
+"""
+
+import asyncio
+import math
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Deque, Dict, Optional
+
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# 서비스 시간 지수 이동 평균 가중치 (최근 요청 반영 비율)
+_SERVICE_TIME_ALPHA = 0.2
+
+# 대기 시간 분위수 계산용 최근 표본 수
+_WAIT_SAMPLES = 1000
+
+
+class AdmissionRejected(Exception):
+    """수락 거절 (대기열 가득 참 / 기한 내 시작 불가) - retry_after 초 후 재시도 권장"""
+
+    def __init__(self, reason: str, retry_after: int, queue_depth: int):
+        super().__init__(f"요청 수락 거절 ({reason}): 대기 {queue_depth}건, {retry_after}초 후 재시도")
+        self.reason = reason
+        self.retry_after = retry_after
+        self.queue_depth = queue_depth
+
+
+class AdmissionController:
+    """동시 실행 수와 대기열 길이를 제한하는 FIFO 수락 제어기
+
+    - 실행 슬롯이 비어 있으면 바로 시작, 아니면 대기열에서 도착 순서대로 대기
+    - 대기열이 가득 찼거나, 관측된 서비스 속도로 추정한 완료 시간(대기 + 처리)이 기한을 넘으면 즉시 거절
+    - 기한까지 슬롯을 얻지 못한 요청도 거절 (대기열에서 제거)
+    - Retry-After 는 (앞선 대기 요청 수 + 1) × 평균 서비스 시간 / 동시 실행 한도로 추정
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int,
+        max_queue: int,
+        timeout: float,
+        name: str = "inference"
+    ):
+        self.max_concurrent = max(1, max_concurrent)
+        self.max_queue = max(0, max_queue)
+        self.timeout = timeout
+        self.name = name
+
+        self.in_flight = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+        self._avg_service_time: Optional[float] = None
+        self._wait_samples: Deque[float] = deque(maxlen=_WAIT_SAMPLES)
+
+        # 통계
+        self.admitted = 0
+        self.completed = 0
+        self.rejected_queue_full = 0
+        self.rejected_deadline = 0
+        self.peak_in_flight = 0
+        self.peak_queue_depth = 0
+        self.total_wait = 0.0
+
+    @property
+    def queue_depth(self) -> int:
+        return len(self._waiters)
+
+    def estimated_wait(self, ahead: Optional[int] = None) -> float:
+        """앞선 대기 요청이 모두 시작될 때까지의 추정 시간 (초, 서비스 시간 관측 전에는 0)"""
+        if self._avg_service_time is None:
+            return 0.0
+        ahead = self.queue_depth if ahead is None else ahead
+        return (ahead + 1) * self._avg_service_time / self.max_concurrent
+
+    def retry_after(self) -> int:
+        """Retry-After 추정치 (초, 최소 1)"""
+        return max(1, math.ceil(self.estimated_wait()))
+
+    def _reject(self, reason: str) -> AdmissionRejected:
+        if reason == "queue_full":
+            self.rejected_queue_full += 1
+        else:
+            self.rejected_deadline += 1
+        error = AdmissionRejected(reason, self.retry_after(), self.queue_depth)
+        logger.debug(f"[{self.name}] {error}")
+        return error
+
+    async def acquire(self, timeout: Optional[float] = None) -> float:
+        """실행 슬롯 획득 (대기 시간 반환) - 시작할 수 없으면 AdmissionRejected"""
+        timeout = self.timeout if timeout is None else timeout
+        start_time = time.perf_counter()
+
+        # 1. 슬롯이 비어 있고 앞선 대기 요청이 없으면 바로 시작
+        if self.in_flight < self.max_concurrent and not self._waiters:
+            self._start(0.0)
+            return 0.0
+
+        # 2. 대기열 한도 / 추정 완료 시간 검사 (기한 내 끝낼 수 없으면 기다리지 않고 거절)
+        if self.queue_depth >= self.max_queue:
+            raise self._reject("queue_full")
+        if self._avg_service_time is not None and self.estimated_wait() + self._avg_service_time > timeout:
+            raise self._reject("deadline")
+
+        # 3. FIFO 대기 (슬롯 반납 시 맨 앞 대기자에게 넘겨줌)
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        self.peak_queue_depth = max(self.peak_queue_depth, self.queue_depth)
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter), timeout=timeout)
+        except (asyncio.TimeoutError, asyncio.CancelledError) as e:
+            if waiter.done() and not waiter.cancelled():
+                # 취소/만료 직전에 슬롯을 넘겨받았으면 다음 대기자에게 반납
+                self._handoff()
+            else:
+                waiter.cancel()
+                self._remove_waiter(waiter)
+            if isinstance(e, asyncio.CancelledError):
+                raise
+            raise self._reject("deadline")
+
+        waited = time.perf_counter() - start_time
+        self._record_wait(waited)
+        self.admitted += 1
+        return waited
+
+    def _start(self, waited: float) -> None:
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        self._record_wait(waited)
+        self.admitted += 1
+
+    def _record_wait(self, waited: float) -> None:
+        self._wait_samples.append(waited)
+        self.total_wait += waited
+
+    def _remove_waiter(self, waiter: asyncio.Future) -> None:
+        try:
+            self._waiters.remove(waiter)
+        except ValueError:
+            pass
+
+    def _handoff(self) -> None:
+        """슬롯을 맨 앞 대기자에게 넘기거나(실행 수 유지) 반납"""
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self.in_flight -= 1
+
+    def release(self, service_time: Optional[float] = None) -> None:
+        """실행 슬롯 반납 (service_time 지정 시 서비스 속도 추정에 반영)"""
+        if service_time is not None:
+            self._avg_service_time = service_time if self._avg_service_time is None else (
+                _SERVICE_TIME_ALPHA * service_time + (1 - _SERVICE_TIME_ALPHA) * self._avg_service_time
+            )
+        self.completed += 1
+        self._handoff()
+
+    @asynccontextmanager
+    async def slot(self, timeout: Optional[float] = None) -> AsyncIterator[float]:
+        """실행 슬롯 컨텍스트 (블록 실행 시간을 서비스 시간으로 기록)"""
+        waited = await self.acquire(timeout)
+        start_time = time.perf_counter()
+        try:
+            yield waited
+        finally:
+            self.release(time.perf_counter() - start_time)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """수락 제어 지표 (대기열 깊이, 대기 시간, 거절 수)"""
+        waits = sorted(self._wait_samples)
+        return {
+            "name": self.name,
+            "max_concurrent": self.max_concurrent,
+            "max_queue": self.max_queue,
+            "timeout_seconds": self.timeout,
+            "in_flight": self.in_flight,
+            "queue_depth": self.queue_depth,
+            "peak_in_flight": self.peak_in_flight,
+            "peak_queue_depth": self.peak_queue_depth,
+            "admitted": self.admitted,
+            "completed": self.completed,
+            "rejected_queue_full": self.rejected_queue_full,
+            "rejected_deadline": self.rejected_deadline,
+            "avg_wait_ms": self.total_wait * 1000 / self.admitted if self.admitted else 0.0,
+            "p99_wait_ms": waits[min(len(waits) - 1, int(len(waits) * 0.99))] * 1000 if waits else 0.0,
+            "avg_service_ms": self._avg_service_time * 1000 if self._avg_service_time is not None else None,
+            "estimated_wait_ms": self.estimated_wait() * 1000
+        }
@@ -0,0 +1,136 @@
+"""
+다중 패턴 키워드 오토마톤
+Aho-Corasick 기반으로 사전 전체를 한 번의 텍스트 순회로 검색
+"""
+
+import sys
+from typing import Dict, Iterable, List, Mapping, Sequence, Tuple
+from collections import deque
+
+
+class KeywordAutomaton:
+    """Aho-Corasick 다중 패턴 매처
+
+    사전은 생성 시 한 번만 컴파일되며, `find_all` 한 번의 순회로
+    모든 키워드의 (겹치는 것 포함) 등장 위치를 반환합니다.
+    """
+
+    def __init__(self, keywords: Iterable[str]):
+        # 중복 제거 (등록 순서 유지)
+        self.keywords: List[str] = list(dict.fromkeys(k for k in keywords if k))
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[Tuple[int, ...]] = [()]
+        self._build()
+
+    def _build(self) -> None:
+        """트라이 구성 후 실패 링크 및 출력 집합 계산"""
+        goto, fail, output = self._goto, self._fail, self._output
+        pending_output: List[List[int]] = [[]]
+
+        # 1. 트라이 구성
+        for keyword_id, keyword in enumerate(self.keywords):
+            state = 0
+            for ch in keyword:
+                next_state = goto[state].get(ch)
+                if next_state is None:
+                    next_state = len(goto)
+                    goto[state][ch] = next_state
+                    goto.append({})
+                    fail.append(0)
+                    pending_output.append([])
+                state = next_state
+            pending_output[state].append(keyword_id)
+
+        # 2. BFS로 실패 링크 계산 (출력은 실패 링크를 따라 미리 병합)
+        queue = deque(goto[0].values())
+        merged: List[Tuple[int, ...]] = [()] * len(goto)
+        while queue:
+            state = queue.popleft()
+            merged[state] = tuple(pending_output[state]) + merged[fail[state]]
+            for ch, next_state in goto[state].items():
+                fallback = fail[state]
+                while fallback and ch not in goto[fallback]:
+                    fallback = fail[fallback]
+                fail[next_state] = goto[fallback].get(ch, 0)
+                queue.append(next_state)
+
+        output[:] = merged
+
+    def to_tables(self) -> Dict[str, List[int]]:
+        """상태 테이블을 정수 배열로 평탄화 (사전 컴파일 아티팩트 저장용)
+
+        - state_offsets/trans_chars/trans_next: 상태별 전이 (문자 코드포인트 → 다음 상태)
+        - fail: 상태별 실패 링크
+        - output_offsets/output_ids: 상태별 출력 키워드 ID (실패 링크 병합 완료)
+        """
+        tables: Dict[str, List[int]] = {
+            "state_offsets": [0], "trans_chars": [], "trans_next": [],
+            "fail": list(self._fail), "output_offsets": [0], "output_ids": []
+        }
+        for transitions, outputs in zip(self._goto, self._output):
+            for ch, next_state in transitions.items():
+                tables["trans_chars"].append(ord(ch))
+                tables["trans_next"].append(next_state)
+            tables["state_offsets"].append(len(tables["trans_chars"]))
+            tables["output_ids"].extend(outputs)
+            tables["output_offsets"].append(len(tables["output_ids"]))
+        return tables
+
+    @classmethod
+    def from_tables(cls, keywords: Sequence[str], tables: Mapping[str, Sequence[int]]) -> "KeywordAutomaton":
+        """평탄화된 배열에서 복원 (트라이/실패 링크 재계산 없음, mmap 뷰도 입력 가능)"""
+        automaton = cls.__new__(cls)
+        automaton.keywords = list(keywords)
+
+        state_offsets, trans_next = tables["state_offsets"], tables["trans_next"]
+        output_offsets, output_ids = tables["output_offsets"], tables["output_ids"]
+        chars = [sys.intern(chr(code)) for code in tables["trans_chars"]]
+        state_count = len(tables["fail"])
+
+        automaton._goto = [
+            dict(zip(chars[state_offsets[state]:state_offsets[state + 1]],
+                     trans_next[state_offsets[state]:state_offsets[state + 1]]))
+            for state in range(state_count)
+        ]
+        automaton._fail = list(tables["fail"])
+        automaton._output = [
+            tuple(output_ids[output_offsets[state]:output_offsets[state + 1]])
+            for state in range(state_count)
+        ]
+        return automaton
+
+    def find_all(self, text: str) -> Dict[str, List[int]]:
+        """키워드별 시작 위치 목록 (겹치는 등장 포함, 오름차순)"""
+        goto, fail, output, keywords = self._goto, self._fail, self._output, self.keywords
+        hits: Dict[str, List[int]] = {}
+        state = 0
+
+        for index, ch in enumerate(text):
+            next_state = goto[state].get(ch)
+            while next_state is None and state:
+                state = fail[state]
+                next_state = goto[state].get(ch)
+            state = next_state or 0
+
+            for keyword_id in output[state]:
+                keyword = keywords[keyword_id]
+                start = index - len(keyword) + 1
+                positions = hits.get(keyword)
+                if positions is None:
+                    hits[keyword] = [start]
+                else:
+                    positions.append(start)
+
+        return hits
+
+    @staticmethod
+    def non_overlapping(positions: List[int], length: int) -> List[int]:
+        """겹치지 않는 등장 위치만 선택 (re.finditer / str.count 와 동일한 규칙)"""
+        selected: List[int] = []
+        next_free = 0
+        for start in positions:
+            if start >= next_free:
+                selected.append(start)
+                next_free = start + length
+        return selected
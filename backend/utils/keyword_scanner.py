@@ -0,0 +1,62 @@
+"""
+분류별 키워드 스캐너
+여러 키워드 목록을 하나의 정규식으로 컴파일해 한 번의 텍스트 순회로 분류 플래그 계산
+"""
+
+import re
+from typing import Callable, Dict, FrozenSet, Iterable, Mapping, Optional
+
+
+class KeywordScanner:
+    """분류(category)별 키워드 포함 여부를 한 번에 검사
+
+    - 모든 키워드를 긴 것부터 정렬한 교대(alternation) 정규식 하나로 컴파일하므로
+      목록마다 `any(keyword in text ...)` 를 반복하는 대신 C 정규식 엔진이 텍스트를 한 번만 순회합니다.
+    - 매치마다 시작 위치 + 1 부터 다시 검색하고, 키워드 안에 포함된 다른 키워드의 분류도 함께 반환하므로
+      키워드끼리 겹쳐도 부분 문자열 검사(`in`)와 같은 결과를 냅니다.
+    - 모든 분류가 발견되면 나머지 텍스트는 검사하지 않습니다.
+    """
+
+    def __init__(
+        self,
+        categories: Mapping[str, Iterable[str]],
+        normalize: Optional[Callable[[str], str]] = None
+    ):
+        self.normalize = normalize
+
+        # 1. 키워드 → 분류 (같은 키워드가 여러 분류에 있으면 모두 포함)
+        keyword_categories: Dict[str, set] = {}
+        for category, keywords in categories.items():
+            for keyword in keywords:
+                if keyword:
+                    keyword_categories.setdefault(keyword, set()).add(category)
+
+        # 2. 키워드 안에 포함된 다른 키워드의 분류 병합 (긴 키워드가 먼저 매치되어도 누락 없음)
+        self._categories: Dict[str, FrozenSet[str]] = {
+            keyword: frozenset().union(*(
+                found for other, found in keyword_categories.items() if other in keyword
+            ))
+            for keyword in keyword_categories
+        }
+        self.all_categories = frozenset().union(*keyword_categories.values())  # 키워드가 있는 분류만
+
+        # 3. 긴 키워드 우선 교대 정규식
+        ordered = sorted(self._categories, key=len, reverse=True)
+        self._pattern = re.compile("|".join(map(re.escape, ordered))) if ordered else None
+
+    def scan(self, text: str) -> FrozenSet[str]:
+        """텍스트에 키워드가 등장한 분류 집합"""
+        if self._pattern is None or not text:
+            return frozenset()
+        if self.normalize is not None:
+            text = self.normalize(text)
+
+        search, categories, remaining = self._pattern.search, self._categories, self.all_categories
+        found: FrozenSet[str] = frozenset()
+        match = search(text)
+        while match is not None:
+            found |= categories[match.group()]
+            if found >= remaining:
+                break
+            match = search(text, match.start() + 1)
+        return found
@@ -0,0 +1,105 @@
+"""
+메모리 한도 LRU/TTL 캐시
+프로세스 내 결과 재사용을 위한 스레드 안전 캐시 (적중/미스/축출 통계 포함)
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+
+class LRUCache:
+    """항목 수/메모리 한도를 가진 LRU 캐시 (선택적 TTL)
+
+    - 한도 초과 시 가장 오래 사용되지 않은 항목부터 축출
+    - ttl_seconds 지정 시 만료된 항목은 조회 시점에 제거
+    - 항목 크기는 sizeof(key, value) 추정치로 계산
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        max_bytes: int,
+        ttl_seconds: Optional[float] = None,
+        sizeof: Optional[Callable[[Hashable, Any], int]] = None
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._sizeof = sizeof or (lambda key, value: 0)
+
+        # key -> (value, 크기, 저장 시각)
+        self._entries: "OrderedDict[Hashable, Tuple[Any, int, float]]" = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """캐시 조회 (없거나 만료되면 None)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            value, size, stored_at = entry
+            if self.ttl_seconds is not None and time.monotonic() - stored_at > self.ttl_seconds:
+                self._remove(key, size)
+                self.expirations += 1
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """캐시 저장 (한도 초과 시 LRU 축출)"""
+        size = self._sizeof(key, value)
+        if size > self.max_bytes or self.max_entries <= 0:
+            return
+
+        with self._lock:
+            existing = self._entries.pop(key, None)
+            if existing is not None:
+                self._total_bytes -= existing[1]
+
+            self._entries[key] = (value, size, time.monotonic())
+            self._total_bytes += size
+
+            while len(self._entries) > self.max_entries or self._total_bytes > self.max_bytes:
+                oldest_key, (_, oldest_size, _) = next(iter(self._entries.items()))
+                self._remove(oldest_key, oldest_size)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """전체 항목 제거 (통계는 유지)"""
+        with self._lock:
+            self._entries.clear()
+            self._total_bytes = 0
+
+    def _remove(self, key: Hashable, size: int) -> None:
+        del self._entries[key]
+        self._total_bytes -= size
+
+    def get_stats(self) -> Dict[str, Any]:
+        """캐시 통계 (용량 산정용)"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._total_bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "hit_rate": self.hits / lookups if lookups else 0.0
+            }
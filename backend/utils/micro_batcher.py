@@ -0,0 +1,191 @@
+"""
+마이크로 배치 스케줄러
+짧은 대기 창 동안 도착한 요청을 호환 가능한 그룹별로 모아 한 번의 배치 호출로 실행하고 결과를 호출자에게 분배
+"""
+
+import asyncio
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Hashable, List, Optional
+
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class _PendingGroup:
+    """같은 배치 키로 대기 중인 요청 묶음"""
+    first_arrival: float
+    items: List[Any] = field(default_factory=list)
+    futures: List[asyncio.Future] = field(default_factory=list)
+    arrivals: List[float] = field(default_factory=list)
+
+
+class MicroBatcher:
+    """동적 마이크로 배치 스케줄러
+
+    - 요청은 배치 키(예: 생성 파라미터)별로 모이며, 그룹의 첫 요청 도착 후 window_ms가 지나거나
+      max_batch_size에 도달하면 한 번의 run_batch(key, items) 호출로 실행됩니다.
+    - 배치는 전용 스레드 1개에서 하나씩 실행되므로(모델 1개 공유), 실행 중에 도착한 요청은
+      다음 배치로 계속 모입니다. 부하가 높을수록 배치가 커지고, 한산할 때는 창만큼만 기다립니다.
+    - 여러 그룹이 준비되면 가장 먼저 도착한 그룹부터 실행합니다.
+    """
+
+    def __init__(
+        self,
+        run_batch: Callable[[Hashable, List[Any]], List[Any]],
+        max_batch_size: int,
+        window_ms: float,
+        name: str = "batch"
+    ):
+        self._run_batch = run_batch
+        self.max_batch_size = max(1, max_batch_size)
+        self.window = max(0.0, window_ms) / 1000
+        self.name = name
+
+        self._pending: "OrderedDict[Hashable, _PendingGroup]" = OrderedDict()
+        self._wakeup: Optional[asyncio.Event] = None
+        self._dispatcher: Optional[asyncio.Task] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+        # 통계
+        self.submitted = 0
+        self.batches = 0
+        self.batched_items = 0
+        self.max_observed_batch = 0
+        self.total_queue_wait = 0.0
+        self.total_batch_time = 0.0
+        self.failed_batches = 0
+
+    @property
+    def queued(self) -> int:
+        return sum(len(group.items) for group in self._pending.values())
+
+    async def submit(self, key: Hashable, item: Any) -> Any:
+        """요청 1건 제출 후 배치 실행 결과 중 자기 몫을 반환"""
+        loop = asyncio.get_running_loop()
+        self._ensure_dispatcher(loop)
+
+        future = loop.create_future()
+        now = time.perf_counter()
+        group = self._pending.get(key)
+        if group is None:
+            group = self._pending[key] = _PendingGroup(first_arrival=now)
+        group.items.append(item)
+        group.futures.append(future)
+        group.arrivals.append(now)
+        self.submitted += 1
+        self._wakeup.set()
+
+        return await future
+
+    def _ensure_dispatcher(self, loop: asyncio.AbstractEventLoop) -> None:
+        if self._dispatcher is None or self._dispatcher.done():
+            self._wakeup = asyncio.Event()
+            self._executor = self._executor or ThreadPoolExecutor(max_workers=1, thread_name_prefix=self.name)
+            self._dispatcher = loop.create_task(self._dispatch_loop())
+
+    def _next_ready(self, now: float) -> Optional[Hashable]:
+        """실행할 그룹 키 (가득 찼거나 대기 창이 지난 그룹 중 가장 먼저 도착한 것)"""
+        for key, group in self._pending.items():
+            if len(group.items) >= self.max_batch_size or now - group.first_arrival >= self.window:
+                return key
+        return None
+
+    async def _dispatch_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            # 1. 준비된 그룹이 생길 때까지 대기 (가장 이른 그룹의 창 만료 또는 새 요청 도착)
+            if not self._pending:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+
+            now = time.perf_counter()
+            key = self._next_ready(now)
+            if key is None:
+                earliest = min(group.first_arrival for group in self._pending.values())
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=max(0.0, earliest + self.window - now))
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            # 2. 최대 배치 크기만큼 꺼내고 나머지는 같은 그룹에 남김
+            group = self._pending[key]
+            size = self.max_batch_size
+            batch = [
+                (item, future, arrival)
+                for item, future, arrival in zip(group.items[:size], group.futures[:size], group.arrivals[:size])
+                if not future.done()  # 대기 중 호출자가 취소한 요청은 제외
+            ]
+            del group.items[:size], group.futures[:size], group.arrivals[:size]
+            if group.items:
+                group.first_arrival = group.arrivals[0]
+            else:
+                del self._pending[key]
+            if not batch:
+                continue
+            items = [item for item, _, _ in batch]
+            futures = [future for _, future, _ in batch]
+
+            # 3. 전용 스레드에서 배치 실행 후 결과 분배
+            start_time = time.perf_counter()
+            self.total_queue_wait += sum(start_time - arrival for _, _, arrival in batch)
+            try:
+                results = await loop.run_in_executor(self._executor, self._run_batch, key, items)
+                if len(results) != len(items):
+                    raise RuntimeError(f"배치 결과 수 불일치 ({len(results)} != {len(items)})")
+            except Exception as e:
+                self.failed_batches += 1
+                logger.error(f"[{self.name}] 배치 실행 실패 ({len(items)}건): {e}")
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(e)
+            else:
+                for future, result in zip(futures, results):
+                    if not future.done():  # 호출자가 취소한 요청은 결과 버림
+                        future.set_result(result)
+
+            self.batches += 1
+            self.batched_items += len(items)
+            self.max_observed_batch = max(self.max_observed_batch, len(items))
+            self.total_batch_time += time.perf_counter() - start_time
+
+    async def shutdown(self) -> None:
+        """디스패처 중단 및 대기 요청 취소"""
+        if self._dispatcher is not None:
+            self._dispatcher.cancel()
+            try:
+                await self._dispatcher
+            except asyncio.CancelledError:
+                pass
+            self._dispatcher = None
+        for group in self._pending.values():
+            for future in group.futures:
+                if not future.done():
+                    future.cancel()
+        self._pending.clear()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """배치 통계"""
+        return {
+            "name": self.name,
+            "max_batch_size": self.max_batch_size,
+            "window_ms": self.window * 1000,
+            "submitted": self.submitted,
+            "batches": self.batches,
+            "avg_batch_size": self.batched_items / self.batches if self.batches else 0.0,
+            "max_observed_batch": self.max_observed_batch,
+            "avg_queue_wait_ms": self.total_queue_wait * 1000 / self.batched_items if self.batched_items else 0.0,
+            "avg_batch_ms": self.total_batch_time * 1000 / self.batches if self.batches else 0.0,
+            "failed_batches": self.failed_batches,
+            "queued": self.queued
+        }
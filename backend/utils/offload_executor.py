@@ -0,0 +1,157 @@
+"""
+CPU 작업 오프로드 실행기
+이벤트 루프를 막지 않도록 CPU 바운드 작업을 스레드/프로세스 풀에서 실행 (대기열 지표 포함)
+"""
+
+import asyncio
+import os
+import threading
+import time
+from concurrent.futures import BrokenExecutor, Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+EXECUTION_MODES = ("inline", "thread", "process")
+
+
+class OffloadExecutor:
+    """스레드/프로세스 풀 기반 오프로드 실행기
+
+    - thread: 같은 프로세스의 사전/모델을 공유 (GIL로 인해 CPU 작업 간 병렬성은 제한)
+    - process: 워커별 initializer로 사전을 미리 적재, 호출당 인자/결과만 직렬화
+    - 풀은 첫 사용 시 생성되며, 워커 프로세스가 비정상 종료되면 다음 호출에서 재생성
+    """
+
+    def __init__(
+        self,
+        mode: str,
+        max_workers: int,
+        initializer: Optional[Callable[[], None]] = None,
+        name: str = "offload"
+    ):
+        if mode not in ("thread", "process"):
+            raise ValueError(f"지원하지 않는 오프로드 모드: {mode}")
+
+        self.mode = mode
+        self.max_workers = max(1, max_workers)
+        self.name = name
+        self._initializer = initializer
+        self._executor: Optional[Executor] = None
+        self._lock = threading.Lock()
+
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.total_latency = 0.0
+
+    def _create_executor(self) -> Executor:
+        if self.mode == "process":
+            executor: Executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                initializer=self._initializer
+            )
+        else:
+            executor = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix=self.name
+            )
+        logger.info(f"✅ 오프로드 풀 생성: {self.name} ({self.mode} x {self.max_workers})")
+        return executor
+
+    def _get_executor(self) -> Executor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = self._create_executor()
+            return self._executor
+
+    def _warm_up(self, executor: Executor) -> None:
+        """프로세스 모드는 모든 워커의 initializer 실행을 기다림"""
+        if self.mode == "process":
+            futures = [executor.submit(os.getpid) for _ in range(self.max_workers)]
+            pids = {future.result() for future in futures}
+            logger.info(f"✅ 오프로드 워커 예열 완료: {self.name} (프로세스 {len(pids)}개)")
+
+    def start(self) -> None:
+        """풀 생성 및 워커 예열"""
+        self._warm_up(self._get_executor())
+
+    def recycle(self) -> None:
+        """새 풀을 예열한 뒤 교체 (워커 상태 갱신용, 이전 풀의 진행 중 작업은 끝까지 처리)
+
+        교체 직전에 이전 풀을 가져간 run() 호출은 제출이 거절되면 새 풀로 다시 제출
+        """
+        executor = self._create_executor()
+        self._warm_up(executor)
+        with self._lock:
+            previous, self._executor = self._executor, executor
+        if previous is not None:
+            previous.shutdown(wait=False)
+
+    async def run(self, func: Callable[..., Any], *args: Any) -> Any:
+        """func(*args)를 풀에서 실행하고 결과를 기다림"""
+        executor = self._get_executor()
+        loop = asyncio.get_running_loop()
+
+        self.submitted += 1
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        start_time = time.perf_counter()
+
+        try:
+            try:
+                future = loop.run_in_executor(executor, func, *args)
+            except RuntimeError:
+                # recycle()가 다른 스레드에서 풀을 교체하고 이전 풀을 닫은 직후 - 새 풀로 한 번 재시도
+                current = self._get_executor()
+                if current is executor:
+                    raise
+                executor = current
+                future = loop.run_in_executor(executor, func, *args)
+            result = await future
+            self.completed += 1
+            return result
+        except BrokenExecutor:
+            self.failed += 1
+            self._discard(executor)
+            raise
+        except Exception:
+            self.failed += 1
+            raise
+        finally:
+            self.in_flight -= 1
+            self.total_latency += time.perf_counter() - start_time
+
+    def _discard(self, executor: Executor) -> None:
+        """손상된 풀 폐기 (다음 호출에서 재생성)"""
+        with self._lock:
+            if self._executor is executor:
+                self._executor = None
+        executor.shutdown(wait=False, cancel_futures=True)
+        logger.warning(f"⚠️ 오프로드 풀 손상으로 재생성 예정: {self.name}")
+
+    def shutdown(self, wait: bool = True) -> None:
+        """풀 종료"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """대기열 지표 (queued = 워커 수를 넘어 대기 중인 작업 수)"""
+        finished = self.completed + self.failed
+        return {
+            "mode": self.mode,
+            "max_workers": self.max_workers,
+            "in_flight": self.in_flight,
+            "queued": max(0, self.in_flight - self.max_workers),
+            "peak_in_flight": self.peak_in_flight,
+            "submitted": self.submitted,
+            "completed": self.completed,
+            "failed": self.failed,
+            "avg_latency_ms": self.total_latency * 1000 / finished if finished else 0.0
+        }